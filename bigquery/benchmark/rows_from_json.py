@@ -0,0 +1,86 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Microbenchmark for decoding JSON rows with _helpers._rows_from_json.
+
+Times wide scalar, all-STRING and nested schemas, so that regressions in
+the per-cell conversion cost are visible.
+"""
+
+import sys
+import timeit
+
+from google.cloud.bigquery import _helpers
+from google.cloud.bigquery.schema import SchemaField
+
+NUM_ROWS = 10000
+SCALAR_CELLS = (
+    ('INTEGER', u'123456'),
+    ('FLOAT', u'1.25'),
+    ('BOOLEAN', u'true'),
+    ('STRING', u'abcdef'),
+    ('TIMESTAMP', u'1.4338368E9'),
+    ('DATE', u'2016-12-03'),
+)
+
+
+def wide_schema(num_columns):
+    schema, cells = [], []
+    for index in range(num_columns):
+        field_type, value = SCALAR_CELLS[index % len(SCALAR_CELLS)]
+        schema.append(SchemaField('col_{}'.format(index), field_type))
+        cells.append({'v': value})
+    return schema, {'f': cells}
+
+
+def string_schema(num_columns):
+    schema = [
+        SchemaField('col_{}'.format(index), 'STRING')
+        for index in range(num_columns)]
+    return schema, {'f': [{'v': u'abcdef'} for _ in range(num_columns)]}
+
+
+def nested_schema(depth):
+    schema, row = wide_schema(len(SCALAR_CELLS))
+    for _ in range(depth):
+        schema = [
+            SchemaField('record', 'RECORD', fields=schema),
+            SchemaField('records', 'RECORD', mode='REPEATED', fields=schema),
+            SchemaField('ints', 'INTEGER', mode='REPEATED'),
+        ]
+        row = {'f': [
+            {'v': row},
+            {'v': [{'v': row}, {'v': row}]},
+            {'v': [{'v': u'1'}, {'v': u'2'}, {'v': u'3'}]},
+        ]}
+    return schema, row
+
+
+def main(repeat):
+    cases = (
+        ('wide (100 columns)', wide_schema(100)),
+        ('wide STRING (100 columns)', string_schema(100)),
+        ('nested (depth 3)', nested_schema(3)),
+    )
+    for name, (schema, row) in cases:
+        rows = [row] * NUM_ROWS
+        elapsed = min(timeit.repeat(
+            lambda: _helpers._rows_from_json(rows, schema),
+            repeat=repeat, number=1))
+        print('{}: {} rows in {:.3f} sec ({:.0f} rows/sec)'.format(
+            name, NUM_ROWS, elapsed, NUM_ROWS / elapsed))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,87 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare RowIterator.to_dataframe against building a DataFrame from rows.
+
+Runs offline against synthetic ``tabledata.list`` pages, so only the
+decoding cost is measured.
+"""
+
+import random
+import sys
+import timeit
+
+import pandas
+
+from google.cloud.bigquery.schema import SchemaField
+from google.cloud.bigquery.table import RowIterator
+
+SCHEMA = [
+    SchemaField('start_timestamp', 'TIMESTAMP'),
+    SchemaField('seconds', 'INT64'),
+    SchemaField('miles', 'FLOAT64'),
+    SchemaField('payment_type', 'STRING'),
+    SchemaField('complete', 'BOOL'),
+]
+PAGE_SIZE = 10000
+
+
+def make_page(num_rows):
+    rows = []
+    for _ in range(num_rows):
+        rows.append({'f': [
+            {'v': '{:.6f}'.format(random.uniform(1e9, 1.5e9))},
+            {'v': str(random.randint(0, 10000))},
+            {'v': repr(random.random() * 100)},
+            {'v': random.choice(['Cash', 'Credit'])},
+            {'v': random.choice(['true', 'false'])},
+        ]})
+    return {'rows': rows}
+
+
+def make_iterator(pages):
+    responses = iter(pages)
+
+    def api_request(**kwargs):
+        return next(responses)
+
+    return RowIterator(None, api_request, '/benchmark', SCHEMA)
+
+
+def rows_to_dataframe(pages):
+    row_iterator = make_iterator(pages)
+    column_headers = [field.name for field in SCHEMA]
+    return pandas.DataFrame(
+        (row.values() for row in row_iterator), columns=column_headers)
+
+
+def columns_to_dataframe(pages):
+    return make_iterator(pages).to_dataframe()
+
+
+def main(num_pages):
+    pages = [make_page(PAGE_SIZE) for _ in range(num_pages)]
+    for page in pages[:-1]:
+        page['pageToken'] = 'token'
+
+    for func in (rows_to_dataframe, columns_to_dataframe):
+        elapsed = min(timeit.repeat(
+            lambda: func(pages), repeat=3, number=1))
+        print('{}: {} rows in {:.3f} sec ({:.0f} rows/sec)'.format(
+            func.__name__, num_pages * PAGE_SIZE, elapsed,
+            num_pages * PAGE_SIZE / elapsed))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
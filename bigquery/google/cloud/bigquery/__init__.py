@@ -31,6 +31,8 @@ The main concepts with this API are:
 from pkg_resources import get_distribution
 __version__ = get_distribution('google-cloud-bigquery').version
 
+from google.cloud.bigquery.batcher import InsertBatcher
+from google.cloud.bigquery.cache import QueryCache
 from google.cloud.bigquery.client import Client
 from google.cloud.bigquery.dataset import AccessEntry
 from google.cloud.bigquery.dataset import Dataset
@@ -71,6 +73,7 @@ from google.cloud.bigquery.table import TableReference
 from google.cloud.bigquery.table import Row
 from google.cloud.bigquery.table import TimePartitioningType
 from google.cloud.bigquery.table import TimePartitioning
+from google.cloud.bigquery.waiter import JobWaiter
 
 __all__ = [
     '__version__',
@@ -78,6 +81,7 @@ __all__ = [
     # Queries
     'QueryJob',
     'QueryJobConfig',
+    'QueryCache',
     'ArrayQueryParameter',
     'ScalarQueryParameter',
     'StructQueryParameter',
@@ -90,6 +94,7 @@ __all__ = [
     'Table',
     'TableReference',
     'Row',
+    'InsertBatcher',
     'CopyJob',
     'CopyJobConfig',
     'ExtractJob',
@@ -97,6 +102,7 @@ __all__ = [
     'LoadJob',
     'LoadJobConfig',
     'UnknownJob',
+    'JobWaiter',
     'TimePartitioningType',
     'TimePartitioning',
     # Shared helpers
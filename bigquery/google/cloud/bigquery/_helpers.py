@@ -53,10 +53,15 @@ def _decimal_from_json(value, field):
         return decimal.Decimal(value)
 
 
+def _bool_from_string(value):
+    """Coerce a non-null 'value' to a bool."""
+    return value.lower() in ('t', 'true', '1')
+
+
 def _bool_from_json(value, field):
     """Coerce 'value' to a bool, if set or not nullable."""
     if _not_null(value, field):
-        return value.lower() in ['t', 'true', '1']
+        return _bool_from_string(value)
 
 
 def _string_from_json(value, _):
@@ -64,17 +69,27 @@ def _string_from_json(value, _):
     return value
 
 
+def _bytes_from_string(value):
+    """Base64-decode a non-null value"""
+    return base64.standard_b64decode(_to_bytes(value))
+
+
 def _bytes_from_json(value, field):
     """Base64-decode value"""
     if _not_null(value, field):
-        return base64.standard_b64decode(_to_bytes(value))
+        return _bytes_from_string(value)
+
+
+def _timestamp_from_string(value):
+    """Coerce a non-null 'value' to a datetime."""
+    # value will be a float in seconds, to microsecond precision, in UTC.
+    return _datetime_from_microseconds(1e6 * float(value))
 
 
 def _timestamp_from_json(value, field):
     """Coerce 'value' to a datetime, if set or not nullable."""
     if _not_null(value, field):
-        # value will be a float in seconds, to microsecond precision, in UTC.
-        return _datetime_from_microseconds(1e6 * float(value))
+        return _timestamp_from_string(value)
 
 
 def _timestamp_query_param_from_json(value, field):
@@ -123,16 +138,21 @@ def _datetime_from_json(value, field):
         :data:`None`).
     """
     if _not_null(value, field):
-        if '.' in value:
-            # YYYY-MM-DDTHH:MM:SS.ffffff
-            return datetime.datetime.strptime(value, _RFC3339_MICROS_NO_ZULU)
-        else:
-            # YYYY-MM-DDTHH:MM:SS
-            return datetime.datetime.strptime(value, _RFC3339_NO_FRACTION)
+        return _datetime_from_string(value)
     else:
         return None
 
 
+def _datetime_from_string(value):
+    """Coerce a non-null 'value' to a naive datetime."""
+    if '.' in value:
+        # YYYY-MM-DDTHH:MM:SS.ffffff
+        return datetime.datetime.strptime(value, _RFC3339_MICROS_NO_ZULU)
+    else:
+        # YYYY-MM-DDTHH:MM:SS
+        return datetime.datetime.strptime(value, _RFC3339_NO_FRACTION)
+
+
 def _date_from_json(value, field):
     """Coerce 'value' to a datetime date, if set or not nullable"""
     if _not_null(value, field):
@@ -140,16 +160,21 @@ def _date_from_json(value, field):
         return _date_from_iso8601_date(value)
 
 
+def _time_from_string(value):
+    """Coerce a non-null 'value' to a datetime time"""
+    if len(value) == 8:  # HH:MM:SS
+        fmt = _TIMEONLY_WO_MICROS
+    elif len(value) == 15:  # HH:MM:SS.micros
+        fmt = _TIMEONLY_W_MICROS
+    else:
+        raise ValueError("Unknown time format: {}".format(value))
+    return datetime.datetime.strptime(value, fmt).time()
+
+
 def _time_from_json(value, field):
     """Coerce 'value' to a datetime date, if set or not nullable"""
     if _not_null(value, field):
-        if len(value) == 8:  # HH:MM:SS
-            fmt = _TIMEONLY_WO_MICROS
-        elif len(value) == 15:  # HH:MM:SS.micros
-            fmt = _TIMEONLY_W_MICROS
-        else:
-            raise ValueError("Unknown time format: {}".format(value))
-        return datetime.datetime.strptime(value, fmt).time()
+        return _time_from_string(value)
 
 
 def _record_from_json(value, field):
@@ -194,6 +219,118 @@ def _field_to_index_mapping(schema):
     return {f.name: i for i, f in enumerate(schema)}
 
 
+# Converters for non-null cell values, used by compiled row converters.
+_NOT_NULL_CELLDATA_FROM_JSON = {
+    'INTEGER': int,
+    'INT64': int,
+    'FLOAT': float,
+    'FLOAT64': float,
+    'NUMERIC': decimal.Decimal,
+    'BOOLEAN': _bool_from_string,
+    'BOOL': _bool_from_string,
+    'BYTES': _bytes_from_string,
+    'TIMESTAMP': _timestamp_from_string,
+    'DATETIME': _datetime_from_string,
+    'DATE': _date_from_iso8601_date,
+    'TIME': _time_from_string,
+}
+
+# Maximum number of compiled row converters kept by _row_converter.
+_MAX_ROW_CONVERTERS = 128
+_ROW_CONVERTERS = {}
+
+
+def _identity(value):
+    """Return 'value' unchanged."""
+    return value
+
+
+def _record_converter(field):
+    """Compile a converter for the non-null JSON value of a RECORD field.
+
+    :type field: :class:`~google.cloud.bigquery.schema.SchemaField`
+    :param field: A field with ``field_type`` of ``RECORD``.
+
+    :rtype: callable
+    :returns: A function mapping the JSON value of the record to a dict.
+    """
+    names = [subfield.name for subfield in field.fields]
+    converters = [_field_converter(subfield) for subfield in field.fields]
+
+    def convert(value):
+        return {
+            name: converter(cell['v'])
+            for name, converter, cell in zip(names, converters, value['f'])
+        }
+
+    return convert
+
+
+def _field_converter(field):
+    """Compile a converter for the JSON cell values of a field.
+
+    The field's type, mode and subfields are resolved once, so that
+    converting a cell is a single call.
+
+    :type field: :class:`~google.cloud.bigquery.schema.SchemaField`
+    :param field: The field describing the cells.
+
+    :rtype: callable
+    :returns: A function mapping a cell's JSON ``v`` value to a native value.
+    """
+    if field.field_type in ('STRING', 'GEOGRAPHY'):
+        converter = _identity
+    elif field.field_type == 'RECORD':
+        converter = _record_converter(field)
+    else:
+        converter = _NOT_NULL_CELLDATA_FROM_JSON[field.field_type]
+
+    if field.mode == 'REPEATED':
+        if converter is _identity:
+            return lambda value: [item['v'] for item in value]
+        return lambda value: [converter(item['v']) for item in value]
+
+    if field.mode == 'NULLABLE' and converter is not _identity:
+        return lambda value: None if value is None else converter(value)
+
+    return converter
+
+
+def _row_converter(schema):
+    """Compile a converter for JSON rows of a schema.
+
+    Converters are cached by schema, so repeated calls with an equal schema
+    return the same function.
+
+    :type schema: tuple
+    :param schema: A tuple of
+                   :class:`~google.cloud.bigquery.schema.SchemaField`.
+
+    :rtype: callable
+    :returns: A function mapping a JSON row to a tuple of native values.
+    """
+    key = tuple(schema)
+    row_converter = _ROW_CONVERTERS.get(key)
+    if row_converter is not None:
+        return row_converter
+
+    converters = [_field_converter(field) for field in key]
+    if all(converter is _identity for converter in converters):
+        # All columns are scalar strings: the values need no conversion.
+        def row_converter(row):
+            return tuple([cell['v'] for cell in row['f']])
+    else:
+        def row_converter(row):
+            return tuple([
+                converter(cell['v'])
+                for converter, cell in zip(converters, row['f'])])
+
+    if len(_ROW_CONVERTERS) >= _MAX_ROW_CONVERTERS:
+        _ROW_CONVERTERS.clear()
+    _ROW_CONVERTERS[key] = row_converter
+    return row_converter
+
+
 def _row_tuple_from_json(row, schema):
     """Convert JSON row data to row with appropriate types.
 
@@ -209,16 +346,7 @@ def _row_tuple_from_json(row, schema):
     :rtype: tuple
     :returns: A tuple of data converted to native types.
     """
-    row_data = []
-    for field, cell in zip(schema, row['f']):
-        converter = _CELLDATA_FROM_JSON[field.field_type]
-        if field.mode == 'REPEATED':
-            row_data.append([converter(item['v'], field)
-                             for item in cell['v']])
-        else:
-            row_data.append(converter(cell['v'], field))
-
-    return tuple(row_data)
+    return _row_converter(schema)(row)
 
 
 def _rows_from_json(values, schema):
@@ -226,8 +354,8 @@ def _rows_from_json(values, schema):
     from google.cloud.bigquery import Row
 
     field_to_index = _field_to_index_mapping(schema)
-    return [Row(_row_tuple_from_json(r, schema), field_to_index)
-            for r in values]
+    row_converter = _row_converter(schema)
+    return [Row(row_converter(r), field_to_index) for r in values]
 
 
 def _int_to_json(value):
@@ -325,6 +453,28 @@ _SCALAR_VALUE_TO_JSON_ROW = {
 }
 
 
+def _row_to_json(row, schema):
+    """Convert a row tuple to a JSON-compatible mapping for ``insertAll``.
+
+    :type row: tuple
+    :param row: Row values, ordered according to ``schema``.
+
+    :type schema: tuple
+    :param schema: A tuple of
+                   :class:`~google.cloud.bigquery.schema.SchemaField`.
+
+    :rtype: dict
+    :returns: A mapping from field name to JSON-compatible value.
+    """
+    json_row = {}
+    for field, value in zip(schema, row):
+        converter = _SCALAR_VALUE_TO_JSON_ROW.get(field.field_type)
+        if converter is not None:  # STRING doesn't need converting
+            value = converter(value)
+        json_row[field.name] = value
+    return json_row
+
+
 # Converters used for scalar values marshalled as query parameters.
 _SCALAR_VALUE_TO_JSON_PARAM = _SCALAR_VALUE_TO_JSON_ROW.copy()
 _SCALAR_VALUE_TO_JSON_PARAM['TIMESTAMP'] = _timestamp_to_json_parameter
@@ -0,0 +1,424 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared helper functions for connecting BigQuery and pandas."""
+
+import threading
+
+import six
+try:
+    import numpy
+except ImportError:  # pragma: NO COVER
+    numpy = None
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
+from google.cloud.bigquery import _helpers
+
+
+_NO_PYARROW_ERROR = (
+    'The pyarrow library is not installed, please install '
+    'pyarrow to stream a DataFrame as Parquet.'
+)
+
+
+class _Pipe(object):
+    """A bounded in-memory pipe between a writer and a reader thread.
+
+    Writes block while ``max_size`` bytes are buffered, and reads block
+    until the requested number of bytes are buffered or the writer closes
+    the pipe. So long as ``max_size`` is at least the size of the reads,
+    at most ``max_size`` bytes plus one write are buffered.
+
+    Args:
+        max_size (int): The number of buffered bytes which blocks writes.
+    """
+
+    def __init__(self, max_size):
+        self._max_size = max_size
+        self._lock = threading.Condition()
+        self._buffer = bytearray()
+        self._bytes_written = 0
+        self._bytes_read = 0
+        self._write_closed = False
+        self._read_closed = False
+        self._exception = None
+
+    def write(self, data):
+        """Append bytes to the pipe, blocking while it is full.
+
+        Args:
+            data (bytes): The bytes to write.
+
+        Returns:
+            int: The number of bytes written.
+
+        Raises:
+            ValueError: If the reader closed the pipe.
+        """
+        with self._lock:
+            while (len(self._buffer) >= self._max_size and
+                    not self._read_closed):
+                self._lock.wait()
+            if self._read_closed:
+                raise ValueError('The reader closed the pipe.')
+            self._buffer.extend(data)
+            self._bytes_written += len(data)
+            self._lock.notify_all()
+        return len(data)
+
+    def read(self, size):
+        """Read bytes from the pipe, blocking until enough are written.
+
+        Args:
+            size (int): The number of bytes to read.
+
+        Returns:
+            bytes:
+                ``size`` bytes, or fewer once the writer closed the pipe.
+
+        Raises:
+            Exception: The error which stopped the writer, if any.
+        """
+        with self._lock:
+            while len(self._buffer) < size and not self._write_closed:
+                self._lock.wait()
+            if self._exception is not None:
+                raise self._exception
+            data = bytes(self._buffer[:size])
+            del self._buffer[:size]
+            self._bytes_read += len(data)
+            self._lock.notify_all()
+        return data
+
+    def close_write(self, exception=None):
+        """Signal the reader that no more bytes will be written.
+
+        Args:
+            exception (Exception):
+                (Optional) The error which stopped the writer, raised to
+                the reader on its next read.
+        """
+        with self._lock:
+            self._write_closed = True
+            self._exception = exception
+            self._lock.notify_all()
+
+    def close_read(self):
+        """Signal the writer that no more bytes will be read."""
+        with self._lock:
+            self._read_closed = True
+            self._lock.notify_all()
+
+    @property
+    def bytes_written(self):
+        """int: The number of bytes written to the pipe."""
+        return self._bytes_written
+
+    @property
+    def bytes_read(self):
+        """int: The number of bytes read from the pipe."""
+        return self._bytes_read
+
+
+class _PipeWriter(object):
+    """The file-like writing end of a :class:`_Pipe`.
+
+    Args:
+        pipe (_Pipe): The pipe.
+    """
+
+    def __init__(self, pipe):
+        self._pipe = pipe
+        self.closed = False
+
+    def write(self, data):
+        return self._pipe.write(data)
+
+    def tell(self):
+        return self._pipe.bytes_written
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class _PipeReader(object):
+    """The file-like reading end of a :class:`_Pipe`.
+
+    Args:
+        pipe (_Pipe): The pipe.
+    """
+
+    def __init__(self, pipe):
+        self._pipe = pipe
+
+    def read(self, size):
+        return self._pipe.read(size)
+
+    def tell(self):
+        return self._pipe.bytes_read
+
+
+def _dataframe_to_arrow_schema(dataframe, sample_rows):
+    """Infer the Arrow schema of a DataFrame from a sample of its rows.
+
+    The schema is inferred from the first ``sample_rows`` rows. Columns
+    which are all null in those rows take their type from the first rows
+    in which they are not null.
+
+    Args:
+        dataframe (pandas.DataFrame): The DataFrame.
+        sample_rows (int): The number of rows to infer types from.
+
+    Returns:
+        pyarrow.Schema: The schema to write all of the rows with.
+    """
+    schema = pyarrow.Table.from_pandas(dataframe.iloc[:sample_rows]).schema
+    for index, field in enumerate(schema):
+        if field.type != pyarrow.null() or field.name not in dataframe:
+            continue
+        column = dataframe[field.name]
+        not_null = column.notnull().values
+        if not not_null.any():
+            continue
+        start = not_null.argmax()
+        sample = column.iloc[start:start + sample_rows]
+        schema = schema.set(index, pyarrow.field(
+            field.name, pyarrow.Array.from_pandas(sample).type))
+    return schema
+
+
+def _write_parquet_row_groups(dataframe, pipe, row_group_size):
+    """Write a DataFrame to a pipe as Parquet, one row group at a time.
+
+    Runs in a background thread. Errors are passed on to the reader of
+    the pipe.
+
+    Args:
+        dataframe (pandas.DataFrame): The DataFrame to write.
+        pipe (_Pipe): The pipe to write to.
+        row_group_size (int): The number of rows in each row group.
+    """
+    try:
+        schema = _dataframe_to_arrow_schema(dataframe, row_group_size)
+        writer = pyarrow.parquet.ParquetWriter(_PipeWriter(pipe), schema)
+        for start in six.moves.range(0, len(dataframe), row_group_size):
+            row_group = pyarrow.Table.from_pandas(
+                dataframe.iloc[start:start + row_group_size], schema=schema)
+            # The pandas metadata is regenerated for each slice, so keep
+            # the file's copy to match the writer's schema.
+            writer.write_table(
+                row_group.replace_schema_metadata(schema.metadata))
+        writer.close()
+    except Exception as exc:
+        pipe.close_write(exception=exc)
+    else:
+        pipe.close_write()
+
+
+class ParquetStream(object):
+    """Encode a DataFrame as Parquet in a background thread.
+
+    The encoded bytes are read through :attr:`reader` while row groups
+    are still being encoded, so that encoding overlaps with uploading.
+
+    Args:
+        dataframe (pandas.DataFrame): The DataFrame to encode.
+        row_group_size (int): The number of rows in each row group.
+        max_buffer_size (int):
+            The maximum number of encoded bytes to buffer. Must be at least
+            the size of the reads from :attr:`reader`.
+
+    Raises:
+        ValueError: If the :mod:`pyarrow` library cannot be imported.
+    """
+
+    def __init__(self, dataframe, row_group_size, max_buffer_size):
+        if pyarrow is None:
+            raise ValueError(_NO_PYARROW_ERROR)
+        self._pipe = _Pipe(max_buffer_size)
+        self.reader = _PipeReader(self._pipe)
+        self._thread = threading.Thread(
+            name='Thread-ParquetStreamWriter',
+            target=_write_parquet_row_groups,
+            args=(dataframe, self._pipe, row_group_size))
+        self._thread.daemon = True
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Unblock the writer if the upload stopped before reading it all.
+        self._pipe.close_read()
+        self._thread.join()
+
+
+def _timestamp_column_to_json(values):
+    """Convert ``datetime64`` values to floating-point seconds."""
+    return (values.astype('datetime64[us]').view('i8') * 1e-6).astype(object)
+
+
+def _datetime_column_to_json(values):
+    """Convert ``datetime64`` values to ``DATETIME`` strings."""
+    return numpy.datetime_as_string(
+        values.astype('datetime64[us]'), unit='us').astype(object)
+
+
+def _date_column_to_json(values):
+    """Convert ``datetime64`` values to ``DATE`` strings."""
+    return numpy.datetime_as_string(
+        values.astype('datetime64[D]'), unit='D').astype(object)
+
+
+def _bool_column_to_json(values):
+    """Convert boolean values to ``'true'`` / ``'false'`` strings."""
+    return numpy.where(values, 'true', 'false').astype(object)
+
+
+def _int_column_to_json(values):
+    """Convert integer values to decimal strings."""
+    return values.astype(str).astype(object)
+
+
+def _float_as_int_column_to_json(values):
+    """Convert integral floating-point values, as when NaN is present.
+
+    NaN values are converted to ``None``.
+
+    Raises:
+        ValueError: If a value is not an integer.
+    """
+    nulls = numpy.isnan(values)
+    filled = numpy.where(nulls, 0.0, values)
+    invalid = ~numpy.isfinite(filled) | (filled != numpy.floor(filled))
+    if invalid.any():
+        raise ValueError(
+            'Cannot convert non-integral values to INTEGER: {}'.format(
+                values[invalid][:5].tolist()))
+    converted = filled.astype('i8').astype(str).astype(object)
+    converted[nulls] = None
+    return converted
+
+
+def _float_column_to_json(values):
+    """Convert floating-point values to Python floats."""
+    return values.astype(object)
+
+
+# Converters for whole columns, keyed by field type and then by the kind of
+# the column's NumPy dtype. Other columns are converted one value at a time.
+_COLUMN_TO_JSON = {
+    'INTEGER': {
+        'i': _int_column_to_json, 'u': _int_column_to_json,
+        'f': _float_as_int_column_to_json},
+    'INT64': {
+        'i': _int_column_to_json, 'u': _int_column_to_json,
+        'f': _float_as_int_column_to_json},
+    'FLOAT': {
+        'f': _float_column_to_json, 'i': _float_column_to_json,
+        'u': _float_column_to_json},
+    'FLOAT64': {
+        'f': _float_column_to_json, 'i': _float_column_to_json,
+        'u': _float_column_to_json},
+    'BOOLEAN': {'b': _bool_column_to_json},
+    'BOOL': {'b': _bool_column_to_json},
+    'TIMESTAMP': {'M': _timestamp_column_to_json},
+    'DATETIME': {'M': _datetime_column_to_json},
+    'DATE': {'M': _date_column_to_json},
+}
+
+
+def _series_to_json(series, field):
+    """Convert a DataFrame column to JSON-compatible ``insertAll`` values.
+
+    Args:
+        series (pandas.Series): The column.
+        field (google.cloud.bigquery.schema.SchemaField):
+            The field the column is inserted into.
+
+    Returns:
+        List: The JSON-compatible values, with ``None`` for null values.
+    """
+    # Timezone-aware columns are converted to UTC by ``Series.values``.
+    values = series.values
+    nulls = series.isnull().values
+    converter = _COLUMN_TO_JSON.get(field.field_type, {}).get(
+        values.dtype.kind)
+
+    if converter is not None:
+        converted = converter(values)
+    else:
+        scalar_converter = _helpers._SCALAR_VALUE_TO_JSON_ROW.get(
+            field.field_type)
+        # ``tolist`` turns NumPy scalars into the Python types the scalar
+        # converters expect.
+        converted = numpy.empty(len(values), dtype=object)
+        converted[:] = [
+            scalar_converter(value) if scalar_converter else value
+            for value in series.tolist()]
+
+    if nulls.any():
+        converted[nulls] = None
+    return converted.tolist()
+
+
+def dataframe_to_json_rows(dataframe, schema, chunk_size):
+    """Convert a DataFrame to ``insertAll`` rows, in chunks.
+
+    Each column is converted as a whole before any rows are built.
+
+    Args:
+        dataframe (pandas.DataFrame): The rows to convert.
+        schema (Sequence[google.cloud.bigquery.schema.SchemaField]):
+            The fields of the destination table. Fields with no matching
+            column are left out of the rows.
+        chunk_size (int): The number of rows in each chunk.
+
+    Yields:
+        List[Dict[str, object]]: The JSON-compatible rows of each chunk.
+
+    Raises:
+        ValueError:
+            If a ``REQUIRED`` field has no column, or if :mod:`numpy`
+            cannot be imported.
+    """
+    if numpy is None:
+        raise ValueError(
+            'The numpy library is not installed, please install numpy '
+            'to convert a DataFrame to rows.')
+
+    names = []
+    columns = []
+    for field in schema:
+        if field.name not in dataframe.columns:
+            if field.mode == 'REQUIRED':
+                raise ValueError(
+                    'DataFrame has no column for required field: '
+                    '{}'.format(field.name))
+            continue
+        names.append(field.name)
+        columns.append(_series_to_json(dataframe[field.name], field))
+
+    for start in six.moves.range(0, len(dataframe), chunk_size):
+        stop = start + chunk_size
+        yield [
+            dict(zip(names, values))
+            for values in zip(*[column[start:stop] for column in columns])]
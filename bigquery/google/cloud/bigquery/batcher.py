@@ -0,0 +1,425 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Batch rows for the streaming insert API."""
+
+from __future__ import absolute_import
+
+from concurrent import futures
+import json
+import logging
+import math
+import threading
+import time
+import uuid
+
+import six
+
+from google.cloud.bigquery._helpers import _row_to_json
+from google.cloud.bigquery.retry import DEFAULT_RETRY
+from google.cloud.bigquery.table import Table
+from google.cloud.bigquery.table import TableReference
+from google.cloud.bigquery.table import _TABLE_HAS_NO_SCHEMA
+from google.cloud.bigquery.table import _row_from_mapping
+
+
+_LOGGER = logging.getLogger(__name__)
+
+# Limits of a single tabledata.insertAll request. See
+# https://cloud.google.com/bigquery/quotas#streaming_inserts
+_MAX_INSERT_ROWS = 10000
+_MAX_INSERT_BYTES = 10 * 1000 * 1000
+# Bytes reserved in each request for the envelope around the rows.
+_REQUEST_OVERHEAD_BYTES = 1000
+
+# Reasons of row errors which may succeed when the row is sent again.
+# Rows with a "stopped" error were valid, but were not inserted because
+# another row in the same request was invalid.
+_RETRYABLE_REASONS = frozenset([
+    'backendError',
+    'internalError',
+    'rateLimitExceeded',
+    'stopped',
+    'timeout',
+])
+_INITIAL_RETRY_DELAY = 1.0
+_MAX_RETRY_DELAY = 32.0
+
+
+class InsertError(Exception):
+    """A row could not be inserted.
+
+    Args:
+        errors (Sequence[Mapping[str, str]]):
+            The mappings describing the problems with the row, from the
+            ``insertErrors`` of the ``insertAll`` response.
+    """
+
+    def __init__(self, errors):
+        super(InsertError, self).__init__(
+            'Row could not be inserted: {}'.format(errors))
+        self.errors = errors
+
+
+class _InsertBatch(object):
+    """Rows waiting to be sent to a table in one ``insertAll`` request.
+
+    Args:
+        table (google.cloud.bigquery.table.TableReference):
+            The destination table.
+    """
+
+    def __init__(self, table):
+        self.table = table
+        self.created = time.time()
+        self.rows = []
+        self.row_ids = []
+        self.futures = []
+        self.size = 0
+
+
+class InsertBatcher(object):
+    """Accumulate rows per table and stream them with ``insertAll``.
+
+    Rows are sent when a table's pending batch reaches ``max_rows`` rows or
+    ``max_bytes`` bytes, or has waited ``max_latency`` seconds. Requests
+    run on a pool of ``max_workers`` threads. Each row gets an ``insertId``
+    (generated, unless given) so that BigQuery can de-duplicate rows which
+    are sent more than once. Rows which fail with a transient error are
+    sent again, up to ``max_retries`` times, without the rows of the
+    request which succeeded.
+
+    Use the batcher as a context manager, or call :meth:`close`, to send
+    the remaining rows and release its threads.
+
+    Args:
+        client (google.cloud.bigquery.client.Client):
+            The client used to send requests.
+        max_rows (int):
+            (Optional) The maximum number of rows per request. Capped at
+            the ``insertAll`` limit of 10,000 rows.
+        max_bytes (int):
+            (Optional) The maximum size of the rows of a request, in bytes,
+            as encoded in JSON. Capped at the ``insertAll`` limit of 10 MB.
+        max_latency (float):
+            (Optional) The maximum time, in seconds, a row waits in a
+            batch before it is sent. Pass ``float('inf')`` to send batches
+            only when they are full or flushed.
+        max_workers (int):
+            (Optional) The maximum number of concurrent requests.
+        max_retries (int):
+            (Optional) The number of times to send again rows which fail
+            with a transient error.
+        skip_invalid_rows (bool):
+            (Optional) See
+            :meth:`~google.cloud.bigquery.client.Client.insert_rows_json`.
+        ignore_unknown_values (bool):
+            (Optional) See
+            :meth:`~google.cloud.bigquery.client.Client.insert_rows_json`.
+        retry (google.api_core.retry.Retry):
+            (Optional) How to retry failed requests.
+    """
+
+    def __init__(self, client, max_rows=500, max_bytes=5 * 1000 * 1000,
+                 max_latency=0.5, max_workers=4, max_retries=3,
+                 skip_invalid_rows=None, ignore_unknown_values=None,
+                 retry=DEFAULT_RETRY):
+        self._client = client
+        self._max_rows = min(max_rows, _MAX_INSERT_ROWS)
+        self._max_bytes = min(
+            max_bytes, _MAX_INSERT_BYTES - _REQUEST_OVERHEAD_BYTES)
+        self._max_latency = max_latency
+        self._max_retries = max_retries
+        self._skip_invalid_rows = skip_invalid_rows
+        self._ignore_unknown_values = ignore_unknown_values
+        self._retry = retry
+
+        # These members are all communicated between threads; ensure that
+        # any writes to them hold the lock. The lock is reentrant, because
+        # request callbacks may run in the thread which holds it.
+        self._lock = threading.RLock()
+        self._wake_up = threading.Condition(self._lock)
+        self._batches = {}
+        self._requests = set()
+        self._closed = False
+
+        self._executor = futures.ThreadPoolExecutor(max_workers=max_workers)
+        self._thread = threading.Thread(
+            name='Thread-InsertBatcherMonitor', target=self._monitor)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def insert_rows(self, table, rows, selected_fields=None):
+        """Queue rows to insert into a table.
+
+        Args:
+            table (Union[ \
+                :class:`~google.cloud.bigquery.table.Table`, \
+                :class:`~google.cloud.bigquery.table.TableReference`, \
+                str, \
+            ]):
+                The destination table for the row data, or a reference to it.
+            rows (Union[ \
+                Sequence[Tuple], \
+                Sequence[dict], \
+            ]):
+                Row data to be inserted. See
+                :meth:`~google.cloud.bigquery.client.Client.insert_rows`.
+            selected_fields (Sequence[ \
+                :class:`~google.cloud.bigquery.schema.SchemaField`, \
+            ]):
+                The fields of the rows. Required if ``table`` is a
+                :class:`~google.cloud.bigquery.table.TableReference`.
+
+        Returns:
+            List[concurrent.futures.Future]:
+                One future per row. See :meth:`insert_rows_json`.
+
+        Raises:
+            ValueError: if table's schema is not set
+        """
+        table = self._table_reference(table)
+
+        if selected_fields is not None:
+            schema = selected_fields
+        elif isinstance(table, TableReference):
+            raise ValueError('need selected_fields with TableReference')
+        else:
+            if len(table.schema) == 0:
+                raise ValueError(_TABLE_HAS_NO_SCHEMA)
+            schema = table.schema
+
+        json_rows = []
+        for row in rows:
+            if isinstance(row, dict):
+                row = _row_from_mapping(row, schema)
+            json_rows.append(_row_to_json(row, schema))
+        return self.insert_rows_json(table, json_rows)
+
+    def insert_rows_json(self, table, json_rows, row_ids=None):
+        """Queue rows to insert into a table, without type conversions.
+
+        Args:
+            table (Union[ \
+                :class:`~google.cloud.bigquery.table.Table`, \
+                :class:`~google.cloud.bigquery.table.TableReference`, \
+                str, \
+            ]):
+                The destination table for the row data, or a reference to it.
+            json_rows (Sequence[dict]):
+                Row data to be inserted. Keys must match the table schema
+                fields and values must be JSON-compatible representations.
+            row_ids (Sequence[str]):
+                (Optional) Unique ids, one per row being inserted. If
+                omitted, unique IDs are created.
+
+        Returns:
+            List[concurrent.futures.Future]:
+                One future per row. Its result is the row's ``insertId``
+                once the row is inserted. If the row cannot be inserted, its
+                exception is an :class:`InsertError`, or the error raised by
+                the request.
+
+        Raises:
+            ValueError: if the batcher is closed.
+        """
+        table = self._table_reference(table)
+        row_futures = []
+
+        with self._lock:
+            if self._closed:
+                raise ValueError('Cannot insert rows with a closed batcher.')
+
+            for index, row in enumerate(json_rows):
+                if row_ids is not None:
+                    row_id = row_ids[index]
+                else:
+                    row_id = str(uuid.uuid4())
+                future = futures.Future()
+                row_futures.append(future)
+
+                size = len(json.dumps({'json': row, 'insertId': row_id}))
+                if size > self._max_bytes:
+                    future.set_exception(ValueError(
+                        'Row of {} bytes is larger than the maximum request '
+                        'size of {} bytes.'.format(size, self._max_bytes)))
+                    continue
+
+                batch = self._batches.get(table.path)
+                if batch is not None and batch.size + size > self._max_bytes:
+                    self._commit(table.path)
+                    batch = None
+                if batch is None:
+                    batch = self._batches[table.path] = _InsertBatch(table)
+                    self._wake_up.notify()
+
+                batch.rows.append(row)
+                batch.row_ids.append(row_id)
+                batch.futures.append(future)
+                batch.size += size
+                if len(batch.rows) >= self._max_rows:
+                    self._commit(table.path)
+
+        return row_futures
+
+    def flush(self):
+        """Send all pending rows and wait for the requests to finish."""
+        with self._lock:
+            for path in list(self._batches):
+                self._commit(path)
+            requests = list(self._requests)
+        futures.wait(requests)
+
+    def close(self):
+        """Send all pending rows and stop the batcher's threads.
+
+        Blocks until all rows have been sent.
+        """
+        self.flush()
+        with self._lock:
+            self._closed = True
+            self._wake_up.notify()
+        self._thread.join()
+        self._executor.shutdown(wait=True)
+
+    def _table_reference(self, table):
+        """Normalize a table argument.
+
+        Args:
+            table (Union[Table, TableReference, str]): The table.
+
+        Returns:
+            Union[Table, TableReference]: The table, or a reference to it.
+        """
+        if isinstance(table, six.string_types):
+            table = TableReference.from_string(
+                table, default_project=self._client.project)
+        if not isinstance(table, (Table, TableReference)):
+            raise TypeError('table should be Table or TableReference')
+        return table
+
+    def _commit(self, path):
+        """Start a request for the pending batch of a table.
+
+        Must be called with the lock held.
+
+        Args:
+            path (str): The path of the table.
+        """
+        batch = self._batches.pop(path)
+        request = self._executor.submit(self._insert, batch)
+        self._requests.add(request)
+        request.add_done_callback(self._request_done)
+
+    def _request_done(self, request):
+        """Forget a finished request.
+
+        Args:
+            request (concurrent.futures.Future): The finished request.
+        """
+        with self._lock:
+            self._requests.discard(request)
+
+    def _monitor(self):
+        """Send batches which have waited ``max_latency`` seconds.
+
+        Runs in a background thread until the batcher is closed.
+        """
+        with self._lock:
+            while not self._closed:
+                now = time.time()
+                next_deadline = None
+                for path, batch in list(six.iteritems(self._batches)):
+                    deadline = batch.created + self._max_latency
+                    if math.isinf(deadline) or math.isnan(deadline):
+                        # No deadline: wait for the batch to fill up.
+                        continue
+                    if deadline <= now:
+                        self._commit(path)
+                    elif next_deadline is None or deadline < next_deadline:
+                        next_deadline = deadline
+
+                if next_deadline is None:
+                    self._wake_up.wait()
+                else:
+                    self._wake_up.wait(next_deadline - now)
+
+    def _insert(self, batch):
+        """Send a batch of rows, retrying the rows with transient errors.
+
+        Args:
+            batch (_InsertBatch): The rows to send.
+        """
+        indexes = list(six.moves.range(len(batch.rows)))
+        delay = _INITIAL_RETRY_DELAY
+
+        for attempt in six.moves.range(self._max_retries + 1):
+            try:
+                errors = self._client.insert_rows_json(
+                    batch.table,
+                    [batch.rows[index] for index in indexes],
+                    row_ids=[batch.row_ids[index] for index in indexes],
+                    skip_invalid_rows=self._skip_invalid_rows,
+                    ignore_unknown_values=self._ignore_unknown_values,
+                    retry=self._retry)
+            except Exception as exc:
+                _LOGGER.exception(
+                    'Failed to insert %s rows into %s.',
+                    len(indexes), batch.table.path)
+                for index in indexes:
+                    batch.futures[index].set_exception(exc)
+                return
+
+            errors_by_position = {
+                error['index']: error['errors'] for error in errors}
+            retry_indexes = []
+            for position, index in enumerate(indexes):
+                row_errors = errors_by_position.get(position)
+                if row_errors is None:
+                    batch.futures[index].set_result(batch.row_ids[index])
+                elif (attempt < self._max_retries and
+                        _is_retryable(row_errors)):
+                    retry_indexes.append(index)
+                else:
+                    batch.futures[index].set_exception(
+                        InsertError(row_errors))
+
+            if not retry_indexes:
+                return
+
+            _LOGGER.debug(
+                'Retrying %s rows into %s.',
+                len(retry_indexes), batch.table.path)
+            indexes = retry_indexes
+            time.sleep(delay)
+            delay = min(delay * 2, _MAX_RETRY_DELAY)
+
+
+def _is_retryable(row_errors):
+    """Check whether a row may be inserted if it is sent again.
+
+    Args:
+        row_errors (Sequence[Mapping[str, str]]): The errors of the row.
+
+    Returns:
+        bool: True if all of the errors are transient.
+    """
+    return all(
+        error.get('reason') in _RETRYABLE_REASONS for error in row_errors)
@@ -0,0 +1,372 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Cache query results on the client."""
+
+from __future__ import absolute_import
+
+import collections
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+
+from google.cloud.bigquery import job
+from google.cloud.bigquery.query import _QueryResults
+from google.cloud.bigquery.table import RowIterator
+from google.cloud.bigquery.table import TableReference
+
+
+# Quoted strings and identifiers, whose whitespace is significant.
+_QUOTED_RE = re.compile(
+    r"""('(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|`(?:[^`\\]|\\.)*`)""")
+_WHITESPACE_RE = re.compile(r'\s+')
+_CACHE_FILE_SUFFIX = '.json'
+
+
+def _normalize_query(query):
+    """Collapse runs of whitespace outside of quoted strings.
+
+    Args:
+        query (str): A query string.
+
+    Returns:
+        str: The query with each run of unquoted whitespace replaced by a
+        single space.
+    """
+    parts = _QUOTED_RE.split(query.strip())
+    # Quoted strings are at the odd indexes of the split.
+    for index in range(0, len(parts), 2):
+        parts[index] = _WHITESPACE_RE.sub(' ', parts[index])
+    return ''.join(parts)
+
+
+class QueryCache(object):
+    """Cache the results of queries on the client.
+
+    Results are keyed on the normalized query text, the query job
+    configuration (including the API representation of its query
+    parameters and its default dataset), and the project and location of
+    the job. A hit returns a completed
+    :class:`~google.cloud.bigquery.job.QueryJob` whose ``result()`` yields
+    the cached rows without any API requests.
+
+    Only the results of ``SELECT`` queries with at most ``max_rows`` rows
+    are cached. Queries configured with a destination table, as a dry run,
+    or with ``use_query_cache`` set to ``False`` bypass the cache.
+
+    Entries expire ``ttl`` seconds after they are stored, and the least
+    recently used entries are evicted to keep the encoded results under
+    ``max_bytes``.
+
+    Args:
+        max_bytes (int):
+            (Optional) The maximum total size of the cached results, as
+            encoded in JSON.
+        ttl (float):
+            (Optional) The seconds for which results are served from the
+            cache.
+        max_rows (int):
+            (Optional) The maximum number of rows of a cached result.
+            Results with more rows are not downloaded in full to be cached.
+        directory (str):
+            (Optional) If set, store results as files in this directory
+            instead of in memory. Entries in the directory are reused
+            across processes.
+        validate_tables (bool):
+            (Optional) If ``True``, store the last modified time of each
+            table referenced by a query, and treat an entry as stale if any
+            of them have been modified since. This costs one ``tables.get``
+            request per referenced table on each hit.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, ttl=600.0,
+                 max_rows=100000, directory=None, validate_tables=False):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.max_rows = max_rows
+        self.validate_tables = validate_tables
+        self._directory = directory
+        self._lock = threading.Lock()
+        # Least recently used first: key -> (expiry time, size in bytes).
+        self._entries = collections.OrderedDict()
+        self._payloads = {}
+        self._total_bytes = 0
+        if directory is not None:
+            self._load_directory()
+
+    @property
+    def total_bytes(self):
+        """int: The total size of the cached results."""
+        return self._total_bytes
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def _key(self, query, job_config, project, location):
+        """Compute the cache key of a query.
+
+        Args:
+            query (str): The query string.
+            job_config (google.cloud.bigquery.job.QueryJobConfig):
+                (Optional) The configuration of the query job.
+            project (str): The project of the query job.
+            location (str): The location of the query job.
+
+        Returns:
+            Optional[str]:
+                The cache key, or ``None`` if the query bypasses the cache.
+        """
+        config = {}
+        if job_config is not None:
+            if (job_config.destination is not None or job_config.dry_run or
+                    job_config.use_query_cache is False):
+                return None
+            config = job_config.to_api_repr()
+        key_parts = [project, location, _normalize_query(query), config]
+        encoded = json.dumps(key_parts, sort_keys=True).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _get_job(self, client, key):
+        """Get a completed query job from the cache.
+
+        Args:
+            client (google.cloud.bigquery.client.Client):
+                The client of the returned job.
+            key (str): The cache key of the query.
+
+        Returns:
+            Optional[google.cloud.bigquery.job.QueryJob]:
+                A completed job, with all of its rows, or ``None`` if the
+                query is not in the cache.
+        """
+        entry = self._get(key)
+        if entry is None:
+            return None
+
+        if self.validate_tables:
+            for table_id, modified in entry['tables']:
+                table = client.get_table(TableReference.from_string(table_id))
+                if table._properties.get('lastModifiedTime') != modified:
+                    with self._lock:
+                        if key in self._entries:
+                            self._remove(key)
+                    return None
+
+        query_job = job.QueryJob.from_api_repr(entry['job'], client)
+        query_job._query_results = _QueryResults.from_api_repr(
+            entry['queryResults'])
+        query_job._results_cached = True
+        return query_job
+
+    def _put_job(self, query_job, key, retry):
+        """Download all the rows of a completed query job and cache them.
+
+        Args:
+            query_job (google.cloud.bigquery.job.QueryJob):
+                A completed job, with its first page of results.
+            key (str): The cache key of the query.
+            retry (google.api_core.retry.Retry):
+                How to retry the calls that retrieve rows.
+
+        Returns:
+            Optional[google.cloud.bigquery.query._QueryResults]:
+                The query results, with all of the rows, or ``None`` if the
+                results are not cacheable.
+        """
+        query_results = query_job._query_results
+        statement_type = query_job.statement_type
+        if statement_type is not None and statement_type.upper() != 'SELECT':
+            return None
+        if (query_results.total_rows is None or
+                query_results.total_rows > self.max_rows):
+            return None
+
+        client = query_job._client
+        rows_iter = client._list_rows_from_query_results(
+            query_results, query_job.destination, retry=retry,
+            max_results=None, page_size=None, max_workers=None,
+            prefetch_pages=None)
+        rows = []
+        for page in rows_iter.pages:
+            rows.extend(page._rows_json)
+
+        resource = dict(query_results._properties)
+        resource.pop('pageToken', None)
+        resource['rows'] = rows
+
+        tables = []
+        if self.validate_tables:
+            for table_ref in query_job.referenced_tables:
+                table = client.get_table(table_ref)
+                tables.append([
+                    '{}.{}.{}'.format(
+                        table_ref.project, table_ref.dataset_id,
+                        table_ref.table_id),
+                    table._properties.get('lastModifiedTime'),
+                ])
+
+        self._put(key, {
+            'job': query_job._properties,
+            'queryResults': resource,
+            'tables': tables,
+        })
+        return _QueryResults.from_api_repr(resource)
+
+    def _list_rows(self, query_job, max_results=None, page_size=None):
+        """List the cached rows of a query job.
+
+        Args:
+            query_job (google.cloud.bigquery.job.QueryJob):
+                A job whose query results hold all of its rows.
+            max_results (int): (Optional) The maximum number of rows to
+                return.
+            page_size (int): (Optional) The maximum number of rows in each
+                page of the iterator.
+
+        Returns:
+            google.cloud.bigquery.table.RowIterator:
+                Iterator over the cached rows, without any API requests.
+        """
+        query_results = query_job._query_results
+        rows = query_results._properties.get('rows', [])
+        if max_results is not None:
+            rows = rows[:max_results]
+        page_size = page_size or max(len(rows), 1)
+
+        def get_page(start):
+            resource = dict(query_results._properties)
+            resource['rows'] = rows[start:start + page_size]
+            if start + page_size < len(rows):
+                resource['pageToken'] = str(start + page_size)
+            return resource
+
+        def api_request(method, path, query_params):
+            return get_page(int(query_params['pageToken']))
+
+        return RowIterator(
+            client=query_job._client,
+            api_request=api_request,
+            path='%s/data' % (query_job.destination.path,),
+            schema=query_results.schema,
+            page_size=page_size,
+            first_page_response=get_page(0))
+
+    def _get(self, key):
+        """Get an unexpired entry, marking it as recently used."""
+        with self._lock:
+            if key not in self._entries:
+                return None
+            expires, size = self._entries.pop(key)
+            self._entries[key] = (expires, size)
+            if expires <= time.time():
+                self._remove(key)
+                return None
+            payload = self._read(key)
+
+        if payload is None:
+            return None
+        return json.loads(payload.decode('utf-8'))
+
+    def _put(self, key, entry):
+        """Store an entry, evicting the least recently used ones."""
+        payload = json.dumps(entry).encode('utf-8')
+        if len(payload) > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            while self._entries and (
+                    self._total_bytes + len(payload) > self.max_bytes):
+                self._remove(next(iter(self._entries)))
+            self._write(key, payload)
+            self._entries[key] = (time.time() + self.ttl, len(payload))
+            self._total_bytes += len(payload)
+
+    def _remove(self, key):
+        """Remove an entry. Must be called with the lock held."""
+        _, size = self._entries.pop(key)
+        self._total_bytes -= size
+        if self._directory is None:
+            del self._payloads[key]
+        else:
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def _path(self, key):
+        return os.path.join(self._directory, key + _CACHE_FILE_SUFFIX)
+
+    def _read(self, key):
+        """Read the payload of an entry. Must be called with the lock held."""
+        if self._directory is None:
+            return self._payloads[key]
+
+        try:
+            with open(self._path(key), 'rb') as file_obj:
+                payload = file_obj.read()
+        except (OSError, IOError):
+            payload = None
+        if not payload:
+            # Removed by another process, or empty.
+            self._remove(key)
+            return None
+        return payload
+
+    def _write(self, key, payload):
+        """Write the payload of an entry. Must be called with the lock held.
+        """
+        if self._directory is None:
+            self._payloads[key] = payload
+            return
+
+        # Write to a temporary file first, so that readers in other
+        # processes never see a partially written entry.
+        handle, temp_path = tempfile.mkstemp(dir=self._directory)
+        with os.fdopen(handle, 'wb') as file_obj:
+            file_obj.write(payload)
+        os.rename(temp_path, self._path(key))
+
+    def _load_directory(self):
+        """Index the unexpired entries stored in the cache directory."""
+        now = time.time()
+        found = []
+        for name in os.listdir(self._directory):
+            if not name.endswith(_CACHE_FILE_SUFFIX):
+                continue
+            path = os.path.join(self._directory, name)
+            stat = os.stat(path)
+            found.append((stat.st_mtime, name[:-len(_CACHE_FILE_SUFFIX)],
+                          stat.st_size))
+
+        for mtime, key, size in sorted(found):
+            self._entries[key] = (mtime + self.ttl, size)
+            self._total_bytes += size
+        with self._lock:
+            for key, (expires, _) in list(self._entries.items()):
+                if expires <= now:
+                    self._remove(key)
+            while self._total_bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
@@ -17,6 +17,7 @@
 from __future__ import absolute_import
 
 import collections
+from concurrent import futures
 import functools
 import gzip
 import os
@@ -33,7 +34,8 @@ import google.cloud._helpers
 from google.cloud import exceptions
 from google.cloud.client import ClientWithProject
 
-from google.cloud.bigquery._helpers import _SCALAR_VALUE_TO_JSON_ROW
+from google.cloud.bigquery import _pandas_helpers
+from google.cloud.bigquery._helpers import _row_to_json
 from google.cloud.bigquery._helpers import _str_or_none
 from google.cloud.bigquery._http import Connection
 from google.cloud.bigquery.dataset import Dataset
@@ -48,6 +50,7 @@ from google.cloud.bigquery.table import TableReference
 from google.cloud.bigquery.table import RowIterator
 from google.cloud.bigquery.table import _TABLE_HAS_NO_SCHEMA
 from google.cloud.bigquery.table import _row_from_mapping
+from google.cloud.bigquery.waiter import JobWaiter
 
 
 _DEFAULT_CHUNKSIZE = 1048576  # 1024 * 1024 B = 1 MB
@@ -113,6 +116,10 @@ class Client(ClientWithProject):
         default_query_job_config (google.cloud.bigquery.job.QueryJobConfig):
             (Optional) Default ``QueryJobConfig``.
             Will be merged into job configs passed into the ``query`` method.
+        query_cache (google.cloud.bigquery.cache.QueryCache):
+            (Optional) A cache of query results. If set, the ``query``
+            method returns cached results of identical queries without
+            running a new job.
 
     Raises:
         google.auth.exceptions.DefaultCredentialsError:
@@ -126,11 +133,13 @@ class Client(ClientWithProject):
 
     def __init__(
             self, project=None, credentials=None, _http=None,
-            location=None, default_query_job_config=None):
+            location=None, default_query_job_config=None,
+            query_cache=None):
         super(Client, self).__init__(
             project=project, credentials=credentials, _http=_http)
         self._connection = Connection(self)
         self._location = location
+        self._query_cache = query_cache
         self._default_query_job_config = default_query_job_config
 
     @property
@@ -586,7 +595,8 @@ class Client(ClientWithProject):
         self._call_api(retry, method='DELETE', path=table.path)
 
     def _get_query_results(
-            self, job_id, retry, project=None, timeout_ms=None, location=None):
+            self, job_id, retry, project=None, timeout_ms=None, location=None,
+            max_results=0):
         """Get the query results object for a query job.
 
         Arguments:
@@ -600,13 +610,21 @@ class Client(ClientWithProject):
                 (Optional) number of milliseconds the the API call should
                 wait for the query to complete before the request times out.
             location (str): Location of the query job.
+            max_results (int):
+                (Optional) maximum number of rows to include in the response
+                once the query is complete. Defaults to ``0``, so that no rows
+                are returned. If ``None``, the server's default page size is
+                used.
 
         Returns:
             google.cloud.bigquery.query._QueryResults:
                 A new ``_QueryResults`` instance.
         """
 
-        extra_params = {'maxResults': 0}
+        extra_params = {}
+
+        if max_results is not None:
+            extra_params['maxResults'] = max_results
 
         if project is None:
             project = self.project
@@ -739,6 +757,42 @@ class Client(ClientWithProject):
 
         return self.job_from_resource(resource['job'])
 
+    def wait_jobs(self, jobs, timeout=None,
+                  return_when=futures.ALL_COMPLETED, retry=DEFAULT_RETRY):
+        """Wait for jobs to complete, polling them from a single thread.
+
+        Unlike calling ``result()`` on each job, which blocks a thread per
+        job, the jobs are polled by a
+        :class:`~google.cloud.bigquery.waiter.JobWaiter` at intervals
+        adapted to how long each job has been running. To wait for jobs
+        as they are started, use a
+        :class:`~google.cloud.bigquery.waiter.JobWaiter` directly.
+
+        Args:
+            jobs (Sequence[google.cloud.bigquery.job._AsyncJob]):
+                Jobs which have been started.
+            timeout (float):
+                (Optional) The maximum seconds to wait. If ``None``, wait
+                until ``return_when`` is satisfied.
+            return_when (str):
+                (Optional) When to return, as for
+                :func:`concurrent.futures.wait`: one of
+                ``concurrent.futures.FIRST_COMPLETED``,
+                ``FIRST_EXCEPTION`` or ``ALL_COMPLETED``.
+            retry (google.api_core.retry.Retry):
+                (Optional) How to retry each poll.
+
+        Returns:
+            Tuple[List[google.cloud.bigquery.job._AsyncJob], \
+                  List[google.cloud.bigquery.job._AsyncJob]]:
+                The jobs which are done, and the jobs which are not, each in
+                the order given. Call ``result()`` on a done job to get its
+                result or error without polling again.
+        """
+        with JobWaiter(retry=retry) as waiter:
+            return waiter.wait(
+                jobs, timeout=timeout, return_when=return_when)
+
     def list_jobs(
             self, project=None, max_results=None, page_token=None,
             all_users=None, state_filter=None, retry=DEFAULT_RETRY,
@@ -972,7 +1026,7 @@ class Client(ClientWithProject):
                                   num_retries=_DEFAULT_NUM_RETRIES,
                                   job_id=None, job_id_prefix=None,
                                   location=None, project=None,
-                                  job_config=None):
+                                  job_config=None, row_group_size=None):
         """Upload the contents of a table from a pandas DataFrame.
 
         Similar to :meth:`load_table_from_uri`, this method creates, starts and
@@ -1007,6 +1061,13 @@ class Client(ClientWithProject):
                 to the client's project.
             job_config (google.cloud.bigquery.job.LoadJobConfig, optional):
                 Extra configuration options for the job.
+            row_group_size (int, optional):
+                If set, stream the :class:`~pandas.DataFrame` to the upload
+                as Parquet row groups of this many rows, encoding in a
+                background thread while earlier row groups are uploaded.
+                At most one upload chunk of encoded data is buffered, rather
+                than a copy of the whole file. Column types are inferred
+                from the first row group.
 
         Returns:
             google.cloud.bigquery.job.LoadJob: A new load job.
@@ -1015,10 +1076,10 @@ class Client(ClientWithProject):
             ImportError:
                 If a usable parquet engine cannot be found. This method
                 requires :mod:`pyarrow` to be installed.
+            ValueError:
+                If ``row_group_size`` is set and :mod:`pyarrow` cannot be
+                imported.
         """
-        buffer = six.BytesIO()
-        dataframe.to_parquet(buffer)
-
         if job_config is None:
             job_config = job.LoadJobConfig()
         job_config.source_format = job.SourceFormat.PARQUET
@@ -1026,6 +1087,23 @@ class Client(ClientWithProject):
         if location is None:
             location = self.location
 
+        if row_group_size is not None:
+            with _pandas_helpers.ParquetStream(
+                    dataframe, row_group_size,
+                    _DEFAULT_CHUNKSIZE) as parquet_stream:
+                return self.load_table_from_file(
+                    parquet_stream.reader, destination,
+                    num_retries=num_retries,
+                    job_id=job_id,
+                    job_id_prefix=job_id_prefix,
+                    location=location,
+                    project=project,
+                    job_config=job_config,
+                )
+
+        buffer = six.BytesIO()
+        dataframe.to_parquet(buffer)
+
         return self.load_table_from_file(
             buffer, destination,
             num_retries=num_retries,
@@ -1318,7 +1396,10 @@ class Client(ClientWithProject):
                 (Optional) How to retry the RPC.
 
         Returns:
-            google.cloud.bigquery.job.QueryJob: A new query job instance.
+            google.cloud.bigquery.job.QueryJob:
+                A new query job instance, or a completed job with cached
+                results if the client has a ``query_cache`` which holds the
+                results of the query.
         """
         job_id = _make_job_id(job_id, job_id_prefix)
 
@@ -1339,9 +1420,19 @@ class Client(ClientWithProject):
             else:
                 job_config = self._default_query_job_config
 
+        cache_key = None
+        if self._query_cache is not None:
+            cache_key = self._query_cache._key(
+                query, job_config, project, location)
+            if cache_key is not None:
+                cached_job = self._query_cache._get_job(self, cache_key)
+                if cached_job is not None:
+                    return cached_job
+
         job_ref = job._JobReference(job_id, project=project, location=location)
         query_job = job.QueryJob(
             job_ref, query, client=self, job_config=job_config)
+        query_job._cache_key = cache_key
         query_job._begin(retry=retry)
 
         return query_job
@@ -1407,17 +1498,83 @@ class Client(ClientWithProject):
         for index, row in enumerate(rows):
             if isinstance(row, dict):
                 row = _row_from_mapping(row, schema)
-            json_row = {}
+            json_rows.append(_row_to_json(row, schema))
 
-            for field, value in zip(schema, row):
-                converter = _SCALAR_VALUE_TO_JSON_ROW.get(field.field_type)
-                if converter is not None:  # STRING doesn't need converting
-                    value = converter(value)
-                json_row[field.name] = value
+        return self.insert_rows_json(table, json_rows, **kwargs)
 
-            json_rows.append(json_row)
+    def insert_rows_from_dataframe(self, table, dataframe,
+                                   selected_fields=None, chunk_size=500,
+                                   **kwargs):
+        """Insert the rows of a DataFrame into a table via the streaming API.
 
-        return self.insert_rows_json(table, json_rows, **kwargs)
+        Columns are converted to JSON-compatible values a whole column at
+        a time, rather than one value at a time as in :meth:`insert_rows`.
+        The rows are then sent in chunks through :meth:`insert_rows_json`.
+
+        Args:
+            table (Union[ \
+                :class:`~google.cloud.bigquery.table.Table`, \
+                :class:`~google.cloud.bigquery.table.TableReference`, \
+                str, \
+            ]):
+                The destination table for the row data, or a reference to it.
+            dataframe (pandas.DataFrame):
+                A :class:`~pandas.DataFrame` containing the data to insert.
+                Columns are matched to schema fields by name. Columns which
+                do not correspond to a field in the schema are ignored.
+            selected_fields (Sequence[ \
+                :class:`~google.cloud.bigquery.schema.SchemaField`, \
+            ]):
+                The fields to return. Required if ``table`` is a
+                :class:`~google.cloud.bigquery.table.TableReference`.
+            chunk_size (int):
+                The number of rows to send in each ``insertAll`` request.
+            kwargs (dict):
+                Keyword arguments to
+                :meth:`~google.cloud.bigquery.client.Client.insert_rows_json`.
+                If ``row_ids`` is given, it must have one ID per row of
+                ``dataframe``.
+
+        Returns:
+            Sequence[Mappings]:
+                One mapping per row with insert errors: the "index" key
+                identifies the row by its position in ``dataframe``, and the
+                "errors" key contains a list of the mappings describing one
+                or more problems with the row.
+
+        Raises:
+            ValueError: if table's schema is not set
+        """
+        if isinstance(table, str):
+            table = TableReference.from_string(
+                table, default_project=self.project)
+
+        if selected_fields is not None:
+            schema = selected_fields
+        elif isinstance(table, TableReference):
+            raise ValueError('need selected_fields with TableReference')
+        elif isinstance(table, Table):
+            if len(table.schema) == 0:
+                raise ValueError(_TABLE_HAS_NO_SCHEMA)
+            schema = table.schema
+        else:
+            raise TypeError('table should be Table or TableReference')
+
+        row_ids = kwargs.pop('row_ids', None)
+        errors = []
+        start = 0
+
+        for json_rows in _pandas_helpers.dataframe_to_json_rows(
+                dataframe, schema, chunk_size):
+            stop = start + len(json_rows)
+            if row_ids is not None:
+                kwargs['row_ids'] = row_ids[start:stop]
+            for error in self.insert_rows_json(table, json_rows, **kwargs):
+                error = dict(error, index=error['index'] + start)
+                errors.append(error)
+            start = stop
+
+        return errors
 
     def insert_rows_json(self, table, json_rows, row_ids=None,
                          skip_invalid_rows=None, ignore_unknown_values=None,
@@ -1533,7 +1690,7 @@ class Client(ClientWithProject):
 
     def list_rows(self, table, selected_fields=None, max_results=None,
                   page_token=None, start_index=None, page_size=None,
-                  retry=DEFAULT_RETRY):
+                  retry=DEFAULT_RETRY, max_workers=None, prefetch_pages=None):
         """List the rows of the table.
 
         See
@@ -1574,6 +1731,15 @@ class Client(ClientWithProject):
                 the iterator.
             retry (:class:`google.api_core.retry.Retry`):
                 (Optional) How to retry the RPC.
+            max_workers (int):
+                (Optional) If set, fetch the pages after the first one
+                concurrently, by ``startIndex``, using this many threads.
+                Rows are still returned in order. Rows added to the table
+                after the first page is fetched are not returned.
+            prefetch_pages (int):
+                (Optional) The maximum number of pages to fetch ahead of the
+                page being consumed when ``max_workers`` is set. Defaults to
+                ``max_workers``.
 
         Returns:
             google.cloud.bigquery.table.RowIterator:
@@ -1614,7 +1780,53 @@ class Client(ClientWithProject):
             page_token=page_token,
             max_results=max_results,
             page_size=page_size,
-            extra_params=params)
+            extra_params=params,
+            max_workers=max_workers,
+            prefetch_pages=prefetch_pages)
+        return row_iterator
+
+    def _list_rows_from_query_results(
+            self, query_results, destination, retry=DEFAULT_RETRY,
+            max_results=None, page_size=None, max_workers=None,
+            prefetch_pages=None):
+        """List the rows of a query's destination table.
+
+        The rows already included in the ``getQueryResults`` response are
+        used as the first page, so only the following pages are fetched
+        from ``tabledata.list``.
+
+        Args:
+            query_results (google.cloud.bigquery.query._QueryResults):
+                The results of a completed query.
+            destination (google.cloud.bigquery.table.TableReference):
+                The query's destination table.
+            retry (:class:`google.api_core.retry.Retry`):
+                (Optional) How to retry the RPC.
+            max_results (int):
+                (Optional) maximum number of rows to return.
+            page_size (int):
+                (Optional) The maximum number of items to return per page in
+                the iterator.
+            max_workers (int):
+                (Optional) See :meth:`list_rows`.
+            prefetch_pages (int):
+                (Optional) See :meth:`list_rows`.
+
+        Returns:
+            google.cloud.bigquery.table.RowIterator:
+                Iterator of row data
+                :class:`~google.cloud.bigquery.table.Row`-s.
+        """
+        row_iterator = RowIterator(
+            client=self,
+            api_request=functools.partial(self._call_api, retry),
+            path='%s/data' % (destination.path,),
+            schema=query_results.schema,
+            max_results=max_results,
+            page_size=page_size,
+            max_workers=max_workers,
+            prefetch_pages=prefetch_pages,
+            first_page_response=query_results._properties)
         return row_iterator
 
 
@@ -17,8 +17,13 @@
 import collections
 
 import six
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
 
 from google.cloud.bigquery import job
+from google.cloud.bigquery import table
 from google.cloud.bigquery.dbapi import _helpers
 from google.cloud.bigquery.dbapi import exceptions
 import google.cloud.exceptions
@@ -51,6 +56,13 @@ class Cursor(object):
         # Per PEP 249: The arraysize attribute defaults to 1, meaning to fetch
         # a single row at a time.
         self.arraysize = 1
+        # The number of rows per ``tabledata.list`` request, independent of
+        # ``arraysize``. ``None`` lets the server choose the page size.
+        self.page_size = None
+        # The number of pages to fetch in the background while the current
+        # page is being consumed. ``0`` (the default) fetches each page on
+        # demand.
+        self.prefetch_pages = 0
         self._query_data = None
         self._query_job = None
 
@@ -185,17 +197,22 @@ class Cursor(object):
             self._query_job.statement_type
             and self._query_job.statement_type.upper() != 'SELECT')
         if is_dml:
-            self._query_data = iter([])
+            self._query_data = _QueryPages(iter([]))
             return
 
         if self._query_data is None:
             client = self.connection._client
+            max_workers = None
+            if self.prefetch_pages:
+                max_workers = self.prefetch_pages
             rows_iter = client.list_rows(
                 self._query_job.destination,
                 selected_fields=self._query_job._query_results.schema,
-                page_size=self.arraysize
+                page_size=self.page_size,
+                max_workers=max_workers,
+                prefetch_pages=max_workers,
             )
-            self._query_data = iter(rows_iter)
+            self._query_data = _QueryPages(iter(rows_iter.pages))
 
     def fetchone(self):
         """Fetch a single row from the results of the last ``execute*()`` call.
@@ -208,18 +225,18 @@ class Cursor(object):
             if called before ``execute()``.
         """
         self._try_fetch()
-        try:
-            return six.next(self._query_data)
-        except StopIteration:
+        rows = self._query_data.rows(1)
+        if not rows:
             return None
+        return rows[0]
 
     def fetchmany(self, size=None):
         """Fetch multiple results from the last ``execute*()`` call.
 
         .. note::
             The size parameter is not used for the request/response size.
-            Set the ``arraysize`` attribute before calling ``execute()`` to
-            set the batch size.
+            Set the ``page_size`` attribute before calling ``execute()`` to
+            set the number of rows per request.
 
         :type size: int
         :param size:
@@ -235,14 +252,7 @@ class Cursor(object):
             size = self.arraysize
 
         self._try_fetch(size=size)
-        rows = []
-
-        for row in self._query_data:
-            rows.append(row)
-            if len(rows) >= size:
-                break
-
-        return rows
+        return self._query_data.rows(size)
 
     def fetchall(self):
         """Fetch all remaining results from the last ``execute*()`` call.
@@ -253,7 +263,57 @@ class Cursor(object):
             if called before ``execute()``.
         """
         self._try_fetch()
-        return list(self._query_data)
+        return self._query_data.rows()
+
+    def fetch_dataframe_batches(self, dtypes=None):
+        """Fetch the remaining results as one DataFrame per page.
+
+        Each page is decoded column-wise, as in
+        :meth:`~google.cloud.bigquery.table.RowIterator.to_dataframe`,
+        without creating a row object per record. Rows already returned by
+        the ``fetch*()`` methods are skipped.
+
+        :type dtypes: Map[str, Union[str, pandas.Series.dtype]]
+        :param dtypes: (Optional) A dictionary of column names to pandas
+                       ``dtype`` values, used instead of the ``dtype``
+                       derived from the column's schema type.
+
+        :rtype: Iterator[pandas.DataFrame]
+        :returns: A generator of DataFrames, one per page of results.
+        :raises: :class:`~google.cloud.bigquery.dbapi.InterfaceError`
+            if called before ``execute()``, or if the :mod:`pandas` library
+            cannot be imported.
+        """
+        if table.pandas is None:
+            raise exceptions.InterfaceError(table._NO_PANDAS_ERROR)
+        if dtypes is None:
+            dtypes = {}
+
+        self._try_fetch()
+        schema = self._query_job._query_results.schema or ()
+        column_names = [field.name for field in schema]
+        for rows_json in self._query_data.pages_json():
+            columns = table._rows_page_columns(schema, rows_json)
+            yield table._columns_to_dataframe(column_names, columns, dtypes)
+
+    def fetch_arrow_batches(self):
+        """Fetch the remaining results as one Arrow record batch per page.
+
+        Rows already returned by the ``fetch*()`` methods are skipped.
+
+        :rtype: Iterator[pyarrow.RecordBatch]
+        :returns: A generator of record batches, one per page of results.
+        :raises: :class:`~google.cloud.bigquery.dbapi.InterfaceError`
+            if called before ``execute()``, or if the :mod:`pandas` or
+            :mod:`pyarrow` libraries cannot be imported.
+        """
+        if pyarrow is None:
+            raise exceptions.InterfaceError(
+                'The pyarrow library is not installed, please install '
+                'pyarrow to use the fetch_arrow_batches() function.')
+
+        for frame in self.fetch_dataframe_batches():
+            yield pyarrow.RecordBatch.from_pandas(frame, preserve_index=False)
 
     def setinputsizes(self, sizes):
         """No-op."""
@@ -262,6 +322,64 @@ class Cursor(object):
         """No-op."""
 
 
+class _QueryPages(object):
+    """Rows of the pages of query results, consumed in slices.
+
+    :type pages: Iterator[:class:`~google.api_core.page_iterator.Page`]
+    :param pages: The pages of results.
+    """
+
+    def __init__(self, pages):
+        self._pages = pages
+        # The current page, and its rows once converted.
+        self._page = None
+        self._page_rows = []
+        self._offset = 0
+
+    def _clear_page(self):
+        self._page = None
+        self._page_rows = []
+        self._offset = 0
+
+    def rows(self, size=None):
+        """Take rows, slicing them from the converted pages.
+
+        :type size: int
+        :param size: (Optional) The maximum number of rows. Defaults to all
+                     remaining rows.
+
+        :rtype: List[:class:`~google.cloud.bigquery.table.Row`]
+        :returns: Up to ``size`` rows.
+        """
+        rows = []
+        while size is None or len(rows) < size:
+            if self._offset >= len(self._page_rows):
+                self._clear_page()
+                self._page = six.next(self._pages, None)
+                if self._page is None:
+                    break
+                self._page_rows = list(self._page)
+            stop = len(self._page_rows)
+            if size is not None:
+                stop = min(stop, self._offset + size - len(rows))
+            rows.extend(self._page_rows[self._offset:stop])
+            self._offset = stop
+        return rows
+
+    def pages_json(self):
+        """Take the remaining rows as JSON, one list per page.
+
+        :rtype: Iterator[List[dict]]
+        :returns: The unconverted rows left in each page.
+        """
+        if self._offset < len(self._page_rows):
+            rows_json = self._page._rows_json[self._offset:]
+            self._clear_page()
+            yield rows_json
+        for page in self._pages:
+            yield page._rows_json
+
+
 def _format_operation_list(operation, parameters):
     """Formats parameters in operation in the way BigQuery expects.
 
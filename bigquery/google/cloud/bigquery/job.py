@@ -34,8 +34,8 @@ from google.cloud.bigquery.schema import SchemaField
 from google.cloud.bigquery.table import _EmptyRowIterator
 from google.cloud.bigquery.table import EncryptionConfiguration
 from google.cloud.bigquery.table import TableReference
-from google.cloud.bigquery.table import Table
 from google.cloud.bigquery.table import TimePartitioning
+from google.cloud.bigquery.waiter import default_waiter
 from google.cloud.bigquery import _helpers
 
 _DONE_STATE = 'DONE'
@@ -696,6 +696,33 @@ class _AsyncJob(google.api_core.future.polling.PollingFuture):
         # TODO: modify PollingFuture so it can pass a retry argument to done().
         return super(_AsyncJob, self).result(timeout=timeout)
 
+    def result_async(self, waiter=None, loop=None):
+        """Start the job and get an :mod:`asyncio` future of its result.
+
+        Rather than blocking a thread per job, the job is polled by a
+        :class:`~google.cloud.bigquery.waiter.JobWaiter`, shared by all jobs
+        unless ``waiter`` is passed. Use as ``result = await
+        job.result_async()``. Requires Python 3.
+
+        :type waiter: :class:`~google.cloud.bigquery.waiter.JobWaiter`
+        :param waiter: (Optional) The waiter which polls the job.
+
+        :type loop: :class:`asyncio.AbstractEventLoop`
+        :param loop: (Optional) The event loop of the returned future.
+                     Defaults to the current event loop.
+
+        :rtype: :class:`asyncio.Future`
+        :returns: Resolved with the value returned by :meth:`result`, or
+                  with the exception it raises.
+        """
+        import asyncio
+
+        if self.state is None:
+            self._begin()
+        if waiter is None:
+            waiter = default_waiter()
+        return asyncio.wrap_future(waiter.watch(self), loop=loop)
+
     def cancelled(self):
         """Check if the job has been cancelled.
 
@@ -2227,6 +2254,11 @@ class QueryJob(_AsyncJob):
         self._configuration = job_config
         self._query_results = None
         self._done_timeout = None
+        self._done_max_results = 0
+        # Set by ``Client.query`` when the results should be cached.
+        self._cache_key = None
+        # Whether ``_query_results`` holds every row, from the query cache.
+        self._results_cached = False
 
     @property
     def allow_large_results(self):
@@ -2641,10 +2673,13 @@ class QueryJob(_AsyncJob):
         # Do not refresh is the state is already done, as the job will not
         # change once complete.
         if self.state != _DONE_STATE:
+            # When called from result(), ask for the first page of rows, so
+            # that it does not need to be fetched again with tabledata.list
+            # once the query completes.
             self._query_results = self._client._get_query_results(
                 self.job_id, retry,
                 project=self.project, timeout_ms=timeout_ms,
-                location=self.location)
+                location=self.location, max_results=self._done_max_results)
 
             # Only reload the job once we know the query is complete.
             # This will ensure that fields such as the destination table are
@@ -2658,7 +2693,8 @@ class QueryJob(_AsyncJob):
         self._done_timeout = timeout
         super(QueryJob, self)._blocking_poll(timeout=timeout)
 
-    def result(self, timeout=None, retry=DEFAULT_RETRY):
+    def result(self, timeout=None, retry=DEFAULT_RETRY, max_workers=None,
+               prefetch_pages=None, page_size=None, max_results=None):
         """Start the job and wait for it to complete and get the result.
 
         :type timeout: float
@@ -2669,6 +2705,27 @@ class QueryJob(_AsyncJob):
         :type retry: :class:`google.api_core.retry.Retry`
         :param retry: (Optional) How to retry the call that retrieves rows.
 
+        :type max_workers: int
+        :param max_workers:
+            (Optional) If set, fetch the pages of the result set after the
+            first one concurrently using this many threads. See
+            :meth:`~google.cloud.bigquery.client.Client.list_rows`.
+
+        :type prefetch_pages: int
+        :param prefetch_pages:
+            (Optional) The maximum number of pages to fetch ahead of the page
+            being consumed when ``max_workers`` is set.
+
+        :type page_size: int
+        :param page_size:
+            (Optional) The maximum number of rows in each page of results.
+            The first page is returned by the final ``getQueryResults``
+            poll, and only later pages are fetched with ``tabledata.list``.
+
+        :type max_results: int
+        :param max_results:
+            (Optional) The maximum number of rows to return.
+
         :rtype: :class:`~google.cloud.bigquery.table.RowIterator`
         :returns:
             Iterator of row data :class:`~google.cloud.bigquery.table.Row`-s.
@@ -2682,12 +2739,20 @@ class QueryJob(_AsyncJob):
             failed or :class:`concurrent.futures.TimeoutError` if the job did
             not complete in the given timeout.
         """
+        first_page_size = page_size
+        if max_results is not None:
+            first_page_size = min(max_results, page_size or max_results)
+        self._done_max_results = first_page_size
         super(QueryJob, self).result(timeout=timeout)
-        # Return an iterator instead of returning the job.
-        if not self._query_results:
+        # Return an iterator instead of returning the job. Re-fetch the query
+        # results if the ones from polling do not include the first page of
+        # rows, such as when the job was already done before result().
+        if (not self._query_results or
+                self._query_results.total_rows and
+                'rows' not in self._query_results._properties):
             self._query_results = self._client._get_query_results(
                 self.job_id, retry, project=self.project,
-                location=self.location)
+                location=self.location, max_results=first_page_size)
 
         # If the query job is complete but there are no query results, this was
         # special job, such as a DDL query. Return an empty result set to
@@ -2696,14 +2761,43 @@ class QueryJob(_AsyncJob):
         if self._query_results.total_rows is None:
             return _EmptyRowIterator()
 
-        schema = self._query_results.schema
-        dest_table_ref = self.destination
-        dest_table = Table(dest_table_ref, schema=schema)
-        return self._client.list_rows(dest_table, retry=retry)
+        if self._cache_key is not None:
+            cached_results = self._client._query_cache._put_job(
+                self, self._cache_key, retry)
+            if cached_results is not None:
+                self._query_results = cached_results
+                self._results_cached = True
+            self._cache_key = None
+
+        if self._results_cached:
+            # All of the rows are in the cached results, so page through
+            # them locally instead of returning them as one page.
+            return self._client._query_cache._list_rows(
+                self, max_results=max_results, page_size=page_size)
+
+        # The first page may be from an earlier call with a larger page.
+        first_page_rows = self._query_results._properties.get('rows', ())
+        if (first_page_size is not None and
+                len(first_page_rows) > first_page_size):
+            self._query_results = self._client._get_query_results(
+                self.job_id, retry, project=self.project,
+                location=self.location, max_results=first_page_size)
+
+        return self._client._list_rows_from_query_results(
+            self._query_results, self.destination, retry=retry,
+            max_results=max_results, page_size=page_size,
+            max_workers=max_workers, prefetch_pages=prefetch_pages)
 
-    def to_dataframe(self):
+    def to_dataframe(self, dtypes=None):
         """Return a pandas DataFrame from a QueryJob
 
+        Args:
+            dtypes (Map[str, Union[str, pandas.Series.dtype]]):
+                (Optional) A dictionary of column names to pandas ``dtype``
+                values. The provided ``dtype`` is used when constructing the
+                series for the column specified. Otherwise, the ``dtype`` is
+                derived from the column's schema type.
+
         Returns:
             A :class:`~pandas.DataFrame` populated with row data and column
             headers from the query results. The column headers are derived
@@ -2712,7 +2806,7 @@ class QueryJob(_AsyncJob):
         Raises:
             ValueError: If the `pandas` library cannot be imported.
         """
-        return self.result().to_dataframe()
+        return self.result().to_dataframe(dtypes=dtypes)
 
     def __iter__(self):
         return iter(self.result())
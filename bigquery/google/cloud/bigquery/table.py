@@ -16,15 +16,19 @@
 
 from __future__ import absolute_import
 
+import collections
 import copy
 import datetime
 import operator
 import warnings
 
+from concurrent import futures
 import six
 try:
+    import numpy
     import pandas
 except ImportError:  # pragma: NO COVER
+    numpy = None
     pandas = None
 
 from google.api_core.page_iterator import HTTPIterator
@@ -43,6 +47,7 @@ _NO_PANDAS_ERROR = (
 )
 _TABLE_HAS_NO_SCHEMA = 'Table has no schema:  call "client.get_table()"'
 _MARKER = object()
+_BOOL_TRUE_STRINGS = ('t', 'true', '1')
 
 
 def _reference_getter(table):
@@ -1135,10 +1140,26 @@ class RowIterator(HTTPIterator):
         page_size (int, optional): The number of items to return per page.
         extra_params (Dict[str, object]):
             Extra query string parameters for the API call.
+        max_workers (int, optional):
+            If set, fetch the pages following the first one concurrently
+            using a pool of this many threads. Pages are requested by
+            ``startIndex`` once the first page reports ``totalRows``, and
+            are still returned in order. Rows added to the table after the
+            first page was fetched are not returned.
+        prefetch_pages (int, optional):
+            The maximum number of pages fetched ahead of the page currently
+            being consumed when ``max_workers`` is set. Bounds the memory
+            used by prefetched pages. Defaults to ``max_workers``.
+        first_page_response (Dict[str, object], optional):
+            An API response, such as from ``jobs.getQueryResults``, to use
+            as the first page instead of requesting it. Its ``pageToken``
+            is used to request the following pages.
     """
 
     def __init__(self, client, api_request, path, schema, page_token=None,
-                 max_results=None, page_size=None, extra_params=None):
+                 max_results=None, page_size=None, extra_params=None,
+                 max_workers=None, prefetch_pages=None,
+                 first_page_response=None):
         super(RowIterator, self).__init__(
             client, api_request, path, item_to_value=_item_to_row,
             items_key='rows', page_token=page_token, max_results=max_results,
@@ -1146,8 +1167,16 @@ class RowIterator(HTTPIterator):
             next_token='pageToken')
         self._schema = schema
         self._field_to_index = _helpers._field_to_index_mapping(schema)
+        self._row_converter = _helpers._row_converter(schema)
         self._total_rows = None
         self._page_size = page_size
+        self._started_from_token = page_token is not None
+        self._max_workers = max_workers
+        self._prefetch_pages = prefetch_pages or max_workers
+        self._prefetch_ranges = None
+        self._prefetch_futures = None
+        self._prefetch_executor = None
+        self._first_page_response = first_page_response
 
     def _get_next_page_response(self):
         """Requests the next page from the path provided.
@@ -1156,13 +1185,133 @@ class RowIterator(HTTPIterator):
             Dict[str, object]:
                 The parsed JSON response of the next page's contents.
         """
-        params = self._get_query_params()
-        if self._page_size is not None:
-            params['maxResults'] = self._page_size
-        return self.api_request(
-            method=self._HTTP_METHOD,
-            path=self.path,
-            query_params=params)
+        if self._prefetch_futures is not None:
+            return self._next_prefetched_response()
+
+        if self._first_page_response is not None:
+            response = self._first_page_response
+            self._first_page_response = None
+        else:
+            params = self._get_query_params()
+            if self._page_size is not None:
+                params['maxResults'] = self._page_size
+            response = self.api_request(
+                method=self._HTTP_METHOD,
+                path=self.path,
+                query_params=params)
+
+        if self._max_workers and self.page_number == 0:
+            self._start_prefetch(response)
+        return response
+
+    def _has_next_page(self):
+        """Determines whether or not there are more pages with results.
+
+        Returns:
+            bool: Whether the iterator has more pages.
+        """
+        if self._prefetch_futures is not None:
+            return len(self._prefetch_futures) > 0
+        return super(RowIterator, self)._has_next_page()
+
+    def _start_prefetch(self, response):
+        """Begin fetching the remaining pages concurrently.
+
+        The remaining rows are split into ``startIndex`` ranges of the
+        page size, each fetched by :meth:`_fetch_range`. Nothing is
+        prefetched if the first page is the last one, or if the position of
+        the first page in the table is unknown because the iterator was
+        started from a page token.
+
+        Args:
+            response (Dict[str, object]): The response of the first page.
+        """
+        total_rows = response.get('totalRows')
+        page_rows = len(response.get(self._items_key, ()))
+        if (total_rows is None or page_rows == 0 or
+                response.get(self._next_token) is None or
+                self._started_from_token):
+            return
+
+        first_index = int(self.extra_params.get('startIndex', 0))
+        end_index = int(total_rows)
+        if self.max_results is not None:
+            end_index = min(end_index, first_index + self.max_results)
+        page_size = self._page_size or page_rows
+
+        self._prefetch_ranges = iter([
+            (start_index, min(page_size, end_index - start_index))
+            for start_index in six.moves.range(
+                first_index + page_rows, end_index, page_size)])
+        self._prefetch_futures = collections.deque()
+        self._prefetch_executor = futures.ThreadPoolExecutor(
+            max_workers=self._max_workers)
+        for _ in six.moves.range(self._prefetch_pages):
+            self._submit_prefetch()
+        if not self._prefetch_futures:
+            self._prefetch_executor.shutdown(wait=False)
+
+    def _submit_prefetch(self):
+        """Request the next ``startIndex`` range, if any are left."""
+        range_ = next(self._prefetch_ranges, None)
+        if range_ is None:
+            return
+        self._prefetch_futures.append(self._prefetch_executor.submit(
+            self._fetch_range, *range_))
+
+    def _fetch_range(self, start_index, num_rows):
+        """Request the rows of a ``startIndex`` range.
+
+        ``tabledata.list`` may return fewer rows than requested, so the
+        rest of the range is requested until it is complete or the table
+        has no more rows.
+
+        Args:
+            start_index (int): The index of the first row of the range.
+            num_rows (int): The number of rows in the range.
+
+        Returns:
+            Dict[str, object]:
+                The response for the first rows of the range, with the rows
+                of the following responses appended.
+        """
+        response = None
+        rows = []
+        while len(rows) < num_rows:
+            params = dict(self.extra_params)
+            params['startIndex'] = start_index + len(rows)
+            params['maxResults'] = num_rows - len(rows)
+            next_response = self.api_request(
+                method=self._HTTP_METHOD,
+                path=self.path,
+                query_params=params)
+            next_rows = next_response.get(self._items_key, ())
+            if response is None:
+                response = next_response
+            if not next_rows:
+                break
+            rows.extend(next_rows)
+        response[self._items_key] = rows
+        return response
+
+    def _next_prefetched_response(self):
+        """Wait for the oldest prefetched page.
+
+        Returns:
+            Dict[str, object]:
+                The parsed JSON response of the next page's contents.
+        """
+        future = self._prefetch_futures.popleft()
+        self._submit_prefetch()
+        if not self._prefetch_futures:
+            self._prefetch_executor.shutdown(wait=False)
+        try:
+            return future.result()
+        except Exception:
+            for pending in self._prefetch_futures:
+                pending.cancel()
+            self._prefetch_executor.shutdown(wait=False)
+            raise
 
     @property
     def schema(self):
@@ -1174,9 +1323,25 @@ class RowIterator(HTTPIterator):
         """int: The total number of rows in the table."""
         return self._total_rows
 
-    def to_dataframe(self):
+    def to_dataframe(self, dtypes=None):
         """Create a pandas DataFrame from the query results.
 
+        Each page of ``tabledata.list`` results is decoded directly into
+        per-column arrays using the table schema, without creating a
+        :class:`~google.cloud.bigquery.table.Row` for every record.
+        ``INTEGER``, ``FLOAT``, ``BOOLEAN`` and ``TIMESTAMP`` columns are
+        decoded into ``int64``, ``float64``, ``bool`` and
+        ``datetime64[ns, UTC]`` arrays. Integer columns containing nulls are
+        decoded as ``float64`` (with ``NaN``) and boolean columns containing
+        nulls as ``object``, matching pandas' own type inference.
+
+        Args:
+            dtypes (Map[str, Union[str, pandas.Series.dtype]]):
+                (Optional) A dictionary of column names to pandas ``dtype``
+                values. The provided ``dtype`` is used when constructing the
+                series for the column specified. Otherwise, the ``dtype`` is
+                derived from the column's schema type.
+
         Returns:
             pandas.DataFrame:
                 A :class:`~pandas.DataFrame` populated with row data and column
@@ -1189,12 +1354,21 @@ class RowIterator(HTTPIterator):
         """
         if pandas is None:
             raise ValueError(_NO_PANDAS_ERROR)
+        if dtypes is None:
+            dtypes = {}
 
-        column_headers = [field.name for field in self.schema]
-        # Use generator, rather than pulling the whole rowset into memory.
-        rows = (row.values() for row in iter(self))
+        column_names = [field.name for field in self._schema]
+        frames = []
+        for page in iter(self.pages):
+            columns = _rows_page_columns(self._schema, page._rows_json)
+            frames.append(
+                _columns_to_dataframe(column_names, columns, dtypes))
 
-        return pandas.DataFrame(rows, columns=column_headers)
+        if not frames:
+            return pandas.DataFrame(columns=column_names)
+        if len(frames) == 1:
+            return frames[0]
+        return pandas.concat(frames, ignore_index=True)
 
 
 class _EmptyRowIterator(object):
@@ -1208,7 +1382,16 @@ class _EmptyRowIterator(object):
     pages = ()
     total_rows = 0
 
-    def to_dataframe(self):
+    def to_dataframe(self, dtypes=None):
+        """Create an empty dataframe.
+
+        Args:
+            dtypes (Any): Ignored. Added for compatibility with RowIterator.
+
+        Returns:
+            pandas.DataFrame:
+                An empty :class:`~pandas.DataFrame`.
+        """
         if pandas is None:
             raise ValueError(_NO_PANDAS_ERROR)
         return pandas.DataFrame()
@@ -1348,9 +1531,8 @@ def _item_to_row(iterator, resource):
 
     .. note::
 
-        This assumes that the ``schema`` attribute has been
-        added to the iterator after being created, which
-        should be done by the caller.
+        This assumes that the iterator is a :class:`RowIterator`, which
+        compiles a row converter for its schema when created.
 
     :type iterator: :class:`~google.api_core.page_iterator.Iterator`
     :param iterator: The iterator that is currently in use.
@@ -1361,8 +1543,7 @@ def _item_to_row(iterator, resource):
     :rtype: :class:`~google.cloud.bigquery.table.Row`
     :returns: The next row in the page.
     """
-    return Row(_helpers._row_tuple_from_json(resource, iterator.schema),
-               iterator._field_to_index)
+    return Row(iterator._row_converter(resource), iterator._field_to_index)
 
 
 # pylint: disable=unused-argument
@@ -1382,4 +1563,95 @@ def _rows_page_start(iterator, page, response):
     if total_rows is not None:
         total_rows = int(total_rows)
     iterator._total_rows = total_rows
+    # Keep the raw rows around so that column-oriented consumers (such as
+    # ``RowIterator.to_dataframe``) can skip the per-row conversion.
+    page._rows_json = response.get(iterator._items_key, ())
 # pylint: enable=unused-argument
+
+
+def _column_from_json(cells, field):
+    """Convert the JSON cells of a single column to an array.
+
+    Scalar ``INTEGER``, ``FLOAT``, ``BOOLEAN`` and ``TIMESTAMP`` columns are
+    converted with vectorized NumPy operations. Other columns fall back to
+    the compiled converter for the field.
+
+    Args:
+        cells (List[object]): The ``v`` value of each cell in the column.
+        field (google.cloud.bigquery.schema.SchemaField):
+            The schema field describing the column.
+
+    Returns:
+        Union[numpy.ndarray, pandas.DatetimeIndex, List[object]]:
+            The converted column values.
+    """
+    field_type = field.field_type
+    has_nulls = None in cells
+
+    if field.mode != 'REPEATED':
+        if field_type in ('INTEGER', 'INT64'):
+            # Integer columns with nulls are upcast to float, using NaN as
+            # the null marker, as pandas does when inferring types.
+            if has_nulls:
+                return numpy.array(cells, dtype='float64')
+            return numpy.array(cells, dtype='int64')
+
+        if field_type in ('FLOAT', 'FLOAT64'):
+            return numpy.array(cells, dtype='float64')
+
+        if field_type in ('BOOLEAN', 'BOOL') and not has_nulls:
+            lowered = numpy.char.lower(numpy.array(cells, dtype=six.text_type))
+            return numpy.in1d(lowered, _BOOL_TRUE_STRINGS)
+
+        if field_type == 'TIMESTAMP':
+            # Values are floating-point seconds since the epoch, to
+            # microsecond precision, in UTC.
+            micros = numpy.round(numpy.array(cells, dtype='float64') * 1e6)
+            nulls = numpy.isnan(micros)
+            values = numpy.where(nulls, 0, micros).astype('datetime64[us]')
+            values[nulls] = numpy.datetime64('NaT')
+            return pandas.DatetimeIndex(values).tz_localize('UTC')
+
+    converter = _helpers._field_converter(field)
+    return [converter(cell) for cell in cells]
+
+
+def _rows_page_columns(schema, rows):
+    """Convert a page of JSON rows to a list of columns.
+
+    Args:
+        schema (Sequence[google.cloud.bigquery.schema.SchemaField]):
+            The schema of the rows.
+        rows (Sequence[Dict[str, object]]):
+            The ``rows`` of a ``tabledata.list`` or ``getQueryResults``
+            response.
+
+    Returns:
+        List[Union[numpy.ndarray, pandas.DatetimeIndex, List[object]]]:
+            One converted array per field in ``schema``.
+    """
+    columns = []
+    for index, field in enumerate(schema):
+        cells = [row['f'][index]['v'] for row in rows]
+        columns.append(_column_from_json(cells, field))
+    return columns
+
+
+def _columns_to_dataframe(column_names, columns, dtypes):
+    """Build a DataFrame from decoded columns.
+
+    Args:
+        column_names (List[str]): The name of each column.
+        columns (List[object]): The decoded values of each column.
+        dtypes (Dict[str, object]): Overrides of the pandas ``dtype`` to use
+            for specific columns.
+
+    Returns:
+        pandas.DataFrame: The columns as a DataFrame.
+    """
+    data = collections.OrderedDict()
+    for name, values in zip(column_names, columns):
+        if name in dtypes:
+            values = pandas.Series(values, dtype=dtypes[name])
+        data[name] = values
+    return pandas.DataFrame(data, columns=column_names)
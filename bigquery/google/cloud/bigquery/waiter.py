@@ -0,0 +1,259 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Wait for many jobs from a fixed number of threads."""
+
+from __future__ import absolute_import
+
+from concurrent import futures
+import datetime
+import heapq
+import itertools
+import threading
+import time
+
+from google.cloud._helpers import UTC
+from google.cloud.bigquery.retry import DEFAULT_RETRY
+
+
+_DONE_STATE = 'DONE'
+
+# A running job is polled again after this fraction of the time it has
+# been running: a job which has run for ten minutes is unlikely to finish
+# in the next second.
+_RUNNING_INTERVAL_FRACTION = 0.1
+# A job which has not started yet backs off by this factor on each poll.
+_PENDING_INTERVAL_MULTIPLIER = 1.5
+
+_default_waiter = None
+_default_waiter_lock = threading.Lock()
+
+
+def default_waiter():
+    """Get the waiter shared by :meth:`~.job._AsyncJob.result_async` calls.
+
+    Returns:
+        google.cloud.bigquery.waiter.JobWaiter: The shared waiter.
+    """
+    global _default_waiter
+    with _default_waiter_lock:
+        if _default_waiter is None:
+            _default_waiter = JobWaiter()
+        return _default_waiter
+
+
+class _Watch(object):
+    """A job being waited for.
+
+    Args:
+        job (google.cloud.bigquery.job._AsyncJob): The job.
+        future (concurrent.futures.Future): Resolved when the job is done.
+        interval (float): The seconds to wait before the next poll.
+    """
+
+    def __init__(self, job, future, interval):
+        self.job = job
+        self.future = future
+        self.interval = interval
+
+
+class JobWaiter(object):
+    """Wait for many jobs, polling them from a fixed number of threads.
+
+    One scheduler thread keeps the jobs in order of their next poll, and
+    a pool of ``max_workers`` threads sends the ``jobs.get`` requests. The
+    scheduler thread exits when no jobs are left to poll, and is started
+    again by :meth:`watch`.
+
+    The interval between polls adapts to the job's statistics. A job which
+    has started is polled again after a tenth of the time it has been
+    running, and a job which is still pending backs off exponentially,
+    both between ``initial_interval`` and ``max_interval`` seconds.
+
+    Args:
+        retry (google.api_core.retry.Retry):
+            (Optional) How to retry each poll.
+        initial_interval (float):
+            (Optional) The seconds to wait before the first poll.
+        max_interval (float):
+            (Optional) The maximum seconds to wait between polls.
+        max_workers (int):
+            (Optional) The maximum number of concurrent requests.
+    """
+
+    def __init__(self, retry=DEFAULT_RETRY, initial_interval=0.5,
+                 max_interval=30.0, max_workers=8):
+        self._retry = retry
+        self._initial_interval = initial_interval
+        self._max_interval = max_interval
+        self._executor = futures.ThreadPoolExecutor(max_workers)
+        self._condition = threading.Condition()
+        # Heap of (next poll time, sequence number, watch).
+        self._schedule = []
+        self._sequence = itertools.count()
+        self._thread = None
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def watch(self, job):
+        """Start waiting for a job.
+
+        Args:
+            job (google.cloud.bigquery.job._AsyncJob):
+                A job which has been started.
+
+        Returns:
+            concurrent.futures.Future:
+                Resolved with the job's ``result()`` once the job is done,
+                or with the exception it raises. The job is not polled
+                again once the future is cancelled.
+
+        Raises:
+            ValueError: If the waiter is closed.
+        """
+        future = futures.Future()
+        watch = _Watch(job, future, self._initial_interval)
+        with self._condition:
+            if self._closed:
+                raise ValueError('Cannot watch jobs after the waiter closed.')
+            if job.state == _DONE_STATE:
+                self._executor.submit(self._finish, watch)
+            else:
+                self._schedule_poll(watch)
+        return future
+
+    def wait(self, jobs, timeout=None, return_when=futures.ALL_COMPLETED):
+        """Wait for jobs to complete.
+
+        Args:
+            jobs (Sequence[google.cloud.bigquery.job._AsyncJob]):
+                Jobs which have been started.
+            timeout (float):
+                (Optional) The maximum seconds to wait. If ``None``, wait
+                until ``return_when`` is satisfied.
+            return_when (str):
+                (Optional) When to return, as for
+                :func:`concurrent.futures.wait`: one of
+                ``concurrent.futures.FIRST_COMPLETED``,
+                ``FIRST_EXCEPTION`` or ``ALL_COMPLETED``.
+
+        Returns:
+            Tuple[List[google.cloud.bigquery.job._AsyncJob], \
+                  List[google.cloud.bigquery.job._AsyncJob]]:
+                The jobs which are done, and the jobs which are not, each in
+                the order given.
+        """
+        job_futures = [self.watch(job) for job in jobs]
+        done, _ = futures.wait(
+            job_futures, timeout=timeout, return_when=return_when)
+
+        done_jobs = []
+        not_done_jobs = []
+        for job, future in zip(jobs, job_futures):
+            if future in done:
+                done_jobs.append(job)
+            else:
+                future.cancel()
+                not_done_jobs.append(job)
+        return done_jobs, not_done_jobs
+
+    def close(self):
+        """Stop polling, and cancel the futures of jobs not yet done."""
+        with self._condition:
+            self._closed = True
+            schedule, self._schedule = self._schedule, []
+            self._condition.notify_all()
+        for _, _, watch in schedule:
+            watch.future.cancel()
+        self._executor.shutdown(wait=False)
+
+    def _schedule_poll(self, watch):
+        """Schedule the next poll of a job.
+
+        Must be called with the condition held.
+        """
+        heapq.heappush(self._schedule, (
+            time.time() + watch.interval, next(self._sequence), watch))
+        if self._thread is None:
+            self._thread = threading.Thread(
+                name='Thread-BigQueryJobWaiter', target=self._run)
+            self._thread.daemon = True
+            self._thread.start()
+        self._condition.notify()
+
+    def _run(self):
+        """Submit polls as they come due, until none are scheduled."""
+        with self._condition:
+            while not self._closed and self._schedule:
+                due = self._schedule[0][0] - time.time()
+                if due > 0:
+                    self._condition.wait(due)
+                    continue
+                _, _, watch = heapq.heappop(self._schedule)
+                if not watch.future.cancelled():
+                    self._executor.submit(self._poll, watch)
+            self._thread = None
+
+    def _poll(self, watch):
+        """Reload a job, then finish it or schedule its next poll."""
+        try:
+            watch.job.reload(retry=self._retry)
+        except Exception as exc:
+            if not watch.future.cancelled():
+                watch.future.set_exception(exc)
+            return
+
+        if watch.job.state == _DONE_STATE:
+            self._finish(watch)
+            return
+
+        watch.interval = self._next_interval(watch)
+        with self._condition:
+            if not self._closed:
+                self._schedule_poll(watch)
+
+    def _finish(self, watch):
+        """Resolve the future of a job which is done."""
+        # A job which is done is not polled again by ``result()``.
+        try:
+            result = watch.job.result()
+        except Exception as exc:
+            if not watch.future.cancelled():
+                watch.future.set_exception(exc)
+        else:
+            if not watch.future.cancelled():
+                watch.future.set_result(result)
+
+    def _next_interval(self, watch):
+        """Pick the seconds to wait before polling a job again.
+
+        Args:
+            watch (_Watch): The job, which is not done.
+
+        Returns:
+            float: The seconds to wait.
+        """
+        started = watch.job.started
+        if started is None:
+            interval = watch.interval * _PENDING_INTERVAL_MULTIPLIER
+        else:
+            running = datetime.datetime.utcnow().replace(tzinfo=UTC) - started
+            interval = (
+                running.total_seconds() * _RUNNING_INTERVAL_FRACTION)
+        return max(self._initial_interval, min(interval, self._max_interval))
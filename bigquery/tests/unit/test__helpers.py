@@ -17,6 +17,8 @@ import datetime
 import decimal
 import unittest
 
+import mock
+
 
 class Test_not_null(unittest.TestCase):
 
@@ -536,6 +538,79 @@ class Test_row_tuple_from_json(unittest.TestCase):
             ],))
 
 
+class Test_row_converter(unittest.TestCase):
+
+    def _call_fut(self, schema):
+        from google.cloud.bigquery._helpers import _row_converter
+
+        return _row_converter(schema)
+
+    def test_cached_per_schema(self):
+        from google.cloud.bigquery.schema import SchemaField
+
+        schema = [SchemaField('col', 'INTEGER')]
+        converter = self._call_fut(schema)
+        self.assertIs(self._call_fut(tuple(schema)), converter)
+        self.assertIs(
+            self._call_fut([SchemaField('col', 'INTEGER')]), converter)
+        self.assertIsNot(
+            self._call_fut([SchemaField('col', 'FLOAT')]), converter)
+
+    def test_cache_is_bounded(self):
+        from google.cloud.bigquery import _helpers
+        from google.cloud.bigquery.schema import SchemaField
+
+        with mock.patch.object(_helpers, '_MAX_ROW_CONVERTERS', new=2):
+            with mock.patch.object(_helpers, '_ROW_CONVERTERS', new={}):
+                for index in range(5):
+                    self._call_fut([SchemaField(str(index), 'STRING')])
+                    self.assertLessEqual(len(_helpers._ROW_CONVERTERS), 2)
+
+    def test_w_all_string_columns(self):
+        first = _Field('REQUIRED', 'first', 'STRING')
+        second = _Field('NULLABLE', 'second', 'GEOGRAPHY')
+        row = {u'f': [{u'v': u'abc'}, {u'v': None}]}
+        converter = self._call_fut([first, second])
+        self.assertEqual(converter(row), (u'abc', None))
+
+    def test_w_nullable_columns(self):
+        from google.cloud._helpers import UTC
+
+        schema = [
+            _Field('NULLABLE', 'int', 'INT64'),
+            _Field('NULLABLE', 'float', 'FLOAT64'),
+            _Field('NULLABLE', 'numeric', 'NUMERIC'),
+            _Field('NULLABLE', 'bool', 'BOOL'),
+            _Field('NULLABLE', 'bytes', 'BYTES'),
+            _Field('NULLABLE', 'timestamp', 'TIMESTAMP'),
+            _Field('NULLABLE', 'datetime', 'DATETIME'),
+            _Field('NULLABLE', 'date', 'DATE'),
+            _Field('NULLABLE', 'time', 'TIME'),
+            _Field('NULLABLE', 'record', 'RECORD', fields=[
+                _Field('REPEATED', 'strings', 'STRING'),
+            ]),
+        ]
+        values = [
+            u'1', u'1.5', u'1.25', u'true', u'Ynl0ZXM=', u'1.4338368E9',
+            u'2016-12-03T14:11:27.123456', u'2016-12-03', u'12:12:27',
+            {u'f': [{u'v': [{u'v': u'a'}, {u'v': u'b'}]}]},
+        ]
+        converter = self._call_fut(schema)
+
+        self.assertEqual(
+            converter({u'f': [{u'v': value} for value in values]}),
+            (
+                1, 1.5, decimal.Decimal('1.25'), True, b'bytes',
+                datetime.datetime(2015, 6, 9, 8, 0, tzinfo=UTC),
+                datetime.datetime(2016, 12, 3, 14, 11, 27, 123456),
+                datetime.date(2016, 12, 3), datetime.time(12, 12, 27),
+                {u'strings': [u'a', u'b']},
+            ))
+        self.assertEqual(
+            converter({u'f': [{u'v': None} for _ in values]}),
+            (None,) * len(values))
+
+
 class Test_rows_from_json(unittest.TestCase):
 
     def _call_fut(self, rows, schema):
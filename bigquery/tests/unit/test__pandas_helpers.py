@@ -0,0 +1,135 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import unittest
+
+import mock
+
+try:
+    import pandas
+except (ImportError, AttributeError):  # pragma: NO COVER
+    pandas = None
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
+
+class Test_Pipe(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery._pandas_helpers import _Pipe
+
+        return _Pipe
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_read_waits_for_size(self):
+        from google.cloud.bigquery._pandas_helpers import _PipeReader
+        from google.cloud.bigquery._pandas_helpers import _PipeWriter
+
+        pipe = self._make_one(4)
+        writer = _PipeWriter(pipe)
+        reader = _PipeReader(pipe)
+
+        def write():
+            for _ in range(5):
+                writer.write(b'ab')
+            pipe.close_write()
+
+        thread = threading.Thread(target=write)
+        thread.start()
+        chunks = [reader.read(4), reader.read(4), reader.read(4)]
+        thread.join()
+
+        self.assertEqual(chunks, [b'abab', b'abab', b'ab'])
+        self.assertEqual(reader.tell(), 10)
+        self.assertEqual(writer.tell(), 10)
+        self.assertEqual(reader.read(4), b'')
+
+    def test_write_blocks_while_full(self):
+        pipe = self._make_one(4)
+        pipe.write(b'abcd')
+        written = threading.Event()
+
+        def write():
+            pipe.write(b'ef')
+            written.set()
+
+        thread = threading.Thread(target=write)
+        thread.start()
+        self.assertFalse(written.wait(0.05))
+
+        self.assertEqual(pipe.read(2), b'ab')
+        thread.join()
+
+        self.assertTrue(written.is_set())
+        pipe.close_write()
+        self.assertEqual(pipe.read(8), b'cdef')
+
+    def test_close_read_unblocks_writer(self):
+        pipe = self._make_one(4)
+        pipe.write(b'abcd')
+        errors = []
+
+        def write():
+            try:
+                pipe.write(b'ef')
+            except ValueError as exc:
+                errors.append(exc)
+
+        thread = threading.Thread(target=write)
+        thread.start()
+        pipe.close_read()
+        thread.join()
+
+        self.assertEqual(len(errors), 1)
+
+    def test_close_write_w_exception(self):
+        pipe = self._make_one(4)
+        error = RuntimeError('encoding failed')
+        pipe.close_write(exception=error)
+
+        with self.assertRaises(RuntimeError):
+            pipe.read(4)
+
+
+class TestParquetStream(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery._pandas_helpers import ParquetStream
+
+        return ParquetStream
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_ctor_wo_pyarrow(self):
+        with mock.patch('google.cloud.bigquery._pandas_helpers.pyarrow',
+                        new=None):
+            with self.assertRaises(ValueError):
+                self._make_one(None, 10, 1024)
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+    def test_encoding_error_raised_to_reader(self):
+        dataframe = pandas.DataFrame({'mixed': [1, 'two', 3.0]})
+
+        with self._make_one(dataframe, 2, 1024) as stream:
+            with self.assertRaises(Exception):
+                stream.reader.read(1024)
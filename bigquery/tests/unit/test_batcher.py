@@ -0,0 +1,270 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+
+
+class TestInsertBatcher(unittest.TestCase):
+    PROJECT = 'prahj-ekt'
+    TABLE_PATH = '/projects/prahj-ekt/datasets/some_dset/tables/some_tbl'
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.batcher import InsertBatcher
+
+        return InsertBatcher
+
+    def _make_one(self, client=None, **kwargs):
+        if client is None:
+            client = self._make_client()
+        batcher = self._get_target_class()(client, **kwargs)
+        self.addCleanup(batcher.close)
+        return batcher
+
+    def _make_client(self, *responses):
+        client = mock.Mock(spec=['insert_rows_json'])
+        client.project = self.PROJECT
+        if responses:
+            client.insert_rows_json.side_effect = responses
+        else:
+            client.insert_rows_json.return_value = []
+        return client
+
+    def _make_table_ref(self):
+        from google.cloud.bigquery.table import TableReference
+
+        return TableReference.from_string(
+            'prahj-ekt.some_dset.some_tbl')
+
+    def test_ctor_caps_limits(self):
+        batcher = self._make_one(
+            max_rows=100000, max_bytes=100 * 1000 * 1000)
+
+        self.assertEqual(batcher._max_rows, 10000)
+        self.assertLess(batcher._max_bytes, 10 * 1000 * 1000)
+
+    def test_insert_rows_json_flushes_on_max_rows(self):
+        client = self._make_client()
+        batcher = self._make_one(
+            client=client, max_rows=2, max_latency=float('inf'))
+        rows = [{'n': 1}, {'n': 2}, {'n': 3}]
+
+        row_futures = batcher.insert_rows_json(
+            'some_dset.some_tbl', rows, row_ids=['a', 'b', 'c'])
+
+        self.assertEqual(row_futures[0].result(timeout=5), 'a')
+        self.assertEqual(row_futures[1].result(timeout=5), 'b')
+        self.assertFalse(row_futures[2].done())
+        client.insert_rows_json.assert_called_once_with(
+            mock.ANY, [{'n': 1}, {'n': 2}], row_ids=['a', 'b'],
+            skip_invalid_rows=None, ignore_unknown_values=None,
+            retry=mock.ANY)
+        table = client.insert_rows_json.call_args[0][0]
+        self.assertEqual(table.path, self.TABLE_PATH)
+
+        batcher.flush()
+
+        self.assertEqual(row_futures[2].result(timeout=5), 'c')
+        self.assertEqual(client.insert_rows_json.call_count, 2)
+
+    def test_insert_rows_json_flushes_on_max_bytes(self):
+        client = self._make_client()
+        batcher = self._make_one(
+            client=client, max_bytes=100, max_latency=float('inf'))
+        rows = [{'name': 'x' * 20} for _ in range(3)]
+
+        batcher.insert_rows_json(self._make_table_ref(), rows)
+        batcher.flush()
+
+        sent = [
+            len(call[0][1]) for call in client.insert_rows_json.call_args_list]
+        self.assertEqual(sorted(sent), [1, 1, 1])
+
+    def test_insert_rows_json_flushes_on_max_latency(self):
+        client = self._make_client()
+        batcher = self._make_one(client=client, max_latency=0.01)
+
+        row_futures = batcher.insert_rows_json(
+            self._make_table_ref(), [{'n': 1}])
+
+        insert_id = row_futures[0].result(timeout=5)
+        client.insert_rows_json.assert_called_once_with(
+            mock.ANY, [{'n': 1}], row_ids=[insert_id],
+            skip_invalid_rows=None, ignore_unknown_values=None,
+            retry=mock.ANY)
+
+    def test_insert_rows_json_wo_max_latency(self):
+        client = self._make_client()
+        batcher = self._make_one(client=client, max_latency=float('inf'))
+
+        row_futures = batcher.insert_rows_json(
+            self._make_table_ref(), [{'n': 1}])
+        batcher._thread.join(0.05)
+
+        self.assertTrue(batcher._thread.is_alive())
+        self.assertFalse(row_futures[0].done())
+        client.insert_rows_json.assert_not_called()
+
+    def test_insert_rows_json_batches_per_table(self):
+        from google.cloud.bigquery.table import TableReference
+
+        client = self._make_client()
+        batcher = self._make_one(client=client, max_latency=float('inf'))
+        other_ref = TableReference.from_string('prahj-ekt.some_dset.other')
+
+        batcher.insert_rows_json(self._make_table_ref(), [{'n': 1}])
+        batcher.insert_rows_json(other_ref, [{'n': 2}])
+        batcher.insert_rows_json(self._make_table_ref(), [{'n': 3}])
+        batcher.flush()
+
+        sent = sorted(
+            (call[0][0].table_id, call[0][1])
+            for call in client.insert_rows_json.call_args_list)
+        self.assertEqual(
+            sent, [('other', [{'n': 2}]), ('some_tbl', [{'n': 1}, {'n': 3}])])
+
+    def test_insert_rows_json_row_too_large(self):
+        client = self._make_client()
+        batcher = self._make_one(client=client, max_bytes=50)
+
+        row_futures = batcher.insert_rows_json(
+            self._make_table_ref(), [{'name': 'x' * 100}])
+
+        with self.assertRaises(ValueError):
+            row_futures[0].result(timeout=5)
+        batcher.flush()
+        client.insert_rows_json.assert_not_called()
+
+    def test_insert_rows_json_after_close(self):
+        batcher = self._make_one()
+        batcher.close()
+
+        with self.assertRaises(ValueError):
+            batcher.insert_rows_json(self._make_table_ref(), [{'n': 1}])
+
+    @mock.patch('time.sleep')
+    def test_retries_only_failed_rows(self, sleep):
+        client = self._make_client(
+            [
+                {'index': 1, 'errors': [{'reason': 'invalid'}]},
+                {'index': 2, 'errors': [{'reason': 'stopped'}]},
+            ],
+            [],
+        )
+        batcher = self._make_one(client=client, max_latency=float('inf'))
+
+        row_futures = batcher.insert_rows_json(
+            self._make_table_ref(), [{'n': 1}, {'n': 2}, {'n': 3}],
+            row_ids=['a', 'b', 'c'])
+        batcher.flush()
+
+        self.assertEqual(row_futures[0].result(), 'a')
+        self.assertEqual(row_futures[2].result(), 'c')
+        exception = row_futures[1].exception()
+        self.assertEqual(exception.errors, [{'reason': 'invalid'}])
+        self.assertEqual(client.insert_rows_json.call_count, 2)
+        retry_call = client.insert_rows_json.call_args_list[1]
+        self.assertEqual(retry_call[0][1], [{'n': 3}])
+        self.assertEqual(retry_call[1]['row_ids'], ['c'])
+        sleep.assert_called_once_with(1.0)
+
+    @mock.patch('time.sleep')
+    def test_retries_exhausted(self, sleep):
+        from google.cloud.bigquery.batcher import InsertError
+
+        errors = [{'index': 0, 'errors': [{'reason': 'backendError'}]}]
+        client = self._make_client(errors, errors, errors)
+        batcher = self._make_one(
+            client=client, max_latency=float('inf'), max_retries=2)
+
+        row_futures = batcher.insert_rows_json(
+            self._make_table_ref(), [{'n': 1}])
+        batcher.flush()
+
+        self.assertIsInstance(row_futures[0].exception(), InsertError)
+        self.assertEqual(client.insert_rows_json.call_count, 3)
+        self.assertEqual(
+            [call[0][0] for call in sleep.call_args_list], [1.0, 2.0])
+
+    def test_request_error(self):
+        from google.api_core import exceptions
+
+        error = exceptions.BadRequest('bad')
+        client = self._make_client(error)
+        batcher = self._make_one(client=client, max_latency=float('inf'))
+
+        row_futures = batcher.insert_rows_json(
+            self._make_table_ref(), [{'n': 1}, {'n': 2}])
+        batcher.flush()
+
+        self.assertIs(row_futures[0].exception(), error)
+        self.assertIs(row_futures[1].exception(), error)
+
+    def test_insert_rows_converts_rows(self):
+        from google.cloud.bigquery.schema import SchemaField
+        from google.cloud.bigquery.table import Table
+
+        schema = [
+            SchemaField('full_name', 'STRING', mode='REQUIRED'),
+            SchemaField('age', 'INTEGER', mode='REQUIRED'),
+            SchemaField('alive', 'BOOLEAN', mode='NULLABLE'),
+        ]
+        table = Table(self._make_table_ref(), schema=schema)
+        client = self._make_client()
+        batcher = self._make_one(client=client, max_latency=float('inf'))
+
+        batcher.insert_rows(
+            table, [('Phred Phlyntstone', 32, True), {
+                'full_name': 'Bharney Rhubble', 'age': 33}])
+        batcher.flush()
+
+        client.insert_rows_json.assert_called_once_with(
+            table, [
+                {'full_name': 'Phred Phlyntstone', 'age': '32',
+                 'alive': 'true'},
+                {'full_name': 'Bharney Rhubble', 'age': '33', 'alive': None},
+            ], row_ids=mock.ANY, skip_invalid_rows=None,
+            ignore_unknown_values=None, retry=mock.ANY)
+
+    def test_insert_rows_w_table_reference(self):
+        batcher = self._make_one()
+
+        with self.assertRaises(ValueError):
+            batcher.insert_rows(self._make_table_ref(), [(1,)])
+
+    def test_insert_rows_w_schemaless_table(self):
+        from google.cloud.bigquery.table import Table
+
+        batcher = self._make_one()
+
+        with self.assertRaises(ValueError):
+            batcher.insert_rows(Table(self._make_table_ref()), [(1,)])
+
+    def test_insert_rows_w_wrong_table_type(self):
+        batcher = self._make_one()
+
+        with self.assertRaises(TypeError):
+            batcher.insert_rows(object(), [(1,)])
+
+    def test_context_manager_flushes(self):
+        client = self._make_client()
+
+        with self._get_target_class()(
+                client, max_latency=float('inf')) as batcher:
+            row_futures = batcher.insert_rows_json(
+                self._make_table_ref(), [{'n': 1}], row_ids=['a'])
+
+        self.assertEqual(row_futures[0].result(timeout=0), 'a')
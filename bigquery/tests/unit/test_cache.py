@@ -0,0 +1,347 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+
+def _make_credentials():
+    import google.auth.credentials
+
+    return mock.Mock(spec=google.auth.credentials.Credentials)
+
+
+def _make_connection(*responses):
+    import google.cloud.bigquery._http
+    from google.cloud.exceptions import NotFound
+
+    mock_conn = mock.create_autospec(google.cloud.bigquery._http.Connection)
+    mock_conn.USER_AGENT = 'testing 1.2.3'
+    mock_conn.api_request.side_effect = list(responses) + [NotFound('miss')]
+    return mock_conn
+
+
+class Test__normalize_query(unittest.TestCase):
+
+    def _call_fut(self, query):
+        from google.cloud.bigquery.cache import _normalize_query
+
+        return _normalize_query(query)
+
+    def test_collapses_whitespace(self):
+        self.assertEqual(
+            self._call_fut('  SELECT a,\n\tb  FROM   t \n'),
+            'SELECT a, b FROM t')
+
+    def test_keeps_quoted_whitespace(self):
+        self.assertEqual(
+            self._call_fut(
+                "SELECT  'a  b', \"c\\\"  d\"  FROM  `my  table`"),
+            "SELECT 'a  b', \"c\\\"  d\" FROM `my  table`")
+
+
+class TestQueryCache(unittest.TestCase):
+    PROJECT = 'prahj-ekt'
+    QUERY = 'SELECT name, age FROM people WHERE age > @age'
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.cache import QueryCache
+
+        return QueryCache
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def _make_directory(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        return directory
+
+    def _make_config(self, age=21):
+        from google.cloud.bigquery.job import QueryJobConfig
+        from google.cloud.bigquery.query import ScalarQueryParameter
+
+        config = QueryJobConfig()
+        config.query_parameters = [
+            ScalarQueryParameter('age', 'INT64', age)]
+        return config
+
+    def test__key_normalizes_query(self):
+        cache = self._make_one()
+
+        key = cache._key(self.QUERY, self._make_config(), self.PROJECT, None)
+        spaced = cache._key(
+            '  SELECT name,  age\nFROM people WHERE age > @age ',
+            self._make_config(), self.PROJECT, None)
+
+        self.assertEqual(key, spaced)
+
+    def test__key_w_different_parameters(self):
+        cache = self._make_one()
+
+        key = cache._key(self.QUERY, self._make_config(), self.PROJECT, None)
+        other = cache._key(
+            self.QUERY, self._make_config(age=30), self.PROJECT, None)
+        other_location = cache._key(
+            self.QUERY, self._make_config(), self.PROJECT, 'EU')
+
+        self.assertNotEqual(key, other)
+        self.assertNotEqual(key, other_location)
+
+    def test__key_bypasses_cache(self):
+        from google.cloud.bigquery.table import TableReference
+
+        cache = self._make_one()
+        dry_run = self._make_config()
+        dry_run.dry_run = True
+        no_cache = self._make_config()
+        no_cache.use_query_cache = False
+        destination = self._make_config()
+        destination.destination = TableReference.from_string(
+            'prahj-ekt.dset.tbl')
+
+        for config in (dry_run, no_cache, destination):
+            self.assertIsNone(
+                cache._key(self.QUERY, config, self.PROJECT, None))
+
+    def test__put_evicts_least_recently_used(self):
+        cache = self._make_one(max_bytes=25)
+
+        cache._put('a', 'x' * 8)
+        cache._put('b', 'y' * 8)
+        self.assertEqual(cache._get('a'), 'x' * 8)
+        cache._put('c', 'z' * 8)
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache._get('b'))
+        self.assertEqual(cache._get('a'), 'x' * 8)
+        self.assertEqual(cache._get('c'), 'z' * 8)
+        self.assertEqual(cache.total_bytes, 20)
+
+    def test__put_too_large(self):
+        cache = self._make_one(max_bytes=5)
+
+        cache._put('a', 'x' * 8)
+
+        self.assertEqual(len(cache), 0)
+
+    def test__get_expired(self):
+        cache = self._make_one(ttl=10)
+
+        with mock.patch('time.time', return_value=1000.0):
+            cache._put('a', [1, 2])
+        with mock.patch('time.time', return_value=1005.0):
+            self.assertEqual(cache._get('a'), [1, 2])
+        with mock.patch('time.time', return_value=1011.0):
+            self.assertIsNone(cache._get('a'))
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.total_bytes, 0)
+
+    def test_directory_shared_between_caches(self):
+        import os
+
+        directory = self._make_directory()
+        cache = self._make_one(directory=directory, max_bytes=25)
+        cache._put('a', 'x' * 8)
+        cache._put('b', 'y' * 8)
+
+        reopened = self._make_one(directory=directory, max_bytes=25)
+
+        self.assertEqual(len(reopened), 2)
+        self.assertEqual(reopened._get('a'), 'x' * 8)
+        reopened._put('c', 'z' * 8)
+        self.assertEqual(
+            sorted(os.listdir(directory)), ['a.json', 'c.json'])
+
+        # Each cache only removes the entries it knows of.
+        cache.clear()
+        self.assertEqual(os.listdir(directory), ['c.json'])
+        self.assertIsNone(reopened._get('a'))
+        self.assertEqual(len(reopened), 1)
+
+    def test_directory_entry_removed_by_other_process(self):
+        import os
+
+        directory = self._make_directory()
+        cache = self._make_one(directory=directory)
+        cache._put('a', {'x': 1})
+        cache._put('b', {'y': 2})
+        os.remove(os.path.join(directory, 'a.json'))
+        open(os.path.join(directory, 'b.json'), 'wb').close()
+
+        self.assertIsNone(cache._get('a'))
+        self.assertIsNone(cache._get('b'))
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.total_bytes, 0)
+
+    def _query_resources(self):
+        job_resource = {
+            'jobReference': {'projectId': self.PROJECT, 'jobId': 'job-1'},
+            'configuration': {'query': {'query': self.QUERY}},
+            'status': {'state': 'RUNNING'},
+        }
+        done_resource = {
+            'jobReference': {'projectId': self.PROJECT, 'jobId': 'job-1'},
+            'configuration': {
+                'query': {
+                    'query': self.QUERY,
+                    'destinationTable': {
+                        'projectId': self.PROJECT,
+                        'datasetId': '_anon',
+                        'tableId': 'anon_tbl',
+                    },
+                },
+            },
+            'statistics': {
+                'query': {
+                    'statementType': 'SELECT',
+                    'referencedTables': [{
+                        'projectId': self.PROJECT,
+                        'datasetId': 'dset',
+                        'tableId': 'people',
+                    }],
+                },
+            },
+            'status': {'state': 'DONE'},
+        }
+        query_resource = {
+            'jobComplete': True,
+            'jobReference': {'projectId': self.PROJECT, 'jobId': 'job-1'},
+            'totalRows': '3',
+            'pageToken': 'next-page',
+            'schema': {
+                'fields': [
+                    {'name': 'name', 'type': 'STRING'},
+                    {'name': 'age', 'type': 'INTEGER'},
+                ],
+            },
+            'rows': [
+                {'f': [{'v': 'Phred'}, {'v': '32'}]},
+                {'f': [{'v': 'Bharney'}, {'v': '33'}]},
+            ],
+        }
+        rows_resource = {
+            'totalRows': '3',
+            'rows': [{'f': [{'v': 'Wylma'}, {'v': '29'}]}],
+        }
+        return job_resource, query_resource, done_resource, rows_resource
+
+    def _make_client(self, cache, *responses):
+        from google.cloud.bigquery.client import Client
+
+        client = Client(
+            project=self.PROJECT, credentials=_make_credentials(),
+            _http=object(), query_cache=cache)
+        client._connection = _make_connection(*responses)
+        return client
+
+    def test_client_query_hit(self):
+        cache = self._make_one()
+        client = self._make_client(cache, *self._query_resources())
+
+        rows = list(client.query(
+            self.QUERY, job_config=self._make_config()).result())
+        calls = client._connection.api_request.call_count
+        cached_job = client.query(
+            '\n' + self.QUERY, job_config=self._make_config())
+        cached_rows = list(cached_job.result())
+
+        self.assertEqual(calls, 4)
+        self.assertEqual(client._connection.api_request.call_count, 4)
+        self.assertEqual(
+            [row.values() for row in rows],
+            [('Phred', 32), ('Bharney', 33), ('Wylma', 29)])
+        self.assertEqual(
+            [row.values() for row in cached_rows],
+            [row.values() for row in rows])
+        self.assertEqual(cached_job.job_id, 'job-1')
+        self.assertEqual(len(cache), 1)
+
+    def test_client_query_w_max_results_and_page_size(self):
+        cache = self._make_one()
+        client = self._make_client(cache, *self._query_resources())
+
+        missed = client.query(
+            self.QUERY, job_config=self._make_config()).result(
+                max_results=2, page_size=1)
+        cached = client.query(
+            self.QUERY, job_config=self._make_config()).result(
+                max_results=2, page_size=1)
+
+        for rows in (missed, cached):
+            pages = [
+                [row.values() for row in page] for page in rows.pages]
+            self.assertEqual(pages, [[('Phred', 32)], [('Bharney', 33)]])
+            self.assertEqual(rows.total_rows, 3)
+        self.assertEqual(client._connection.api_request.call_count, 4)
+        self.assertEqual(len(cache), 1)
+
+    def test_client_query_miss_w_other_parameters(self):
+        cache = self._make_one()
+        client = self._make_client(cache, *self._query_resources())
+        list(client.query(
+            self.QUERY, job_config=self._make_config()).result())
+        client._connection.api_request.side_effect = (
+            self._query_resources())
+
+        list(client.query(
+            self.QUERY, job_config=self._make_config(age=40)).result())
+
+        self.assertEqual(client._connection.api_request.call_count, 8)
+        self.assertEqual(len(cache), 2)
+
+    def test_client_query_w_too_many_rows(self):
+        cache = self._make_one(max_rows=2)
+        client = self._make_client(cache, *self._query_resources())
+
+        rows = client.query(
+            self.QUERY, job_config=self._make_config()).result()
+
+        # Only the first page is fetched until the rows are iterated.
+        self.assertEqual(client._connection.api_request.call_count, 3)
+        self.assertEqual(len(list(rows)), 3)
+        self.assertEqual(len(cache), 0)
+
+    def test_client_query_validate_tables(self):
+        table_resource = {
+            'tableReference': {
+                'projectId': self.PROJECT,
+                'datasetId': 'dset',
+                'tableId': 'people',
+            },
+            'lastModifiedTime': '1000',
+        }
+        modified_resource = dict(table_resource, lastModifiedTime='2000')
+        resources = self._query_resources()
+        cache = self._make_one(validate_tables=True)
+        client = self._make_client(
+            cache, *(resources + (table_resource, table_resource,
+                                  modified_resource)))
+
+        list(client.query(
+            self.QUERY, job_config=self._make_config()).result())
+        hit = client.query(self.QUERY, job_config=self._make_config())
+        self.assertEqual(client._connection.api_request.call_count, 6)
+        client._connection.api_request.side_effect = (
+            (modified_resource,) + resources)
+        miss = client.query(self.QUERY, job_config=self._make_config())
+
+        self.assertEqual(hit.state, 'DONE')
+        self.assertEqual(miss.state, 'RUNNING')
+        self.assertEqual(len(cache), 0)
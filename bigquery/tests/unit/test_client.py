@@ -172,6 +172,21 @@ class TestClient(unittest.TestCase):
             path='/projects/PROJECT/queries/nothere',
             query_params={'maxResults': 0, 'location': self.LOCATION})
 
+    def test__get_query_results_miss_w_max_results(self):
+        from google.cloud.exceptions import NotFound
+
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        conn = client._connection = _make_connection()
+
+        with self.assertRaises(NotFound):
+            client._get_query_results('nothere', None, max_results=None)
+
+        conn.api_request.assert_called_once_with(
+            method='GET',
+            path='/projects/PROJECT/queries/nothere',
+            query_params={})
+
     def test__get_query_results_hit(self):
         job_id = 'query_job'
         data = {
@@ -1796,6 +1811,28 @@ class TestClient(unittest.TestCase):
             path='/projects/PROJECT/jobs/query_job/cancel',
             query_params={'projection': 'full'})
 
+    def test_wait_jobs(self):
+        from concurrent import futures
+        from google.cloud.bigquery.retry import DEFAULT_RETRY
+
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        jobs = [object(), object()]
+        waiter_patch = mock.patch(
+            'google.cloud.bigquery.client.JobWaiter', autospec=True)
+
+        with waiter_patch as waiter_class:
+            waiter = waiter_class.return_value.__enter__.return_value
+            waiter.wait.return_value = ([jobs[1]], [jobs[0]])
+            done, not_done = client.wait_jobs(
+                jobs, timeout=10, return_when=futures.FIRST_COMPLETED)
+
+        self.assertEqual(done, [jobs[1]])
+        self.assertEqual(not_done, [jobs[0]])
+        waiter_class.assert_called_once_with(retry=DEFAULT_RETRY)
+        waiter.wait.assert_called_once_with(
+            jobs, timeout=10, return_when=futures.FIRST_COMPLETED)
+
     def test_list_jobs_defaults(self):
         from google.cloud.bigquery.job import CopyJob
         from google.cloud.bigquery.job import CreateDisposition
@@ -3518,6 +3555,108 @@ class TestClient(unittest.TestCase):
                 project, ds_id, table_id),
             data=sent)
 
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_insert_rows_from_dataframe(self):
+        import datetime
+        import decimal
+        from google.cloud._helpers import UTC
+        from google.cloud.bigquery._helpers import _row_to_json
+        from google.cloud.bigquery.table import Table, SchemaField
+
+        creds = _make_credentials()
+        client = self._make_one(
+            project=self.PROJECT, credentials=creds, _http=object())
+        schema = [
+            SchemaField('full_name', 'STRING', mode='REQUIRED'),
+            SchemaField('age', 'INTEGER', mode='NULLABLE'),
+            SchemaField('score', 'FLOAT', mode='NULLABLE'),
+            SchemaField('alive', 'BOOLEAN', mode='NULLABLE'),
+            SchemaField('joined', 'TIMESTAMP', mode='NULLABLE'),
+            SchemaField('born', 'DATE', mode='NULLABLE'),
+            SchemaField('seen', 'DATETIME', mode='NULLABLE'),
+            SchemaField('balance', 'NUMERIC', mode='NULLABLE'),
+            SchemaField('photo', 'BYTES', mode='NULLABLE'),
+            SchemaField('missing', 'STRING', mode='NULLABLE'),
+        ]
+        table = Table(self.TABLE_REF, schema=schema)
+        when = datetime.datetime(2018, 7, 24, 19, 53, 19, 6000, tzinfo=UTC)
+        rows = [
+            ('Phred Phlyntstone', 32, 1.5, True, when,
+             datetime.date(1980, 1, 2), datetime.datetime(2018, 1, 2, 3, 4, 5),
+             decimal.Decimal('1.25'), b'\x00\x01'),
+            ('Bharney Rhubble', None, None, False, None, None, None, None,
+             None),
+            ('Wylma Phlyntstone', 29, 2.0, True,
+             when + datetime.timedelta(seconds=1), datetime.date(1981, 3, 4),
+             datetime.datetime(2018, 5, 6, 7, 8, 9, 123456),
+             decimal.Decimal('-3'), b'abc'),
+        ]
+        names = [field.name for field in schema[:-1]]
+        dataframe = pandas.DataFrame(rows, columns=names)
+        dataframe['born'] = pandas.to_datetime(dataframe['born'])
+        dataframe['ignored'] = 1
+
+        insert_patch = mock.patch.object(
+            client, 'insert_rows_json', autospec=True, side_effect=[
+                [], [{'index': 0, 'errors': [{'reason': 'invalid'}]}]])
+        with insert_patch as insert_rows_json:
+            errors = client.insert_rows_from_dataframe(
+                table, dataframe, chunk_size=2, row_ids=['a', 'b', 'c'],
+                skip_invalid_rows=True)
+
+        self.assertEqual(
+            errors, [{'index': 2, 'errors': [{'reason': 'invalid'}]}])
+        self.assertEqual(insert_rows_json.call_count, 2)
+        sent_rows = []
+        sent_ids = []
+        for call in insert_rows_json.call_args_list:
+            self.assertIs(call[0][0], table)
+            self.assertTrue(call[1]['skip_invalid_rows'])
+            sent_rows.extend(call[0][1])
+            sent_ids.extend(call[1]['row_ids'])
+        self.assertEqual(sent_ids, ['a', 'b', 'c'])
+        expected = [_row_to_json(row, schema[:-1]) for row in rows]
+        self.assertEqual(sent_rows, expected)
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_insert_rows_from_dataframe_w_missing_required_column(self):
+        from google.cloud.bigquery.table import Table, SchemaField
+
+        creds = _make_credentials()
+        client = self._make_one(
+            project=self.PROJECT, credentials=creds, _http=object())
+        schema = [SchemaField('full_name', 'STRING', mode='REQUIRED')]
+        table = Table(self.TABLE_REF, schema=schema)
+        dataframe = pandas.DataFrame({'age': [32]})
+
+        with self.assertRaises(ValueError):
+            client.insert_rows_from_dataframe(table, dataframe)
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_insert_rows_from_dataframe_w_non_integral_floats(self):
+        from google.cloud.bigquery.table import Table, SchemaField
+
+        creds = _make_credentials()
+        client = self._make_one(
+            project=self.PROJECT, credentials=creds, _http=object())
+        schema = [SchemaField('age', 'INTEGER', mode='NULLABLE')]
+        table = Table(self.TABLE_REF, schema=schema)
+        dataframe = pandas.DataFrame({'age': [32.0, None, 29.5]})
+
+        with mock.patch.object(client, 'insert_rows_json') as insert:
+            with self.assertRaises(ValueError):
+                client.insert_rows_from_dataframe(table, dataframe)
+
+        insert.assert_not_called()
+
+    def test_insert_rows_from_dataframe_w_table_reference(self):
+        creds = _make_credentials()
+        client = self._make_one(
+            project=self.PROJECT, credentials=creds, _http=object())
+
+        with self.assertRaises(ValueError):
+            client.insert_rows_from_dataframe(self.TABLE_REF, None)
+
     def test_insert_rows_json(self):
         from google.cloud.bigquery.table import Table, SchemaField
         from google.cloud.bigquery.dataset import DatasetReference
@@ -3768,6 +3907,36 @@ class TestClient(unittest.TestCase):
             self.assertEqual(req[1]['query_params'], test[1],
                              'for kwargs %s' % test[0])
 
+    def test_list_rows_w_max_workers(self):
+        from google.cloud.bigquery.table import Table, SchemaField
+
+        PATH = 'projects/%s/datasets/%s/tables/%s/data' % (
+            self.PROJECT, self.DS_ID, self.TABLE_ID)
+        creds = _make_credentials()
+        http = object()
+        client = self._make_one(project=self.PROJECT, credentials=creds,
+                                _http=http)
+        table = Table(self.TABLE_REF,
+                      schema=[SchemaField('age', 'INTEGER', mode='NULLABLE')])
+        first_page = {
+            'totalRows': '3',
+            'pageToken': 'TOKEN',
+            'rows': [{'f': [{'v': '31'}]}, {'f': [{'v': '32'}]}],
+        }
+        second_page = {
+            'totalRows': '3',
+            'rows': [{'f': [{'v': '33'}]}],
+        }
+        conn = client._connection = _make_connection(first_page, second_page)
+
+        iterator = client.list_rows(table, max_workers=2, prefetch_pages=4)
+        rows = list(iterator)
+
+        self.assertEqual([row.age for row in rows], [31, 32, 33])
+        conn.api_request.assert_called_with(
+            method='GET', path='/%s' % PATH,
+            query_params={'startIndex': 2, 'maxResults': 1})
+
     def test_list_rows_repeated_fields(self):
         from google.cloud.bigquery.table import SchemaField
 
@@ -4277,6 +4446,78 @@ class TestClientUpload(object):
         sent_config = load_table_from_file.mock_calls[0][2]['job_config']
         assert sent_config.source_format == job.SourceFormat.PARQUET
 
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+    def test_load_table_from_dataframe_w_row_group_size(self):
+        import pyarrow.parquet
+        from google.cloud.bigquery.client import _DEFAULT_NUM_RETRIES
+        from google.cloud.bigquery import job
+
+        client = self._make_client()
+        dataframe = pandas.DataFrame({
+            'name': ['Monty', 'Python', None, 'Eric', 'Idle'],
+            'nickname': [None, None, None, 'Vikings', None],
+            'age': [100, 60, 12, 75, 45],
+        })
+        sent = []
+
+        def load_table_from_file(client, file_obj, destination, **kwargs):
+            chunks = []
+            while True:
+                chunk = file_obj.read(64)
+                chunks.append(chunk)
+                if len(chunk) < 64:
+                    break
+            sent.append(b''.join(chunks))
+            assert file_obj.tell() == len(sent[0])
+
+        load_patch = mock.patch(
+            'google.cloud.bigquery.client.Client.load_table_from_file',
+            autospec=True, side_effect=load_table_from_file)
+        with load_patch as load_table_from_file:
+            client.load_table_from_dataframe(
+                dataframe, self.TABLE_REF, row_group_size=2)
+
+        load_table_from_file.assert_called_once_with(
+            client, mock.ANY, self.TABLE_REF, num_retries=_DEFAULT_NUM_RETRIES,
+            job_id=None, job_id_prefix=None, location=None,
+            project=None, job_config=mock.ANY)
+        sent_config = load_table_from_file.mock_calls[0][2]['job_config']
+        assert sent_config.source_format == job.SourceFormat.PARQUET
+
+        parquet_file = pyarrow.parquet.ParquetFile(
+            pyarrow.BufferReader(sent[0]))
+        assert parquet_file.num_row_groups == 3
+        sent_frame = parquet_file.read().to_pandas()
+        assert list(sent_frame['age']) == [100, 60, 12, 75, 45]
+        assert list(sent_frame['nickname']) == [
+            None, None, None, 'Vikings', None]
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+    def test_load_table_from_dataframe_w_row_group_size_upload_error(self):
+        import os
+        from google.api_core import exceptions
+        from google.cloud.bigquery.client import _DEFAULT_CHUNKSIZE
+
+        client = self._make_client()
+        # Large enough that the encoder blocks on the full pipe.
+        dataframe = pandas.DataFrame({
+            'payload': [os.urandom(1024) for _ in range(4 * 1024)],
+        })
+
+        def load_table_from_file(client, file_obj, destination, **kwargs):
+            file_obj.read(_DEFAULT_CHUNKSIZE)
+            raise exceptions.ServiceUnavailable('upload failed')
+
+        load_patch = mock.patch(
+            'google.cloud.bigquery.client.Client.load_table_from_file',
+            autospec=True, side_effect=load_table_from_file)
+        with load_patch:
+            with pytest.raises(exceptions.ServiceUnavailable):
+                client.load_table_from_dataframe(
+                    dataframe, self.TABLE_REF, row_group_size=16)
+
     @unittest.skipIf(pandas is None, 'Requires `pandas`')
     @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
     def test_load_table_from_dataframe_w_client_location(self):
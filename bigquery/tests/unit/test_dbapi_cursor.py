@@ -15,6 +15,14 @@
 import unittest
 
 import mock
+try:
+    import pandas
+except (ImportError, AttributeError):  # pragma: NO COVER
+    pandas = None
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
 
 
 class TestCursor(unittest.TestCase):
@@ -41,7 +49,9 @@ class TestCursor(unittest.TestCase):
             total_rows=total_rows,
             schema=schema,
             num_dml_affected_rows=num_dml_affected_rows)
-        mock_client.list_rows.return_value = rows
+        mock_rows = mock.Mock(spec=['pages'])
+        mock_rows.pages = [rows] if rows else []
+        mock_client.list_rows.return_value = mock_rows
         return mock_client
 
     def _mock_job(
@@ -161,6 +171,128 @@ class TestCursor(unittest.TestCase):
         third_page = cursor.fetchmany()
         self.assertEqual(third_page, [])
 
+    def test_fetchmany_w_pages(self):
+        from google.cloud.bigquery import dbapi
+
+        client = self._mock_client(rows=[(1,)])
+        client.list_rows.return_value.pages = [
+            [(1,), (2,), (3,)],
+            [(4,)],
+            [(5,), (6,)],
+        ]
+        connection = dbapi.connect(client)
+        cursor = connection.cursor()
+        cursor.execute('SELECT a;')
+
+        self.assertEqual(cursor.fetchmany(size=2), [(1,), (2,)])
+        self.assertEqual(cursor.fetchmany(size=3), [(3,), (4,), (5,)])
+        self.assertEqual(cursor.fetchone(), (6,))
+        self.assertEqual(cursor.fetchmany(size=2), [])
+
+    def test_fetch_page_size_independent_of_arraysize(self):
+        from google.cloud.bigquery import dbapi
+
+        client = self._mock_client(rows=[(1,)])
+        connection = dbapi.connect(client)
+        cursor = connection.cursor()
+        cursor.arraysize = 2
+        cursor.execute('SELECT a;')
+
+        cursor.fetchmany()
+
+        client.list_rows.assert_called_once_with(
+            mock.ANY, selected_fields=None, page_size=None,
+            max_workers=None, prefetch_pages=None)
+
+    def test_fetch_w_page_size_and_prefetch(self):
+        from google.cloud.bigquery import dbapi
+
+        client = self._mock_client(rows=[(1,)])
+        connection = dbapi.connect(client)
+        cursor = connection.cursor()
+        cursor.page_size = 500
+        cursor.prefetch_pages = 2
+        cursor.execute('SELECT a;')
+
+        cursor.fetchall()
+
+        client.list_rows.assert_called_once_with(
+            mock.ANY, selected_fields=None, page_size=500,
+            max_workers=2, prefetch_pages=2)
+
+    def _mock_client_w_json_pages(self, pages):
+        from google.cloud.bigquery.schema import SchemaField
+        from google.cloud.bigquery.table import Row
+
+        schema = [
+            SchemaField('name', 'STRING', mode='NULLABLE'),
+            SchemaField('age', 'INTEGER', mode='NULLABLE'),
+        ]
+        field_to_index = {'name': 0, 'age': 1}
+        mock_pages = []
+        for page in pages:
+            rows_json = [
+                {'f': [{'v': name}, {'v': str(age)}]} for name, age in page]
+            mock_page = mock.MagicMock(spec=['__iter__', '_rows_json'])
+            mock_page.__iter__.return_value = [
+                Row(row, field_to_index) for row in page]
+            mock_page._rows_json = rows_json
+            mock_pages.append(mock_page)
+
+        client = self._mock_client(rows=[], schema=schema)
+        client.list_rows.return_value.pages = mock_pages
+        return client
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_fetch_dataframe_batches(self):
+        from google.cloud.bigquery import dbapi
+
+        client = self._mock_client_w_json_pages([
+            [('Phred', 32), ('Bharney', 33)],
+            [('Wylma', 29)],
+        ])
+        connection = dbapi.connect(client)
+        cursor = connection.cursor()
+        cursor.execute('SELECT name, age;')
+
+        self.assertEqual(cursor.fetchone().values(), ('Phred', 32))
+        frames = list(cursor.fetch_dataframe_batches(
+            dtypes={'age': 'int32'}))
+
+        self.assertEqual(len(frames), 2)
+        self.assertEqual(list(frames[0].columns), ['name', 'age'])
+        self.assertEqual(list(frames[0]['name']), ['Bharney'])
+        self.assertEqual(list(frames[1]['name']), ['Wylma'])
+        self.assertEqual(frames[1]['age'].dtype.name, 'int32')
+        self.assertIsNone(cursor.fetchone())
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+    def test_fetch_arrow_batches(self):
+        from google.cloud.bigquery import dbapi
+
+        client = self._mock_client_w_json_pages([
+            [('Phred', 32), ('Bharney', 33)],
+        ])
+        connection = dbapi.connect(client)
+        cursor = connection.cursor()
+        cursor.execute('SELECT name, age;')
+
+        batches = list(cursor.fetch_arrow_batches())
+
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(batches[0].num_rows, 2)
+        self.assertEqual(batches[0].schema.names, ['name', 'age'])
+
+    def test_fetch_dataframe_batches_wo_execute_raises_error(self):
+        from google.cloud.bigquery import dbapi
+
+        connection = dbapi.connect(self._mock_client())
+        cursor = connection.cursor()
+
+        with self.assertRaises(dbapi.Error):
+            list(cursor.fetch_dataframe_batches())
+
     def test_fetchall_wo_execute_raises_error(self):
         from google.cloud.bigquery import dbapi
         connection = dbapi.connect(self._mock_client())
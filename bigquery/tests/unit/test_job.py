@@ -16,6 +16,7 @@ import copy
 import unittest
 
 import mock
+import six
 from six.moves import http_client
 try:
     import pandas
@@ -866,6 +867,50 @@ class Test_AsyncJob(unittest.TestCase):
         begin.assert_not_called()
         result.assert_called_once_with(timeout=timeout)
 
+    @unittest.skipIf(six.PY2, 'Requires `asyncio`')
+    def test_result_async_wo_state(self):
+        import asyncio
+        from concurrent import futures
+
+        client = _make_client(project=self.PROJECT)
+        job = self._make_one(self.JOB_ID, client)
+        begin = job._begin = mock.Mock()
+        waiter = mock.Mock(spec=['watch'])
+        job_future = futures.Future()
+        job_future.set_result(job)
+        waiter.watch.return_value = job_future
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        result = loop.run_until_complete(
+            job.result_async(waiter=waiter, loop=loop))
+
+        self.assertIs(result, job)
+        begin.assert_called_once()
+        waiter.watch.assert_called_once_with(job)
+
+    @unittest.skipIf(six.PY2, 'Requires `asyncio`')
+    @mock.patch('google.cloud.bigquery.job.default_waiter')
+    def test_result_async_w_state_default_waiter(self, default_waiter):
+        import asyncio
+        from concurrent import futures
+
+        client = _make_client(project=self.PROJECT)
+        job = self._make_one(self.JOB_ID, client)
+        job._properties['status'] = {'state': 'RUNNING'}
+        begin = job._begin = mock.Mock()
+        error = ValueError('job failed')
+        job_future = futures.Future()
+        job_future.set_exception(error)
+        default_waiter.return_value.watch.return_value = job_future
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        with self.assertRaises(ValueError):
+            loop.run_until_complete(job.result_async(loop=loop))
+
+        begin.assert_not_called()
+
     def test_cancelled_wo_error_result(self):
         client = _make_client(project=self.PROJECT)
         job = self._make_one(self.JOB_ID, client)
@@ -3713,6 +3758,112 @@ class TestQueryJob(unittest.TestCase, _Base):
 
         self.assertEqual(list(result), [])
 
+    def test_result_reuses_first_page_from_query_results(self):
+        begun_resource = self._make_resource()
+        incomplete_resource = {
+            'jobComplete': False,
+            'jobReference': {
+                'projectId': self.PROJECT,
+                'jobId': self.JOB_ID,
+            },
+            'schema': {'fields': [{'name': 'col1', 'type': 'STRING'}]},
+        }
+        query_resource = copy.deepcopy(incomplete_resource)
+        query_resource['jobComplete'] = True
+        query_resource['totalRows'] = '3'
+        query_resource['pageToken'] = 'next-page'
+        query_resource['rows'] = [
+            {'f': [{'v': 'abc'}]},
+            {'f': [{'v': 'def'}]},
+        ]
+        done_resource = copy.deepcopy(begun_resource)
+        done_resource['status'] = {'state': 'DONE'}
+        tabledata_resource = {
+            'totalRows': '3',
+            'rows': [{'f': [{'v': 'ghi'}]}],
+        }
+        connection = _make_connection(
+            begun_resource, incomplete_resource, query_resource, done_resource,
+            tabledata_resource)
+        client = _make_client(project=self.PROJECT, connection=connection)
+        job = self._make_one(self.JOB_ID, self.QUERY, client)
+
+        result = job.result(page_size=2)
+        rows = list(result)
+
+        self.assertEqual([row.col1 for row in rows], ['abc', 'def', 'ghi'])
+        self.assertEqual(result.total_rows, 3)
+        self.assertEqual(len(connection.api_request.call_args_list), 5)
+        query_request = connection.api_request.call_args_list[2]
+        self.assertEqual(query_request[1]['query_params']['maxResults'], 2)
+        tabledata_request = connection.api_request.call_args_list[4]
+        destination = done_resource['configuration']['query'][
+            'destinationTable']
+        self.assertEqual(
+            tabledata_request[1]['path'],
+            '/projects/{}/datasets/{}/tables/{}/data'.format(
+                destination['projectId'], destination['datasetId'],
+                destination['tableId']))
+        self.assertEqual(
+            tabledata_request[1]['query_params'],
+            {'pageToken': 'next-page', 'maxResults': 2})
+
+    def test_result_w_done_job_fetches_first_page(self):
+        query_resource = {
+            'jobComplete': True,
+            'jobReference': {
+                'projectId': self.PROJECT,
+                'jobId': self.JOB_ID,
+            },
+            'schema': {'fields': [{'name': 'col1', 'type': 'STRING'}]},
+            'totalRows': '1',
+            'rows': [{'f': [{'v': 'abc'}]}],
+        }
+        connection = _make_connection(query_resource)
+        client = _make_client(self.PROJECT, connection=connection)
+        resource = self._make_resource(ended=True)
+        job = self._get_target_class().from_api_repr(resource, client)
+
+        result = job.result(max_results=10)
+
+        self.assertEqual([row.col1 for row in result], ['abc'])
+        connection.api_request.assert_called_once_with(
+            method='GET',
+            path='/projects/{}/queries/{}'.format(self.PROJECT, self.JOB_ID),
+            query_params={'maxResults': 10})
+
+    def test_result_w_smaller_max_results_refetches_first_page(self):
+        query_resource = {
+            'jobComplete': True,
+            'jobReference': {
+                'projectId': self.PROJECT,
+                'jobId': self.JOB_ID,
+            },
+            'schema': {'fields': [{'name': 'col1', 'type': 'STRING'}]},
+            'totalRows': '3',
+            'rows': [
+                {'f': [{'v': 'abc'}]},
+                {'f': [{'v': 'def'}]},
+                {'f': [{'v': 'ghi'}]},
+            ],
+        }
+        short_resource = copy.deepcopy(query_resource)
+        short_resource['rows'] = query_resource['rows'][:1]
+        short_resource['pageToken'] = 'next-page'
+        connection = _make_connection(query_resource, short_resource)
+        client = _make_client(self.PROJECT, connection=connection)
+        resource = self._make_resource(ended=True)
+        job = self._get_target_class().from_api_repr(resource, client)
+
+        self.assertEqual(len(list(job.result())), 3)
+        rows = list(job.result(max_results=1))
+
+        self.assertEqual([row.col1 for row in rows], ['abc'])
+        self.assertEqual(connection.api_request.call_count, 2)
+        self.assertEqual(
+            connection.api_request.call_args[1]['query_params'],
+            {'maxResults': 1})
+
     def test_result_w_empty_schema(self):
         # Destination table may have no schema for some DDL and DML queries.
         query_resource = {
@@ -1287,6 +1287,164 @@ class TestRowIterator(unittest.TestCase):
             method='GET', path=path, query_params={
                 'maxResults': row_iterator._page_size})
 
+    def test_iterate_w_first_page_response(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField('name', 'STRING', mode='REQUIRED')]
+        first_page = {
+            'totalRows': '2',
+            'pageToken': 'next-page',
+            'rows': [{'f': [{'v': 'Phred Phlyntstone'}]}],
+        }
+        path = '/foo'
+        api_request = mock.Mock(return_value={
+            'totalRows': '2',
+            'rows': [{'f': [{'v': 'Bharney Rhubble'}]}],
+        })
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, path, schema,
+            first_page_response=first_page)
+
+        rows = list(row_iterator)
+
+        self.assertEqual(
+            [row.name for row in rows],
+            ['Phred Phlyntstone', 'Bharney Rhubble'])
+        self.assertEqual(row_iterator.total_rows, 2)
+        api_request.assert_called_once_with(
+            method='GET', path=path, query_params={'pageToken': 'next-page'})
+
+    def _make_prefetch_api_request(
+            self, num_rows, first_page_size, max_page_size=None):
+        def api_request(method, path, query_params):
+            start_index = query_params.get('startIndex', 0)
+            page_size = query_params.get('maxResults', first_page_size)
+            if max_page_size is not None:
+                # Return short pages, as ``tabledata.list`` may.
+                page_size = min(page_size, max_page_size)
+            end_index = min(start_index + page_size, num_rows)
+            response = {
+                'totalRows': str(num_rows),
+                'rows': [
+                    {'f': [{'v': str(index)}]}
+                    for index in range(start_index, end_index)],
+            }
+            if end_index < num_rows:
+                response['pageToken'] = 'token-{}'.format(end_index)
+            return response
+
+        return mock.Mock(side_effect=api_request)
+
+    def test_iterate_w_max_workers(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField('index', 'INTEGER', mode='REQUIRED')]
+        path = '/foo'
+        api_request = self._make_prefetch_api_request(10, 3)
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, path, schema,
+            extra_params={'selectedFields': 'index'},
+            max_workers=2, prefetch_pages=1)
+
+        rows = list(row_iterator)
+
+        self.assertEqual([row.index for row in rows], list(range(10)))
+        self.assertEqual(row_iterator.total_rows, 10)
+        self.assertEqual(api_request.call_count, 4)
+        api_request.assert_any_call(
+            method='GET', path=path, query_params={'selectedFields': 'index'})
+        for start_index, max_results in ((3, 3), (6, 3), (9, 1)):
+            api_request.assert_any_call(
+                method='GET', path=path, query_params={
+                    'selectedFields': 'index',
+                    'startIndex': start_index,
+                    'maxResults': max_results,
+                })
+
+    def test_iterate_w_max_workers_and_short_pages(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField('index', 'INTEGER', mode='REQUIRED')]
+        path = '/foo'
+        api_request = self._make_prefetch_api_request(9, 3, max_page_size=2)
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, path, schema, page_size=3,
+            max_workers=2)
+
+        rows = list(row_iterator)
+
+        self.assertEqual([row.index for row in rows], list(range(9)))
+        for start_index, max_results in ((2, 3), (4, 1), (5, 3), (7, 1)):
+            api_request.assert_any_call(
+                method='GET', path=path, query_params={
+                    'startIndex': start_index,
+                    'maxResults': max_results,
+                })
+
+    def test_iterate_w_max_workers_and_max_results(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField('index', 'INTEGER', mode='REQUIRED')]
+        path = '/foo'
+        api_request = self._make_prefetch_api_request(100, 4)
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, path, schema,
+            extra_params={'startIndex': 10}, max_results=10, page_size=4,
+            max_workers=4)
+
+        rows = list(row_iterator)
+
+        self.assertEqual([row.index for row in rows], list(range(10, 20)))
+        self.assertEqual(api_request.call_count, 3)
+
+    def test_iterate_w_max_workers_and_page_token(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField('index', 'INTEGER', mode='REQUIRED')]
+        path = '/foo'
+        api_request = mock.Mock(side_effect=[
+            {'totalRows': '4', 'pageToken': 'next',
+             'rows': [{'f': [{'v': '2'}]}]},
+            {'totalRows': '4', 'rows': [{'f': [{'v': '3'}]}]},
+        ])
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, path, schema,
+            page_token='start', max_workers=2)
+
+        rows = list(row_iterator)
+
+        # The position of the page token is unknown, so pages are fetched
+        # sequentially.
+        self.assertEqual([row.index for row in rows], [2, 3])
+        api_request.assert_called_with(
+            method='GET', path=path, query_params={'pageToken': 'next'})
+
+    def test_iterate_w_max_workers_error(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField('index', 'INTEGER', mode='REQUIRED')]
+        path = '/foo'
+        first_page = {
+            'totalRows': '4', 'pageToken': 'next',
+            'rows': [{'f': [{'v': '0'}]}, {'f': [{'v': '1'}]}],
+        }
+        api_request = mock.Mock(
+            side_effect=[first_page, ValueError('boom')])
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, path, schema, max_workers=1)
+
+        rows_iter = iter(row_iterator)
+        self.assertEqual(six.next(rows_iter).index, 0)
+        self.assertEqual(six.next(rows_iter).index, 1)
+        with self.assertRaises(ValueError):
+            six.next(rows_iter)
+
     @unittest.skipIf(pandas is None, 'Requires `pandas`')
     def test_to_dataframe(self):
         from google.cloud.bigquery.table import RowIterator
@@ -1416,6 +1574,106 @@ class TestRowIterator(unittest.TestCase):
         self.assertEqual(df.complete.dtype.name, 'bool')
         self.assertEqual(df.date.dtype.name, 'object')
 
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_to_dataframe_w_dtypes(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [
+            SchemaField('start_timestamp', 'TIMESTAMP'),
+            SchemaField('seconds', 'INT64'),
+            SchemaField('miles', 'FLOAT64'),
+        ]
+        row_data = [
+            ['1.4338368E9', '420', '1.1'],
+            ['1.3878117E9', '2580', '17.7'],
+        ]
+        rows = [{'f': [{'v': field} for field in row]} for row in row_data]
+        path = '/foo'
+        api_request = mock.Mock(return_value={'rows': rows})
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, path, schema)
+
+        df = row_iterator.to_dataframe(
+            dtypes={'seconds': 'int32', 'miles': 'float32'})
+
+        self.assertEqual(df.start_timestamp.dtype.name, 'datetime64[ns, UTC]')
+        self.assertEqual(df.seconds.dtype.name, 'int32')
+        self.assertEqual(df.miles.dtype.name, 'float32')
+        self.assertEqual(list(df.seconds), [420, 2580])
+        self.assertEqual([round(miles, 1) for miles in df.miles], [1.1, 17.7])
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_to_dataframe_w_multiple_pages(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [
+            SchemaField('name', 'STRING'),
+            SchemaField('age', 'INTEGER'),
+            SchemaField('alive', 'BOOLEAN'),
+        ]
+        page_1 = {
+            'pageToken': 'next-page',
+            'rows': [
+                {'f': [{'v': 'Phred Phlyntstone'}, {'v': '32'},
+                       {'v': 'true'}]},
+                {'f': [{'v': 'Bharney Rhubble'}, {'v': '33'},
+                       {'v': 'false'}]},
+            ],
+        }
+        page_2 = {
+            'rows': [
+                {'f': [{'v': 'Wylma Phlyntstone'}, {'v': None},
+                       {'v': None}]},
+            ],
+        }
+        path = '/foo'
+        api_request = mock.Mock(side_effect=[page_1, page_2])
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, path, schema)
+
+        df = row_iterator.to_dataframe()
+
+        self.assertEqual(len(df), 3)
+        self.assertEqual(list(df.index), [0, 1, 2])
+        self.assertEqual(list(df), ['name', 'age', 'alive'])
+        # Nulls in the second page upcast the columns of the first page.
+        self.assertEqual(df.age.dtype.name, 'float64')
+        self.assertEqual(df.alive.dtype.name, 'object')
+        self.assertEqual(list(df.age[:2]), [32.0, 33.0])
+        self.assertTrue(pandas.isnull(df.age[2]))
+        self.assertEqual(list(df.alive), [True, False, None])
+        self.assertEqual(api_request.call_count, 2)
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_to_dataframe_w_repeated_and_record(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [
+            SchemaField('scores', 'INTEGER', mode='REPEATED'),
+            SchemaField('address', 'RECORD', fields=[
+                SchemaField('city', 'STRING'),
+                SchemaField('zip', 'INTEGER'),
+            ]),
+        ]
+        rows = [
+            {'f': [
+                {'v': [{'v': '1'}, {'v': '2'}]},
+                {'v': {'f': [{'v': 'Bedrock'}, {'v': '70777'}]}},
+            ]},
+        ]
+        path = '/foo'
+        api_request = mock.Mock(return_value={'rows': rows})
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, path, schema)
+
+        df = row_iterator.to_dataframe()
+
+        self.assertEqual(df.scores[0], [1, 2])
+        self.assertEqual(df.address[0], {'city': 'Bedrock', 'zip': 70777})
+
     @mock.patch('google.cloud.bigquery.table.pandas', new=None)
     def test_to_dataframe_error_if_pandas_is_none(self):
         from google.cloud.bigquery.table import RowIterator
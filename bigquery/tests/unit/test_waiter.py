@@ -0,0 +1,159 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import unittest
+
+import mock
+
+
+def _make_job(states, started=None, result=None):
+    """Make a job whose state advances through ``states`` on each reload."""
+    job = mock.Mock(spec=['reload', 'result', 'state', 'started'])
+    remaining = list(states)
+    job.state = remaining.pop(0)
+    job.started = started
+
+    def reload(retry=None):
+        job.state = remaining.pop(0)
+
+    job.reload.side_effect = reload
+    if isinstance(result, Exception):
+        job.result.side_effect = result
+    else:
+        job.result.return_value = result if result is not None else job
+    return job
+
+
+class TestJobWaiter(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.waiter import JobWaiter
+
+        return JobWaiter
+
+    def _make_one(self, **kwargs):
+        kwargs.setdefault('initial_interval', 0.001)
+        waiter = self._get_target_class()(**kwargs)
+        self.addCleanup(waiter.close)
+        return waiter
+
+    def test_watch_resolves_with_result(self):
+        waiter = self._make_one()
+        job = _make_job(['RUNNING', 'RUNNING', 'DONE'], result='rows')
+
+        future = waiter.watch(job)
+
+        self.assertEqual(future.result(timeout=5), 'rows')
+        self.assertEqual(job.reload.call_count, 2)
+
+    def test_watch_done_job_does_not_poll(self):
+        waiter = self._make_one()
+        job = _make_job(['DONE'])
+
+        future = waiter.watch(job)
+
+        self.assertIs(future.result(timeout=5), job)
+        job.reload.assert_not_called()
+
+    def test_watch_job_error(self):
+        waiter = self._make_one()
+        error = ValueError('job failed')
+        job = _make_job(['RUNNING', 'DONE'], result=error)
+
+        future = waiter.watch(job)
+
+        self.assertIs(future.exception(timeout=5), error)
+
+    def test_watch_reload_error(self):
+        waiter = self._make_one()
+        job = _make_job(['RUNNING'])
+        error = ValueError('reload failed')
+        job.reload.side_effect = error
+
+        future = waiter.watch(job)
+
+        self.assertIs(future.exception(timeout=5), error)
+
+    def test_watch_after_close(self):
+        waiter = self._make_one()
+        waiter.close()
+
+        with self.assertRaises(ValueError):
+            waiter.watch(_make_job(['RUNNING']))
+
+    def test_close_cancels_pending(self):
+        waiter = self._make_one(initial_interval=60)
+        future = waiter.watch(_make_job(['RUNNING']))
+
+        waiter.close()
+
+        self.assertTrue(future.cancelled())
+
+    def test_wait_first_completed(self):
+        from concurrent import futures
+
+        waiter = self._make_one()
+        done_job = _make_job(['RUNNING', 'DONE'])
+        running_job = _make_job(['RUNNING'] + ['RUNNING'] * 1000)
+
+        done, not_done = waiter.wait(
+            [running_job, done_job], timeout=5,
+            return_when=futures.FIRST_COMPLETED)
+
+        self.assertEqual(done, [done_job])
+        self.assertEqual(not_done, [running_job])
+
+    def test_next_interval_pending_backs_off(self):
+        from google.cloud.bigquery.waiter import _Watch
+
+        waiter = self._make_one(initial_interval=1.0, max_interval=4.0)
+        watch = _Watch(_make_job(['PENDING']), None, 1.0)
+
+        self.assertEqual(waiter._next_interval(watch), 1.5)
+        watch.interval = 3.0
+        self.assertEqual(waiter._next_interval(watch), 4.0)
+
+    def test_next_interval_running_scales_with_runtime(self):
+        from google.cloud._helpers import UTC
+        from google.cloud.bigquery.waiter import _Watch
+
+        now = datetime.datetime.utcnow().replace(tzinfo=UTC)
+        waiter = self._make_one(initial_interval=1.0, max_interval=30.0)
+        short = _Watch(_make_job(
+            ['RUNNING'], started=now - datetime.timedelta(seconds=2)),
+            None, 1.0)
+        long = _Watch(_make_job(
+            ['RUNNING'], started=now - datetime.timedelta(seconds=120)),
+            None, 1.0)
+        very_long = _Watch(_make_job(
+            ['RUNNING'], started=now - datetime.timedelta(hours=2)),
+            None, 1.0)
+
+        self.assertEqual(waiter._next_interval(short), 1.0)
+        self.assertAlmostEqual(waiter._next_interval(long), 12.0, places=0)
+        self.assertEqual(waiter._next_interval(very_long), 30.0)
+
+
+class Test_default_waiter(unittest.TestCase):
+
+    def test_shared(self):
+        from google.cloud.bigquery.waiter import default_waiter
+        from google.cloud.bigquery.waiter import JobWaiter
+
+        waiter = default_waiter()
+
+        self.assertIsInstance(waiter, JobWaiter)
+        self.assertIs(default_waiter(), waiter)
@@ -0,0 +1,184 @@
+# Copyright 2018, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Batches which share one timer thread and a bounded pool of committers.
+
+:class:`~.pubsub_v1.publisher._batch.thread.Batch` starts a thread to wait
+out ``max_latency`` for every batch it opens, and another thread for every
+commit. The batches here instead register their deadline with the
+:class:`BatchScheduler` of their client, which keeps the deadlines of all
+topics in a heap, waits for the earliest one on a single thread, and runs
+the commits in a thread pool.
+"""
+
+from __future__ import absolute_import
+
+import concurrent.futures
+import heapq
+import itertools
+import logging
+import sys
+import threading
+import time
+
+from google.cloud.pubsub_v1.publisher._batch import thread
+
+
+_LOGGER = logging.getLogger(__name__)
+_MAX_COMMIT_WORKERS = 10
+
+
+def _make_commit_executor(max_workers):
+    # Python 2.7 and 3.6+ have the thread_name_prefix argument, which is useful
+    # for debugging.
+    executor_kwargs = {}
+    if sys.version_info[:2] == (2, 7) or sys.version_info >= (3, 6):
+        executor_kwargs['thread_name_prefix'] = (
+            'ThreadPoolExecutor-CommitBatchPublisher')
+    return concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers,
+        **executor_kwargs
+    )
+
+
+class BatchScheduler(object):
+    """Run callbacks at deadlines, and batch commits, for a publisher client.
+
+    The deadlines are kept in a heap and waited for by one thread, which is
+    started when the first deadline is scheduled and exits once none are
+    left, so that an idle client holds no threads and, as with
+    :class:`~.pubsub_v1.publisher._batch.thread.Batch`, pending batches are
+    published before the interpreter exits. Callbacks run on the timer
+    thread, so they must not block; :meth:`submit` runs blocking work in the
+    commit pool.
+
+    Args:
+        max_workers (int): The maximum number of batches committed at once.
+    """
+    def __init__(self, max_workers=_MAX_COMMIT_WORKERS):
+        self._max_workers = max_workers
+        self._condition = threading.Condition()
+        # A heap of ``(deadline, sequence, callback)`` tuples; the sequence
+        # number breaks ties so callbacks are never compared.
+        self._deadlines = []
+        self._sequence = itertools.count()
+        self._thread = None
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    def call_at(self, deadline, callback):
+        """Call ``callback`` on the timer thread at ``deadline``.
+
+        Args:
+            deadline (float): The time to call the callback at, as returned
+                by :func:`time.time`.
+            callback (Callable[[], None]): The function to call.
+        """
+        with self._condition:
+            entry = (deadline, next(self._sequence), callback)
+            heapq.heappush(self._deadlines, entry)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    name='Thread-BatchScheduler',
+                    target=self._run,
+                )
+                self._thread.start()
+            elif self._deadlines[0] is entry:
+                # The timer thread is waiting for a later deadline.
+                self._condition.notify()
+
+    def submit(self, func, *args, **kwargs):
+        """Call ``func`` in the commit pool.
+
+        Args:
+            func (Callable): The function to call.
+            args: Positional arguments passed to the function.
+            kwargs: Key-word arguments passed to the function.
+
+        Returns:
+            ~concurrent.futures.Future: The future of the call.
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = _make_commit_executor(self._max_workers)
+        return self._executor.submit(func, *args, **kwargs)
+
+    def _due(self):
+        """Wait for deadlines to pass, and pop their callbacks.
+
+        Returns:
+            List[Callable[[], None]]: The callbacks which are due, or an
+            empty list if there are no deadlines left.
+        """
+        with self._condition:
+            while self._deadlines:
+                timeout = self._deadlines[0][0] - time.time()
+                if timeout > 0:
+                    self._condition.wait(timeout)
+                    continue
+
+                now = time.time()
+                due = []
+                while self._deadlines and self._deadlines[0][0] <= now:
+                    due.append(heapq.heappop(self._deadlines)[2])
+                return due
+
+            # Let the next call to ``call_at`` start a new thread.
+            self._thread = None
+            return []
+
+    def _run(self):
+        """Call callbacks as their deadlines pass, until there are none."""
+        while True:
+            due = self._due()
+            if not due:
+                return
+            for callback in due:
+                try:
+                    callback()
+                except Exception:
+                    _LOGGER.exception('Scheduled batch callback failed.')
+
+
+class Batch(thread.Batch):
+    """A batch of messages which is committed by its client's scheduler.
+
+    This behaves as :class:`~.pubsub_v1.publisher._batch.thread.Batch`, but
+    starts no threads of its own: it is committed when ``max_latency`` has
+    elapsed by the :class:`BatchScheduler` of the client, and commits run in
+    the scheduler's thread pool.
+
+    Args:
+        client (~.pubsub_v1.PublisherClient): The publisher client used to
+            create this batch.
+        topic (str): The topic. The format for this is
+            ``projects/{project}/topics/{topic}``.
+        settings (~.pubsub_v1.types.BatchSettings): The settings for batch
+            publishing. These should be considered immutable once the batch
+            has been opened.
+        autocommit (bool): Whether to autocommit the batch when the time
+            has elapsed. Defaults to True unless ``settings.max_latency`` is
+            inf.
+    """
+    def __init__(self, client, topic, settings, autocommit=True):
+        super(Batch, self).__init__(
+            client, topic, settings, autocommit=False)
+
+        if autocommit and self._settings.max_latency < float('inf'):
+            client._batch_scheduler.call_at(
+                time.time() + self._settings.max_latency, self.commit)
+
+    def _start_commit(self):
+        """Call :meth:`_commit` in the scheduler's thread pool."""
+        self._client._batch_scheduler.submit(self._commit)
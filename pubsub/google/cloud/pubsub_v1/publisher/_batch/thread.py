@@ -162,7 +162,10 @@ class Batch(base.Batch):
             else:
                 return
 
-        # Start a new thread to actually handle the commit.
+        self._start_commit()
+
+    def _start_commit(self):
+        """Start a new thread to actually handle the commit."""
         commit_thread = threading.Thread(
             name='Thread-CommitBatchPublisher',
             target=self._commit,
@@ -286,7 +289,8 @@ class Batch(base.Batch):
             if not self.will_accept(message):
                 return future
 
-            new_size = self._size + message.ByteSize()
+            message_size = message.ByteSize()
+            new_size = self._size + message_size
             new_count = len(self._messages) + 1
             overflow = (
                 new_size > self.settings.max_bytes or
@@ -304,9 +308,36 @@ class Batch(base.Batch):
                 future = futures.Future(completed=threading.Event())
                 self._futures.append(future)
 
+                # Count the message as outstanding until the future is done.
+                self._client._flow_controller.track(
+                    future, self, message_size)
+
         # Try to commit, but it must be **without** the lock held, since
         # ``commit()`` will try to obtain the lock.
         if overflow:
             self.commit()
 
         return future
+
+    def drop(self, future):
+        """Remove a message from the batch, unless it is being sent.
+
+        This is called by the publisher's flow control to drop the oldest
+        outstanding messages. The caller completes the future.
+
+        Args:
+            future (~.pubsub_v1.publisher.futures.Future): The future of the
+                message, as returned by :meth:`publish`.
+
+        Returns:
+            bool: Whether the message was removed.
+        """
+        with self._state_lock:
+            if self._status not in _CAN_COMMIT:
+                return False
+
+            index = self._futures.index(future)
+            message = self._messages.pop(index)
+            del self._futures[index]
+            self._size -= message.ByteSize()
+            return True
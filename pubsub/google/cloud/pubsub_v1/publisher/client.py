@@ -26,7 +26,8 @@ from google.api_core import grpc_helpers
 from google.cloud.pubsub_v1 import _gapic
 from google.cloud.pubsub_v1 import types
 from google.cloud.pubsub_v1.gapic import publisher_client
-from google.cloud.pubsub_v1.publisher._batch import thread
+from google.cloud.pubsub_v1.publisher import flow_controller
+from google.cloud.pubsub_v1.publisher._batch import scheduled
 
 
 __version__ = pkg_resources.get_distribution('google-cloud-pubsub').version
@@ -43,6 +44,10 @@ class Client(object):
     Args:
         batch_settings (~google.cloud.pubsub_v1.types.BatchSettings): The
             settings for batch publishing.
+        flow_control (~google.cloud.pubsub_v1.types.PublishFlowControl): The
+            limits on messages published but not yet sent, and whether
+            :meth:`publish` blocks, raises or drops older messages when
+            they are exceeded. By default there are no limits.
         kwargs (dict): Any additional arguments provided are sent as keyword
             arguments to the underlying
             :class:`~.gapic.pubsub.v1.publisher_client.PublisherClient`.
@@ -51,9 +56,9 @@ class Client(object):
             be added if ``credentials`` are passed explicitly or if the
             Pub / Sub emulator is detected as running.
     """
-    _batch_class = thread.Batch
+    _batch_class = scheduled.Batch
 
-    def __init__(self, batch_settings=(), **kwargs):
+    def __init__(self, batch_settings=(), flow_control=(), **kwargs):
         # Sanity check: Is our goal to use the emulator?
         # If so, create a grpc insecure channel with the emulator host
         # as the target.
@@ -80,12 +85,30 @@ class Client(object):
         # client.
         self.api = publisher_client.PublisherClient(**kwargs)
         self.batch_settings = types.BatchSettings(*batch_settings)
+        self.flow_control = types.PublishFlowControl(*flow_control)
+        self._flow_controller = flow_controller.FlowController(
+            self.flow_control)
 
         # The batches on the publisher client are responsible for holding
         # messages. One batch exists for each topic.
         self._batch_lock = self._batch_class.make_lock()
         self._batches = {}
 
+        # The batches of all topics are committed by one timer thread and a
+        # bounded pool of threads; both are started only when needed.
+        self._batch_scheduler = scheduled.BatchScheduler()
+
+    @property
+    def outstanding_messages(self):
+        """int: The number of messages published and not yet sent."""
+        return self._flow_controller.outstanding_messages
+
+    @property
+    def outstanding_bytes(self):
+        """int: The total size of the messages published and not yet sent.
+        """
+        return self._flow_controller.outstanding_bytes
+
     @property
     def target(self):
         """Return the target (where the API is).
@@ -169,6 +192,11 @@ class Client(object):
         Returns:
             ~concurrent.futures.Future: An object conforming to the
             ``concurrent.futures.Future`` interface.
+
+        Raises:
+            ~.pubsub_v1.publisher.exceptions.FlowControlLimitError: If the
+                message exceeds the ``flow_control`` limits of the client,
+                and its behavior is ``ERROR``.
         """
         # Sanity check: Is the data being sent as a bytestring?
         # If it is literally anything else, complain loudly about it.
@@ -193,12 +221,20 @@ class Client(object):
         # Create the Pub/Sub message object.
         message = types.PubsubMessage(data=data, attributes=attrs)
 
+        # Wait for (or make) room for the message, without any locks held.
+        size = message.ByteSize()
+        self._flow_controller.reserve(size)
+
         # Delegate the publishing to the batch.
-        batch = self._batch(topic)
-        future = None
-        while future is None:
-            future = batch.publish(message)
-            if future is None:
-                batch = self._batch(topic, create=True)
+        try:
+            batch = self._batch(topic)
+            future = None
+            while future is None:
+                future = batch.publish(message)
+                if future is None:
+                    batch = self._batch(topic, create=True)
+        except Exception:
+            self._flow_controller.release(size)
+            raise
 
         return future
@@ -22,7 +22,12 @@ class PublishError(GoogleAPICallError):
     pass
 
 
+class FlowControlLimitError(Exception):
+    """A message was rejected or dropped by publisher flow control."""
+
+
 __all__ = (
+    'FlowControlLimitError',
     'PublishError',
     'TimeoutError',
 )
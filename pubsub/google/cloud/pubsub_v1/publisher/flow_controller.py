@@ -0,0 +1,164 @@
+# Copyright 2018, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import collections
+import logging
+import threading
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher._batch import base
+
+
+_LOGGER = logging.getLogger(__name__)
+_CAN_DROP = (
+    base.BatchStatus.ACCEPTING_MESSAGES,
+    base.BatchStatus.STARTING,
+)
+
+
+class FlowController(object):
+    """Bound the messages a publisher client holds until they are sent.
+
+    A message is *outstanding* from :meth:`reserve`, called by
+    :meth:`~.pubsub_v1.publisher.client.Client.publish` before the message is
+    added to a batch, until its future completes.
+
+    .. note::
+
+        Locks are taken in one order: a batch's state lock, then this
+        controller's condition. :meth:`reserve` therefore never touches a
+        batch while holding the condition.
+
+    Args:
+        settings (~.pubsub_v1.types.PublishFlowControl): The limits, and what
+            to do when a message exceeds them.
+    """
+    def __init__(self, settings):
+        self._settings = settings
+        self._condition = threading.Condition()
+        self._messages = 0
+        self._bytes = 0
+        # For DROP_OLDEST, the futures of outstanding messages, oldest first,
+        # mapped to their batches.
+        self._droppable = collections.OrderedDict()
+
+    @property
+    def outstanding_messages(self):
+        """int: The number of messages published and not yet sent."""
+        return self._messages
+
+    @property
+    def outstanding_bytes(self):
+        """int: The total size of the messages published and not yet sent."""
+        return self._bytes
+
+    def _fits(self, size):
+        return (
+            self._messages + 1 <= self._settings.max_messages and
+            self._bytes + size <= self._settings.max_bytes
+        )
+
+    def reserve(self, size):
+        """Count a message as outstanding, applying the limits.
+
+        Args:
+            size (int): The size of the message, in bytes.
+
+        Raises:
+            ~.pubsub_v1.publisher.exceptions.FlowControlLimitError: If the
+                behavior is ``ERROR`` and the message exceeds the limits, or
+                the message alone is larger than ``max_bytes``.
+        """
+        behavior = self._settings.limit_exceeded_behavior
+        if behavior == types.LimitExceededBehavior.IGNORE:
+            with self._condition:
+                self._messages += 1
+                self._bytes += size
+            return
+
+        if size > self._settings.max_bytes:
+            raise exceptions.FlowControlLimitError(
+                'Message of {} bytes exceeds the flow control limit of {} '
+                'bytes.'.format(size, self._settings.max_bytes))
+
+        while True:
+            with self._condition:
+                if self._fits(size):
+                    self._messages += 1
+                    self._bytes += size
+                    return
+
+                if behavior == types.LimitExceededBehavior.ERROR:
+                    raise exceptions.FlowControlLimitError(
+                        'Publisher flow control limits exceeded: {} '
+                        'messages, {} bytes outstanding.'.format(
+                            self._messages, self._bytes))
+
+                victim = None
+                while self._droppable and victim is None:
+                    future, batch = self._droppable.popitem(last=False)
+                    # Messages being sent can no longer be dropped; they
+                    # are released when their futures complete.
+                    if batch.status in _CAN_DROP:
+                        victim = future, batch
+
+                if victim is None:
+                    self._condition.wait()
+                    continue
+
+            # Drop the victim without the condition held; this takes the
+            # batch's state lock, and completing the future releases it.
+            future, batch = victim
+            if batch.drop(future):
+                _LOGGER.debug('Dropped the oldest outstanding message.')
+                future.set_exception(exceptions.FlowControlLimitError(
+                    'Message dropped by publisher flow control.'))
+
+    def track(self, future, batch, size):
+        """Release a reserved message when its future completes.
+
+        This is called by the batch, with its state lock held, when it adds
+        the message.
+
+        Args:
+            future (~.pubsub_v1.publisher.futures.Future): The future of the
+                message.
+            batch (~.pubsub_v1.publisher._batch.base.Batch): The batch the
+                message was added to.
+            size (int): The size passed to :meth:`reserve`.
+        """
+        behavior = self._settings.limit_exceeded_behavior
+        if behavior == types.LimitExceededBehavior.DROP_OLDEST:
+            with self._condition:
+                self._droppable[future] = batch
+        future.add_done_callback(
+            lambda completed: self.release(size, completed))
+
+    def release(self, size, future=None):
+        """Count a message as no longer outstanding.
+
+        Args:
+            size (int): The size passed to :meth:`reserve`.
+            future (Optional[~.pubsub_v1.publisher.futures.Future]): The
+                future of the message, if it was tracked.
+        """
+        with self._condition:
+            self._messages -= 1
+            self._bytes -= size
+            if future is not None:
+                self._droppable.pop(future, None)
+            self._condition.notify_all()
@@ -18,6 +18,8 @@ import collections
 import logging
 import threading
 
+import six
+
 from google.cloud.pubsub_v1 import types
 from google.cloud.pubsub_v1.subscriber._protocol import helper_threads
 from google.cloud.pubsub_v1.subscriber._protocol import requests
@@ -25,6 +27,13 @@ from google.cloud.pubsub_v1.subscriber._protocol import requests
 
 _LOGGER = logging.getLogger(__name__)
 _CALLBACK_WORKER_NAME = 'Thread-CallbackRequestDispatcher'
+# The largest stream request Pub/Sub accepts is 512 KiB; leave room for the
+# rest of the request.
+_MAX_REQUEST_SIZE = 512 * 1024 - 1024
+# Each ack ID in a request also takes a field tag and a length prefix, and
+# each modack a deadline, as a varint of at most 5 bytes.
+_ACK_ID_OVERHEAD = 4
+_SECONDS_SIZE = 5
 
 
 class Dispatcher(object):
@@ -71,14 +80,13 @@ class Dispatcher(object):
     def dispatch_callback(self, items):
         """Map the callback request to the appropriate gRPC request.
 
-        Args:
-            action (str): The method to be invoked.
-            kwargs (Dict[str, Any]): The keyword arguments for the method
-                specified by ``action``.
+        Acks, modacks and nacks from all of the items are coalesced and sent
+        together by :meth:`coalesce`.
 
-        Raises:
-            ValueError: If ``action`` isn't one of the expected actions
-                "ack", "drop", "lease", "modify_ack_deadline" or "nack".
+        Args:
+            items (Sequence[Any]): The requests queued up by callbacks: any
+                of the request types in
+                :mod:`~.pubsub_v1.subscriber._protocol.requests`.
         """
         if not self._manager.is_active:
             return
@@ -92,36 +100,65 @@ class Dispatcher(object):
 
         if batched_commands[requests.LeaseRequest]:
             self.lease(batched_commands.pop(requests.LeaseRequest))
-        if batched_commands[requests.ModAckRequest]:
-            self.modify_ack_deadline(
-                batched_commands.pop(requests.ModAckRequest))
         # Note: Drop and ack *must* be after lease. It's possible to get both
         # the lease the and ack/drop request in the same batch.
-        if batched_commands[requests.AckRequest]:
-            self.ack(batched_commands.pop(requests.AckRequest))
-        if batched_commands[requests.NackRequest]:
-            self.nack(batched_commands.pop(requests.NackRequest))
+        acks = batched_commands.pop(requests.AckRequest, [])
+        modacks = batched_commands.pop(requests.ModAckRequest, [])
+        nacks = batched_commands.pop(requests.NackRequest, [])
+        if acks or modacks or nacks:
+            self.coalesce(acks, modacks, nacks)
         if batched_commands[requests.DropRequest]:
             self.drop(batched_commands.pop(requests.DropRequest))
 
-    def ack(self, items):
-        """Acknowledge the given messages.
+    def coalesce(self, acks=(), modacks=(), nacks=()):
+        """Send acks, modacks and nacks in as few requests as possible.
+
+        Repeated ack IDs are sent once. An ack supersedes any modack or nack
+        of the same message, and a nack supersedes modacks. The ack IDs are
+        packed into requests of at most ``_MAX_REQUEST_SIZE`` bytes. Acked
+        and nacked messages are then removed from lease management.
 
         Args:
-            items(Sequence[AckRequest]): The items to acknowledge.
+            acks (Sequence[AckRequest]): The items to acknowledge.
+            modacks (Sequence[ModAckRequest]): The items to modify.
+            nacks (Sequence[NackRequest]): The items to deny.
         """
+        acked = collections.OrderedDict()
+        for item in acks:
+            if item.ack_id not in acked:
+                acked[item.ack_id] = item
+
         # If we got timing information, add it to the histogram.
-        for item in items:
+        for item in six.itervalues(acked):
             time_to_ack = item.time_to_ack
             if time_to_ack is not None:
                 self._manager.ack_histogram.add(time_to_ack)
 
-        ack_ids = [item.ack_id for item in items]
-        request = types.StreamingPullRequest(ack_ids=ack_ids)
-        self._manager.send(request)
+        deadlines = collections.OrderedDict()
+        for item in modacks:
+            if item.ack_id not in acked:
+                deadlines[item.ack_id] = item.seconds
+        nacked = collections.OrderedDict()
+        for item in nacks:
+            if item.ack_id not in acked:
+                deadlines[item.ack_id] = 0
+                nacked[item.ack_id] = requests.DropRequest(*item)
 
-        # Remove the message from lease management.
-        self.drop(items)
+        for request in _pack_requests(list(acked), deadlines):
+            self._manager.send(request)
+
+        # Remove the messages from lease management.
+        to_drop = list(six.itervalues(acked)) + list(six.itervalues(nacked))
+        if to_drop:
+            self.drop(to_drop)
+
+    def ack(self, items):
+        """Acknowledge the given messages.
+
+        Args:
+            items(Sequence[AckRequest]): The items to acknowledge.
+        """
+        self.coalesce(acks=items)
 
     def drop(self, items):
         """Remove the given messages from lease management.
@@ -130,6 +167,7 @@ class Dispatcher(object):
             items(Sequence[DropRequest]): The items to drop.
         """
         self._manager.leaser.remove(items)
+        self._manager.drop_messages(items)
         self._manager.maybe_resume_consumer()
 
     def lease(self, items):
@@ -147,14 +185,7 @@ class Dispatcher(object):
         Args:
             items(Sequence[ModAckRequest]): The items to modify.
         """
-        ack_ids = [item.ack_id for item in items]
-        seconds = [item.seconds for item in items]
-
-        request = types.StreamingPullRequest(
-            modify_deadline_ack_ids=ack_ids,
-            modify_deadline_seconds=seconds,
-        )
-        self._manager.send(request)
+        self.coalesce(modacks=items)
 
     def nack(self, items):
         """Explicitly deny receipt of messages.
@@ -162,8 +193,51 @@ class Dispatcher(object):
         Args:
             items(Sequence[NackRequest]): The items to deny.
         """
-        self.modify_ack_deadline([
-            requests.ModAckRequest(ack_id=item.ack_id, seconds=0)
-            for item in items])
-        self.drop(
-            [requests.DropRequest(*item) for item in items])
+        self.coalesce(nacks=items)
+
+
+def _pack_requests(ack_ids, deadlines):
+    """Pack acks and modacks into requests within the request size limit.
+
+    Args:
+        ack_ids (Sequence[str]): The ack IDs to acknowledge.
+        deadlines (Mapping[str, int]): The ack IDs to modify, and their new
+            deadlines in seconds.
+
+    Returns:
+        List[~.pubsub_v1.types.StreamingPullRequest]: The requests.
+    """
+    packed = []
+    request_ack_ids = []
+    modack_ids = []
+    modack_seconds = []
+    size = 0
+
+    def flush():
+        if request_ack_ids or modack_ids:
+            packed.append(types.StreamingPullRequest(
+                ack_ids=list(request_ack_ids),
+                modify_deadline_ack_ids=list(modack_ids),
+                modify_deadline_seconds=list(modack_seconds),
+            ))
+        del request_ack_ids[:], modack_ids[:], modack_seconds[:]
+
+    for ack_id in ack_ids:
+        item_size = len(ack_id) + _ACK_ID_OVERHEAD
+        if size + item_size > _MAX_REQUEST_SIZE:
+            flush()
+            size = 0
+        request_ack_ids.append(ack_id)
+        size += item_size
+
+    for ack_id, seconds in six.iteritems(deadlines):
+        item_size = len(ack_id) + _ACK_ID_OVERHEAD + _SECONDS_SIZE
+        if size + item_size > _MAX_REQUEST_SIZE:
+            flush()
+            size = 0
+        modack_ids.append(ack_id)
+        modack_seconds.append(seconds)
+        size += item_size
+
+    flush()
+    return packed
@@ -15,6 +15,10 @@
 from __future__ import absolute_import, division
 
 
+_MIN_VALUE = 10
+_MAX_VALUE = 600
+
+
 class Histogram(object):
     """Representation of a single histogram.
 
@@ -29,36 +33,28 @@ class Histogram(object):
     The precision of data stored is to the nearest integer. Additionally,
     values outside the range of ``10 <= x <= 600`` are stored as ``10`` or
     ``600``, since these are the boundaries of leases in the actual API.
-    """
-    def __init__(self, data=None):
-        """Instantiate the histogram.
 
-        Args:
-            data (Mapping[str, int]): The data strucure to be used to store
-                the underlying data. The default is an empty dictionary.
-                This can be set to a dictionary-like object if required
-                (for example, if a special object is needed for
-                concurrency reasons).
-        """
-        # The data is stored as a dictionary, with the keys being the
-        # value being added and the values being the number of times that
-        # value was added to the dictionary.
-        #
-        # This is depending on the Python interpreter's implicit ordering
-        # of dictionaries, which is a bitwise sort by the key's ``hash()``
-        # value. Because ``hash(int i) -> i`` and all of our keys are
-        # positive integers (negatives would be a problem because the sort
-        # is bitwise), we can rely on this.
-        if data is None:
-            data = {}
-        self._data = data
+    The counts are kept in a list with one bucket per second, so adding a
+    value is constant time and a percentile takes at most one pass over the
+    buckets. Percentiles are cached until the next value is added.
+    """
+    def __init__(self):
+        # The number of times each value was added, at index
+        # ``value - _MIN_VALUE``.
+        self._data = [0] * (_MAX_VALUE - _MIN_VALUE + 1)
         self._len = 0
+        self._min = None
+        self._max = None
+        # Maps each percent requested to ``(len(self), percentile)``. As the
+        # length only grows, an entry is current iff its length matches;
+        # this keeps :meth:`add` cheap and needs no lock.
+        self._percentiles = {}
 
     def __len__(self):
         """Return the total number of data points in this histogram.
 
         This is cached on a separate counter (rather than computing it using
-        ``sum([v for v in self._data.values()])``) to optimize lookup.
+        ``sum(self._data)``) to optimize lookup.
 
         Returns:
             int: The total number of data points in this histogram.
@@ -71,7 +67,9 @@ class Histogram(object):
         Returns:
             bool: True or False
         """
-        return needle in self._data
+        if not _MIN_VALUE <= needle <= _MAX_VALUE:
+            return False
+        return self._data[needle - _MIN_VALUE] > 0
 
     def __repr__(self):
         return '<Histogram: {len} values between {min} and {max}>'.format(
@@ -89,9 +87,9 @@ class Histogram(object):
         Returns:
             int: The maximum value in the histogram.
         """
-        if len(self._data) == 0:
-            return 600
-        return next(iter(reversed(sorted(self._data.keys()))))
+        if self._max is None:
+            return _MAX_VALUE
+        return self._max
 
     @property
     def min(self):
@@ -102,9 +100,9 @@ class Histogram(object):
         Returns:
             int: The minimum value in the histogram.
         """
-        if len(self._data) == 0:
-            return 10
-        return next(iter(sorted(self._data.keys())))
+        if self._min is None:
+            return _MIN_VALUE
+        return self._min
 
     def add(self, value):
         """Add the value to this histogram.
@@ -115,14 +113,17 @@ class Histogram(object):
         """
         # If the value is out of bounds, bring it in bounds.
         value = int(value)
-        if value < 10:
-            value = 10
-        if value > 600:
-            value = 600
-
-        # Add the value to the histogram's data dictionary.
-        self._data.setdefault(value, 0)
-        self._data[value] += 1
+        if value < _MIN_VALUE:
+            value = _MIN_VALUE
+        if value > _MAX_VALUE:
+            value = _MAX_VALUE
+
+        # Add the value to the histogram's buckets.
+        self._data[value - _MIN_VALUE] += 1
+        if self._min is None or value < self._min:
+            self._min = value
+        if self._max is None or value > self._max:
+            self._max = value
         self._len += 1
 
     def percentile(self, percent):
@@ -139,17 +140,24 @@ class Histogram(object):
         if percent >= 100:
             percent = 100
 
+        length = self._len
+        cached = self._percentiles.get(percent)
+        if cached is not None and cached[0] == length:
+            return cached[1]
+
         # Determine the actual target number.
-        target = len(self) - len(self) * (percent / 100)
+        target = length - length * (percent / 100)
 
         # Iterate over the values in reverse, dropping the target by the
         # number of times each value has been seen. When the target passes
-        # 0, return the value we are currently viewing.
-        for k in reversed(sorted(self._data.keys())):
-            target -= self._data[k]
-            if target < 0:
-                return k
-
-        # The only way to get here is if there was no data.
-        # In this case, just return 10 seconds.
-        return 10
+        # 0, return the value we are currently viewing. With no data, this
+        # returns 10 seconds.
+        value = _MIN_VALUE
+        if self._max is not None:
+            for value in range(self._max, _MIN_VALUE - 1, -1):
+                target -= self._data[value - _MIN_VALUE]
+                if target < 0:
+                    break
+
+        self._percentiles[percent] = (length, value)
+        return value
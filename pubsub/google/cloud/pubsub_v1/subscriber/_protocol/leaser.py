@@ -15,19 +15,25 @@
 from __future__ import absolute_import
 
 import collections
-import copy
+import heapq
 import logging
-import random
 import threading
 import time
 
-import six
-
 from google.cloud.pubsub_v1.subscriber._protocol import requests
 
 
 _LOGGER = logging.getLogger(__name__)
 _LEASE_WORKER_NAME = 'Thread-LeaseMaintainer'
+# Leases are renewed once this fraction of their duration has passed.
+_RENEWAL_FRACTION = 0.75
+# The shortest ack deadline, in seconds, that Pub/Sub allows.
+_MIN_ACK_DEADLINE = 10
+# The longest time, in seconds, between checks for due renewals.
+_MAX_SNOOZE = 5.0
+# The most ack IDs extended in one request. Ack IDs are at most about 200
+# bytes, so this keeps requests well under the 512 KiB request limit.
+_MAX_MODACK_BATCH = 2500
 
 
 _LeasedMessage = collections.namedtuple(
@@ -40,12 +46,21 @@ class Leaser(object):
         self._thread = None
         self._operational_lock = threading.Lock()
         self._manager = manager
+        # Messages are added by the consumer thread and removed by the
+        # dispatcher thread.
+        self._add_remove_lock = threading.Lock()
 
         self._leased_messages = {}
-        """dict[str, float]: A mapping of ack IDs to the local time when the
-            ack ID was initially leased in seconds since the epoch."""
+        """dict[str, _LeasedMessage]: A mapping of ack IDs to the local time
+            when the ack ID was initially leased in seconds since the epoch,
+            and the size of the message."""
         self._bytes = 0
         """int: The total number of bytes consumed by leased messages."""
+        self._renewals = []
+        """list[tuple[float, str, float]]: A heap of the times at which
+            leases are due for renewal, with their ack IDs and
+            ``added_time``. Entries of removed messages are discarded when
+            they come up."""
 
         self._stop_event = threading.Event()
 
@@ -64,100 +79,138 @@ class Leaser(object):
         """int: The total size, in bytes, of all leased messages."""
         return self._bytes
 
-    def add(self, items):
-        """Add messages to be managed by the leaser."""
-        for item in items:
-            # Add the ack ID to the set of managed ack IDs, and increment
-            # the size counter.
-            if item.ack_id not in self._leased_messages:
-                self._leased_messages[item.ack_id] = _LeasedMessage(
-                    added_time=time.time(),
-                    size=item.byte_size)
-                self._bytes += item.byte_size
-            else:
-                _LOGGER.debug(
-                    'Message %s is already lease managed', item.ack_id)
+    def add(self, items, seconds=_MIN_ACK_DEADLINE):
+        """Add messages to be managed by the leaser.
+
+        The streaming pull manager extends the deadlines of messages when it
+        receives them, so the leases are first renewed most of the way
+        through that deadline.
+
+        Args:
+            items (Sequence[LeaseRequest]): The messages to lease.
+            seconds (int): The ack deadline the messages were last given.
+                Defaults to the shortest deadline Pub/Sub allows.
+        """
+        now = time.time()
+        due = now + seconds * _RENEWAL_FRACTION
+        with self._add_remove_lock:
+            for item in items:
+                # Add the ack ID to the set of managed ack IDs, and increment
+                # the size counter.
+                if item.ack_id not in self._leased_messages:
+                    self._leased_messages[item.ack_id] = _LeasedMessage(
+                        added_time=now,
+                        size=item.byte_size)
+                    self._bytes += item.byte_size
+                    heapq.heappush(self._renewals, (due, item.ack_id, now))
+                else:
+                    _LOGGER.debug(
+                        'Message %s is already lease managed', item.ack_id)
 
     def remove(self, items):
         """Remove messages from lease management."""
         # Remove the ack ID from lease management, and decrement the
         # byte counter.
-        for item in items:
-            if self._leased_messages.pop(item.ack_id, None) is not None:
-                self._bytes -= item.byte_size
-            else:
-                _LOGGER.debug('Item %s was not managed.', item.ack_id)
+        with self._add_remove_lock:
+            for item in items:
+                if self._leased_messages.pop(item.ack_id, None) is not None:
+                    self._bytes -= item.byte_size
+                else:
+                    _LOGGER.debug('Item %s was not managed.', item.ack_id)
+
+            if self._bytes < 0:
+                _LOGGER.debug(
+                    'Bytes was unexpectedly negative: %d', self._bytes)
+                self._bytes = 0
+
+    def _pop_due(self, now, p99):
+        """Pop the leases due for renewal.
 
-        if self._bytes < 0:
-            _LOGGER.debug(
-                'Bytes was unexpectedly negative: %d', self._bytes)
-            self._bytes = 0
+        A lease is due once ``_RENEWAL_FRACTION`` of the deadline it was
+        last given has passed. Renewed leases are given ``p99`` seconds.
+
+        Args:
+            now (float): The current time.
+            p99 (int): The lease duration to renew with, in seconds.
+
+        Returns:
+            Tuple[List[str], List[DropRequest]]: The ack IDs to renew, and
+            the messages leased for longer than ``max_lease_duration``.
+        """
+        cutoff = now - self._manager.flow_control.max_lease_duration
+        next_due = now + p99 * _RENEWAL_FRACTION
+        to_renew = []
+        to_drop = []
+        with self._add_remove_lock:
+            while self._renewals and self._renewals[0][0] <= now:
+                _, ack_id, added_time = heapq.heappop(self._renewals)
+                item = self._leased_messages.get(ack_id)
+                if item is None or item.added_time != added_time:
+                    # The message was acked, nacked or dropped.
+                    continue
+
+                if item.added_time < cutoff:
+                    to_drop.append(requests.DropRequest(ack_id, item.size))
+                    continue
+
+                to_renew.append(ack_id)
+                heapq.heappush(
+                    self._renewals, (next_due, ack_id, added_time))
+
+        return to_renew, to_drop
+
+    def _snooze_time(self, now):
+        """Return how long to wait until the next lease is due."""
+        with self._add_remove_lock:
+            if not self._renewals:
+                return _MAX_SNOOZE
+            next_due = self._renewals[0][0]
+        return min(max(next_due - now, 0.0), _MAX_SNOOZE)
 
     def maintain_leases(self):
         """Maintain all of the leases being managed.
 
-        This method modifies the ack deadline for all of the managed
-        ack IDs, then waits for most of that time (but with jitter), and
-        repeats.
+        Leases are kept in a heap ordered by when they must next be renewed.
+        This method extends the ack deadline of the leases which are due,
+        in requests of at most ``_MAX_MODACK_BATCH`` ack IDs, then waits
+        until the next lease is due, and repeats.
         """
         while self._manager.is_active and not self._stop_event.is_set():
             # Determine the appropriate duration for the lease. This is
             # based off of how long previous messages have taken to ack, with
             # a sensible default and within the ranges allowed by Pub/Sub.
             p99 = self._manager.ack_histogram.percentile(99)
-            _LOGGER.debug('The current p99 value is %d seconds.', p99)
 
-            # Make a copy of the leased messages. This is needed because it's
-            # possible for another thread to modify the dictionary while
-            # we're iterating over it.
-            leased_messages = copy.copy(self._leased_messages)
+            now = time.time()
+            to_renew, to_drop = self._pop_due(now, p99)
 
             # Drop any leases that are well beyond max lease time. This
             # ensures that in the event of a badly behaving actor, we can
             # drop messages and allow Pub/Sub to resend them.
-            cutoff = (
-                time.time() -
-                self._manager.flow_control.max_lease_duration)
-            to_drop = [
-                requests.DropRequest(ack_id, item.size)
-                for ack_id, item
-                in six.iteritems(leased_messages)
-                if item.added_time < cutoff]
-
             if to_drop:
                 _LOGGER.warning(
                     'Dropping %s items because they were leased too long.',
                     len(to_drop))
                 self._manager.dispatcher.drop(to_drop)
 
-            # Remove dropped items from our copy of the leased messages (they
-            # have already been removed from the real one by
-            # self._manager.drop(), which calls self.remove()).
-            for item in to_drop:
-                leased_messages.pop(item.ack_id)
-
-            # Create a streaming pull request.
-            # We do not actually call `modify_ack_deadline` over and over
-            # because it is more efficient to make a single request.
-            ack_ids = leased_messages.keys()
-            if ack_ids:
-                _LOGGER.debug('Renewing lease for %d ack IDs.', len(ack_ids))
+            if to_renew:
+                _LOGGER.debug(
+                    'Renewing lease for %d ack IDs for %d seconds.',
+                    len(to_renew), p99)
 
                 # NOTE: This may not work as expected if ``consumer.active``
                 #       has changed since we checked it. An implementation
                 #       without any sort of race condition would require a
                 #       way for ``send_request`` to fail when the consumer
                 #       is inactive.
-                self._manager.dispatcher.modify_ack_deadline([
-                    requests.ModAckRequest(ack_id, p99) for ack_id in ack_ids])
-
-            # Now wait an appropriate period of time and do this again.
-            #
-            # We determine the appropriate period of time based on a random
-            # period between 0 seconds and 90% of the lease. This use of
-            # jitter (http://bit.ly/2s2ekL7) helps decrease contention in cases
-            # where there are many clients.
-            snooze = random.uniform(0.0, p99 * 0.9)
+                for start in range(0, len(to_renew), _MAX_MODACK_BATCH):
+                    self._manager.dispatcher.modify_ack_deadline([
+                        requests.ModAckRequest(ack_id, p99)
+                        for ack_id
+                        in to_renew[start:start + _MAX_MODACK_BATCH]])
+
+            # Now wait until the next lease is due, and do this again.
+            snooze = self._snooze_time(time.time())
             _LOGGER.debug('Snoozing lease management for %f seconds.', snooze)
             self._stop_event.wait(timeout=snooze)
 
@@ -22,6 +22,11 @@ import threading
 import grpc
 import six
 
+try:
+    import asyncio
+except ImportError:  # Python 2.7
+    asyncio = None
+
 from google.api_core import exceptions
 from google.cloud.pubsub_v1 import types
 from google.cloud.pubsub_v1.subscriber._protocol import bidi
@@ -51,16 +56,25 @@ def _maybe_wrap_exception(exception):
     return exception
 
 
-def _wrap_callback_errors(callback, message):
+def _wrap_callback_errors(callback, message, loop=None):
     """Wraps a user callback so that if an exception occurs the message is
     nacked.
 
     Args:
         callback (Callable[None, Message]): The user callback.
         message (~Message): The Pub/Sub message.
+        loop (asyncio.AbstractEventLoop): The event loop of the
+            :class:`~.pubsub_v1.subscriber.scheduler.AsyncioScheduler`, if
+            that is the scheduler in use. Coroutines returned by the
+            callback are only run on this loop; without it, they are
+            errors and the message is nacked.
+
+    Returns:
+        Optional[asyncio.Future]: If the callback returned a coroutine, the
+        task running it, which nacks the message if the coroutine raises.
     """
     try:
-        callback(message)
+        result = callback(message)
     except Exception:
         # Note: the likelihood of this failing is extremely low. This just adds
         # a message to a queue, so if this doesn't work the world is in an
@@ -69,6 +83,33 @@ def _wrap_callback_errors(callback, message):
             'Top-level exception occurred in callback while processing a '
             'message')
         message.nack()
+        return None
+
+    if not google.cloud.pubsub_v1.subscriber.scheduler._is_awaitable(result):
+        return None
+
+    if loop is None:
+        _LOGGER.error(
+            'Callback returned %r, but only callbacks run by the '
+            'AsyncioScheduler may return coroutines.', result)
+        if asyncio.iscoroutine(result):
+            # Avoid a "coroutine was never awaited" warning.
+            result.close()
+        message.nack()
+        return None
+
+    task = asyncio.ensure_future(result, loop=loop)
+    task.add_done_callback(functools.partial(_nack_on_error, message))
+    return task
+
+
+def _nack_on_error(message, task):
+    """Nack the message if the task running its async callback raised.
+
+    The scheduler logs the exception.
+    """
+    if not task.cancelled() and task.exception() is not None:
+        message.nack()
 
 
 class StreamingPullManager(object):
@@ -106,6 +147,16 @@ class StreamingPullManager(object):
         self._closed = False
         self._close_callbacks = []
 
+        # Messages which are leased, but held back from the scheduler until
+        # the messages being processed are within the flow control limits.
+        self._messages_on_hold = collections.deque()
+        self._on_hold_bytes = 0
+        # The sizes of the messages released to the scheduler, by ack ID,
+        # until they are acked, nacked or dropped.
+        self._processing = {}
+        self._processing_bytes = 0
+        self._hold_lock = threading.Lock()
+
         if scheduler is None:
             self._scheduler = (
                 google.cloud.pubsub_v1.subscriber.scheduler.ThreadScheduler())
@@ -173,6 +224,12 @@ class StreamingPullManager(object):
             self._ack_deadline = self.ack_histogram.percentile(percent=99)
         return self._ack_deadline
 
+    @property
+    def messages_on_hold(self):
+        """int: The number of received messages held back from the
+        scheduler by flow control."""
+        return len(self._messages_on_hold)
+
     @property
     def load(self):
         """Return the current load.
@@ -187,6 +244,10 @@ class StreamingPullManager(object):
         whichever value is higher. (It does not matter that we have lots of
         running room on setting A if setting B is over.)
 
+        The load counts all leased messages, including those held back from
+        the scheduler, so the consumer stays paused until they are
+        processed.
+
         Returns:
             float: The load value.
         """
@@ -215,7 +276,12 @@ class StreamingPullManager(object):
                 self._consumer.pause()
 
     def maybe_resume_consumer(self):
-        """Check the current load and resume the consumer if needed."""
+        """Release held messages and resume the consumer if the load allows.
+        """
+        # Messages were acked, nacked or dropped; schedule held messages in
+        # their place.
+        self._maybe_release_messages()
+
         # If we have been paused by flow control, check and see if we are
         # back within our limits.
         #
@@ -230,6 +296,60 @@ class StreamingPullManager(object):
         else:
             _LOGGER.debug('Did not resume, current load is %s', self.load)
 
+    def _maybe_release_messages(self):
+        """Schedule held messages while the messages being processed are
+        within the flow control limits.
+
+        At least one message is always processed, even if it alone exceeds
+        ``max_bytes``.
+        """
+        if self._leaser is None:
+            return
+
+        with self._hold_lock:
+            while self._messages_on_hold:
+                message = self._messages_on_hold[0]
+                count = len(self._processing)
+                if count >= self._flow_control.max_messages:
+                    break
+                if count > 0 and (
+                        self._processing_bytes + message.size >
+                        self._flow_control.max_bytes):
+                    break
+
+                self._messages_on_hold.popleft()
+                self._on_hold_bytes -= message.size
+                self._processing[message.ack_id] = message.size
+                self._processing_bytes += message.size
+                self._scheduler.schedule(self._callback, message)
+
+    def drop_messages(self, items):
+        """Stop tracking messages removed from lease management.
+
+        Messages being processed no longer count against the flow control
+        limits. Held messages, such as ones leased for longer than
+        ``max_lease_duration``, are discarded instead of being released, as
+        Pub/Sub will redeliver them.
+
+        Args:
+            items (Sequence[DropRequest]): The messages which were removed.
+        """
+        with self._hold_lock:
+            dropped_on_hold = set()
+            for item in items:
+                size = self._processing.pop(item.ack_id, None)
+                if size is None:
+                    dropped_on_hold.add(item.ack_id)
+                else:
+                    self._processing_bytes -= size
+
+            if dropped_on_hold and self._messages_on_hold:
+                kept = [
+                    message for message in self._messages_on_hold
+                    if message.ack_id not in dropped_on_hold]
+                self._messages_on_hold = collections.deque(kept)
+                self._on_hold_bytes = sum(message.size for message in kept)
+
     def _send_unary_request(self, request):
         """Send a request using a separate unary request instead of over the
         stream.
@@ -296,7 +416,13 @@ class StreamingPullManager(object):
             raise ValueError(
                 'This manager has been closed and can not be re-used.')
 
-        self._callback = functools.partial(_wrap_callback_errors, callback)
+        loop = None
+        if isinstance(
+                self._scheduler,
+                google.cloud.pubsub_v1.subscriber.scheduler.AsyncioScheduler):
+            loop = self._scheduler._loop
+        self._callback = functools.partial(
+            _wrap_callback_errors, callback, loop=loop)
 
         # Create the RPC
         self._rpc = bidi.ResumableBidiRpc(
@@ -344,6 +470,14 @@ class StreamingPullManager(object):
                 self._consumer.stop()
             self._consumer = None
 
+            # Held messages are leased, but the lease is no longer
+            # maintained; Pub/Sub will redeliver them.
+            with self._hold_lock:
+                self._messages_on_hold.clear()
+                self._on_hold_bytes = 0
+                self._processing.clear()
+                self._processing_bytes = 0
+
             # Shutdown all helper threads
             _LOGGER.debug('Stopping scheduler.')
             self._scheduler.shutdown()
@@ -405,8 +539,11 @@ class StreamingPullManager(object):
         timer closer to each other thus preventing the message being
         redelivered multiple times.
 
-        After the messages have all had their ack deadline updated, execute
-        the callback for each message using the executor.
+        After the messages have all had their ack deadline updated, they are
+        leased and held. They are released to the scheduler, to execute the
+        callback, as long as the messages being processed are within the flow
+        control limits; the rest are released as earlier messages are acked,
+        nacked or dropped.
         """
 
         _LOGGER.debug(
@@ -415,19 +552,34 @@ class StreamingPullManager(object):
 
         # Immediately modack the messages we received, as this tells the server
         # that we've received them.
+        ack_deadline = self._ack_histogram.percentile(99)
         items = [
-            requests.ModAckRequest(
-                message.ack_id, self._ack_histogram.percentile(99))
+            requests.ModAckRequest(message.ack_id, ack_deadline)
             for message in response.received_messages
         ]
         self._dispatcher.modify_ack_deadline(items)
-        for received_message in response.received_messages:
-            message = google.cloud.pubsub_v1.subscriber.message.Message(
+
+        messages = [
+            google.cloud.pubsub_v1.subscriber.message.Message(
                 received_message.message,
                 received_message.ack_id,
                 self._scheduler.queue)
-            # TODO: Immediately lease instead of using the callback queue.
-            self._scheduler.schedule(self._callback, message)
+            for received_message in response.received_messages
+        ]
+
+        # Lease and hold the messages together, so that the held messages
+        # are always counted by the leaser.
+        with self._hold_lock:
+            self._leaser.add([
+                requests.LeaseRequest(
+                    ack_id=message.ack_id, byte_size=message.size)
+                for message in messages
+            ], seconds=ack_deadline)
+            self._messages_on_hold.extend(messages)
+            self._on_hold_bytes += sum(message.size for message in messages)
+
+        self.maybe_pause_consumer()
+        self._maybe_release_messages()
 
     def _should_recover(self, exception):
         """Determine if an error on the RPC stream should be recovered.
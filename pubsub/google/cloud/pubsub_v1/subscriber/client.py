@@ -159,7 +159,10 @@ class Client(object):
                 process depending on the scheduling strategy.
             flow_control (~.pubsub_v1.types.FlowControl): The flow control
                 settings. Use this to prevent situations where you are
-                inundated with too many messages at once.
+                inundated with too many messages at once. At most
+                ``max_messages`` callbacks run at once; further messages
+                received are leased and held until earlier ones are acked,
+                nacked or dropped.
             scheduler (~.pubsub_v1.subscriber.scheduler.Scheduler): An optional
                 *scheduler* to use when executing the callback. This controls
                 how callbacks are executed concurrently.
@@ -96,10 +96,6 @@ class Message(object):
         # the default lease deadline.
         self._received_timestamp = time.time()
 
-        # The policy should lease this message, telling PubSub that it has
-        # it until it is acked or otherwise dropped.
-        self.lease()
-
     def __repr__(self):
         # Get an abbreviated version of the data.
         abbv_data = self._message.data
@@ -216,8 +212,8 @@ class Message(object):
         """Inform the policy to lease this message continually.
 
         .. note::
-            This method is called by the constructor, and you should never
-            need to call it manually.
+            The streaming pull manager leases messages as it receives them,
+            and you should never need to call this manually.
         """
         self._request_queue.put(
             requests.LeaseRequest(
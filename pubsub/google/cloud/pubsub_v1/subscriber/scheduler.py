@@ -19,12 +19,22 @@ each message.
 """
 
 import abc
+import collections
 import concurrent.futures
+import logging
 import sys
 
 import six
 from six.moves import queue
 
+try:
+    import asyncio
+except ImportError:  # Python 2.7
+    asyncio = None
+
+
+_LOGGER = logging.getLogger(__name__)
+
 
 @six.add_metaclass(abc.ABCMeta)
 class Scheduler(object):
@@ -124,3 +134,125 @@ class ThreadScheduler(object):
         except queue.Empty:
             pass
         self._executor.shutdown()
+
+
+def _is_awaitable(result):
+    """Return True if ``result`` is a coroutine or an asyncio future."""
+    return asyncio is not None and (
+        asyncio.iscoroutine(result) or isinstance(result, asyncio.Future))
+
+
+class AsyncioScheduler(Scheduler):
+    """A scheduler which runs callbacks on an asyncio event loop.
+
+    This scheduler is useful for I/O-bound message processing which needs
+    many more messages in flight than threads would allow. Callbacks may be
+    ``async def`` functions; the coroutines they return run as tasks on the
+    loop. Plain functions are called on the loop, and must not block it.
+
+    :meth:`~.pubsub_v1.subscriber.message.Message.ack` and the other message
+    methods put requests on :attr:`queue`, a thread-safe queue, so they may
+    be called from the loop; the dispatcher thread sends them on.
+
+    .. note::
+
+        This scheduler requires Python 3. The loop must be running (for
+        example, with :meth:`~asyncio.AbstractEventLoop.run_forever` in
+        another thread) for messages to be processed.
+
+    Args:
+        loop (asyncio.AbstractEventLoop): The event loop to run callbacks on.
+        max_concurrency (int): The maximum number of callbacks running at
+            once. Further callbacks wait, in order, for one to finish.
+    """
+    def __init__(self, loop, max_concurrency=1000):
+        if asyncio is None:
+            raise RuntimeError(
+                'The asyncio scheduler requires Python 3.')
+        self._loop = loop
+        self._max_concurrency = max_concurrency
+        self._queue = queue.Queue()
+        # These are only used on the loop's thread, so need no lock.
+        self._pending = collections.deque()
+        self._running = 0
+        self._tasks = set()
+        self._shutdown = False
+
+    @property
+    def queue(self):
+        """Queue: A thread-safe queue used for communication between callbacks
+        and the scheduling thread."""
+        return self._queue
+
+    def schedule(self, callback, *args, **kwargs):
+        """Schedule the callback to be called on the event loop.
+
+        This may be called from any thread.
+
+        Args:
+            callback (Callable): The function to call. If it returns a
+                coroutine, the coroutine is run as a task.
+            args: Positional arguments passed to the function.
+            kwargs: Key-word arguments passed to the function.
+
+        Returns:
+            None
+        """
+        self._loop.call_soon_threadsafe(self._start, callback, args, kwargs)
+
+    def shutdown(self):
+        """Shuts down the scheduler and immediately end all pending callbacks.
+
+        Callbacks waiting to run are discarded, and running tasks are
+        cancelled. This may be called from any thread.
+        """
+        try:
+            self._loop.call_soon_threadsafe(self._shutdown_on_loop)
+        except RuntimeError:
+            # The loop is closed, so nothing is running on it.
+            _LOGGER.debug('Event loop closed before scheduler shutdown.')
+
+    def _start(self, callback, args, kwargs):
+        """Run the callback, or queue it if at the concurrency limit."""
+        if self._shutdown:
+            return
+        if self._running >= self._max_concurrency:
+            self._pending.append((callback, args, kwargs))
+            return
+        self._run(callback, args, kwargs)
+
+    def _run(self, callback, args, kwargs):
+        self._running += 1
+        try:
+            result = callback(*args, **kwargs)
+        except Exception:
+            _LOGGER.exception('Top-level exception occurred in callback.')
+            self._on_done(None)
+            return
+
+        if not _is_awaitable(result):
+            self._on_done(None)
+            return
+
+        task = asyncio.ensure_future(result, loop=self._loop)
+        self._tasks.add(task)
+        task.add_done_callback(self._on_done)
+
+    def _on_done(self, task):
+        """Count a finished callback, and start the next waiting one."""
+        self._running -= 1
+        if task is not None:
+            self._tasks.discard(task)
+            if not task.cancelled() and task.exception() is not None:
+                _LOGGER.error(
+                    'Top-level exception occurred in callback.',
+                    exc_info=task.exception())
+
+        if self._pending and not self._shutdown:
+            self._run(*self._pending.popleft())
+
+    def _shutdown_on_loop(self):
+        self._shutdown = True
+        self._pending.clear()
+        for task in list(self._tasks):
+            task.cancel()
@@ -14,6 +14,7 @@
 
 from __future__ import absolute_import
 import collections
+import enum
 import sys
 
 from google.api import http_pb2
@@ -45,6 +46,41 @@ BatchSettings.__new__.__defaults__ = (
     1000,              # max_messages: 1,000
 )
 
+
+class LimitExceededBehavior(enum.Enum):
+    """What the publisher does when a message exceeds its flow control."""
+
+    IGNORE = 'ignore'
+    """Publish the message anyway; only count outstanding messages."""
+
+    BLOCK = 'block'
+    """Block ``publish()`` until enough outstanding messages are published."""
+
+    ERROR = 'error'
+    """Raise :class:`~.pubsub_v1.publisher.exceptions.FlowControlLimitError`.
+    """
+
+    DROP_OLDEST = 'drop_oldest'
+    """Drop the oldest messages which are not being sent yet, failing their
+    futures with
+    :class:`~.pubsub_v1.publisher.exceptions.FlowControlLimitError`, and
+    block if all outstanding messages are being sent."""
+
+
+# Define the type class and default values for publisher flow control.
+#
+# This class is used when creating a publisher client, and bounds the
+# messages published but not yet sent to (or acknowledged by) the server.
+PublishFlowControl = collections.namedtuple(
+    'PublishFlowControl',
+    ['max_bytes', 'max_messages', 'limit_exceeded_behavior'],
+)
+PublishFlowControl.__new__.__defaults__ = (
+    100 * 1024 * 1024,               # max_bytes: 100mb
+    10000,                           # max_messages: 10,000
+    LimitExceededBehavior.IGNORE,    # limit_exceeded_behavior: no limits
+)
+
 # Define the type class and default values for flow control settings.
 #
 # This class is used when creating a publisher or subscriber client, and
@@ -84,7 +120,12 @@ _local_modules = [
 ]
 
 
-names = ['BatchSettings', 'FlowControl']
+names = [
+    'BatchSettings',
+    'FlowControl',
+    'LimitExceededBehavior',
+    'PublishFlowControl',
+]
 
 
 for module in _shared_modules:
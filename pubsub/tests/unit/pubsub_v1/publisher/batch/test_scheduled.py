@@ -0,0 +1,188 @@
+# Copyright 2018, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+
+import mock
+
+from google.auth import credentials
+from google.cloud.pubsub_v1 import publisher
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher._batch.base import BatchStatus
+from google.cloud.pubsub_v1.publisher._batch import scheduled
+from google.cloud.pubsub_v1.publisher._batch.scheduled import Batch
+from google.cloud.pubsub_v1.publisher._batch.scheduled import BatchScheduler
+
+
+def create_client():
+    creds = mock.Mock(spec=credentials.Credentials)
+    return publisher.Client(credentials=creds)
+
+
+def wait_for(scheduler):
+    thread = scheduler._thread
+    if thread is not None:
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+
+
+def test_scheduler_calls_in_deadline_order():
+    scheduler = BatchScheduler()
+    called = []
+    now = time.time()
+
+    scheduler.call_at(now + 0.03, lambda: called.append('c'))
+    scheduler.call_at(now + 0.01, lambda: called.append('a'))
+    scheduler.call_at(now + 0.02, lambda: called.append('b'))
+    scheduler.call_at(now - 1, lambda: called.append('past'))
+    wait_for(scheduler)
+
+    assert called == ['past', 'a', 'b', 'c']
+    assert scheduler._thread is None
+    assert scheduler._deadlines == []
+
+
+def test_scheduler_uses_one_thread():
+    scheduler = BatchScheduler()
+    deadline = time.time() + 0.05
+
+    with mock.patch.object(threading, 'Thread', autospec=True) as Thread:
+        for _ in range(5):
+            scheduler.call_at(deadline, mock.Mock())
+
+    Thread.assert_called_once_with(
+        name='Thread-BatchScheduler',
+        target=scheduler._run,
+    )
+    Thread.return_value.start.assert_called_once_with()
+    assert len(scheduler._deadlines) == 5
+
+
+def test_scheduler_restarts_thread_when_idle():
+    scheduler = BatchScheduler()
+    first = mock.Mock()
+    second = mock.Mock()
+
+    scheduler.call_at(time.time(), first)
+    wait_for(scheduler)
+    scheduler.call_at(time.time(), second)
+    wait_for(scheduler)
+
+    first.assert_called_once_with()
+    second.assert_called_once_with()
+
+
+def test_scheduler_earlier_deadline_wakes_thread():
+    scheduler = BatchScheduler()
+    called = threading.Event()
+
+    scheduler.call_at(time.time() + 60, mock.Mock())
+    scheduler.call_at(time.time(), called.set)
+
+    assert called.wait(timeout=5)
+    # Leave no thread waiting behind.
+    with scheduler._condition:
+        scheduler._deadlines[:] = []
+        scheduler._condition.notify()
+    wait_for(scheduler)
+
+
+@mock.patch.object(scheduled, '_LOGGER')
+def test_scheduler_callback_error(_LOGGER):
+    scheduler = BatchScheduler()
+    after = mock.Mock()
+    now = time.time()
+
+    scheduler.call_at(now, mock.Mock(side_effect=ValueError('nope')))
+    scheduler.call_at(now + 0.01, after)
+    wait_for(scheduler)
+
+    _LOGGER.exception.assert_called_once_with(
+        'Scheduled batch callback failed.')
+    after.assert_called_once_with()
+
+
+def test_scheduler_submit():
+    scheduler = BatchScheduler(max_workers=2)
+    assert scheduler._executor is None
+
+    future = scheduler.submit(lambda x, y=1: x + y, 1, y=2)
+
+    assert future.result(timeout=5) == 3
+    assert scheduler._executor._max_workers == 2
+    scheduler._executor.shutdown()
+
+
+def test_client_uses_scheduled_batches():
+    client = create_client()
+
+    assert client._batch_class is Batch
+    assert isinstance(client._batch_scheduler, BatchScheduler)
+
+
+def test_init():
+    client = create_client()
+    settings = types.BatchSettings(max_latency=0.5)
+
+    with mock.patch.object(threading, 'Thread', autospec=True) as Thread:
+        with mock.patch.object(time, 'time', return_value=100.0):
+            with mock.patch.object(client._batch_scheduler,
+                                   'call_at') as call_at:
+                batch = Batch(client, 'topic_name', settings)
+
+    Thread.assert_not_called()
+    call_at.assert_called_once_with(100.5, batch.commit)
+    assert batch.status == BatchStatus.ACCEPTING_MESSAGES
+
+
+def test_init_without_autocommit():
+    client = create_client()
+
+    with mock.patch.object(client._batch_scheduler, 'call_at') as call_at:
+        Batch(client, 'topic_name', types.BatchSettings(), autocommit=False)
+        Batch(client, 'topic_name',
+              types.BatchSettings(max_latency=float('inf')))
+
+    call_at.assert_not_called()
+
+
+def test_commit():
+    client = create_client()
+    batch = Batch(client, 'topic_name', types.BatchSettings(),
+                  autocommit=False)
+
+    with mock.patch.object(threading, 'Thread', autospec=True) as Thread:
+        with mock.patch.object(client._batch_scheduler, 'submit') as submit:
+            batch.commit()
+            batch.commit()
+
+    Thread.assert_not_called()
+    submit.assert_called_once_with(batch._commit)
+    assert batch.status == BatchStatus.STARTING
+
+
+def test_autocommit_publishes():
+    client = create_client()
+    settings = types.BatchSettings(max_latency=0.01)
+    batch = Batch(client, 'topic_name', settings)
+    done = threading.Event()
+
+    with mock.patch.object(type(batch), '_commit',
+                           side_effect=done.set) as _commit:
+        assert done.wait(timeout=5)
+
+    _commit.assert_called_once_with()
+    assert batch.status == BatchStatus.STARTING
+    wait_for(client._batch_scheduler)
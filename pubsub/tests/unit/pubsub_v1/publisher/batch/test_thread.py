@@ -322,3 +322,38 @@ def test_publish_dict():
         data=b'foobarbaz', attributes={'spam': 'eggs'})
     assert batch.messages == [expected_message]
     assert batch._futures == [future]
+
+
+def test_publish_tracks_flow_control():
+    batch = create_batch()
+    message = types.PubsubMessage(data=b'foobarbaz')
+
+    with mock.patch.object(batch.client._flow_controller, 'track') as track:
+        future = batch.publish(message)
+
+    track.assert_called_once_with(future, batch, message.ByteSize())
+
+
+def test_drop():
+    batch = create_batch()
+    messages = (
+        types.PubsubMessage(data=b'foobarbaz'),
+        types.PubsubMessage(data=b'spameggs'),
+    )
+    first, second = [batch.publish(message) for message in messages]
+
+    assert batch.drop(first)
+
+    assert batch.messages == [messages[1]]
+    assert batch._futures == [second]
+    assert batch.size == messages[1].ByteSize()
+
+
+def test_drop_in_progress():
+    batch = create_batch()
+    batch._status = BatchStatus.IN_PROGRESS
+    batch._futures.append(mock.sentinel.future)
+
+    assert not batch.drop(mock.sentinel.future)
+
+    assert batch._futures == [mock.sentinel.future]
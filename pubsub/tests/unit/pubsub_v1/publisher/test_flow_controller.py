@@ -0,0 +1,177 @@
+# Copyright 2018, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import threading
+
+from google.auth import credentials
+import mock
+import pytest
+
+from google.cloud.pubsub_v1 import publisher
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher import flow_controller
+from google.cloud.pubsub_v1.publisher import futures
+from google.cloud.pubsub_v1.publisher._batch.base import BatchStatus
+
+
+def make_controller(behavior, max_messages=2, max_bytes=100):
+    settings = types.PublishFlowControl(
+        max_bytes=max_bytes,
+        max_messages=max_messages,
+        limit_exceeded_behavior=behavior,
+    )
+    return flow_controller.FlowController(settings)
+
+
+def make_batch(status=BatchStatus.ACCEPTING_MESSAGES, dropped=True):
+    batch = mock.Mock(spec=['drop', 'status'])
+    batch.status = status
+    batch.drop.return_value = dropped
+    return batch
+
+
+def add_message(controller, size, batch=None):
+    controller.reserve(size)
+    future = futures.Future()
+    controller.track(future, batch or make_batch(), size)
+    return future
+
+
+def test_ignore_counts_without_limits():
+    controller = make_controller(types.LimitExceededBehavior.IGNORE)
+
+    futures_ = [add_message(controller, 60) for _ in range(3)]
+
+    assert controller.outstanding_messages == 3
+    assert controller.outstanding_bytes == 180
+    for future in futures_:
+        future.set_result('id')
+    assert controller.outstanding_messages == 0
+    assert controller.outstanding_bytes == 0
+
+
+def test_error():
+    controller = make_controller(types.LimitExceededBehavior.ERROR)
+    add_message(controller, 60)
+
+    with pytest.raises(exceptions.FlowControlLimitError):
+        controller.reserve(60)
+
+    controller.reserve(40)
+    assert controller.outstanding_messages == 2
+    with pytest.raises(exceptions.FlowControlLimitError):
+        controller.reserve(0)
+
+
+def test_message_larger_than_limit():
+    controller = make_controller(types.LimitExceededBehavior.BLOCK)
+
+    with pytest.raises(exceptions.FlowControlLimitError):
+        controller.reserve(101)
+
+    assert controller.outstanding_messages == 0
+
+
+def test_block_until_released():
+    controller = make_controller(
+        types.LimitExceededBehavior.BLOCK, max_messages=1)
+    future = add_message(controller, 10)
+    reserved = threading.Event()
+
+    def reserve():
+        controller.reserve(10)
+        reserved.set()
+
+    thread = threading.Thread(target=reserve)
+    thread.start()
+    assert not reserved.wait(timeout=0.05)
+
+    future.set_result('id')
+    assert reserved.wait(timeout=5)
+    thread.join()
+    assert controller.outstanding_messages == 1
+
+
+def test_drop_oldest():
+    controller = make_controller(types.LimitExceededBehavior.DROP_OLDEST)
+    in_flight = make_batch(status=BatchStatus.IN_PROGRESS)
+    batch = make_batch()
+    sending = add_message(controller, 10, batch=in_flight)
+    oldest = add_message(controller, 10, batch=batch)
+
+    controller.reserve(10)
+
+    in_flight.drop.assert_not_called()
+    batch.drop.assert_called_once_with(oldest)
+    assert not sending.done()
+    with pytest.raises(exceptions.FlowControlLimitError):
+        oldest.result()
+    assert controller.outstanding_messages == 2
+    assert list(controller._droppable) == []
+
+
+def test_release_forgets_droppable_future():
+    controller = make_controller(types.LimitExceededBehavior.DROP_OLDEST)
+    future = add_message(controller, 10)
+
+    future.set_result('id')
+
+    assert list(controller._droppable) == []
+    assert controller.outstanding_messages == 0
+
+
+def test_client_publish_applies_flow_control():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(
+        credentials=creds,
+        flow_control=types.PublishFlowControl(
+            max_messages=1,
+            limit_exceeded_behavior=types.LimitExceededBehavior.ERROR,
+        ),
+    )
+    client._batch_class = mock.Mock(spec=['make_lock'])
+    batch = client._batch_class.return_value
+
+    # The batch tracks the message once it accepts it.
+    def publish(message):
+        future = futures.Future()
+        client._flow_controller.track(future, batch, message.ByteSize())
+        return future
+    batch.publish.side_effect = publish
+
+    future = client.publish('topic', b'spam')
+    assert client.outstanding_messages == 1
+    assert client.outstanding_bytes == batch.publish.call_args[0][0].ByteSize()
+    with pytest.raises(exceptions.FlowControlLimitError):
+        client.publish('topic', b'eggs')
+
+    future.set_result('id')
+    assert client.outstanding_messages == 0
+    assert client.outstanding_bytes == 0
+
+
+def test_client_publish_releases_on_error():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(credentials=creds)
+    client._batch_class = mock.Mock(spec=['make_lock'])
+    client._batch_class.return_value.publish.side_effect = ValueError
+
+    with pytest.raises(ValueError):
+        client.publish('topic', b'spam')
+
+    assert client.outstanding_messages == 0
+    assert client.outstanding_bytes == 0
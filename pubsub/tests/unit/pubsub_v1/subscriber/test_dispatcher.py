@@ -26,11 +26,8 @@ import pytest
 
 
 @pytest.mark.parametrize('item,method_name', [
-    (requests.AckRequest(0, 0, 0), 'ack'),
     (requests.DropRequest(0, 0), 'drop'),
     (requests.LeaseRequest(0, 0), 'lease'),
-    (requests.ModAckRequest(0, 0), 'modify_ack_deadline'),
-    (requests.NackRequest(0, 0), 'nack')
 ])
 def test_dispatch_callback(item, method_name):
     manager = mock.create_autospec(
@@ -45,6 +42,83 @@ def test_dispatch_callback(item, method_name):
     method.assert_called_once_with([item])
 
 
+def test_dispatch_callback_coalesces():
+    manager = mock.create_autospec(
+        streaming_pull_manager.StreamingPullManager, instance=True)
+    dispatcher_ = dispatcher.Dispatcher(manager, mock.sentinel.queue)
+    ack = requests.AckRequest(0, 0, 0)
+    modack = requests.ModAckRequest(1, 0)
+    nack = requests.NackRequest(2, 0)
+
+    with mock.patch.object(dispatcher_, 'coalesce') as coalesce:
+        dispatcher_.dispatch_callback([nack, ack, modack])
+
+    coalesce.assert_called_once_with([ack], [modack], [nack])
+
+
+def test_coalesce():
+    manager = mock.create_autospec(
+        streaming_pull_manager.StreamingPullManager, instance=True)
+    dispatcher_ = dispatcher.Dispatcher(manager, mock.sentinel.queue)
+    acks = [
+        requests.AckRequest('ack1', 10, 20),
+        requests.AckRequest('ack2', 10, None),
+        requests.AckRequest('ack1', 10, 20),
+    ]
+    modacks = [
+        requests.ModAckRequest('ack1', 30),
+        requests.ModAckRequest('ack3', 30),
+        requests.ModAckRequest('ack3', 40),
+        requests.ModAckRequest('ack4', 30),
+    ]
+    nacks = [
+        requests.NackRequest('ack2', 10),
+        requests.NackRequest('ack4', 10),
+    ]
+
+    dispatcher_.coalesce(acks, modacks, nacks)
+
+    # Acks win over modacks and nacks, and nacks over modacks.
+    manager.send.assert_called_once_with(types.StreamingPullRequest(
+        ack_ids=['ack1', 'ack2'],
+        modify_deadline_ack_ids=['ack3', 'ack4'],
+        modify_deadline_seconds=[40, 0],
+    ))
+    manager.ack_histogram.add.assert_called_once_with(20)
+    manager.leaser.remove.assert_called_once_with([
+        acks[0], acks[1], requests.DropRequest('ack4', 10)])
+    manager.maybe_resume_consumer.assert_called_once_with()
+
+
+def test_coalesce_splits_large_requests():
+    manager = mock.create_autospec(
+        streaming_pull_manager.StreamingPullManager, instance=True)
+    dispatcher_ = dispatcher.Dispatcher(manager, mock.sentinel.queue)
+    # Each ack ID takes about 1 KiB of a request.
+    ack_ids = ['{:01020d}'.format(index) for index in range(1000)]
+
+    dispatcher_.coalesce(
+        acks=[requests.AckRequest(ack_id, 0, None) for ack_id in ack_ids],
+        modacks=[requests.ModAckRequest(ack_id, 10) for ack_id in 'ab'])
+
+    requests_ = [call[0][0] for call in manager.send.call_args_list]
+    assert len(requests_) == 2
+    for request in requests_:
+        assert request.ByteSize() <= 512 * 1024
+    assert list(requests_[0].ack_ids) + list(requests_[1].ack_ids) == ack_ids
+    assert list(requests_[1].modify_deadline_ack_ids) == ['a', 'b']
+
+
+def test_modify_ack_deadline_does_not_drop():
+    manager = mock.create_autospec(
+        streaming_pull_manager.StreamingPullManager, instance=True)
+    dispatcher_ = dispatcher.Dispatcher(manager, mock.sentinel.queue)
+
+    dispatcher_.modify_ack_deadline([requests.ModAckRequest('ack1', 10)])
+
+    manager.leaser.remove.assert_not_called()
+
+
 def test_dispatch_callback_inactive():
     manager = mock.create_autospec(
         streaming_pull_manager.StreamingPullManager, instance=True)
@@ -70,6 +144,7 @@ def test_ack():
     ))
 
     manager.leaser.remove.assert_called_once_with(items)
+    manager.drop_messages.assert_called_once_with(items)
     manager.maybe_resume_consumer.assert_called_once()
     manager.ack_histogram.add.assert_called_once_with(20)
 
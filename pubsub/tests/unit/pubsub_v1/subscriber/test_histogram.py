@@ -16,9 +16,8 @@ from google.cloud.pubsub_v1.subscriber._protocol import histogram
 
 
 def test_init():
-    data = {}
-    histo = histogram.Histogram(data=data)
-    assert histo._data is data
+    histo = histogram.Histogram()
+    assert histo._data == [0] * 591
     assert len(histo) == 0
 
 
@@ -56,9 +55,10 @@ def test_min():
 def test_add():
     histo = histogram.Histogram()
     histo.add(60)
-    assert histo._data[60] == 1
+    assert histo._data[50] == 1
     histo.add(60)
-    assert histo._data[60] == 2
+    assert histo._data[50] == 2
+    assert len(histo) == 2
 
 
 def test_add_lower_limit():
@@ -82,3 +82,19 @@ def test_percentile():
     assert histo.percentile(101) == 200
     assert histo.percentile(99) == 199
     assert histo.percentile(1) == 101
+
+
+def test_percentile_empty():
+    histo = histogram.Histogram()
+    assert histo.percentile(99) == 10
+    assert histo.percentile(0) == 10
+
+
+def test_percentile_cached_until_add():
+    histo = histogram.Histogram()
+    histo.add(30)
+    assert histo.percentile(99) == 30
+    assert histo._percentiles == {99: (1, 30)}
+    histo.add(500)
+    assert histo.percentile(99) == 500
+    assert histo.percentile(1) == 30
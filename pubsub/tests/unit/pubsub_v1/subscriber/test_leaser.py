@@ -129,12 +129,16 @@ def make_sleep_mark_manager_as_inactive(leaser):
     leaser._stop_event.wait = trigger_inactive
 
 
-def test_maintain_leases_ack_ids():
+@mock.patch('time.time', autospec=True)
+def test_maintain_leases_ack_ids(time):
     manager = create_manager()
     leaser_ = leaser.Leaser(manager)
     make_sleep_mark_manager_as_inactive(leaser_)
+    time.return_value = 0
     leaser_.add([requests.LeaseRequest(ack_id='my ack id', byte_size=50)])
 
+    # The lease is renewed 75% of the way through the 10 second deadline.
+    time.return_value = 7.5
     leaser_.maintain_leases()
 
     manager.dispatcher.modify_ack_deadline.assert_called_once_with([
@@ -143,6 +147,101 @@ def test_maintain_leases_ack_ids():
             seconds=10,
         )
     ])
+    assert leaser_._renewals == [(15, 'my ack id', 0)]
+
+
+@mock.patch('time.time', autospec=True)
+def test_maintain_leases_not_due(time):
+    manager = create_manager()
+    leaser_ = leaser.Leaser(manager)
+    make_sleep_mark_manager_as_inactive(leaser_)
+    time.return_value = 0
+    leaser_.add([requests.LeaseRequest(ack_id='ack1', byte_size=50)])
+    time.return_value = 5
+    leaser_.add([requests.LeaseRequest(ack_id='ack2', byte_size=50)])
+
+    time.return_value = 8
+    leaser_.maintain_leases()
+
+    manager.dispatcher.modify_ack_deadline.assert_called_once_with([
+        requests.ModAckRequest(ack_id='ack1', seconds=10)])
+    # The next lease is due at 5 + 7.5 seconds.
+    assert leaser_._snooze_time(8) == 4.5
+
+
+@mock.patch('time.time', autospec=True)
+def test_maintain_leases_skips_removed(time):
+    manager = create_manager()
+    leaser_ = leaser.Leaser(manager)
+    make_sleep_mark_manager_as_inactive(leaser_)
+    time.return_value = 0
+    leaser_.add([
+        requests.LeaseRequest(ack_id='ack1', byte_size=50),
+        requests.LeaseRequest(ack_id='ack2', byte_size=50)])
+    leaser_.remove([requests.DropRequest(ack_id='ack1', byte_size=50)])
+
+    time.return_value = 10
+    leaser_.maintain_leases()
+
+    manager.dispatcher.modify_ack_deadline.assert_called_once_with([
+        requests.ModAckRequest(ack_id='ack2', seconds=10)])
+    assert leaser_._renewals == [(17.5, 'ack2', 0)]
+
+
+@mock.patch('time.time', autospec=True)
+def test_maintain_leases_chunks_requests(time):
+    manager = create_manager()
+    leaser_ = leaser.Leaser(manager)
+    make_sleep_mark_manager_as_inactive(leaser_)
+    time.return_value = 0
+    leaser_.add([
+        requests.LeaseRequest(ack_id='ack{}'.format(index), byte_size=1)
+        for index in range(leaser._MAX_MODACK_BATCH + 1)])
+
+    time.return_value = 10
+    leaser_.maintain_leases()
+
+    calls = manager.dispatcher.modify_ack_deadline.call_args_list
+    assert [len(call[0][0]) for call in calls] == [
+        leaser._MAX_MODACK_BATCH, 1]
+
+
+@mock.patch('time.time', autospec=True)
+def test_maintain_leases_p99_grows(time):
+    manager = create_manager()
+    leaser_ = leaser.Leaser(manager)
+    make_sleep_mark_manager_as_inactive(leaser_)
+    time.return_value = 0
+    leaser_.add(
+        [requests.LeaseRequest(ack_id='ack1', byte_size=50)], seconds=10)
+
+    # Acks start taking longer, but ack1 was only given 10 seconds.
+    for _ in range(10):
+        manager.ack_histogram.add(60)
+    time.return_value = 7.5
+    leaser_.maintain_leases()
+
+    manager.dispatcher.modify_ack_deadline.assert_called_once_with([
+        requests.ModAckRequest(ack_id='ack1', seconds=60)])
+    # It was renewed for 60 seconds, so is next due 45 seconds later.
+    assert leaser_._renewals == [(52.5, 'ack1', 0)]
+
+
+@mock.patch('time.time', autospec=True)
+def test_add_with_seconds(time):
+    leaser_ = leaser.Leaser(create_manager())
+    time.return_value = 0
+
+    leaser_.add(
+        [requests.LeaseRequest(ack_id='ack1', byte_size=50)], seconds=60)
+
+    assert leaser_._renewals == [(45, 'ack1', 0)]
+
+
+def test_snooze_time_without_leases():
+    leaser_ = leaser.Leaser(create_manager())
+
+    assert leaser_._snooze_time(0) == leaser._MAX_SNOOZE
 
 
 def test_maintain_leases_no_ack_ids():
@@ -171,8 +270,9 @@ def test_maintain_leases_outdated_items(time):
     leaser_.add([
         requests.LeaseRequest(ack_id='ack2', byte_size=50)])
 
-    # Now make sure time reports that we are at the end of our timeline.
-    time.return_value = manager.flow_control.max_lease_duration + 1
+    # Now make sure time reports that we are at the end of our timeline,
+    # when ack2 is due for renewal.
+    time.return_value = manager.flow_control.max_lease_duration + 7
 
     leaser_.maintain_leases()
 
@@ -16,6 +16,7 @@ import concurrent.futures
 import threading
 
 import mock
+import pytest
 from six.moves import queue
 
 from google.cloud.pubsub_v1.subscriber import scheduler
@@ -51,3 +52,128 @@ def test_schedule():
     scheduler_.shutdown()
 
     assert called_with == [(('arg1',), {'kwarg1': 'meep'})]
+
+
+requires_asyncio = pytest.mark.skipif(
+    scheduler.asyncio is None, reason='asyncio requires Python 3')
+
+
+def run_pending(loop, iterations=5):
+    """Run the loop until callbacks scheduled so far (and theirs) ran."""
+    for _ in range(iterations):
+        loop.call_soon(loop.stop)
+        loop.run_forever()
+
+
+@pytest.fixture
+def loop():
+    loop = scheduler.asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+def test_asyncio_constructor_wo_asyncio():
+    with mock.patch.object(scheduler, 'asyncio', new=None):
+        with pytest.raises(RuntimeError):
+            scheduler.AsyncioScheduler(mock.sentinel.loop)
+
+
+@requires_asyncio
+def test_asyncio_schedule(loop):
+    callback = mock.Mock(return_value=None)
+    scheduler_ = scheduler.AsyncioScheduler(loop)
+
+    scheduler_.schedule(callback, 'arg1', kwarg1='meep')
+    callback.assert_not_called()
+    run_pending(loop)
+
+    assert isinstance(scheduler_.queue, queue.Queue)
+    callback.assert_called_once_with('arg1', kwarg1='meep')
+    assert scheduler_._running == 0
+
+
+@requires_asyncio
+def test_asyncio_schedule_limits_concurrency(loop):
+    futures = [loop.create_future() for _ in range(3)]
+    callback = mock.Mock(side_effect=futures)
+    scheduler_ = scheduler.AsyncioScheduler(loop, max_concurrency=2)
+
+    for index in range(3):
+        scheduler_.schedule(callback, index)
+    run_pending(loop)
+
+    assert callback.call_count == 2
+    assert scheduler_._running == 2
+    assert len(scheduler_._pending) == 1
+
+    futures[0].set_result(None)
+    run_pending(loop)
+
+    callback.assert_called_with(2)
+    assert scheduler_._running == 2
+    assert len(scheduler_._pending) == 0
+
+    futures[1].set_result(None)
+    futures[2].set_result(None)
+    run_pending(loop)
+
+    assert scheduler_._running == 0
+    assert scheduler_._tasks == set()
+
+
+@requires_asyncio
+def test_asyncio_schedule_coroutine(loop):
+    scheduler_ = scheduler.AsyncioScheduler(loop)
+    scheduler_.schedule(scheduler.asyncio.sleep, 0)
+    run_pending(loop, iterations=1)
+
+    assert scheduler_._running == 1
+    assert len(scheduler_._tasks) == 1
+
+    run_pending(loop)
+
+    assert scheduler_._running == 0
+    assert scheduler_._tasks == set()
+
+
+@requires_asyncio
+@mock.patch.object(scheduler, '_LOGGER')
+def test_asyncio_schedule_errors(_LOGGER, loop):
+    future = loop.create_future()
+    future.set_exception(ValueError('meep'))
+    scheduler_ = scheduler.AsyncioScheduler(loop)
+
+    scheduler_.schedule(mock.Mock(side_effect=ValueError('meep')))
+    scheduler_.schedule(mock.Mock(return_value=future))
+    run_pending(loop)
+
+    _LOGGER.exception.assert_called_once()
+    _LOGGER.error.assert_called_once()
+    assert scheduler_._running == 0
+
+
+@requires_asyncio
+def test_asyncio_shutdown(loop):
+    future = loop.create_future()
+    callback = mock.Mock(return_value=future)
+    scheduler_ = scheduler.AsyncioScheduler(loop, max_concurrency=1)
+    scheduler_.schedule(callback)
+    scheduler_.schedule(callback)
+    run_pending(loop)
+
+    scheduler_.shutdown()
+    scheduler_.schedule(callback)
+    run_pending(loop)
+
+    callback.assert_called_once_with()
+    assert future.cancelled()
+    assert scheduler_._running == 0
+    assert len(scheduler_._pending) == 0
+
+
+@requires_asyncio
+def test_asyncio_shutdown_closed_loop(loop):
+    scheduler_ = scheduler.AsyncioScheduler(loop)
+    loop.close()
+
+    scheduler_.shutdown()  # no raise
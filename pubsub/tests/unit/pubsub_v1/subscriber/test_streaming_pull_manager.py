@@ -61,6 +61,40 @@ def test__wrap_callback_errors_error():
     msg.nack.assert_called_once()
 
 
+@pytest.mark.skipif(
+    streaming_pull_manager.asyncio is None,
+    reason='asyncio requires Python 3')
+def test__wrap_callback_errors_async_error():
+    loop = streaming_pull_manager.asyncio.new_event_loop()
+    msg = mock.create_autospec(message.Message, instance=True)
+    future = loop.create_future()
+    future.set_exception(ValueError('meep'))
+
+    task = streaming_pull_manager._wrap_callback_errors(
+        mock.Mock(return_value=future), msg, loop=loop)
+    msg.nack.assert_not_called()
+    loop.call_soon(loop.stop)
+    loop.run_forever()
+    loop.close()
+
+    assert task is future
+    msg.nack.assert_called_once_with()
+
+
+@pytest.mark.skipif(
+    streaming_pull_manager.asyncio is None,
+    reason='asyncio requires Python 3')
+def test__wrap_callback_errors_coroutine_wo_loop():
+    msg = mock.create_autospec(message.Message, instance=True)
+    coroutine = streaming_pull_manager.asyncio.sleep(0)
+
+    task = streaming_pull_manager._wrap_callback_errors(
+        mock.Mock(return_value=coroutine), msg)
+
+    assert task is None
+    msg.nack.assert_called_once_with()
+
+
 def test_constructor_and_default_state():
     manager = streaming_pull_manager.StreamingPullManager(
         mock.sentinel.client,
@@ -322,6 +356,38 @@ def test_open(
     assert manager.is_active is True
 
 
+@pytest.mark.skipif(
+    streaming_pull_manager.asyncio is None,
+    reason='asyncio requires Python 3')
+@mock.patch(
+    'google.cloud.pubsub_v1.subscriber._protocol.bidi.ResumableBidiRpc',
+    autospec=True)
+@mock.patch(
+    'google.cloud.pubsub_v1.subscriber._protocol.bidi.BackgroundConsumer',
+    autospec=True)
+@mock.patch(
+    'google.cloud.pubsub_v1.subscriber._protocol.leaser.Leaser',
+    autospec=True)
+@mock.patch(
+    'google.cloud.pubsub_v1.subscriber._protocol.dispatcher.Dispatcher',
+    autospec=True)
+@mock.patch(
+    'google.cloud.pubsub_v1.subscriber._protocol.heartbeater.Heartbeater',
+    autospec=True)
+def test_open_w_asyncio_scheduler(*unused_mocks):
+    scheduler_ = mock.create_autospec(
+        scheduler.AsyncioScheduler, instance=True)
+    scheduler_._loop = mock.sentinel.loop
+    manager = streaming_pull_manager.StreamingPullManager(
+        mock.create_autospec(client.Client, instance=True),
+        'subscription-name',
+        scheduler=scheduler_)
+
+    manager.open(mock.sentinel.callback)
+
+    assert manager._callback.keywords == {'loop': mock.sentinel.loop}
+
+
 def test_open_already_active():
     manager = make_manager()
     manager._consumer = mock.create_autospec(
@@ -340,8 +406,8 @@ def test_open_has_been_closed():
         manager.open(mock.sentinel.callback)
 
 
-def make_running_manager():
-    manager = make_manager()
+def make_running_manager(**kwargs):
+    manager = make_manager(**kwargs)
     manager._consumer = mock.create_autospec(
         bidi.BackgroundConsumer, instance=True)
     manager._consumer.is_active = True
@@ -437,6 +503,7 @@ def test__get_initial_request_wo_leaser():
 def test_on_response():
     manager, _, dispatcher, _, _, scheduler = make_running_manager()
     manager._callback = mock.sentinel.callback
+    manager._leaser = leaser.Leaser(manager)
 
     # Set up the messages.
     response = types.StreamingPullResponse(
@@ -453,19 +520,123 @@ def test_on_response():
     )
 
     # Actually run the method and prove that modack and schedule
-    # are called in the expected way.
-    manager._on_response(response)
+    # are called in the expected way. The deadline is computed once.
+    with mock.patch.object(
+            manager._ack_histogram, 'percentile',
+            wraps=manager._ack_histogram.percentile) as percentile:
+        manager._on_response(response)
 
+    percentile.assert_called_once_with(99)
     dispatcher.modify_ack_deadline.assert_called_once_with(
         [requests.ModAckRequest('fack', 10),
          requests.ModAckRequest('back', 10)]
     )
 
+    # The messages are leased immediately.
+    assert sorted(manager._leaser.ack_ids) == ['back', 'fack']
+
     schedule_calls = scheduler.schedule.mock_calls
     assert len(schedule_calls) == 2
     for call in schedule_calls:
         assert call[1][0] == mock.sentinel.callback
         assert isinstance(call[1][1], message.Message)
+    assert manager.messages_on_hold == 0
+
+
+def make_response(count):
+    return types.StreamingPullResponse(
+        received_messages=[
+            types.ReceivedMessage(
+                ack_id='ack{}'.format(index),
+                message=types.PubsubMessage(
+                    data=b'foo', message_id=str(index)),
+            )
+            for index in range(count)
+        ],
+    )
+
+
+def scheduled_ack_ids(scheduler):
+    return [call[1][1].ack_id for call in scheduler.schedule.mock_calls]
+
+
+def test_on_response_holds_messages_over_max_messages():
+    manager, consumer, _, _, _, scheduler = make_running_manager(
+        flow_control=types.FlowControl(max_messages=2))
+    manager._leaser = leaser.Leaser(manager)
+    consumer.is_paused = False
+
+    manager._on_response(make_response(5))
+
+    # All messages are leased, but only two are processed at once.
+    assert manager._leaser.message_count == 5
+    assert scheduled_ack_ids(scheduler) == ['ack0', 'ack1']
+    assert manager.messages_on_hold == 3
+    consumer.pause.assert_called_once_with()
+
+    # Acking a message frees room for the next one.
+    consumer.is_paused = True
+    drop_requests = [requests.DropRequest('ack0', 0)]
+    manager._leaser.remove(drop_requests)
+    manager.drop_messages(drop_requests)
+    manager.maybe_resume_consumer()
+
+    assert scheduled_ack_ids(scheduler) == ['ack0', 'ack1', 'ack2']
+    assert manager.messages_on_hold == 2
+    consumer.resume.assert_not_called()
+
+
+def test_on_response_holds_messages_over_max_bytes():
+    manager, _, _, _, _, scheduler = make_running_manager()
+    response = make_response(3)
+    size = response.received_messages[0].message.ByteSize()
+    manager._flow_control = types.FlowControl(max_bytes=size * 2 - 1)
+    manager._leaser = leaser.Leaser(manager)
+
+    manager._on_response(response)
+
+    # The first message is always processed, even if it alone is too big.
+    assert scheduled_ack_ids(scheduler) == ['ack0']
+    assert manager.messages_on_hold == 2
+
+    drop_requests = [requests.DropRequest('ack0', size)]
+    manager._leaser.remove(drop_requests)
+    manager.drop_messages(drop_requests)
+    manager._maybe_release_messages()
+
+    assert scheduled_ack_ids(scheduler) == ['ack0', 'ack1']
+    assert manager.messages_on_hold == 1
+
+
+def test_drop_messages_discards_held_messages():
+    manager, _, _, _, _, scheduler = make_running_manager(
+        flow_control=types.FlowControl(max_messages=1))
+    manager._leaser = leaser.Leaser(manager)
+    response = make_response(4)
+    size = response.received_messages[0].message.ByteSize()
+
+    manager._on_response(response)
+
+    # The leaser drops two held messages which were leased for too long.
+    expired = [
+        requests.DropRequest('ack1', size), requests.DropRequest('ack2', size)]
+    manager._leaser.remove(expired)
+    manager.drop_messages(expired)
+    manager._maybe_release_messages()
+
+    assert scheduled_ack_ids(scheduler) == ['ack0']
+    assert manager.messages_on_hold == 1
+    assert manager._on_hold_bytes == size
+
+    # Acking the processed message releases the one still held.
+    acked = [requests.DropRequest('ack0', size)]
+    manager._leaser.remove(acked)
+    manager.drop_messages(acked)
+    manager._maybe_release_messages()
+
+    assert scheduled_ack_ids(scheduler) == ['ack0', 'ack3']
+    assert manager.messages_on_hold == 0
+    assert manager._processing_bytes == size
 
 
 def test_retryable_stream_errors():
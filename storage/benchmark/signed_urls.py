@@ -0,0 +1,104 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure how many signed URLs per second can be generated.
+
+Compares ``Blob.generate_signed_url`` with ``SignedURLFactory``, in this
+process and in worker processes. No requests are sent. Uses the service
+account key file given, or else a generated key.
+
+Usage: python signed_urls.py [--key-file KEY.json] [--count N]
+"""
+
+from __future__ import print_function
+
+import argparse
+import datetime
+import multiprocessing
+import time
+
+import rsa
+
+from google.oauth2 import service_account
+
+from google.cloud import storage
+
+
+def make_service_account_info():
+    _, private_key = rsa.newkeys(2048)
+    return {
+        'type': 'service_account',
+        'client_email': 'benchmark@example.iam.gserviceaccount.com',
+        'private_key': private_key.save_pkcs1().decode('utf-8'),
+        'private_key_id': 'benchmark',
+        'token_uri': 'https://accounts.google.com/o/oauth2/token',
+    }
+
+
+def report(label, count, elapsed):
+    print('{:<40} {:>10.0f} URLs/second'.format(label, count / elapsed))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--key-file', help='A service account key file.')
+    parser.add_argument('--count', type=int, default=2000)
+    parser.add_argument(
+        '--processes', type=int, default=multiprocessing.cpu_count())
+    args = parser.parse_args()
+
+    if args.key_file:
+        credentials = service_account.Credentials.from_service_account_file(
+            args.key_file)
+        make_factory = (
+            lambda **kw: storage.SignedURLFactory.from_service_account_file(
+                args.key_file, 'benchmark-bucket', **kw))
+    else:
+        info = make_service_account_info()
+        credentials = service_account.Credentials.from_service_account_info(
+            info)
+        make_factory = (
+            lambda **kw: storage.SignedURLFactory.from_service_account_info(
+                info, 'benchmark-bucket', **kw))
+
+    client = storage.Client(project='benchmark', credentials=credentials)
+    bucket = client.bucket('benchmark-bucket')
+    names = ['path/to/object-{:08d}.jpg'.format(index)
+             for index in range(args.count)]
+    expiration = datetime.timedelta(hours=1)
+
+    start = time.time()
+    for name in names:
+        bucket.blob(name).generate_signed_url(expiration)
+    report('Blob.generate_signed_url', args.count, time.time() - start)
+
+    for version in ('v2', 'v4'):
+        factory = make_factory(version=version)
+        start = time.time()
+        factory.sign(names, expiration)
+        report('SignedURLFactory ({})'.format(version), args.count,
+               time.time() - start)
+
+        with make_factory(version=version,
+                          processes=args.processes) as factory:
+            # Start the workers before timing.
+            factory.sign(names[:args.processes * 2], expiration)
+            start = time.time()
+            factory.sign(names, expiration)
+            report('SignedURLFactory ({}, {} processes)'.format(
+                version, args.processes), args.count, time.time() - start)
+
+
+if __name__ == '__main__':
+    main()
@@ -37,7 +37,11 @@ __version__ = get_distribution('google-cloud-storage').version
 from google.cloud.storage.batch import Batch
 from google.cloud.storage.blob import Blob
 from google.cloud.storage.bucket import Bucket
+from google.cloud.storage.bulk import BulkOperations
 from google.cloud.storage.client import Client
+from google.cloud.storage.signed_url import SignedURLFactory
 
 
-__all__ = ['__version__', 'Batch', 'Blob', 'Bucket', 'Client']
+__all__ = [
+    '__version__', 'Batch', 'Blob', 'Bucket', 'BulkOperations', 'Client',
+    'SignedURLFactory']
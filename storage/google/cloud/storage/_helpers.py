@@ -19,6 +19,16 @@ These are *not* part of the API.
 
 import base64
 from hashlib import md5
+import struct
+
+try:
+    import crcmod.predefined
+    from crcmod.crcmod import _usingExtension as _CRCMOD_EXTENSION
+except ImportError:  # pragma: NO COVER
+    crcmod = None
+    _CRCMOD_EXTENSION = False
+
+_CRC32C_POLYNOMIAL = 0x82F63B78  # Reversed Castagnoli polynomial.
 
 
 def _validate_name(name):
@@ -234,3 +244,196 @@ def _base64_md5hash(buffer_object):
     _write_buffer_to_hash(buffer_object, hash_obj)
     digest_bytes = hash_obj.digest()
     return base64.b64encode(digest_bytes)
+
+
+class _Checksums(object):
+    """The MD5 hash and CRC32C checksum of bytes, updated as they stream.
+
+    The CRC32C checksum is only computed if the ``crcmod`` library is
+    installed with its C extension (as with
+    ``pip install google-cloud-storage[crc32c]`` on a system with a
+    compiler). Its pure-Python fallback only checksums a few megabytes per
+    second, much slower than the transfer itself, so only the MD5 hash is
+    computed without the extension.
+    """
+
+    def __init__(self):
+        self._md5 = md5()
+        self._crc32c = None
+        if crcmod is not None and _CRCMOD_EXTENSION:
+            self._crc32c = crcmod.predefined.Crc('crc-32c')
+        self.size = 0
+        """int: The number of bytes hashed."""
+
+    def update(self, data):
+        """Add bytes to the checksums.
+
+        :type data: bytes
+        :param data: The next bytes of the stream.
+        """
+        self._md5.update(data)
+        if self._crc32c is not None:
+            self._crc32c.update(data)
+        self.size += len(data)
+
+    @property
+    def md5_hash(self):
+        """:rtype: str
+        :returns: The base64-encoded MD5 hash, as in an object's metadata.
+        """
+        return base64.b64encode(self._md5.digest()).decode('utf-8')
+
+    @property
+    def crc32c(self):
+        """:rtype: str or ``NoneType``
+        :returns: The base64-encoded big-endian CRC32C checksum, as in an
+                  object's metadata, or ``None`` if ``crcmod`` is not
+                  installed with its C extension.
+        """
+        if self._crc32c is None:
+            return None
+        return _crc32c_to_base64(self._crc32c.crcValue)
+
+    @property
+    def crc32c_value(self):
+        """:rtype: int or ``NoneType``
+        :returns: The CRC32C checksum as an integer, to combine with
+                  :func:`_crc32c_combine`.
+        """
+        if self._crc32c is None:
+            return None
+        return self._crc32c.crcValue
+
+
+class _HashingReader(object):
+    """Wrap a stream to update checksums with the bytes read from it.
+
+    Bytes read again after seeking backwards (as an upload does to resend a
+    chunk) are only counted once. If the stream is read past bytes which
+    were skipped, :attr:`complete` becomes ``False``.
+
+    :type stream: IO[bytes]
+    :param stream: A stream open for reading.
+
+    :type checksums: :class:`_Checksums`
+    :param checksums: The checksums to update.
+    """
+
+    def __init__(self, stream, checksums):
+        self._stream = stream
+        self._checksums = checksums
+        try:
+            self._position = stream.tell()
+        except (AttributeError, IOError, OSError):
+            self._position = 0
+        self._hashed_to = self._position
+        self.complete = True
+
+    def read(self, size=-1):
+        data = self._stream.read(size)
+        start = self._hashed_to - self._position
+        if start < 0:
+            self.complete = False
+        elif start < len(data):
+            self._checksums.update(data[start:])
+            self._hashed_to = self._position + len(data)
+        self._position += len(data)
+        return data
+
+    def seek(self, offset, whence=0):
+        self._stream.seek(offset, whence)
+        self._position = self._stream.tell()
+        return self._position
+
+    def tell(self):
+        return self._position
+
+
+class _HashingWriter(object):
+    """Wrap a stream to update checksums with the bytes written to it.
+
+    :type stream: IO[bytes]
+    :param stream: A stream open for writing.
+
+    :type checksums: :class:`_Checksums`
+    :param checksums: The checksums to update.
+    """
+
+    def __init__(self, stream, checksums):
+        self._stream = stream
+        self._checksums = checksums
+
+    def write(self, data):
+        self._checksums.update(data)
+        return self._stream.write(data)
+
+
+def _crc32c_to_base64(value):
+    """Encode a CRC32C checksum as in an object's metadata.
+
+    :type value: int
+    :param value: The checksum.
+
+    :rtype: str
+    :returns: The base64-encoded big-endian checksum.
+    """
+    return base64.b64encode(struct.pack('>I', value)).decode('utf-8')
+
+
+def _gf2_matrix_times(matrix, vector):
+    total = 0
+    index = 0
+    while vector:
+        if vector & 1:
+            total ^= matrix[index]
+        vector >>= 1
+        index += 1
+    return total
+
+
+def _gf2_matrix_square(matrix):
+    return [_gf2_matrix_times(matrix, row) for row in matrix]
+
+
+def _crc32c_combine(crc1, crc2, length2):
+    """Get the CRC32C checksum of two blocks of bytes from their checksums.
+
+    Uses the method of ``crc32_combine`` in zlib, which applies ``length2``
+    zero bytes to ``crc1`` in ``O(log(length2))`` matrix operations, so the
+    checksums of slices of a file can be combined without reading it.
+
+    :type crc1: int
+    :param crc1: The checksum of the first block.
+
+    :type crc2: int
+    :param crc2: The checksum of the second block.
+
+    :type length2: int
+    :param length2: The length of the second block, in bytes.
+
+    :rtype: int
+    :returns: The checksum of the first block followed by the second.
+    """
+    if length2 == 0:
+        return crc1
+
+    # The operator for one zero bit, then two, then four.
+    odd = [_CRC32C_POLYNOMIAL] + [1 << bit for bit in range(31)]
+    even = _gf2_matrix_square(odd)
+    odd = _gf2_matrix_square(even)
+
+    # Apply the operator for each set bit of the length in bytes.
+    while True:
+        even = _gf2_matrix_square(odd)
+        if length2 & 1:
+            crc1 = _gf2_matrix_times(even, crc1)
+        length2 >>= 1
+        if not length2:
+            break
+        odd = _gf2_matrix_square(even)
+        if length2 & 1:
+            crc1 = _gf2_matrix_times(odd, crc1)
+        length2 >>= 1
+        if not length2:
+            break
+    return crc1 ^ crc2
@@ -26,14 +26,19 @@
 """
 
 import base64
+import binascii
+from concurrent import futures
 import copy
 import hashlib
+import io
 from io import BytesIO
+import json
 import mimetypes
 import os
 import time
 import warnings
 
+import six
 from six.moves.urllib.parse import parse_qsl
 from six.moves.urllib.parse import quote
 from six.moves.urllib.parse import urlencode
@@ -52,11 +57,19 @@ from google.cloud._helpers import _to_bytes
 from google.cloud._helpers import _bytes_to_unicode
 from google.cloud.exceptions import NotFound
 from google.cloud.iam import Policy
+from google.cloud.storage._helpers import _Checksums
+from google.cloud.storage._helpers import _crc32c_combine
+from google.cloud.storage._helpers import _crc32c_to_base64
+from google.cloud.storage._helpers import _HashingReader
+from google.cloud.storage._helpers import _HashingWriter
 from google.cloud.storage._helpers import _PropertyMixin
 from google.cloud.storage._helpers import _scalar_property
+from google.cloud.storage._helpers import _write_buffer_to_hash
 from google.cloud.storage._signing import generate_signed_url
 from google.cloud.storage.acl import ACL
 from google.cloud.storage.acl import ObjectACL
+from google.cloud.storage.fileio import BlobReader
+from google.cloud.storage.fileio import BlobWriter
 
 
 _API_ACCESS_ENDPOINT = 'https://storage.googleapis.com'
@@ -96,6 +109,15 @@ _READ_LESS_THAN_SIZE = (
 
 _DEFAULT_CHUNKSIZE = 104857600  # 1024 * 1024 B * 100 = 100 MB
 _MAX_MULTIPART_SIZE = 8388608  # 8 MB
+_DEFAULT_SLICE_SIZE = 67108864  # 1024 * 1024 B * 64 = 64 MB
+_SLICE_STATE_SUFFIX = '.slices'
+_DEFAULT_PART_SIZE = 33554432  # 1024 * 1024 B * 32 = 32 MB
+_MAX_COMPOSE_COMPONENTS = 32
+_COMPOSITE_PART_TEMPLATE = u'{}.{}.part-{}-{:05d}'
+_HASH_BLOCK_SIZE = 1048576  # 1 MB
+_CHECKSUM_MISMATCH = (
+    'Checksum mismatch while {} {}: the {} of the object is {}, '
+    'but the {} of the data is {}.')
 
 
 class Blob(_PropertyMixin):
@@ -129,6 +151,8 @@ class Blob(_PropertyMixin):
     """
 
     _chunk_size = None  # Default value for each instance.
+    _computed_md5_hash = None
+    _computed_crc32c = None
     _CHUNK_SIZE_MULTIPLE = 256 * 1024
     """Number (256 KB, in bytes) that must divide the chunk size."""
 
@@ -475,20 +499,36 @@ class Blob(_PropertyMixin):
 
         :type end: int
         :param end: Optional, The last byte in a range to be downloaded.
+
+        :raises: :class:`google.resumable_media.DataCorruption` if the whole
+                 object was downloaded and its checksums don't match the
+                 object's.
         """
+        checksums = _Checksums()
+        stream = _HashingWriter(file_obj, checksums)
         if self.chunk_size is None:
             download = Download(
-                download_url, stream=file_obj, headers=headers,
+                download_url, stream=stream, headers=headers,
                 start=start, end=end)
             download.consume(transport)
         else:
             download = ChunkedDownload(
-                download_url, self.chunk_size, file_obj, headers=headers,
+                download_url, self.chunk_size, stream, headers=headers,
                 start=start if start else 0, end=end)
 
             while not download.finished:
                 download.consume_next_chunk(transport)
 
+        # Objects stored with gzip transcoding are decompressed in transit,
+        # so their checksums don't apply to the data written.
+        whole = not start and end is None
+        if whole and self.content_encoding != 'gzip':
+            self._verify_checksums(
+                checksums.md5_hash, checksums.crc32c, 'downloading')
+        else:
+            self._computed_md5_hash = checksums.md5_hash
+            self._computed_crc32c = checksums.crc32c
+
     def download_to_file(self, file_obj, client=None, start=None, end=None):
         """Download the contents of this blob into a file-like object.
 
@@ -543,12 +583,23 @@ class Blob(_PropertyMixin):
             _raise_from_invalid_response(exc)
 
     def download_to_filename(self, filename, client=None,
-                             start=None, end=None):
+                             start=None, end=None, max_workers=None,
+                             slice_size=_DEFAULT_SLICE_SIZE):
         """Download the contents of this blob into a named file.
 
         If :attr:`user_project` is set on the bucket, bills the API request
         to that project.
 
+        If ``max_workers`` is set, the object is split into slices of
+        ``slice_size`` bytes, which are downloaded concurrently and written
+        in place into the file. If the ``crcmod`` library is installed with
+        its C extension, the CRC32C checksum of each slice is computed as it
+        is written, and the checksums are combined and compared with the
+        object's. Otherwise, the file is read again to compare its MD5 hash
+        with the object's. If a slice fails, the slices which completed are
+        recorded next to the file, and calling this method again downloads
+        only the missing slices.
+
         :type filename: str
         :param filename: A filename to be passed to ``open``.
 
@@ -563,21 +614,183 @@ class Blob(_PropertyMixin):
         :type end: int
         :param end: Optional, The last byte in a range to be downloaded.
 
+        :type max_workers: int
+        :param max_workers: Optional, the number of slices to download
+                            concurrently. Ignored if ``start`` or ``end``
+                            is set.
+
+        :type slice_size: int
+        :param slice_size: Optional, the size of each slice in bytes, when
+                           ``max_workers`` is set.
+
         :raises: :class:`google.cloud.exceptions.NotFound`
         """
-        try:
+        if max_workers is not None and start is None and end is None:
+            self._download_to_filename_sliced(
+                filename, client, max_workers, slice_size)
+        else:
+            try:
+                with open(filename, 'wb') as file_obj:
+                    self.download_to_file(
+                        file_obj, client=client, start=start, end=end)
+            except resumable_media.DataCorruption:
+                # Delete the corrupt downloaded file.
+                os.remove(filename)
+                raise
+
+        updated = self.updated
+        if updated is not None:
+            mtime = time.mktime(updated.timetuple())
+            os.utime(filename, (mtime, mtime))
+
+    def _download_to_filename_sliced(self, filename, client, max_workers,
+                                     slice_size):
+        """Download the blob into a named file as concurrent slices.
+
+        :type filename: str
+        :param filename: The name of the file to write.
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: Optional. The client to use.
+
+        :type max_workers: int
+        :param max_workers: The number of slices to download concurrently.
+
+        :type slice_size: int
+        :param slice_size: The size of each slice in bytes.
+
+        :raises: :class:`google.resumable_media.DataCorruption` if the
+                 checksum of the file does not match the object's.
+        """
+        if self.size is None:
+            self.reload(client=client)
+
+        # Byte ranges of objects stored with gzip transcoding can't be
+        # decompressed independently, so download those in one piece.
+        if self.content_encoding == 'gzip' or self.size <= slice_size:
+            self.download_to_filename(filename, client=client)
+            return
+
+        state_filename = filename + _SLICE_STATE_SUFFIX
+        state = {
+            'generation': self.generation,
+            'size': self.size,
+            'slice_size': slice_size,
+            'done': [],
+            'checksums': {},
+        }
+        previous = _read_slice_state(state_filename)
+        if (previous is not None and os.path.exists(filename) and
+                all(previous.get(key) == value for key, value in
+                    state.items() if key not in ('done', 'checksums'))):
+            state['done'] = previous['done']
+            state['checksums'] = previous.get('checksums', {})
+        else:
             with open(filename, 'wb') as file_obj:
-                self.download_to_file(
-                    file_obj, client=client, start=start, end=end)
+                file_obj.truncate(self.size)
+
+        done = set(state['done'])
+        slices = [
+            (index, offset, min(offset + slice_size, self.size) - 1)
+            for index, offset in enumerate(
+                six.moves.range(0, self.size, slice_size))]
+        pending = [
+            (index, start, end) for index, start, end in slices
+            if index not in done]
+
+        download_url = self._get_download_url()
+        headers = _get_encryption_headers(self._encryption_key)
+        transport = self._get_transport(client)
+        error = None
+        with futures.ThreadPoolExecutor(max_workers) as executor:
+            slice_futures = {
+                executor.submit(
+                    _download_slice, transport, download_url, headers,
+                    filename, start, end): index
+                for index, start, end in pending}
+            for future in futures.as_completed(slice_futures):
+                if future.exception() is not None:
+                    error = error or future.exception()
+                    continue
+                index = slice_futures[future]
+                done.add(index)
+                state['done'] = sorted(done)
+                state['checksums'][str(index)] = future.result()
+                _write_slice_state(state_filename, state)
+
+        if error is not None:
+            if isinstance(error, resumable_media.InvalidResponse):
+                _raise_from_invalid_response(error)
+            raise error
+
+        crcs = [state['checksums'].get(str(index)) for index, _, _ in slices]
+        try:
+            if self.crc32c is not None and None not in crcs:
+                combined = crcs[0]
+                for (_, start, end), crc in zip(slices[1:], crcs[1:]):
+                    combined = _crc32c_combine(combined, crc, end - start + 1)
+                self._verify_checksums(
+                    None, _crc32c_to_base64(combined), 'downloading')
+            else:
+                self._verify_download(filename)
         except resumable_media.DataCorruption:
-            # Delete the corrupt downloaded file.
             os.remove(filename)
             raise
+        finally:
+            os.remove(state_filename)
 
-        updated = self.updated
-        if updated is not None:
-            mtime = time.mktime(updated.timetuple())
-            os.utime(file_obj.name, (mtime, mtime))
+    def _verify_download(self, filename):
+        """Compare the checksums of a downloaded file with the object's.
+
+        Reads the whole file, so it is only used when the checksums could
+        not be computed as the file was written.
+
+        :type filename: str
+        :param filename: The name of the downloaded file.
+
+        :raises: :class:`google.resumable_media.DataCorruption` if the
+                 checksums don't match.
+        """
+        checksums = _Checksums()
+        with open(filename, 'rb') as file_obj:
+            _write_buffer_to_hash(
+                file_obj, checksums, digest_block_size=_HASH_BLOCK_SIZE)
+        self._verify_checksums(
+            checksums.md5_hash, checksums.crc32c, 'downloading')
+
+    def _verify_checksums(self, md5_hash, crc32c, action):
+        """Record the checksums of transferred data, and compare them.
+
+        Each checksum is compared with the object's if both are known:
+        composite objects have no MD5 hash, and the CRC32C checksum is only
+        computed if the ``crcmod`` library is installed with its C
+        extension.
+
+        :type md5_hash: str
+        :param md5_hash: The base64-encoded MD5 hash of the data, or
+                         ``None``.
+
+        :type crc32c: str
+        :param crc32c: The base64-encoded CRC32C checksum of the data, or
+                       ``None``.
+
+        :type action: str
+        :param action: Either ``'downloading'`` or ``'uploading'``, for the
+                       error message.
+
+        :raises: :class:`google.resumable_media.DataCorruption` if a checksum
+                 doesn't match.
+        """
+        self._computed_md5_hash = md5_hash
+        self._computed_crc32c = crc32c
+        for name, expected, actual in (
+                ('MD5 hash', self.md5_hash, md5_hash),
+                ('CRC32C checksum', self.crc32c, crc32c)):
+            if expected is not None and actual not in (None, expected):
+                raise resumable_media.DataCorruption(
+                    None, _CHECKSUM_MISMATCH.format(
+                        action, self.name, name, expected, name, actual))
 
     def download_as_string(self, client=None, start=None, end=None):
         """Download the contents of this blob as a string.
@@ -635,6 +848,81 @@ class Blob(_PropertyMixin):
 
         return content_type
 
+    def open(self, mode='r', chunk_size=None, encoding=None, errors=None,
+             newline=None, content_type=None, client=None,
+             predefined_acl=None):
+        """Open this blob as a file-like object, to stream its contents.
+
+        In binary read mode (``'rb'``), returns a seekable
+        :class:`~google.cloud.storage.fileio.BlobReader`, which downloads
+        ``chunk_size`` bytes at a time with range requests. In binary write
+        mode (``'wb'``), returns a
+        :class:`~google.cloud.storage.fileio.BlobWriter`, which sends each
+        ``chunk_size`` bytes through a resumable upload as soon as they are
+        written, and completes the upload when closed. If the ``with``
+        block of a binary writer raises, the upload is left incomplete and
+        the blob is not changed.
+
+        Text modes (``'r'`` and ``'w'``) wrap these in an
+        :class:`io.TextIOWrapper`.
+
+        If :attr:`user_project` is set on the bucket, bills the API request
+        to that project.
+
+        :type mode: str
+        :param mode: (Optional) One of ``'r'``, ``'rt'``, ``'rb'``, ``'w'``,
+                     ``'wt'`` or ``'wb'``.
+
+        :type chunk_size: int
+        :param chunk_size: (Optional) The number of bytes to download or
+                           upload with each request. For writing, must be a
+                           multiple of 256 KB; defaults to the blob's
+                           ``chunk_size``, if set.
+
+        :type encoding: str
+        :param encoding: (Optional) For text modes, as for :func:`io.open`.
+
+        :type errors: str
+        :param errors: (Optional) For text modes, as for :func:`io.open`.
+
+        :type newline: str
+        :param newline: (Optional) For text modes, as for :func:`io.open`.
+
+        :type content_type: str
+        :param content_type: (Optional) For write modes, the type of the
+                             content being uploaded.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: (Optional) The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+
+        :type predefined_acl: str
+        :param predefined_acl: (Optional) For write modes, predefined access
+                               control list
+
+        :rtype: :class:`io.IOBase`
+        :returns: The file-like object.
+        :raises: :class:`ValueError` if ``mode`` is not supported.
+        """
+        if mode in ('r', 'rt', 'rb'):
+            file_obj = BlobReader(self, chunk_size=chunk_size, client=client)
+            if mode == 'rb':
+                return file_obj
+            return io.TextIOWrapper(
+                io.BufferedReader(file_obj), encoding=encoding,
+                errors=errors, newline=newline)
+
+        if mode in ('w', 'wt', 'wb'):
+            file_obj = BlobWriter(
+                self, chunk_size=chunk_size, content_type=content_type,
+                client=client, predefined_acl=predefined_acl)
+            if mode == 'wb':
+                return file_obj
+            return io.TextIOWrapper(
+                file_obj, encoding=encoding, errors=errors, newline=newline)
+
+        raise ValueError('Unsupported mode: %r' % (mode,))
+
     def _get_writable_metadata(self):
         """Get the object / blob metadata which is writable.
 
@@ -1022,7 +1310,10 @@ class Blob(_PropertyMixin):
         :param predefined_acl: (Optional) predefined access control list
 
         :raises: :class:`~google.cloud.exceptions.GoogleCloudError`
-                 if the upload response returns an error status.
+                 if the upload response returns an error status, or
+                 :class:`google.resumable_media.DataCorruption` if the
+                 checksums of the data read from ``file_obj`` don't match
+                 those of the created object (which is not deleted).
 
         .. _object versioning: https://cloud.google.com/storage/\
                                docs/object-versioning
@@ -1035,16 +1326,25 @@ class Blob(_PropertyMixin):
         _maybe_rewind(file_obj, rewind=rewind)
         predefined_acl = ACL.validate_predefined(predefined_acl)
 
+        # The checksums are computed as the upload reads the data, rather
+        # than with another pass over it.
+        checksums = _Checksums()
+        stream = _HashingReader(file_obj, checksums)
         try:
             created_json = self._do_upload(
-                client, file_obj, content_type,
+                client, stream, content_type,
                 size, num_retries, predefined_acl)
             self._set_properties(created_json)
         except resumable_media.InvalidResponse as exc:
             _raise_from_invalid_response(exc)
 
+        if stream.complete and checksums.size == self.size:
+            self._verify_checksums(
+                checksums.md5_hash, checksums.crc32c, 'uploading')
+
     def upload_from_filename(self, filename, content_type=None, client=None,
-                             predefined_acl=None):
+                             predefined_acl=None, max_workers=None,
+                             part_size=_DEFAULT_PART_SIZE):
         """Upload this blob's contents from the content of a named file.
 
         The content type of the upload will be determined in order
@@ -1081,15 +1381,112 @@ class Blob(_PropertyMixin):
 
         :type predefined_acl: str
         :param predefined_acl: (Optional) predefined access control list
+
+        :type max_workers: int
+        :param max_workers: (Optional) If set, upload a file larger than
+                            ``part_size`` as a parallel composite upload:
+                            the file is split into parts, which are uploaded
+                            concurrently as temporary objects, composed into
+                            this blob, and then deleted. Ignored if
+                            ``predefined_acl`` or an encryption key is set.
+
+        :type part_size: int
+        :param part_size: (Optional) The size of each part in bytes, when
+                          ``max_workers`` is set.
+
+        .. note::
+           The result of a composite upload is a composite object, which has
+           a CRC32C checksum but no MD5 hash.
         """
         content_type = self._get_content_type(content_type, filename=filename)
 
         with open(filename, 'rb') as file_obj:
             total_bytes = os.fstat(file_obj.fileno()).st_size
+            if (max_workers is not None and total_bytes > part_size and
+                    predefined_acl is None and self._encryption_key is None):
+                self._upload_composite(
+                    filename, total_bytes, content_type, client,
+                    max_workers, part_size)
+                return
+
             self.upload_from_file(
                 file_obj, content_type=content_type, client=client,
                 size=total_bytes, predefined_acl=predefined_acl)
 
+    def _upload_composite(self, filename, total_bytes, content_type, client,
+                          max_workers, part_size):
+        """Upload a file as concurrent parts composed into this blob.
+
+        :type filename: str
+        :param filename: The path to the file.
+
+        :type total_bytes: int
+        :param total_bytes: The size of the file.
+
+        :type content_type: str
+        :param content_type: Type of content being uploaded.
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: Optional. The client to use.
+
+        :type max_workers: int
+        :param max_workers: The number of requests to send concurrently.
+
+        :type part_size: int
+        :param part_size: The size of each part in bytes.
+        """
+        token = binascii.hexlify(os.urandom(8)).decode('ascii')
+        temporary = []
+
+        def make_part(level, index):
+            name = _COMPOSITE_PART_TEMPLATE.format(
+                self.name, token, level, index)
+            part = Blob(
+                name, bucket=self.bucket, kms_key_name=self.kms_key_name)
+            part.content_type = content_type
+            temporary.append(part)
+            return part
+
+        def upload_part(part, start):
+            size = min(part_size, total_bytes - start)
+            with open(filename, 'rb') as file_obj:
+                part.upload_from_file(
+                    _FileSlice(file_obj, start, size),
+                    content_type=content_type, client=client, size=size)
+            return part
+
+        def compose_parts(destination, sources):
+            destination.compose(sources, client=client)
+            return destination
+
+        self.content_type = content_type
+        try:
+            with futures.ThreadPoolExecutor(max_workers) as executor:
+                components = list(executor.map(
+                    lambda args: upload_part(*args),
+                    [(make_part(0, index), start) for index, start in
+                     enumerate(six.moves.range(0, total_bytes, part_size))]))
+
+                # A compose request accepts a limited number of components,
+                # so compose the parts in groups, level by level.
+                level = 0
+                while len(components) > _MAX_COMPOSE_COMPONENTS:
+                    level += 1
+                    groups = [
+                        components[start:start + _MAX_COMPOSE_COMPONENTS]
+                        for start in six.moves.range(
+                            0, len(components), _MAX_COMPOSE_COMPONENTS)]
+                    components = list(executor.map(
+                        lambda args: compose_parts(*args),
+                        [(make_part(level, index), group)
+                         for index, group in enumerate(groups)]))
+
+            self.compose(components, client=client)
+        finally:
+            self.bucket.delete_blobs(
+                temporary, on_error=lambda blob: None, client=client)
+
     def upload_from_string(self, data, content_type='text/plain', client=None,
                            predefined_acl=None):
         """Upload contents of this blob from the provided string.
@@ -1558,6 +1955,35 @@ class Blob(_PropertyMixin):
     .. _RFC 4960: https://tools.ietf.org/html/rfc4960#appendix-B
     """
 
+    @property
+    def computed_crc32c(self):
+        """CRC32C checksum of the data last uploaded or downloaded.
+
+        Computed as the data is transferred, in the format of
+        :attr:`crc32c`. For a download of the whole object, it has been
+        compared with :attr:`crc32c`, if that is set.
+
+        :rtype: str or ``NoneType``
+        :returns: The checksum, or ``None`` if no data has been transferred
+                  or the ``crcmod`` library is not installed with its C
+                  extension.
+        """
+        return self._computed_crc32c
+
+    @property
+    def computed_md5_hash(self):
+        """MD5 hash of the data last uploaded or downloaded.
+
+        Computed as the data is transferred, in the format of
+        :attr:`md5_hash`. For a download of the whole object, it has been
+        compared with :attr:`md5_hash`, if that is set.
+
+        :rtype: str or ``NoneType``
+        :returns: The hash, or ``None`` if no data has been transferred, or
+                  the object was downloaded as concurrent slices.
+        """
+        return self._computed_md5_hash
+
     @property
     def component_count(self):
         """Number of underlying components that make up this object.
@@ -1861,6 +2287,150 @@ def _get_encryption_headers(key, source=False):
     }
 
 
+def _download_slice(transport, download_url, headers, filename, start, end):
+    """Download a byte range of an object into place in a file.
+
+    Each slice writes through its own file handle, so slices can be written
+    concurrently.
+
+    :type transport:
+        :class:`~google.auth.transport.requests.AuthorizedSession`
+    :param transport: The transport (with credentials) that will
+                      make authenticated requests.
+
+    :type download_url: str
+    :param download_url: The URL where the media can be accessed.
+
+    :type headers: dict
+    :param headers: Headers to be sent with the request.
+
+    :type filename: str
+    :param filename: The name of the file, already at its full size.
+
+    :type start: int
+    :param start: The first byte of the slice.
+
+    :type end: int
+    :param end: The last byte of the slice.
+
+    :rtype: int
+    :returns: The CRC32C checksum of the slice, or ``None`` if ``crcmod`` is
+              not installed with its C extension.
+    """
+    checksums = _Checksums()
+    with open(filename, 'r+b') as file_obj:
+        file_obj.seek(start)
+        # A single chunk covers the slice. Unlike ``Download``, a
+        # ``ChunkedDownload`` does not compare the range with the checksum
+        # of the whole object. It sets the range in its headers, so each
+        # slice needs its own copy.
+        download = ChunkedDownload(
+            download_url, end - start + 1,
+            _HashingWriter(file_obj, checksums), headers=dict(headers),
+            start=start, end=end)
+        while not download.finished:
+            download.consume_next_chunk(transport)
+    return checksums.crc32c_value
+
+
+def _read_slice_state(filename):
+    """Read the progress of an interrupted sliced download.
+
+    :type filename: str
+    :param filename: The name of the state file.
+
+    :rtype: dict or ``NoneType``
+    :returns: The saved state, or ``None`` if there is none.
+    """
+    try:
+        with open(filename, 'r') as file_obj:
+            return json.load(file_obj)
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def _write_slice_state(filename, state):
+    """Save the progress of a sliced download.
+
+    :type filename: str
+    :param filename: The name of the state file.
+
+    :type state: dict
+    :param state: The state to save.
+    """
+    with open(filename, 'w') as file_obj:
+        json.dump(state, file_obj)
+
+
+class _FileSlice(object):
+    """A read-only view of a range of bytes in a file.
+
+    Uploads expect a stream which starts at position zero, so positions are
+    relative to the start of the range.
+
+    :type file_obj: file
+    :param file_obj: A file opened in binary mode.
+
+    :type start: int
+    :param start: The offset of the range in the file.
+
+    :type size: int
+    :param size: The number of bytes in the range.
+    """
+
+    def __init__(self, file_obj, start, size):
+        self._file_obj = file_obj
+        self._start = start
+        self._size = size
+        self._position = 0
+
+    def read(self, size=-1):
+        """Read bytes from the range.
+
+        :type size: int
+        :param size: (Optional) The maximum number of bytes to read. If
+                     negative, read to the end of the range.
+
+        :rtype: bytes
+        :returns: The bytes read.
+        """
+        remaining = self._size - self._position
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+        self._file_obj.seek(self._start + self._position)
+        data = self._file_obj.read(size)
+        self._position += len(data)
+        return data
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """Change the position in the range.
+
+        :type offset: int
+        :param offset: The offset, relative to ``whence``.
+
+        :type whence: int
+        :param whence: (Optional) One of ``os.SEEK_SET``, ``os.SEEK_CUR``
+                       or ``os.SEEK_END``.
+
+        :rtype: int
+        :returns: The new position.
+        """
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += self._size
+        self._position = max(0, min(offset, self._size))
+        return self._position
+
+    def tell(self):
+        """Get the position in the range.
+
+        :rtype: int
+        :returns: The position.
+        """
+        return self._position
+
+
 def _quote(value):
     """URL-quote a string.
 
@@ -15,8 +15,10 @@
 """Create / interact with Google Cloud Storage buckets."""
 
 import base64
+from concurrent import futures
 import copy
 import datetime
+import heapq
 import json
 import warnings
 
@@ -37,10 +39,12 @@ from google.cloud.storage.acl import BucketACL
 from google.cloud.storage.acl import DefaultObjectACL
 from google.cloud.storage.blob import Blob
 from google.cloud.storage.blob import _get_encryption_headers
+from google.cloud.storage.bulk import BulkOperations
 from google.cloud.storage.notification import BucketNotification
 from google.cloud.storage.notification import NONE_PAYLOAD_FORMAT
 
 
+_NEXT_PAGE_TOKEN_FIELD = 'nextPageToken'
 _LOCATION_SETTER_MESSAGE = (
     "Assignment to 'Bucket.location' is deprecated, as it is only "
     "valid before the bucket is created. Instead, pass the location "
@@ -86,6 +90,117 @@ def _item_to_blob(iterator, item):
     return blob
 
 
+def _keyed_blobs(iterator, index):
+    """Yield ``(name, index, blob)`` for each blob, to merge by name.
+
+    The index of the iterator breaks ties, so that blobs are never compared.
+    """
+    for blob in iterator:
+        yield blob.name, index, blob
+
+
+def _merge_blob_iterators(iterators, executor):
+    """Merge blob iterators ordered by name, then shut down their executor.
+    """
+    try:
+        shards = [
+            _keyed_blobs(iterator, index)
+            for index, iterator in enumerate(iterators)]
+        for _, _, blob in heapq.merge(*shards):
+            yield blob
+    finally:
+        executor.shutdown(wait=False)
+
+
+def _with_paging_fields(fields):
+    """Add the next page token to a field selector, if it is missing.
+
+    Without it, iterating over a partial response stops after one page.
+
+    :type fields: str
+    :param fields: A selector for a partial response, such as
+                   ``'items(name,size)'``.
+
+    :rtype: str
+    :returns: The selector, including the next page token.
+    """
+    selected = set(field.strip() for field in fields.split(','))
+    if _NEXT_PAGE_TOKEN_FIELD in selected:
+        return fields
+    return fields + ',' + _NEXT_PAGE_TOKEN_FIELD
+
+
+class _PrefetchingHTTPIterator(page_iterator.HTTPIterator):
+    """An HTTP iterator which requests each page ahead of time.
+
+    As soon as a page's response arrives, the request for the following
+    page is submitted to ``executor``, so that it is fetched while the
+    current page is consumed.
+
+    :type executor: :class:`concurrent.futures.Executor`
+    :param executor: (Optional) The executor to request pages with. If not
+                     passed, the iterator uses a thread of its own.
+
+    :type kwargs: dict
+    :param kwargs: Keyword arguments passed to
+                   :class:`~google.api_core.page_iterator.HTTPIterator`.
+    """
+
+    def __init__(self, executor=None, **kwargs):
+        super(_PrefetchingHTTPIterator, self).__init__(**kwargs)
+        self._own_executor = executor is None
+        if executor is None:
+            executor = futures.ThreadPoolExecutor(max_workers=1)
+        self._executor = executor
+        self._next_response = None
+
+    def start(self):
+        """Request the first page, without waiting for the response."""
+        if self._next_response is None and self.page_number == 0:
+            self._submit(self._get_query_params())
+
+    def _submit(self, params):
+        self._next_response = self._executor.submit(
+            self.api_request, method=self._HTTP_METHOD, path=self.path,
+            query_params=params)
+
+    def _get_next_page_response(self):
+        """Wait for the prefetched page, and prefetch the one after it.
+
+        :rtype: dict
+        :returns: The parsed JSON response of the next page's contents.
+        """
+        self.start()
+        future, self._next_response = self._next_response, None
+        try:
+            response = future.result()
+        except Exception:
+            self._shutdown()
+            raise
+
+        params = None
+        next_token = response.get(self._next_token)
+        if next_token is not None:
+            params = self._get_query_params()
+            params[self._PAGE_TOKEN] = next_token
+            if self.max_results is not None:
+                remaining = (self.max_results - self.num_results -
+                             len(response.get(self._items_key, ())))
+                params[self._MAX_RESULTS] = remaining
+                if remaining <= 0:
+                    params = None
+
+        if params is None:
+            self._shutdown()
+        else:
+            self._submit(params)
+        return response
+
+    def _shutdown(self):
+        if self._own_executor:
+            self._executor.shutdown(wait=False)
+
+
 def _item_to_notification(iterator, item):
     """Convert a JSON blob to the native object.
 
@@ -592,7 +707,8 @@ class Bucket(_PropertyMixin):
 
     def list_blobs(self, max_results=None, page_token=None, prefix=None,
                    delimiter=None, versions=None,
-                   projection='noAcl', fields=None, client=None):
+                   projection='noAcl', fields=None, client=None,
+                   prefetch=False):
         """Return an iterator used to find blobs in the bucket.
 
         If :attr:`user_project` is set, bills the API request to that project.
@@ -626,16 +742,99 @@ class Bucket(_PropertyMixin):
                        in a partial response. Must be a list of fields. For
                        example to get a partial response with just the next
                        page token and the language of each blob returned:
-                       ``'items/contentLanguage,nextPageToken'``.
+                       ``'items/contentLanguage,nextPageToken'``. The next
+                       page token is added if missing.
 
         :type client: :class:`~google.cloud.storage.client.Client`
         :param client: (Optional) The client to use.  If not passed, falls back
                        to the ``client`` stored on the current bucket.
 
+        :type prefetch: bool
+        :param prefetch: (Optional) If ``True``, request each page in the
+                         background as soon as the previous page arrives,
+                         and request the first page immediately.
+
         :rtype: :class:`~google.api_core.page_iterator.Iterator`
         :returns: Iterator of all :class:`~google.cloud.storage.blob.Blob`
                   in this bucket matching the arguments.
         """
+        extra_params = self._list_blobs_params(
+            prefix, delimiter, versions, projection, fields)
+        iterator = self._list_blobs_iterator(
+            extra_params, client, page_token=page_token,
+            max_results=max_results, prefetch=prefetch)
+        if prefetch:
+            iterator.start()
+        return iterator
+
+    def list_blobs_in_prefixes(self, prefixes, versions=None,
+                               projection='noAcl', fields=None, client=None,
+                               max_workers=8):
+        """Find the blobs under many prefixes, listing them concurrently.
+
+        Splitting a large bucket into disjoint prefixes, such as the
+        hexadecimal digits for objects with hashed names, lets their pages
+        be fetched in parallel. Each prefix fetches its next page while its
+        current one is consumed, and the first page of every prefix is
+        requested immediately.
+
+        If :attr:`user_project` is set, bills the API requests to that
+        project.
+
+        :type prefixes: list of str
+        :param prefixes: The prefixes to list. If one of them is a prefix of
+                         another, the blobs under both are returned twice.
+
+        :type versions: bool
+        :param versions: (Optional) Whether object versions should be returned
+                         as separate blobs.
+
+        :type projection: str
+        :param projection: (Optional) If used, must be 'full' or 'noAcl'.
+                           Defaults to ``'noAcl'``.
+
+        :type fields: str
+        :param fields: (Optional) Selector specifying which fields to include
+                       in a partial response, such as
+                       ``'items(name,size,updated)'``.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: (Optional) The client to use.  If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The number of pages to request
+                            concurrently.
+
+        :rtype: iterator of :class:`~google.cloud.storage.blob.Blob`
+        :returns: The blobs under all the prefixes, ordered by name (and
+                  then by prefix).
+        """
+        executor = futures.ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            iterators = []
+            for prefix in prefixes:
+                extra_params = self._list_blobs_params(
+                    prefix, None, versions, projection, fields)
+                iterator = self._list_blobs_iterator(
+                    extra_params, client, prefetch=True, executor=executor)
+                iterator.start()
+                iterators.append(iterator)
+        except Exception:
+            executor.shutdown(wait=False)
+            raise
+
+        return _merge_blob_iterators(iterators, executor)
+
+    def _list_blobs_params(self, prefix, delimiter, versions, projection,
+                           fields):
+        """Build the query parameters to list blobs.
+
+        See :meth:`list_blobs`.
+
+        :rtype: dict
+        :returns: The query parameters.
+        """
         extra_params = {'projection': projection}
 
         if prefix is not None:
@@ -648,22 +847,38 @@ class Bucket(_PropertyMixin):
             extra_params['versions'] = versions
 
         if fields is not None:
-            extra_params['fields'] = fields
+            extra_params['fields'] = _with_paging_fields(fields)
 
         if self.user_project is not None:
             extra_params['userProject'] = self.user_project
 
+        return extra_params
+
+    def _list_blobs_iterator(self, extra_params, client, page_token=None,
+                             max_results=None, prefetch=False, executor=None):
+        """Create an iterator of blobs.
+
+        See :meth:`list_blobs`.
+
+        :rtype: :class:`~google.api_core.page_iterator.Iterator`
+        :returns: Iterator of :class:`~google.cloud.storage.blob.Blob`.
+        """
         client = self._require_client(client)
         path = self.path + '/o'
-        iterator = page_iterator.HTTPIterator(
-            client=client,
-            api_request=client._connection.api_request,
-            path=path,
-            item_to_value=_item_to_blob,
-            page_token=page_token,
-            max_results=max_results,
-            extra_params=extra_params,
-            page_start=_blobs_page_start)
+        kwargs = {
+            'client': client,
+            'api_request': client._connection.api_request,
+            'path': path,
+            'item_to_value': _item_to_blob,
+            'page_token': page_token,
+            'max_results': max_results,
+            'extra_params': extra_params,
+            'page_start': _blobs_page_start,
+        }
+        if prefetch:
+            iterator = _PrefetchingHTTPIterator(executor=executor, **kwargs)
+        else:
+            iterator = page_iterator.HTTPIterator(**kwargs)
         iterator.bucket = self
         iterator.prefixes = set()
         return iterator
@@ -803,10 +1018,14 @@ class Bucket(_PropertyMixin):
             query_params=query_params,
             _target_object=None)
 
-    def delete_blobs(self, blobs, on_error=None, client=None):
+    def delete_blobs(self, blobs, on_error=None, client=None,
+                     max_workers=None):
         """Deletes a list of blobs from the current bucket.
 
-        Uses :meth:`delete_blob` to delete each individual blob.
+        Uses :meth:`delete_blob` to delete each individual blob, or, if
+        ``max_workers`` is set, a
+        :class:`~google.cloud.storage.bulk.BulkOperations` which sends
+        ``max_workers`` batch requests of up to 100 deletions at a time.
 
         If :attr:`user_project` is set, bills the API request to that project.
 
@@ -824,9 +1043,18 @@ class Bucket(_PropertyMixin):
         :param client: (Optional) The client to use.  If not passed, falls back
                        to the ``client`` stored on the current bucket.
 
+        :type max_workers: int
+        :param max_workers: (Optional) If set, delete the blobs with
+                            concurrent batch requests. Any other error is
+                            raised after all the blobs have been processed.
+
         :raises: :class:`~google.cloud.exceptions.NotFound` (if
                  `on_error` is not passed).
         """
+        if max_workers is not None:
+            self._delete_blobs_bulk(blobs, on_error, client, max_workers)
+            return
+
         for blob in blobs:
             try:
                 blob_name = blob
@@ -839,6 +1067,37 @@ class Bucket(_PropertyMixin):
                 else:
                     raise
 
+    def _delete_blobs_bulk(self, blobs, on_error, client, max_workers):
+        """Delete blobs with concurrent batch requests.
+
+        See :meth:`delete_blobs`.
+        """
+        client = self._require_client(client)
+        originals = {}
+
+        def to_blobs():
+            for blob in blobs:
+                original = blob
+                if isinstance(blob, six.string_types):
+                    blob = Blob(blob, bucket=self)
+                else:
+                    blob = Blob(blob.name, bucket=self)
+                originals[id(blob)] = original
+                yield blob
+
+        bulk = BulkOperations(client, max_workers=max_workers)
+        error = None
+        for result in bulk.delete(to_blobs()):
+            original = originals.pop(id(result.blob))
+            if result.error is None:
+                continue
+            if isinstance(result.error, NotFound) and on_error is not None:
+                on_error(original)
+            else:
+                error = error or result.error
+        if error is not None:
+            raise error
+
     def copy_blob(self, blob, destination_bucket, new_name=None,
                   client=None, preserve_acl=True, source_generation=None):
         """Copy the given blob to the given bucket, optionally with a new name.
@@ -0,0 +1,406 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Bulk operations on many blobs, sent as concurrent batch requests.
+
+See https://cloud.google.com/storage/docs/json_api/v1/how-tos/batch
+"""
+import collections
+from concurrent import futures
+import itertools
+import json
+import time
+
+from six.moves import http_client
+
+from google.cloud import exceptions
+from google.cloud.storage.batch import Batch
+from google.cloud.storage.batch import _unpack_batch_response
+from google.cloud.storage.blob import Blob
+
+
+_MAX_BATCH_SIZE = 100
+_RETRYABLE_STATUS_CODES = (
+    429,  # Too Many Requests, which ``httplib`` does not define.
+    http_client.INTERNAL_SERVER_ERROR,
+    http_client.BAD_GATEWAY,
+    http_client.SERVICE_UNAVAILABLE,
+    http_client.GATEWAY_TIMEOUT,
+)
+# Errors of a whole batch request which are retried like the status codes
+# above: transport errors, such as a reset connection or a timeout, and an
+# incomplete batch response.
+_TRANSIENT_ERRORS = (IOError, ValueError)
+
+
+class BulkResult(collections.namedtuple(
+        'BulkResult', ['blob', 'response', 'error'])):
+    """The result of a bulk operation on one blob.
+
+    :type blob: :class:`~google.cloud.storage.blob.Blob`
+    :param blob: The blob operated on.
+
+    :type response: dict
+    :param response: The API response for the blob, or ``None`` if the
+                     operation failed. Empty for deletions.
+
+    :type error: :class:`Exception`
+    :param error: The error raised for the blob, or ``None`` if the
+                  operation succeeded. Usually a
+                  :class:`~google.cloud.exceptions.GoogleCloudError`, or a
+                  transport error if the batch request kept failing.
+    """
+
+    __slots__ = ()
+
+
+class _SubRequest(object):
+    """A request for one blob, within a batch.
+
+    :type blob: :class:`~google.cloud.storage.blob.Blob`
+    :param blob: The blob operated on.
+
+    :type method: str
+    :param method: The HTTP method.
+
+    :type path: str
+    :param path: The API path.
+
+    :type query_params: dict
+    :param query_params: The query parameters.
+
+    :type data: dict
+    :param data: The body of the request, or ``None``.
+    """
+
+    def __init__(self, blob, method, path, query_params, data):
+        self.blob = blob
+        self.method = method
+        self.path = path
+        self.query_params = query_params
+        self.data = data
+        self.attempts = 0
+
+
+class BulkOperations(object):
+    """Apply an operation to many blobs, using concurrent batch requests.
+
+    The blobs are read lazily, in groups of ``batch_size``, so they can come
+    straight from :meth:`~google.cloud.storage.bucket.Bucket.list_blobs`.
+    Each group is sent as one batch request, with up to ``max_workers``
+    batch requests in flight. Sub-requests which fail with a retryable
+    status are sent again, in a smaller batch, after an exponential
+    backoff; the rest of the batch is not.
+
+    Each operation returns an iterator of :class:`BulkResult`, one per blob,
+    in the order the batches complete.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: The client to use.
+
+    :type batch_size: int
+    :param batch_size: (Optional) The number of sub-requests in each batch
+                       request, at most 100.
+
+    :type max_workers: int
+    :param max_workers: (Optional) The number of batch requests to send
+                        concurrently.
+
+    :type max_attempts: int
+    :param max_attempts: (Optional) The number of times to send a
+                         sub-request which fails with a retryable status.
+
+    :type initial_delay: float
+    :param initial_delay: (Optional) The seconds to wait before the first
+                          retry. Doubles for each retry after that.
+
+    :type max_delay: float
+    :param max_delay: (Optional) The maximum seconds to wait between
+                      retries.
+
+    :raises: :class:`ValueError` if ``batch_size`` is more than 100.
+    """
+
+    def __init__(self, client, batch_size=_MAX_BATCH_SIZE, max_workers=4,
+                 max_attempts=5, initial_delay=1.0, max_delay=32.0):
+        if batch_size > _MAX_BATCH_SIZE:
+            raise ValueError(
+                'A batch request may contain at most %d requests.' % (
+                    _MAX_BATCH_SIZE,))
+        self._client = client
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.max_attempts = max_attempts
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+
+    def delete(self, blobs):
+        """Delete blobs.
+
+        :type blobs: iterable of :class:`~google.cloud.storage.blob.Blob`
+        :param blobs: The blobs to delete.
+
+        :rtype: iterator of :class:`BulkResult`
+        :returns: The result for each blob.
+        """
+        def make_request(blob):
+            return 'DELETE', blob.path, _user_project_params(blob), None
+
+        return self.run(blobs, make_request)
+
+    def copy(self, blobs, destination_bucket, new_name=None):
+        """Copy blobs to a bucket.
+
+        :type blobs: iterable of :class:`~google.cloud.storage.blob.Blob`
+        :param blobs: The blobs to copy.
+
+        :type destination_bucket: :class:`~google.cloud.storage.bucket.Bucket`
+        :param destination_bucket: The bucket to copy the blobs to.
+
+        :type new_name: callable
+        :param new_name: (Optional) Takes a blob and returns the name of its
+                         copy. If not passed, copies keep their names.
+
+        :rtype: iterator of :class:`BulkResult`
+        :returns: The result for each blob. The response is the resource of
+                  the copy.
+        """
+        def make_request(blob):
+            name = blob.name if new_name is None else new_name(blob)
+            destination = Blob(name, bucket=destination_bucket)
+            return ('POST', blob.path + '/copyTo' + destination.path,
+                    _user_project_params(blob), None)
+
+        return self.run(blobs, make_request)
+
+    def rewrite(self, blobs, destination_bucket=None, new_name=None,
+                storage_class=None):
+        """Rewrite blobs to a bucket.
+
+        Unlike :meth:`copy`, a rewrite can change the storage class of the
+        objects, or copy them across locations. Rewrites which the API does
+        not complete in one request are continued with their rewrite token.
+
+        :type blobs: iterable of :class:`~google.cloud.storage.blob.Blob`
+        :param blobs: The blobs to rewrite.
+
+        :type destination_bucket: :class:`~google.cloud.storage.bucket.Bucket`
+        :param destination_bucket: (Optional) The bucket to rewrite the blobs
+                                   to. If not passed, each blob is rewritten
+                                   in its own bucket.
+
+        :type new_name: callable
+        :param new_name: (Optional) Takes a blob and returns the name of its
+                         rewritten copy. If not passed, the rewritten blobs
+                         keep their names.
+
+        :type storage_class: str
+        :param storage_class: (Optional) The storage class of the rewritten
+                              blobs, as for
+                              :meth:`Blob.update_storage_class`.
+
+        :rtype: iterator of :class:`BulkResult`
+        :returns: The result for each blob. The response is the last
+                  response to the rewrite request.
+        """
+        if (storage_class is not None and
+                storage_class not in Blob._STORAGE_CLASSES):
+            raise ValueError("Invalid storage class: %s" % (storage_class,))
+
+        def make_request(blob):
+            name = blob.name if new_name is None else new_name(blob)
+            bucket = blob.bucket
+            if destination_bucket is not None:
+                bucket = destination_bucket
+            destination = Blob(name, bucket=bucket)
+            data = {}
+            if storage_class is not None:
+                data['storageClass'] = storage_class
+            return ('POST', blob.path + '/rewriteTo' + destination.path,
+                    _user_project_params(destination), data)
+
+        return self.run(blobs, make_request)
+
+    def update_storage_class(self, blobs, new_class):
+        """Change the storage class of blobs, by rewriting them in place.
+
+        :type blobs: iterable of :class:`~google.cloud.storage.blob.Blob`
+        :param blobs: The blobs to update.
+
+        :type new_class: str
+        :param new_class: The new storage class of the blobs.
+
+        :rtype: iterator of :class:`BulkResult`
+        :returns: The result for each blob.
+        """
+        return self.rewrite(blobs, storage_class=new_class)
+
+    def run(self, blobs, make_request):
+        """Apply an operation to blobs.
+
+        :type blobs: iterable of :class:`~google.cloud.storage.blob.Blob`
+        :param blobs: The blobs to operate on.
+
+        :type make_request: callable
+        :param make_request: Takes a blob and returns the ``(method, path,
+                             query_params, data)`` of its request.
+
+        :rtype: iterator of :class:`BulkResult`
+        :returns: The result for each blob, in the order the batches
+                  complete.
+        """
+        blobs = iter(blobs)
+        with futures.ThreadPoolExecutor(self.max_workers) as executor:
+            in_flight = set()
+            exhausted = False
+            while in_flight or not exhausted:
+                # Read ahead enough blobs to keep every worker busy, but no
+                # more, so that blobs can be listed as they are processed.
+                while not exhausted and len(in_flight) < 2 * self.max_workers:
+                    requests = [
+                        _SubRequest(blob, *make_request(blob))
+                        for blob in itertools.islice(blobs, self.batch_size)]
+                    if not requests:
+                        exhausted = True
+                        break
+                    in_flight.add(executor.submit(self._run_batch, requests))
+
+                if not in_flight:
+                    break
+                done, in_flight = futures.wait(
+                    in_flight, return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    for result in future.result():
+                        yield result
+
+    def _run_batch(self, requests):
+        """Send sub-requests as a batch, retrying the ones which fail.
+
+        :type requests: list of :class:`_SubRequest`
+        :param requests: The sub-requests to send.
+
+        :rtype: list of :class:`BulkResult`
+        :returns: The result for each sub-request.
+        """
+        results = []
+        retries = 0
+        pending = requests
+        while pending:
+            if retries:
+                time.sleep(min(
+                    self.initial_delay * 2 ** (retries - 1), self.max_delay))
+
+            try:
+                responses = self._send(pending)
+            except (exceptions.GoogleCloudError,) + _TRANSIENT_ERRORS as exc:
+                responses = [exc] * len(pending)
+
+            retry = []
+            continued = []
+            for request, response in zip(pending, responses):
+                if isinstance(response, exceptions.GoogleCloudError):
+                    status_code, error = response.code or 0, response
+                elif isinstance(response, Exception):
+                    # Retry transport errors like an unavailable service.
+                    status_code = http_client.SERVICE_UNAVAILABLE
+                    error = response
+                else:
+                    status_code, error = response.status_code, None
+
+                if 200 <= status_code < 300:
+                    payload = _json_payload(response)
+                    if payload.get('done') is False:
+                        # An incomplete rewrite: continue where it stopped.
+                        request.query_params['rewriteToken'] = (
+                            payload['rewriteToken'])
+                        continued.append(request)
+                    else:
+                        results.append(
+                            BulkResult(request.blob, payload, None))
+                    continue
+
+                request.attempts += 1
+                if (status_code in _RETRYABLE_STATUS_CODES and
+                        request.attempts < self.max_attempts):
+                    retry.append(request)
+                    continue
+
+                if error is None:
+                    error = exceptions.from_http_response(response)
+                results.append(BulkResult(request.blob, None, error))
+
+            if retry:
+                retries += 1
+            pending = retry + continued
+        return results
+
+    def _send(self, requests):
+        """Send one batch request.
+
+        :type requests: list of :class:`_SubRequest`
+        :param requests: The sub-requests to send.
+
+        :rtype: list of :class:`requests.Response`
+        :returns: The response to each sub-request.
+        :raises: :class:`~google.cloud.exceptions.GoogleCloudError` if the
+                 batch request itself fails, a transport error if it could
+                 not be sent, or :class:`ValueError` if the batch response
+                 is incomplete.
+        """
+        batch = Batch(self._client)
+        for request in requests:
+            batch.api_request(
+                method=request.method, path=request.path,
+                query_params=request.query_params, data=request.data)
+        headers, body = batch._prepare_batch_request()
+
+        url = '%s/batch/storage/v1' % (batch.API_BASE_URL,)
+        response = self._client._base_connection._make_request(
+            'POST', url, data=body, headers=headers)
+        if not 200 <= response.status_code < 300:
+            raise exceptions.from_http_response(response)
+
+        responses = list(_unpack_batch_response(response))
+        if len(responses) != len(requests):
+            raise ValueError('Expected a response for every request.')
+        return responses
+
+
+def _user_project_params(blob):
+    """Get the query parameters to bill a request to the user project.
+
+    :type blob: :class:`~google.cloud.storage.blob.Blob`
+    :param blob: The blob whose bucket sets the user project.
+
+    :rtype: dict
+    :returns: The query parameters.
+    """
+    query_params = {}
+    if blob.user_project is not None:
+        query_params['userProject'] = blob.user_project
+    return query_params
+
+
+def _json_payload(response):
+    """Decode the JSON body of a sub-response.
+
+    :type response: :class:`requests.Response`
+    :param response: The sub-response.
+
+    :rtype: dict
+    :returns: The decoded body, or an empty dict if there is none.
+    """
+    content = response.content.decode('utf-8').strip()
+    if not content:
+        return {}
+    return json.loads(content)
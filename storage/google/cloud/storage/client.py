@@ -24,6 +24,7 @@ from google.cloud.exceptions import NotFound
 from google.cloud.storage._http import Connection
 from google.cloud.storage.batch import Batch
 from google.cloud.storage.bucket import Bucket
+from google.cloud.storage.bulk import BulkOperations
 
 
 _marker = object()
@@ -200,6 +201,22 @@ class Client(ClientWithProject):
         """
         return Batch(client=self)
 
+    def bulk(self, **kwargs):
+        """Factory constructor for bulk operations.
+
+        .. note::
+          This will not make an HTTP request; it simply instantiates
+          a bulk operations object owned by this client.
+
+        :type kwargs: dict
+        :param kwargs: Keyword arguments passed to
+                       :class:`~google.cloud.storage.bulk.BulkOperations`.
+
+        :rtype: :class:`google.cloud.storage.bulk.BulkOperations`
+        :returns: The bulk operations object created.
+        """
+        return BulkOperations(self, **kwargs)
+
     def get_bucket(self, bucket_name):
         """Get a bucket by name.
 
@@ -0,0 +1,301 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""File-like objects to stream the contents of blobs.
+
+Use :meth:`~google.cloud.storage.blob.Blob.open` to create them.
+"""
+import io
+
+from google import resumable_media
+
+from google.cloud import exceptions
+
+
+_DEFAULT_READ_SIZE = 8388608  # 1024 * 1024 B * 8 = 8 MB
+_DEFAULT_WRITE_CHUNK_SIZE = 41943040  # 1024 * 1024 B * 40 = 40 MB
+
+
+class BlobReader(io.RawIOBase):
+    """A seekable, read-only stream of the contents of a blob.
+
+    Each read which misses the buffer downloads the next ``chunk_size``
+    bytes (or more, for a larger read) with one range request, so that
+    small reads are served from memory.
+
+    :type blob: :class:`~google.cloud.storage.blob.Blob`
+    :param blob: The blob to read. Reloaded if its size is not known.
+
+    :type chunk_size: int
+    :param chunk_size: (Optional) The minimum number of bytes to download
+                       with each request.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: (Optional) The client to use.  If not passed, falls back
+                   to the ``client`` stored on the blob's bucket.
+    """
+
+    def __init__(self, blob, chunk_size=None, client=None):
+        super(BlobReader, self).__init__()
+        if blob.size is None:
+            blob.reload(client=client)
+        self._blob = blob
+        self._client = client
+        self._chunk_size = chunk_size or _DEFAULT_READ_SIZE
+        self._position = 0
+        self._buffer = b''
+        self._buffer_start = 0
+
+    def readable(self):
+        """:rtype: bool
+        :returns: ``True``: the stream can be read.
+        """
+        return True
+
+    def seekable(self):
+        """:rtype: bool
+        :returns: ``True``: the stream supports random access.
+        """
+        return True
+
+    def readinto(self, buffer_):
+        """Read bytes into a pre-allocated buffer.
+
+        :type buffer_: bytearray
+        :param buffer_: The buffer to fill.
+
+        :rtype: int
+        :returns: The number of bytes read, ``0`` at the end of the blob.
+        """
+        self._check_not_closed()
+        size = min(len(buffer_), self._blob.size - self._position)
+        if size <= 0:
+            return 0
+
+        offset = self._position - self._buffer_start
+        if not 0 <= offset < len(self._buffer):
+            end = min(self._position + max(size, self._chunk_size),
+                      self._blob.size)
+            self._buffer = self._blob.download_as_string(
+                client=self._client, start=self._position, end=end - 1)
+            self._buffer_start = self._position
+            offset = 0
+
+        data = self._buffer[offset:offset + size]
+        buffer_[:len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        """Change the position in the blob.
+
+        The buffer is kept, so seeking within it does not download again.
+
+        :type offset: int
+        :param offset: The offset, relative to ``whence``.
+
+        :type whence: int
+        :param whence: (Optional) One of ``io.SEEK_SET``, ``io.SEEK_CUR``
+                       or ``io.SEEK_END``.
+
+        :rtype: int
+        :returns: The new position.
+        :raises: :class:`ValueError` if the new position is negative.
+        """
+        self._check_not_closed()
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self._blob.size
+        elif whence != io.SEEK_SET:
+            raise ValueError('Invalid whence: %r' % (whence,))
+        if offset < 0:
+            raise ValueError('Negative seek position %d' % (offset,))
+        self._position = offset
+        return self._position
+
+    def tell(self):
+        """:rtype: int
+        :returns: The position in the blob.
+        """
+        self._check_not_closed()
+        return self._position
+
+    def close(self):
+        """Close the stream, releasing the buffer."""
+        self._buffer = b''
+        super(BlobReader, self).close()
+
+    def _check_not_closed(self):
+        if self.closed:
+            raise ValueError('I/O operation on closed file.')
+
+
+class _SlidingBuffer(object):
+    """A buffer which discards bytes once they have been read.
+
+    Positions count every byte ever written, as a resumable upload expects
+    of its stream.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._start = 0
+        self._cursor = 0
+
+    def __len__(self):
+        return len(self._buffer) - self._cursor
+
+    def write(self, data):
+        self._buffer.extend(data)
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = len(self)
+        data = bytes(self._buffer[self._cursor:self._cursor + size])
+        self._cursor += len(data)
+        return data
+
+    def tell(self):
+        return self._start + self._cursor
+
+    def flush(self):
+        """Discard the bytes which have been read."""
+        del self._buffer[:self._cursor]
+        self._start += self._cursor
+        self._cursor = 0
+
+
+class BlobWriter(io.BufferedIOBase):
+    """A write-only stream which uploads the contents of a blob.
+
+    Written bytes are buffered, and sent through a resumable upload in
+    chunks of ``chunk_size`` bytes as soon as each chunk is full, so memory
+    use does not grow with the size of the blob. The upload is completed
+    when the stream is closed. A blob smaller than one chunk is uploaded
+    with a single request on close.
+
+    :type blob: :class:`~google.cloud.storage.blob.Blob`
+    :param blob: The blob to write. Its properties are updated when the
+                 upload completes.
+
+    :type chunk_size: int
+    :param chunk_size: (Optional) The number of bytes to send with each
+                       request. Must be a multiple of 256 KB.
+
+    :type content_type: str
+    :param content_type: (Optional) The type of the content being uploaded.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: (Optional) The client to use.  If not passed, falls back
+                   to the ``client`` stored on the blob's bucket.
+
+    :type predefined_acl: str
+    :param predefined_acl: (Optional) predefined access control list
+
+    :raises: :class:`ValueError` if ``chunk_size`` is not a multiple of
+             256 KB.
+    """
+
+    def __init__(self, blob, chunk_size=None, content_type=None, client=None,
+                 predefined_acl=None):
+        super(BlobWriter, self).__init__()
+        if chunk_size is None:
+            chunk_size = blob.chunk_size or _DEFAULT_WRITE_CHUNK_SIZE
+        if chunk_size % blob._CHUNK_SIZE_MULTIPLE != 0:
+            raise ValueError('Chunk size must be a multiple of %d.' % (
+                blob._CHUNK_SIZE_MULTIPLE,))
+        self._blob = blob
+        self._chunk_size = chunk_size
+        self._content_type = content_type
+        self._client = client
+        self._predefined_acl = predefined_acl
+        self._buffer = _SlidingBuffer()
+        self._upload = None
+        self._transport = None
+
+    def writable(self):
+        """:rtype: bool
+        :returns: ``True``: the stream can be written.
+        """
+        return True
+
+    def write(self, data):
+        """Write bytes, uploading each chunk as soon as it is full.
+
+        :type data: bytes
+        :param data: The bytes to write.
+
+        :rtype: int
+        :returns: The number of bytes written.
+        """
+        if self.closed:
+            raise ValueError('I/O operation on closed file.')
+        self._buffer.write(data)
+        while len(self._buffer) >= self._chunk_size:
+            self._transmit_next_chunk()
+        return len(data)
+
+    def tell(self):
+        """:rtype: int
+        :returns: The number of bytes written.
+        """
+        return self._buffer.tell() + len(self._buffer)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            # Leave the upload incomplete, rather than replace the blob with
+            # partial contents.
+            super(BlobWriter, self).close()
+            return
+        self.close()
+
+    def close(self):
+        """Upload the remaining bytes and complete the upload."""
+        if self.closed:
+            return
+        try:
+            if self._upload is None:
+                size = len(self._buffer)
+                self._blob.upload_from_file(
+                    self._buffer, size=size, content_type=self._content_type,
+                    client=self._client, predefined_acl=self._predefined_acl)
+            else:
+                # The final chunk is the first one shorter than
+                # ``chunk_size``, which may be empty.
+                while not self._upload.finished:
+                    self._transmit_next_chunk()
+        finally:
+            super(BlobWriter, self).close()
+
+    def _transmit_next_chunk(self):
+        """Send the next chunk of the buffer, starting the upload if needed.
+        """
+        try:
+            if self._upload is None:
+                self._upload, self._transport = (
+                    self._blob._initiate_resumable_upload(
+                        self._client, self._buffer, self._content_type,
+                        None, None, predefined_acl=self._predefined_acl,
+                        chunk_size=self._chunk_size))
+            response = self._upload.transmit_next_chunk(self._transport)
+        except resumable_media.InvalidResponse as exc:
+            response = exc.response
+            raise exceptions.from_http_status(
+                response.status_code, u'{method} {url}: {error}'.format(
+                    method=response.request.method,
+                    url=response.request.url, error=str(exc)),
+                response=response)
+        self._buffer.flush()
+        if self._upload.finished:
+            self._blob._set_properties(response.json())
@@ -0,0 +1,352 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Generate signed URLs for many blobs at once.
+
+:meth:`~google.cloud.storage.blob.Blob.generate_signed_url` builds the whole
+string to sign for each URL. A :class:`SignedURLFactory` builds everything
+except the blob name once per call, and signs with the parsed private key
+directly:
+
+.. code-block:: python
+
+    from google.cloud.storage import SignedURLFactory
+
+    factory = SignedURLFactory.from_service_account_file(
+        'key.json', 'my-bucket', version='v4', processes=4)
+    with factory:
+        urls = factory.sign(names, datetime.timedelta(hours=1))
+
+Signing is CPU-bound: with ``processes`` set, the strings are built in this
+process and signed in a pool of worker processes, each of which parses the
+private key once. Install the ``cryptography`` library, which ``google-auth``
+signs with if available: its pure-Python fallback signs only tens of URLs
+per second.
+"""
+
+import base64
+import binascii
+import datetime
+import hashlib
+import json
+import multiprocessing
+
+import six
+from six.moves.urllib.parse import quote
+from six.moves.urllib.parse import quote_plus
+from six.moves.urllib.parse import urlencode
+from six.moves.urllib.parse import urlsplit
+
+from google.auth import crypt
+
+from google.cloud.storage import _signing
+
+
+_API_ACCESS_ENDPOINT = 'https://storage.googleapis.com'
+_V4_ALGORITHM = 'GOOG4-RSA-SHA256'
+_V4_MAX_EXPIRATION = 604800  # 7 days, in seconds.
+_V4_SCOPE_TEMPLATE = '{}/auto/storage/goog4_request'
+_VERSIONS = ('v2', 'v4')
+
+# The signer of a worker process, parsed once by ``_init_worker``.
+_worker_signer = None
+
+
+def _init_worker(service_account_info):
+    """Parse the private key in a worker process."""
+    global _worker_signer
+    _worker_signer = crypt.RSASigner.from_service_account_info(
+        service_account_info)
+
+
+def _sign_in_worker(string_to_sign):
+    """Sign a string in a worker process."""
+    return _worker_signer.sign(string_to_sign)
+
+
+def _quote_v4(value):
+    """Percent-encode a query parameter for the V4 canonical request."""
+    return quote(value, safe='~')
+
+
+class SignedURLFactory(object):
+    """Generate signed URLs for blobs of one bucket.
+
+    :type bucket_name: str
+    :param bucket_name: The name of the bucket.
+
+    :type signer: :class:`google.auth.crypt.Signer`
+    :param signer: The signer of the service account.
+
+    :type signer_email: str
+    :param signer_email: The email of the service account.
+
+    :type method: str
+    :param method: (Optional) The HTTP verb of the requests. If
+                   ``'RESUMABLE'``, the URLs start resumable uploads with a
+                   ``POST`` request with the ``x-goog-resumable: start``
+                   header.
+
+    :type version: str
+    :param version: (Optional) ``'v2'`` or ``'v4'``, the version of the
+                    signing process.
+
+    :type content_type: str
+    :param content_type: (Optional) The content type the requests must
+                         send.
+
+    :type response_type: str
+    :param response_type: (Optional) Content type of responses to requests
+                          for the URLs.
+
+    :type response_disposition: str
+    :param response_disposition: (Optional) Content disposition of responses
+                                 to requests for the URLs.
+
+    :type processes: int
+    :param processes: (Optional) The number of worker processes to sign
+                      with. Requires ``service_account_info``.
+
+    :type service_account_info: dict
+    :param service_account_info: (Optional) The service account key, in the
+                                 format of its JSON file, for the worker
+                                 processes to parse.
+
+    :type api_access_endpoint: str
+    :param api_access_endpoint: (Optional) The URL base.
+
+    :raises: :class:`ValueError` if ``version`` is invalid, or
+             ``processes`` is set without ``service_account_info``.
+    """
+
+    def __init__(self, bucket_name, signer, signer_email, method='GET',
+                 version='v2', content_type=None, response_type=None,
+                 response_disposition=None, processes=None,
+                 service_account_info=None,
+                 api_access_endpoint=_API_ACCESS_ENDPOINT):
+        if version not in _VERSIONS:
+            raise ValueError('Invalid version: %r' % (version,))
+        if processes is not None and service_account_info is None:
+            raise ValueError(
+                'Signing in worker processes requires the service '
+                'account info.')
+        self._bucket_path = '/' + bucket_name + '/'
+        self._signer = signer
+        self._signer_email = signer_email
+        self._version = version
+        self._content_type = content_type or ''
+        self._processes = processes
+        self._service_account_info = service_account_info
+        self._pool = None
+        self._endpoint = api_access_endpoint
+
+        self._resumable = method == 'RESUMABLE'
+        self._method = 'POST' if self._resumable else method
+
+        self._response_params = []
+        if response_type is not None:
+            self._response_params.append(
+                ('response-content-type', response_type))
+        if response_disposition is not None:
+            self._response_params.append(
+                ('response-content-disposition', response_disposition))
+
+        headers = {'host': urlsplit(api_access_endpoint).netloc}
+        if content_type is not None:
+            headers['content-type'] = content_type
+        if self._resumable:
+            headers['x-goog-resumable'] = 'start'
+        self._v4_canonical_headers = ''.join(
+            '{}:{}\n'.format(name, headers[name]) for name in sorted(headers))
+        self._v4_signed_headers = ';'.join(sorted(headers))
+
+    @classmethod
+    def from_credentials(cls, credentials, bucket_name, **kwargs):
+        """Create a factory which signs with credentials' signer.
+
+        :type credentials: :class:`google.auth.credentials.Signing`
+        :param credentials: Credentials with a private key, such as a
+                            client's ``_credentials``.
+
+        :type bucket_name: str
+        :param bucket_name: The name of the bucket.
+
+        :type kwargs: dict
+        :param kwargs: Keyword arguments for :class:`SignedURLFactory`.
+
+        :rtype: :class:`SignedURLFactory`
+        :returns: The factory.
+        :raises: :class:`AttributeError` if the credentials can't sign.
+        """
+        _signing.ensure_signed_credentials(credentials)
+        return cls(bucket_name, credentials.signer, credentials.signer_email,
+                   **kwargs)
+
+    @classmethod
+    def from_service_account_info(cls, info, bucket_name, **kwargs):
+        """Create a factory from a service account key.
+
+        :type info: dict
+        :param info: The service account key, in the format of its JSON
+                     file.
+
+        :type bucket_name: str
+        :param bucket_name: The name of the bucket.
+
+        :type kwargs: dict
+        :param kwargs: Keyword arguments for :class:`SignedURLFactory`.
+
+        :rtype: :class:`SignedURLFactory`
+        :returns: The factory.
+        """
+        signer = crypt.RSASigner.from_service_account_info(info)
+        return cls(bucket_name, signer, info['client_email'],
+                   service_account_info=info, **kwargs)
+
+    @classmethod
+    def from_service_account_file(cls, filename, bucket_name, **kwargs):
+        """Create a factory from a service account key file.
+
+        :type filename: str
+        :param filename: The path to the JSON key file.
+
+        :type bucket_name: str
+        :param bucket_name: The name of the bucket.
+
+        :type kwargs: dict
+        :param kwargs: Keyword arguments for :class:`SignedURLFactory`.
+
+        :rtype: :class:`SignedURLFactory`
+        :returns: The factory.
+        """
+        with open(filename) as file_obj:
+            info = json.load(file_obj)
+        return cls.from_service_account_info(info, bucket_name, **kwargs)
+
+    def sign(self, blob_names, expiration):
+        """Generate a signed URL for each blob.
+
+        :type blob_names: iterable of str or
+                          :class:`~google.cloud.storage.blob.Blob`
+        :param blob_names: The blobs, or their names.
+
+        :type expiration: int, long, datetime.datetime, datetime.timedelta
+        :param expiration: When the URLs should expire. As for
+                           :meth:`~google.cloud.storage.blob.Blob.\
+generate_signed_url`, an integer is a timestamp. V4 URLs may expire at
+                           most 7 days from now.
+
+        :rtype: list of str
+        :returns: The signed URLs, in the order of ``blob_names``.
+        :raises: :class:`ValueError` if a V4 expiration is out of range.
+        """
+        names = [
+            name if isinstance(name, six.string_types) else name.name
+            for name in blob_names]
+        if self._version == 'v2':
+            return self._sign_v2(names, expiration)
+        return self._sign_v4(names, expiration)
+
+    def _sign_v2(self, names, expiration):
+        expiration = _signing.get_expiration_seconds(expiration)
+        resources = [
+            self._bucket_path + quote(name.encode('utf-8'))
+            for name in names]
+
+        prefix = '\n'.join([
+            self._method, '', self._content_type, str(expiration), ''])
+        if self._resumable:
+            prefix += 'x-goog-resumable:start\n'
+        signatures = self._sign_all([prefix + resource for resource in
+                                     resources])
+
+        query_prefix = '?' + urlencode([
+            ('GoogleAccessId', self._signer_email),
+            ('Expires', str(expiration))]) + '&Signature='
+        query_suffix = ''
+        if self._response_params:
+            query_suffix = '&' + urlencode(self._response_params)
+        return [
+            self._endpoint + resource + query_prefix +
+            quote_plus(base64.b64encode(signature)) + query_suffix
+            for resource, signature in zip(resources, signatures)]
+
+    def _sign_v4(self, names, expiration):
+        now = _signing.NOW()
+        if isinstance(expiration, datetime.timedelta):
+            expiration = now + expiration
+        expiration = _signing.get_expiration_seconds(expiration)
+        expires_in = expiration - _signing.get_expiration_seconds(now)
+        if not 0 < expires_in <= _V4_MAX_EXPIRATION:
+            raise ValueError(
+                'V4 signed URLs must expire within %d seconds.' % (
+                    _V4_MAX_EXPIRATION,))
+
+        request_timestamp = now.strftime('%Y%m%dT%H%M%SZ')
+        scope = _V4_SCOPE_TEMPLATE.format(request_timestamp[:8])
+        params = [
+            ('X-Goog-Algorithm', _V4_ALGORITHM),
+            ('X-Goog-Credential', self._signer_email + '/' + scope),
+            ('X-Goog-Date', request_timestamp),
+            ('X-Goog-Expires', str(expires_in)),
+            ('X-Goog-SignedHeaders', self._v4_signed_headers),
+        ] + self._response_params
+        query = '&'.join(
+            _quote_v4(name) + '=' + _quote_v4(value)
+            for name, value in sorted(params))
+
+        paths = [
+            self._bucket_path + quote(name.encode('utf-8'), safe='/~')
+            for name in names]
+        request_prefix = self._method + '\n'
+        request_suffix = '\n'.join([
+            '', query, self._v4_canonical_headers, self._v4_signed_headers,
+            'UNSIGNED-PAYLOAD'])
+        string_prefix = '\n'.join([
+            _V4_ALGORITHM, request_timestamp, scope, ''])
+        signatures = self._sign_all([
+            string_prefix + hashlib.sha256(
+                (request_prefix + path + request_suffix).encode('utf-8')
+            ).hexdigest()
+            for path in paths])
+
+        return [
+            self._endpoint + path + '?' + query + '&X-Goog-Signature=' +
+            binascii.hexlify(signature).decode('ascii')
+            for path, signature in zip(paths, signatures)]
+
+    def _sign_all(self, strings_to_sign):
+        """Sign strings, in the worker processes if there are several."""
+        if self._processes is None or len(strings_to_sign) < 2:
+            return [self._signer.sign(string) for string in strings_to_sign]
+
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(
+                self._processes, initializer=_init_worker,
+                initargs=(self._service_account_info,))
+        chunksize = max(1, len(strings_to_sign) // (self._processes * 4))
+        return self._pool.map(
+            _sign_in_worker, strings_to_sign, chunksize=chunksize)
+
+    def close(self):
+        """Stop the worker processes, if any."""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,446 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Synchronize a local directory with a prefix of a bucket.
+
+For example, to upload the files in ``data`` which have changed since the
+last run, and delete the objects whose files are gone:
+
+.. code-block:: python
+
+    from google.cloud.storage import transfer
+
+    result = transfer.sync(
+        'data', bucket, prefix='backups/data', delete=True,
+        manifest_path='data.manifest')
+    print(result.bytes_per_second)
+"""
+import calendar
+from concurrent import futures
+import json
+import os
+import tempfile
+import time
+
+from google.cloud.exceptions import NotFound
+from google.cloud.storage._helpers import _base64_md5hash
+from google.cloud.storage.bulk import BulkOperations
+
+
+UPLOAD = 'upload'
+"""Make the bucket prefix match the local directory."""
+
+DOWNLOAD = 'download'
+"""Make the local directory match the bucket prefix."""
+
+_MANIFEST_VERSION = 1
+_LIST_FIELDS = 'items(name,size,updated,md5Hash)'
+
+
+class SyncResult(object):
+    """The plan and outcome of a :func:`sync` run.
+
+    :type direction: str
+    :param direction: :data:`UPLOAD` or :data:`DOWNLOAD`.
+    """
+
+    def __init__(self, direction):
+        self.direction = direction
+        self.transfers = []
+        """list of str: The relative paths of the files to copy."""
+        self.deletions = []
+        """list of str: The relative paths of the files to delete."""
+        self.skipped = 0
+        """int: The number of files found to be unchanged."""
+        self.hashed = 0
+        """int: The number of local files whose MD5 hash was computed."""
+        self.errors = []
+        """list of tuple: ``(path, exception)`` for each failed file."""
+        self.bytes_transferred = 0
+        """int: The number of bytes copied."""
+        self.elapsed = 0.0
+        """float: The seconds taken to copy and delete files."""
+
+    @property
+    def bytes_per_second(self):
+        """float: The throughput of the copies."""
+        if not self.elapsed:
+            return 0.0
+        return self.bytes_transferred / self.elapsed
+
+    @property
+    def files_per_second(self):
+        """float: The number of files copied or deleted per second."""
+        if not self.elapsed:
+            return 0.0
+        done = len(self.transfers) + len(self.deletions) - len(self.errors)
+        return done / self.elapsed
+
+    def __repr__(self):
+        return (
+            '<SyncResult: {} {} files, deleted {}, skipped {}, {} errors, '
+            '{:.1f} MB/s>').format(
+                self.direction, len(self.transfers), len(self.deletions),
+                self.skipped, len(self.errors),
+                self.bytes_per_second / 1024 / 1024)
+
+
+def sync(local_dir, bucket, prefix='', direction=UPLOAD, delete=False,
+         checksum=True, manifest_path=None, max_workers=8,
+         hash_processes=None, dry_run=False, client=None):
+    """Make a bucket prefix and a local directory contain the same files.
+
+    Files are compared by size first. Files of the same size are compared
+    by MD5 hash if ``checksum`` is ``True`` and the object has one (composite
+    objects don't), or else by modification time.
+
+    Local MD5 hashes are computed in a pool of processes. If
+    ``manifest_path`` is set, the hashes are saved there along with each
+    file's size and modification time, so later runs only hash the files
+    which changed.
+
+    Copies and deletions run with up to ``max_workers`` at a time. Errors
+    are collected in the result rather than raised, so one failed file does
+    not stop the others; it is copied again by the next run.
+
+    :type local_dir: str
+    :param local_dir: The local directory.
+
+    :type bucket: :class:`~google.cloud.storage.bucket.Bucket`
+    :param bucket: The bucket.
+
+    :type prefix: str
+    :param prefix: (Optional) The prefix in the bucket which corresponds to
+                   ``local_dir``. A ``/`` is appended if missing.
+
+    :type direction: str
+    :param direction: (Optional) :data:`UPLOAD` to copy local files to the
+                      bucket, or :data:`DOWNLOAD` to copy objects to the
+                      local directory.
+
+    :type delete: bool
+    :param delete: (Optional) If ``True``, delete the files in the
+                   destination which are not in the source.
+
+    :type checksum: bool
+    :param checksum: (Optional) If ``False``, compare files of the same size
+                     by modification time only, without hashing.
+
+    :type manifest_path: str
+    :param manifest_path: (Optional) A file to cache local hashes in.
+
+    :type max_workers: int
+    :param max_workers: (Optional) The number of files to copy concurrently.
+
+    :type hash_processes: int
+    :param hash_processes: (Optional) The number of processes to compute
+                           hashes with. Defaults to the number of CPUs. If
+                           ``1``, hashes are computed in this process.
+
+    :type dry_run: bool
+    :param dry_run: (Optional) If ``True``, only plan the changes.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: (Optional) The client to use.  If not passed, falls back
+                   to the ``client`` stored on the bucket.
+
+    :rtype: :class:`SyncResult`
+    :returns: The changes planned, and their outcome.
+    :raises: :class:`ValueError` if ``direction`` is invalid.
+    """
+    if direction not in (UPLOAD, DOWNLOAD):
+        raise ValueError('Invalid direction: %r' % (direction,))
+    if prefix and not prefix.endswith('/'):
+        prefix += '/'
+
+    local_files = _scan_local(local_dir)
+    remote_blobs = _scan_remote(bucket, prefix, client)
+    manifest = _load_manifest(manifest_path)
+
+    result = SyncResult(direction)
+    hashes = _plan(result, local_dir, local_files, remote_blobs, manifest,
+                   delete, checksum, hash_processes)
+    if dry_run:
+        return result
+
+    start = time.time()
+    if direction == UPLOAD:
+        _upload(result, local_dir, bucket, prefix, local_files, hashes,
+                max_workers, client)
+        _delete_remote(result, bucket, remote_blobs, max_workers, client)
+    else:
+        _download(result, local_dir, local_files, remote_blobs, hashes,
+                  max_workers, client)
+        _delete_local(result, local_dir, local_files)
+    result.elapsed = time.time() - start
+
+    if manifest_path is not None:
+        _save_manifest(manifest_path, local_files, manifest, hashes)
+    return result
+
+
+def _plan(result, local_dir, local_files, remote_blobs, manifest, delete,
+          checksum, hash_processes):
+    """Fill in the files to copy and delete.
+
+    :rtype: dict
+    :returns: The known MD5 hash of each unchanged local file, keyed by
+              relative path.
+    """
+    if result.direction == UPLOAD:
+        sources, destinations = local_files, remote_blobs
+    else:
+        sources, destinations = remote_blobs, local_files
+
+    hashes = {}
+    to_hash = []
+    for path in sorted(sources):
+        if path not in destinations:
+            result.transfers.append(path)
+            continue
+        size, mtime = local_files[path]
+        blob = remote_blobs[path]
+        if size != blob.size:
+            result.transfers.append(path)
+        elif checksum and blob.md5_hash is not None:
+            cached = manifest.get(path)
+            if cached is not None and cached[:2] == [size, mtime]:
+                hashes[path] = cached[2]
+            else:
+                to_hash.append(path)
+        elif _is_changed(result.direction, mtime, _blob_mtime(blob)):
+            result.transfers.append(path)
+        else:
+            result.skipped += 1
+
+    hashes.update(_hash_files(local_dir, to_hash, hash_processes))
+    result.hashed = len(to_hash)
+    for path, md5_hash in sorted(hashes.items()):
+        if md5_hash == remote_blobs[path].md5_hash:
+            result.skipped += 1
+        else:
+            result.transfers.append(path)
+            del hashes[path]
+    result.transfers.sort()
+
+    if delete:
+        result.deletions = sorted(set(destinations) - set(sources))
+    return hashes
+
+
+def _is_changed(direction, local_mtime, remote_mtime):
+    """Compare modification times, as for files of the same size.
+
+    An upload replaces an object older than its file. A download replaces a
+    file whose time differs from the object's, as downloaded files are given
+    the time of their object.
+    """
+    if direction == UPLOAD:
+        return local_mtime > remote_mtime
+    return local_mtime != remote_mtime
+
+
+def _blob_mtime(blob):
+    """Get the time a blob was last updated, in seconds since the epoch."""
+    return calendar.timegm(blob.updated.utctimetuple())
+
+
+def _local_path(local_dir, path):
+    return os.path.join(local_dir, *path.split('/'))
+
+
+def _stat(filename):
+    stat = os.stat(filename)
+    return [stat.st_size, stat.st_mtime]
+
+
+def _scan_local(local_dir):
+    """Get the size and modification time of each file in a directory.
+
+    :rtype: dict
+    :returns: ``[size, mtime]`` keyed by path relative to ``local_dir``,
+              with ``/`` separators.
+    """
+    files = {}
+    for dirpath, _, filenames in os.walk(local_dir):
+        relative = os.path.relpath(dirpath, local_dir)
+        for filename in filenames:
+            path = filename
+            if relative != os.curdir:
+                path = '/'.join(relative.split(os.sep) + [filename])
+            files[path] = _stat(os.path.join(dirpath, filename))
+    return files
+
+
+def _scan_remote(bucket, prefix, client):
+    """List the blobs under a prefix, keyed by name relative to it.
+
+    Placeholder objects for directories, whose names end in ``/``, are
+    ignored.
+    """
+    blobs = {}
+    iterator = bucket.list_blobs(
+        prefix=prefix or None, fields=_LIST_FIELDS, prefetch=True,
+        client=client)
+    for blob in iterator:
+        if not blob.name.endswith('/'):
+            blobs[blob.name[len(prefix):]] = blob
+    return blobs
+
+
+def _hash_file(filename):
+    """Get the base64-encoded MD5 hash of a file's contents."""
+    with open(filename, 'rb') as file_obj:
+        return _base64_md5hash(file_obj).decode('utf-8')
+
+
+def _hash_files(local_dir, paths, processes):
+    """Hash files, in a pool of processes if there are several.
+
+    :rtype: dict
+    :returns: The base64-encoded MD5 hash of each file, keyed by path.
+    """
+    filenames = [_local_path(local_dir, path) for path in paths]
+    if len(paths) < 2 or processes == 1:
+        return dict(zip(paths, map(_hash_file, filenames)))
+    with futures.ProcessPoolExecutor(processes) as executor:
+        return dict(zip(paths, executor.map(_hash_file, filenames)))
+
+
+def _load_manifest(manifest_path):
+    """Read the ``[size, mtime, md5]`` of each file from a manifest.
+
+    A missing or unreadable manifest is treated as empty.
+    """
+    if manifest_path is None:
+        return {}
+    try:
+        with open(manifest_path) as file_obj:
+            manifest = json.load(file_obj)
+    except (IOError, OSError, ValueError):
+        return {}
+    if manifest.get('version') != _MANIFEST_VERSION:
+        return {}
+    return manifest['files']
+
+
+def _save_manifest(manifest_path, local_files, manifest, hashes):
+    """Write the ``[size, mtime, md5]`` of each file with a known hash.
+
+    Entries of the previous manifest are kept while the size and
+    modification time of their file are unchanged. The manifest is replaced
+    atomically, so an interrupted run leaves the previous one.
+    """
+    files = {}
+    for path, entry in manifest.items():
+        if local_files.get(path) == entry[:2]:
+            files[path] = entry
+    for path, md5_hash in hashes.items():
+        if path in local_files:
+            files[path] = local_files[path] + [md5_hash]
+    directory = os.path.dirname(os.path.abspath(manifest_path))
+    file_obj = tempfile.NamedTemporaryFile(
+        'w', dir=directory, delete=False)
+    with file_obj:
+        json.dump({'version': _MANIFEST_VERSION, 'files': files}, file_obj)
+    os.rename(file_obj.name, manifest_path)
+
+
+def _run_transfers(result, paths, transfer, max_workers):
+    """Call ``transfer`` on each path concurrently, collecting errors.
+
+    :type transfer: callable
+    :param transfer: Takes a path and returns the number of bytes copied.
+
+    :rtype: list
+    :returns: The paths which were copied.
+    """
+    done = []
+    with futures.ThreadPoolExecutor(max_workers) as executor:
+        pending = {
+            executor.submit(transfer, path): path for path in paths}
+        for future in futures.as_completed(pending):
+            path = pending[future]
+            try:
+                result.bytes_transferred += future.result()
+            except Exception as exc:
+                result.errors.append((path, exc))
+            else:
+                done.append(path)
+    return done
+
+
+def _upload(result, local_dir, bucket, prefix, local_files, hashes,
+            max_workers, client):
+    blobs = {}
+
+    def upload(path):
+        blob = bucket.blob(prefix + path)
+        blob.upload_from_filename(
+            _local_path(local_dir, path), client=client)
+        blobs[path] = blob
+        return local_files[path][0]
+
+    for path in _run_transfers(
+            result, result.transfers, upload, max_workers):
+        if blobs[path].md5_hash is not None:
+            hashes[path] = blobs[path].md5_hash
+
+
+def _download(result, local_dir, local_files, remote_blobs, hashes,
+              max_workers, client):
+    def download(path):
+        blob = remote_blobs[path]
+        filename = _local_path(local_dir, path)
+        directory = os.path.dirname(filename)
+        if not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                # Created by another download.
+                if not os.path.isdir(directory):
+                    raise
+        blob.download_to_filename(filename, client=client)
+        mtime = _blob_mtime(blob)
+        os.utime(filename, (mtime, mtime))
+        return blob.size
+
+    for path in _run_transfers(
+            result, result.transfers, download, max_workers):
+        local_files[path] = _stat(_local_path(local_dir, path))
+        if remote_blobs[path].md5_hash is not None:
+            hashes[path] = remote_blobs[path].md5_hash
+
+
+def _delete_remote(result, bucket, remote_blobs, max_workers, client):
+    if not result.deletions:
+        return
+    bulk = BulkOperations(
+        bucket._require_client(client), max_workers=max_workers)
+    blobs = [remote_blobs[path] for path in result.deletions]
+    paths = {id(blob): path for path, blob in zip(result.deletions, blobs)}
+    for bulk_result in bulk.delete(blobs):
+        if bulk_result.error is not None and not isinstance(
+                bulk_result.error, NotFound):
+            result.errors.append((paths[id(bulk_result.blob)],
+                                  bulk_result.error))
+
+
+def _delete_local(result, local_dir, local_files):
+    for path in result.deletions:
+        try:
+            os.remove(_local_path(local_dir, path))
+        except OSError as exc:
+            result.errors.append((path, exc))
+        else:
+            del local_files[path]
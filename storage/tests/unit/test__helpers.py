@@ -14,6 +14,8 @@
 
 import unittest
 
+import mock
+
 
 class Test_PropertyMixin(unittest.TestCase):
 
@@ -289,6 +291,126 @@ class Test__base64_md5hash(unittest.TestCase):
         self.assertEqual(MD5.hash_obj._blocks, [BYTES_TO_SIGN])
 
 
+class Test_Checksums(unittest.TestCase):
+
+    @staticmethod
+    def _make_one():
+        from google.cloud.storage._helpers import _Checksums
+
+        return _Checksums()
+
+    def test_update(self):
+        checksums = self._make_one()
+        checksums.update(b'1234')
+        checksums.update(b'56789')
+
+        self.assertEqual(checksums.size, 9)
+        self.assertEqual(checksums.md5_hash, u'JfnnlDI7RTiF9RgfG2JNCw==')
+        self.assertEqual(checksums.crc32c, u'4waSgw==')
+        self.assertEqual(checksums.crc32c_value, 0xE3069283)
+
+    def test_wo_crcmod(self):
+        with mock.patch('google.cloud.storage._helpers.crcmod', new=None):
+            checksums = self._make_one()
+        checksums.update(b'123456789')
+
+        self.assertIsNone(checksums.crc32c)
+        self.assertIsNone(checksums.crc32c_value)
+        self.assertEqual(checksums.md5_hash, u'JfnnlDI7RTiF9RgfG2JNCw==')
+
+    def test_wo_crcmod_extension(self):
+        patch = mock.patch(
+            'google.cloud.storage._helpers._CRCMOD_EXTENSION', new=False)
+        with patch:
+            checksums = self._make_one()
+        checksums.update(b'123456789')
+
+        self.assertIsNone(checksums.crc32c)
+        self.assertEqual(checksums.md5_hash, u'JfnnlDI7RTiF9RgfG2JNCw==')
+
+
+class Test_HashingReader(unittest.TestCase):
+
+    @staticmethod
+    def _make_one(stream):
+        from google.cloud.storage._helpers import _Checksums
+        from google.cloud.storage._helpers import _HashingReader
+
+        return _HashingReader(stream, _Checksums())
+
+    def test_reread_hashed_once(self):
+        import io
+
+        stream = io.BytesIO(b'0123456789')
+        stream.seek(1)
+        reader = self._make_one(stream)
+
+        self.assertEqual(reader.read(4), b'1234')
+        self.assertEqual(reader.seek(3), 3)
+        self.assertEqual(reader.read(4), b'3456')
+        self.assertEqual(reader.tell(), 7)
+        self.assertEqual(reader.read(), b'789')
+
+        self.assertTrue(reader.complete)
+        self.assertEqual(reader._checksums.size, 9)
+        self.assertEqual(
+            reader._checksums.md5_hash, u'JfnnlDI7RTiF9RgfG2JNCw==')
+
+    def test_skip_ahead_incomplete(self):
+        import io
+
+        reader = self._make_one(io.BytesIO(b'0123456789'))
+        reader.seek(5)
+        reader.read()
+
+        self.assertFalse(reader.complete)
+        self.assertEqual(reader._checksums.size, 0)
+
+
+class Test_HashingWriter(unittest.TestCase):
+
+    def test_write(self):
+        import io
+        from google.cloud.storage._helpers import _Checksums
+        from google.cloud.storage._helpers import _HashingWriter
+
+        stream = io.BytesIO()
+        checksums = _Checksums()
+        writer = _HashingWriter(stream, checksums)
+
+        writer.write(b'12345')
+        writer.write(b'6789')
+
+        self.assertEqual(stream.getvalue(), b'123456789')
+        self.assertEqual(checksums.crc32c, u'4waSgw==')
+
+
+class Test__crc32c_combine(unittest.TestCase):
+
+    @staticmethod
+    def _crc32c(data):
+        from google.cloud.storage._helpers import _Checksums
+
+        checksums = _Checksums()
+        checksums.update(data)
+        return checksums.crc32c_value
+
+    def test_it(self):
+        from google.cloud.storage._helpers import _crc32c_combine
+
+        first = b'The quick brown fox '
+        second = b'jumps over the lazy dog' * 100
+        combined = _crc32c_combine(
+            self._crc32c(first), self._crc32c(second), len(second))
+
+        self.assertEqual(combined, self._crc32c(first + second))
+
+    def test_empty_second(self):
+        from google.cloud.storage._helpers import _crc32c_combine
+
+        self.assertEqual(_crc32c_combine(1234, 0, 0), 1234)
+
+
 class _Connection(object):
 
     def __init__(self, *responses):
@@ -18,6 +18,7 @@ import hashlib
 import io
 import json
 import os
+import shutil
 import tempfile
 import unittest
 
@@ -27,6 +28,18 @@ import six
 from six.moves import http_client
 
 
+def _base64_md5(data):
+    return base64.b64encode(hashlib.md5(data).digest()).decode(u'utf-8')
+
+
+def _base64_crc32c(data):
+    from google.cloud.storage._helpers import _Checksums
+
+    checksums = _Checksums()
+    checksums.update(data)
+    return checksums.crc32c
+
+
 def _make_credentials():
     import google.auth.credentials
 
@@ -935,6 +948,109 @@ class Test_Blob(unittest.TestCase):
     def test_download_to_file_with_chunk_size(self):
         self._download_to_file_helper(use_chunks=True)
 
+    def _download_w_checksums_helper(self, properties, start=None):
+        transport = self._mock_download_transport()
+        client = mock.Mock(_http=transport, spec=[u'_http'])
+        properties = dict(properties, mediaLink='http://example.com/media/')
+        blob = self._make_one(
+            'blob-name', bucket=_Bucket(client), properties=properties)
+        blob._CHUNK_SIZE_MULTIPLE = 1
+        blob.chunk_size = 3
+
+        blob.download_to_file(io.BytesIO(), start=start)
+        return blob
+
+    def test_download_to_file_verifies_checksums(self):
+        md5_hash = _base64_md5(b'abcdef')
+        crc32c = _base64_crc32c(b'abcdef')
+
+        blob = self._download_w_checksums_helper(
+            {'md5Hash': md5_hash, 'crc32c': crc32c})
+
+        self.assertEqual(blob.computed_md5_hash, md5_hash)
+        self.assertEqual(blob.computed_crc32c, crc32c)
+
+    def test_download_to_file_checksum_mismatch(self):
+        from google.resumable_media import DataCorruption
+
+        with self.assertRaises(DataCorruption) as exc_info:
+            self._download_w_checksums_helper(
+                {'crc32c': _base64_crc32c(b'ABCDEF')})
+
+        self.assertIn('CRC32C checksum', exc_info.exception.args[0])
+
+    def test_download_to_file_range_not_verified(self):
+        transport = self._mock_download_transport_range()
+        client = mock.Mock(_http=transport, spec=[u'_http'])
+        properties = {
+            'mediaLink': 'http://example.com/media/',
+            'md5Hash': _base64_md5(b'abcdef'),
+        }
+        blob = self._make_one(
+            'blob-name', bucket=_Bucket(client), properties=properties)
+        blob._CHUNK_SIZE_MULTIPLE = 1
+        blob.chunk_size = 2
+
+        blob.download_to_file(io.BytesIO(), start=1, end=4)
+
+        self.assertEqual(blob.computed_md5_hash, _base64_md5(b'bcde'))
+
+    def test_download_to_file_gzip_not_verified(self):
+        blob = self._download_w_checksums_helper(
+            {'md5Hash': _base64_md5(b''), 'contentEncoding': 'gzip'})
+
+        self.assertEqual(blob.computed_md5_hash, _base64_md5(b'abcdef'))
+
+    def test_open_rb(self):
+        from google.cloud.storage.fileio import BlobReader
+
+        blob = self._make_one(
+            'blob-name', bucket=None, properties={'size': '3'})
+        blob.download_as_string = mock.Mock(return_value=b'abc', spec=[])
+
+        with blob.open('rb', chunk_size=8, client=mock.sentinel.client) as f:
+            self.assertIsInstance(f, BlobReader)
+            self.assertEqual(f.read(), b'abc')
+
+        blob.download_as_string.assert_called_once_with(
+            client=mock.sentinel.client, start=0, end=2)
+
+    def test_open_r_text(self):
+        blob = self._make_one(
+            'blob-name', bucket=None, properties={'size': '9'})
+        blob.download_as_string = mock.Mock(
+            return_value=u'a,b\nc,\u00e9\n'.encode('utf-8'), spec=[])
+
+        with blob.open('r', encoding='utf-8') as f:
+            lines = list(f)
+
+        self.assertEqual(lines, [u'a,b\n', u'c,\u00e9\n'])
+
+    def test_open_w_text(self):
+        from google.cloud.storage.fileio import BlobWriter
+
+        blob = self._make_one('blob-name', bucket=None)
+        uploaded = []
+        blob.upload_from_file = mock.Mock(
+            side_effect=lambda stream, **kw: uploaded.append(
+                stream.read(kw['size'])),
+            spec=[])
+
+        with blob.open('w', encoding='utf-8', content_type='text/csv') as f:
+            self.assertIsInstance(f.buffer, BlobWriter)
+            f.write(u'\u00e9\n')
+
+        self.assertEqual(uploaded, [u'\u00e9\n'.encode('utf-8')])
+        blob.upload_from_file.assert_called_once_with(
+            mock.ANY, size=3, content_type='text/csv', client=None,
+            predefined_acl=None)
+
+    def test_open_invalid_mode(self):
+        blob = self._make_one('blob-name', bucket=None)
+
+        with self.assertRaises(ValueError):
+            blob.open('a')
+
     def _download_to_filename_helper(self, updated=None):
         import os
         import time
@@ -1052,6 +1168,147 @@ class Test_Blob(unittest.TestCase):
             stream=True,
         )
 
+    def _mock_sliced_download_transport(self, content, fail_start=None):
+        import re
+
+        def request(method, url, data=None, headers=None):
+            start, end = map(int, re.match(
+                r'bytes=(\d+)-(\d+)', headers['range']).groups())
+            if start == fail_start:
+                return self._mock_requests_response(
+                    http_client.FORBIDDEN, {})
+            return self._mock_requests_response(
+                http_client.PARTIAL_CONTENT,
+                {'content-length': str(end - start + 1),
+                 'content-range': 'bytes {}-{}/{}'.format(
+                     start, end, len(content))},
+                content=content[start:end + 1])
+
+        transport = mock.Mock(spec=['request'])
+        transport.request.side_effect = request
+        return transport
+
+    def _make_sliced_blob(self, transport, content, md5_hash=None):
+        client = mock.Mock(_http=transport, spec=['_http'])
+        bucket = _Bucket(client)
+        if md5_hash is None:
+            md5_hash = base64.b64encode(
+                hashlib.md5(content).digest()).decode(u'utf-8')
+        properties = {
+            'mediaLink': 'http://example.com/media/',
+            'size': str(len(content)),
+            'md5Hash': md5_hash,
+            'generation': '12345',
+        }
+        return self._make_one('blob-name', bucket=bucket,
+                              properties=properties)
+
+    def _sliced_filename(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        return os.path.join(directory, 'blob-name')
+
+    def test_download_to_filename_sliced(self):
+        content = b'abcdefghij'
+        transport = self._mock_sliced_download_transport(content)
+        blob = self._make_sliced_blob(transport, content)
+        filename = self._sliced_filename()
+
+        blob.download_to_filename(filename, max_workers=2, slice_size=4)
+
+        with open(filename, 'rb') as file_obj:
+            self.assertEqual(file_obj.read(), content)
+        self.assertFalse(os.path.exists(filename + '.slices'))
+        ranges = sorted(
+            call[1]['headers']['range']
+            for call in transport.request.call_args_list)
+        self.assertEqual(ranges, ['bytes=0-3', 'bytes=4-7', 'bytes=8-9'])
+
+    def test_download_to_filename_sliced_resumes_missing_slices(self):
+        from google.cloud.exceptions import Forbidden
+
+        content = b'abcdefghij'
+        transport = self._mock_sliced_download_transport(
+            content, fail_start=4)
+        blob = self._make_sliced_blob(transport, content)
+        filename = self._sliced_filename()
+
+        with self.assertRaises(Forbidden):
+            blob.download_to_filename(filename, max_workers=2, slice_size=4)
+
+        with open(filename + '.slices') as file_obj:
+            self.assertEqual(json.load(file_obj)['done'], [0, 2])
+
+        transport = self._mock_sliced_download_transport(content)
+        blob.bucket.client._http = transport
+        blob.download_to_filename(filename, max_workers=2, slice_size=4)
+
+        with open(filename, 'rb') as file_obj:
+            self.assertEqual(file_obj.read(), content)
+        self.assertFalse(os.path.exists(filename + '.slices'))
+        transport.request.assert_called_once_with(
+            'GET', 'http://example.com/media/', data=None,
+            headers={'range': 'bytes=4-7'})
+
+    def test_download_to_filename_sliced_corrupted(self):
+        from google.resumable_media import DataCorruption
+
+        content = b'abcdefghij'
+        empty_hash = base64.b64encode(
+            hashlib.md5(b'').digest()).decode(u'utf-8')
+        transport = self._mock_sliced_download_transport(content)
+        blob = self._make_sliced_blob(transport, content, md5_hash=empty_hash)
+        filename = self._sliced_filename()
+
+        with self.assertRaises(DataCorruption):
+            blob.download_to_filename(filename, max_workers=2, slice_size=4)
+
+        self.assertFalse(os.path.exists(filename))
+        self.assertFalse(os.path.exists(filename + '.slices'))
+
+    def test_download_to_filename_sliced_combines_crc32c(self):
+        content = b'abcdefghij'
+        transport = self._mock_sliced_download_transport(content)
+        blob = self._make_sliced_blob(transport, content)
+        blob._properties['crc32c'] = _base64_crc32c(content)
+        filename = self._sliced_filename()
+
+        with mock.patch.object(blob, '_verify_download') as verify:
+            blob.download_to_filename(filename, max_workers=2, slice_size=4)
+
+        # The file is not read again.
+        verify.assert_not_called()
+        self.assertEqual(blob.computed_crc32c, _base64_crc32c(content))
+        self.assertIsNone(blob.computed_md5_hash)
+
+    def test_download_to_filename_sliced_crc32c_mismatch(self):
+        from google.resumable_media import DataCorruption
+
+        content = b'abcdefghij'
+        transport = self._mock_sliced_download_transport(content)
+        blob = self._make_sliced_blob(transport, content)
+        blob._properties['crc32c'] = _base64_crc32c(b'ABCDEFGHIJ')
+        filename = self._sliced_filename()
+
+        with self.assertRaises(DataCorruption):
+            blob.download_to_filename(filename, max_workers=2, slice_size=4)
+
+        self.assertFalse(os.path.exists(filename))
+
+    def test_download_to_filename_sliced_small_object(self):
+        content = b'abcdef'
+        transport = self._mock_download_transport()
+        blob = self._make_sliced_blob(transport, content)
+        blob._CHUNK_SIZE_MULTIPLE = 1
+        blob.chunk_size = 3
+        filename = self._sliced_filename()
+
+        blob.download_to_filename(filename, max_workers=2, slice_size=8)
+
+        with open(filename, 'rb') as file_obj:
+            self.assertEqual(file_obj.read(), content)
+        self.assertEqual(transport.request.call_count, 2)
+
     def test_download_to_filename_w_key(self):
         import os
         import time
@@ -1670,8 +1927,9 @@ class Test_Blob(unittest.TestCase):
         # Check the mock.
         num_retries = kwargs.get('num_retries')
         blob._do_upload.assert_called_once_with(
-            client, stream, content_type,
+            client, mock.ANY, content_type,
             len(data), num_retries, predefined_acl)
+        self.assertIs(blob._do_upload.call_args[0][1]._stream, stream)
         return stream
 
     def test_upload_from_file_success(self):
@@ -1692,6 +1950,45 @@ class Test_Blob(unittest.TestCase):
         stream = self._upload_from_file_helper(rewind=True)
         assert stream.tell() == 0
 
+    def _upload_w_checksums_helper(self, data, created_json):
+        blob = self._make_one('blob-name', bucket=None)
+
+        def do_upload(client, stream, content_type, size, num_retries,
+                      predefined_acl):
+            stream.read(size)
+            return created_json
+
+        blob._do_upload = mock.Mock(side_effect=do_upload, spec=[])
+        blob.upload_from_file(io.BytesIO(data), size=len(data))
+        return blob
+
+    def test_upload_from_file_verifies_checksums(self):
+        data = b'data is here'
+        created_json = {
+            'size': str(len(data)),
+            'md5Hash': _base64_md5(data),
+            'crc32c': _base64_crc32c(data),
+        }
+
+        blob = self._upload_w_checksums_helper(data, created_json)
+
+        self.assertEqual(blob.computed_md5_hash, _base64_md5(data))
+        self.assertEqual(blob.computed_crc32c, _base64_crc32c(data))
+
+    def test_upload_from_file_checksum_mismatch(self):
+        from google.resumable_media import DataCorruption
+
+        data = b'data is here'
+        created_json = {
+            'size': str(len(data)),
+            'md5Hash': _base64_md5(b'other data'),
+        }
+
+        with self.assertRaises(DataCorruption) as exc_info:
+            self._upload_w_checksums_helper(data, created_json)
+
+        self.assertIn('while uploading', exc_info.exception.args[0])
+
     def test_upload_from_file_failure(self):
         import requests
 
@@ -1724,7 +2021,8 @@ class Test_Blob(unittest.TestCase):
         self.assertIsNone(pos_args[5])  # predefined_acl
         self.assertEqual(kwargs, {})
 
-        return pos_args[1]
+        # The stream is wrapped to compute its checksums.
+        return pos_args[1]._stream
 
     def test_upload_from_filename(self):
         from google.cloud._testing import _NamedTemporaryFile
@@ -1757,6 +2055,108 @@ class Test_Blob(unittest.TestCase):
         self.assertEqual(stream.mode, 'rb')
         self.assertEqual(stream.name, temp.name)
 
+    def _upload_composite_helper(self, data, part_size, max_components):
+        import threading
+        from google.cloud._testing import _NamedTemporaryFile
+        from google.cloud.storage.blob import Blob
+
+        bucket = mock.Mock(spec=['delete_blobs', 'user_project'])
+        blob = self._make_one('blob-name', bucket=bucket)
+        client = mock.sentinel.client
+        contents = {}
+        lock = threading.Lock()
+
+        def upload_from_file(part, stream, content_type, client, size):
+            self.assertEqual(stream.tell(), 0)
+            with lock:
+                contents[part.name] = stream.read()
+
+        def compose(destination, sources, client):
+            with lock:
+                contents[destination.name] = b''.join(
+                    contents[source.name] for source in sources)
+
+        patch_upload = mock.patch.object(
+            Blob, 'upload_from_file', autospec=True,
+            side_effect=upload_from_file)
+        patch_compose = mock.patch.object(
+            Blob, 'compose', autospec=True, side_effect=compose)
+        patch_max = mock.patch(
+            'google.cloud.storage.blob._MAX_COMPOSE_COMPONENTS',
+            new=max_components)
+        with _NamedTemporaryFile() as temp:
+            with open(temp.name, 'wb') as file_obj:
+                file_obj.write(data)
+            with patch_upload as upload_mock, patch_compose as compose_mock:
+                with patch_max:
+                    blob.upload_from_filename(
+                        temp.name, content_type=u'text/plain', client=client,
+                        max_workers=4, part_size=part_size)
+
+        self.assertEqual(contents.pop('blob-name'), data)
+        self.assertEqual(blob.content_type, u'text/plain')
+        (temporary,), kwargs = bucket.delete_blobs.call_args
+        self.assertEqual(
+            sorted(part.name for part in temporary), sorted(contents))
+        self.assertEqual(kwargs['client'], client)
+        return upload_mock, compose_mock
+
+    def test_upload_from_filename_composite(self):
+        upload_mock, compose_mock = self._upload_composite_helper(
+            b'abcdefghij', part_size=4, max_components=32)
+
+        self.assertEqual(upload_mock.call_count, 3)
+        sizes = sorted(
+            call[1]['size'] for call in upload_mock.call_args_list)
+        self.assertEqual(sizes, [2, 4, 4])
+        self.assertEqual(compose_mock.call_count, 1)
+
+    def test_upload_from_filename_composite_multi_level(self):
+        upload_mock, compose_mock = self._upload_composite_helper(
+            b'abcdefghij', part_size=1, max_components=3)
+
+        self.assertEqual(upload_mock.call_count, 10)
+        # 10 parts -> 4 composites -> 2 composites -> the blob.
+        self.assertEqual(compose_mock.call_count, 7)
+
+    def test_upload_from_filename_composite_cleans_up_on_error(self):
+        from google.cloud._testing import _NamedTemporaryFile
+        from google.cloud.exceptions import Forbidden
+        from google.cloud.storage.blob import Blob
+
+        bucket = mock.Mock(spec=['delete_blobs', 'user_project'])
+        blob = self._make_one('blob-name', bucket=bucket)
+        patch_upload = mock.patch.object(
+            Blob, 'upload_from_file', autospec=True,
+            side_effect=Forbidden('denied'))
+
+        with _NamedTemporaryFile() as temp:
+            with open(temp.name, 'wb') as file_obj:
+                file_obj.write(b'abcdefghij')
+            with patch_upload:
+                with self.assertRaises(Forbidden):
+                    blob.upload_from_filename(
+                        temp.name, max_workers=2, part_size=4)
+
+        (temporary,), _ = bucket.delete_blobs.call_args
+        self.assertEqual(len(temporary), 3)
+
+    def test_upload_from_filename_composite_small_file(self):
+        from google.cloud._testing import _NamedTemporaryFile
+
+        blob = self._make_one('blob-name', bucket=None)
+        blob._do_upload = mock.Mock(return_value={}, spec=[])
+
+        with _NamedTemporaryFile() as temp:
+            with open(temp.name, 'wb') as file_obj:
+                file_obj.write(b'abc')
+            blob.upload_from_filename(
+                temp.name, content_type=u'text/plain', max_workers=2,
+                part_size=4)
+
+        blob._do_upload.assert_called_once_with(
+            None, mock.ANY, u'text/plain', 3, None, None)
+
     def _upload_from_string_helper(self, data, **kwargs):
         from google.cloud._helpers import _to_bytes
 
@@ -2990,6 +3390,34 @@ class Test_Blob(unittest.TestCase):
         self.assertIsNone(blob.updated)
 
 
+class Test_FileSlice(unittest.TestCase):
+
+    @staticmethod
+    def _make_one(*args, **kw):
+        from google.cloud.storage.blob import _FileSlice
+
+        return _FileSlice(*args, **kw)
+
+    def test_read(self):
+        file_slice = self._make_one(io.BytesIO(b'abcdefghij'), 3, 4)
+
+        self.assertEqual(file_slice.read(3), b'def')
+        self.assertEqual(file_slice.tell(), 3)
+        self.assertEqual(file_slice.read(3), b'g')
+        self.assertEqual(file_slice.read(), b'')
+
+    def test_seek(self):
+        import os
+
+        file_slice = self._make_one(io.BytesIO(b'abcdefghij'), 3, 4)
+
+        self.assertEqual(file_slice.seek(2), 2)
+        self.assertEqual(file_slice.read(), b'fg')
+        self.assertEqual(file_slice.seek(-3, os.SEEK_END), 1)
+        self.assertEqual(file_slice.seek(1, os.SEEK_CUR), 2)
+        self.assertEqual(file_slice.seek(10), 4)
+
+
 class Test__quote(unittest.TestCase):
 
     @staticmethod
@@ -687,6 +687,111 @@ class Test_Bucket(unittest.TestCase):
         self.assertEqual(kw['path'], '/b/%s/o' % NAME)
         self.assertEqual(kw['query_params'], EXPECTED)
 
+    def test_list_blobs_w_fields_wo_next_page_token(self):
+        connection = _Connection({'items': []})
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name='name')
+
+        list(bucket.list_blobs(fields='items(name,size)'))
+
+        kw, = connection._requested
+        self.assertEqual(
+            kw['query_params']['fields'], 'items(name,size),nextPageToken')
+
+    def test_list_blobs_w_prefetch(self):
+        connection = _Connection(
+            {'items': [{'name': 'a'}, {'name': 'b'}], 'nextPageToken': 'p2'},
+            {'items': [{'name': 'c'}], 'nextPageToken': 'p3'},
+            {'items': [{'name': 'd'}]})
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name='name')
+
+        iterator = bucket.list_blobs(prefetch=True, max_results=3)
+        blobs = iter(iterator)
+        first = next(blobs)
+        # The second page is requested before the first one is consumed.
+        self.assertIsNotNone(iterator._next_response)
+        rest = list(blobs)
+
+        self.assertEqual(
+            [blob.name for blob in [first] + rest], ['a', 'b', 'c'])
+        self.assertEqual(len(connection._requested), 2)
+        self.assertEqual(
+            [kw['query_params'] for kw in connection._requested], [
+                {'projection': 'noAcl', 'maxResults': 3},
+                {'projection': 'noAcl', 'maxResults': 1, 'pageToken': 'p2'},
+            ])
+
+    def test_list_blobs_w_prefetch_error(self):
+        from google.cloud.exceptions import NotFound
+
+        connection = _Connection()
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name='name')
+
+        iterator = bucket.list_blobs(prefetch=True)
+
+        with self.assertRaises(NotFound):
+            list(iterator)
+        self.assertTrue(iterator._executor._shutdown)
+
+    def test_list_blobs_in_prefixes(self):
+        pages = {
+            ('a', None): {'items': [{'name': 'a1'}, {'name': 'a3'}],
+                          'nextPageToken': 'a-p2'},
+            ('a', 'a-p2'): {'items': [{'name': 'a5'}]},
+            ('b', None): {'items': [{'name': 'b0'}]},
+            ('', None): {'items': [{'name': 'a2'}]},
+        }
+        requested = []
+
+        def api_request(method, path, query_params):
+            params = dict(query_params)
+            requested.append(params)
+            return pages[params['prefix'], params.get('pageToken')]
+
+        connection = mock.Mock(spec=['api_request'])
+        connection.api_request.side_effect = api_request
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name='name')
+
+        blobs = bucket.list_blobs_in_prefixes(
+            ['b', 'a', ''], fields='items(name)', max_workers=2)
+
+        self.assertEqual(
+            [blob.name for blob in blobs], ['a1', 'a2', 'a3', 'a5', 'b0'])
+        self.assertEqual(len(requested), 4)
+        self.assertEqual(
+            set(params['fields'] for params in requested),
+            set(['items(name),nextPageToken']))
+
+    def test_list_blobs_in_prefixes_overlapping(self):
+        pages = {
+            'a': {'items': [{'name': 'a1'}, {'name': 'a2'}]},
+            'a1': {'items': [{'name': 'a1'}]},
+        }
+        from six.moves import queue
+
+        requested = queue.Queue()
+
+        def api_request(method, path, query_params):
+            requested.put(query_params['prefix'])
+            return pages[query_params['prefix']]
+
+        connection = mock.Mock(spec=['api_request'])
+        connection.api_request.side_effect = api_request
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name='name')
+
+        blobs = bucket.list_blobs_in_prefixes(['a', 'a1'], max_workers=2)
+
+        # The first pages are requested before the blobs are iterated.
+        self.assertEqual(
+            set([requested.get(timeout=5), requested.get(timeout=5)]),
+            set(['a', 'a1']))
+        self.assertEqual(
+            [blob.name for blob in blobs], ['a1', 'a1', 'a2'])
+
     def test_list_blobs(self):
         NAME = 'name'
         connection = _Connection({'items': []})
@@ -921,6 +1026,52 @@ class Test_Bucket(unittest.TestCase):
         self.assertEqual(kw[1]['method'], 'DELETE')
         self.assertEqual(kw[1]['path'], '/b/%s/o/%s' % (NAME, NONESUCH))
 
+    def _delete_blobs_bulk_helper(self, blobs, errors_by_name, **kw):
+        from google.cloud.storage.bulk import BulkResult
+
+        connection = _Connection()
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name='name')
+        deleted = []
+
+        def delete(blobs):
+            for blob in blobs:
+                deleted.append(blob.name)
+                error = errors_by_name.get(blob.name)
+                yield BulkResult(blob, None if error else {}, error)
+
+        patch = mock.patch(
+            'google.cloud.storage.bucket.BulkOperations', autospec=True)
+        with patch as bulk_class:
+            bulk_class.return_value.delete.side_effect = delete
+            try:
+                bucket.delete_blobs(blobs, max_workers=3, **kw)
+            finally:
+                bulk_class.assert_called_once_with(client, max_workers=3)
+                self.assertEqual(connection._requested, [])
+        return deleted
+
+    def test_delete_blobs_bulk_w_on_error(self):
+        from google.cloud.exceptions import NotFound
+
+        blob = self._make_one(name='name').blob('blob-name')
+        errors = []
+
+        deleted = self._delete_blobs_bulk_helper(
+            [blob, 'nonesuch'], {'nonesuch': NotFound('nonesuch')},
+            on_error=errors.append)
+
+        self.assertEqual(deleted, ['blob-name', 'nonesuch'])
+        self.assertEqual(errors, ['nonesuch'])
+
+    def test_delete_blobs_bulk_raises_after_all_blobs(self):
+        from google.cloud.exceptions import Forbidden
+        from google.cloud.exceptions import NotFound
+
+        with self.assertRaises(Forbidden):
+            self._delete_blobs_bulk_helper(
+                ['a', 'b', 'c'], {'a': Forbidden('a'), 'b': NotFound('b')})
+
     def test_delete_blobs_miss_w_on_error(self):
         NAME = 'name'
         BLOB_NAME = 'blob-name'
@@ -0,0 +1,309 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import unittest
+
+import mock
+import requests
+from six.moves import http_client
+
+
+_STATUS_LINES = {
+    200: 'HTTP/1.1 200 OK',
+    204: 'HTTP/1.1 204 No Content',
+    404: 'HTTP/1.1 404 Not Found',
+    503: 'HTTP/1.1 503 Service Unavailable',
+}
+
+
+def _make_batch_response(*parts):
+    """Make a batch response from ``(status, payload)`` pairs."""
+    lines = []
+    for index, (status, payload) in enumerate(parts):
+        body = '' if payload is None else json.dumps(payload)
+        lines.extend([
+            '--DEADBEEF=',
+            'Content-Type: application/json',
+            'Content-ID: <response-id+{}>'.format(index + 1),
+            '',
+            _STATUS_LINES[status],
+            'Content-Type: application/json; charset=UTF-8',
+            'Content-Length: {}'.format(len(body)),
+            '',
+            body,
+            '',
+        ])
+    lines.append('--DEADBEEF=--')
+    return _make_response(content='\n'.join(lines).encode('utf-8'))
+
+
+def _make_response(status=http_client.OK, content=b''):
+    response = requests.Response()
+    response.status_code = status
+    response._content = content
+    response.headers = {
+        'content-type': 'multipart/mixed; boundary="DEADBEEF="'}
+    response.request = requests.Request(
+        'POST', 'http://example.com').prepare()
+    return response
+
+
+def _sent_requests(http, call_index):
+    """Get the request lines of the sub-requests of a batch request."""
+    body = http.request.mock_calls[call_index][2]['data']
+    return [line for line in body.splitlines() if ' HTTP/1.1' in line]
+
+
+class TestBulkOperations(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.bulk import BulkOperations
+
+        return BulkOperations
+
+    def _make_one(self, client, **kw):
+        kw.setdefault('max_workers', 1)
+        return self._get_target_class()(client, **kw)
+
+    @staticmethod
+    def _make_client(*responses):
+        http = mock.create_autospec(requests.Session, instance=True)
+        http.request.side_effect = list(responses)
+        connection = _Connection(http=http)
+        return _Client(connection), http
+
+    @staticmethod
+    def _make_blobs(*names, **kw):
+        from google.cloud.storage.blob import Blob
+
+        bucket = _Bucket(kw.get('bucket_name', 'bucket'))
+        return [Blob(name, bucket=bucket) for name in names]
+
+    def test_ctor_w_batch_size_too_large(self):
+        client, _ = self._make_client()
+
+        with self.assertRaises(ValueError):
+            self._make_one(client, batch_size=101)
+
+    def test_delete(self):
+        client, http = self._make_client(
+            _make_batch_response((204, None), (204, None)),
+            _make_batch_response((204, None)))
+        bulk = self._make_one(client, batch_size=2)
+        blobs = self._make_blobs('a', 'b', 'c')
+
+        results = list(bulk.delete(iter(blobs)))
+
+        self.assertEqual([result.blob for result in results], blobs)
+        self.assertEqual(
+            [(result.response, result.error) for result in results],
+            [({}, None)] * 3)
+        self.assertEqual(http.request.call_count, 2)
+        self.assertEqual(_sent_requests(http, 0), [
+            'DELETE https://www.googleapis.com/storage/v1/b/bucket/o/a'
+            ' HTTP/1.1',
+            'DELETE https://www.googleapis.com/storage/v1/b/bucket/o/b'
+            ' HTTP/1.1',
+        ])
+        call = http.request.mock_calls[0][2]
+        self.assertEqual(call['method'], 'POST')
+        self.assertEqual(
+            call['url'], 'https://www.googleapis.com/batch/storage/v1')
+
+    def test_delete_retries_failed_sub_requests(self):
+        client, http = self._make_client(
+            _make_batch_response(
+                (503, {'error': {'message': 'busy'}}), (204, None)),
+            _make_batch_response((204, None)))
+        bulk = self._make_one(client, initial_delay=0.5)
+        blobs = self._make_blobs('a', 'b')
+
+        with mock.patch('time.sleep') as sleep:
+            results = list(bulk.delete(blobs))
+
+        self.assertEqual(
+            [(result.blob.name, result.error) for result in results],
+            [('b', None), ('a', None)])
+        sleep.assert_called_once_with(0.5)
+        self.assertEqual(len(_sent_requests(http, 1)), 1)
+        self.assertIn('/o/a HTTP', _sent_requests(http, 1)[0])
+
+    def test_delete_gives_up_after_max_attempts(self):
+        from google.cloud.exceptions import ServiceUnavailable
+
+        busy = (503, {'error': {'message': 'busy'}})
+        client, http = self._make_client(
+            _make_batch_response(busy), _make_batch_response(busy),
+            _make_batch_response(busy))
+        bulk = self._make_one(
+            client, max_attempts=3, initial_delay=1.0, max_delay=1.5)
+        blobs = self._make_blobs('a')
+
+        with mock.patch('time.sleep') as sleep:
+            (result,) = list(bulk.delete(blobs))
+
+        self.assertIsNone(result.response)
+        self.assertIsInstance(result.error, ServiceUnavailable)
+        self.assertEqual(http.request.call_count, 3)
+        self.assertEqual(sleep.mock_calls, [mock.call(1.0), mock.call(1.5)])
+
+    def test_delete_does_not_retry_not_found(self):
+        from google.cloud.exceptions import NotFound
+
+        client, http = self._make_client(_make_batch_response(
+            (404, {'error': {'message': 'missing'}}), (204, None)))
+        bulk = self._make_one(client)
+        blobs = self._make_blobs('a', 'b')
+
+        results = list(bulk.delete(blobs))
+
+        self.assertIsInstance(results[0].error, NotFound)
+        self.assertIsNone(results[1].error)
+        self.assertEqual(http.request.call_count, 1)
+
+    def test_delete_retries_failed_batch_request(self):
+        client, http = self._make_client(
+            _make_response(http_client.SERVICE_UNAVAILABLE, b'{}'),
+            _make_batch_response((204, None), (204, None)))
+        bulk = self._make_one(client)
+        blobs = self._make_blobs('a', 'b')
+
+        with mock.patch('time.sleep'):
+            results = list(bulk.delete(blobs))
+
+        self.assertEqual([result.error for result in results], [None, None])
+        self.assertEqual(len(_sent_requests(http, 1)), 2)
+
+    def test_delete_retries_transport_error(self):
+        client, http = self._make_client(
+            requests.exceptions.ConnectionError('reset'),
+            _make_batch_response((204, None)),
+            _make_batch_response((204, None), (204, None)))
+        bulk = self._make_one(client)
+        blobs = self._make_blobs('a', 'b')
+
+        with mock.patch('time.sleep') as sleep:
+            results = list(bulk.delete(blobs))
+
+        # The incomplete batch response is retried too.
+        self.assertEqual([result.error for result in results], [None, None])
+        self.assertEqual(http.request.call_count, 3)
+        self.assertEqual(sleep.call_count, 2)
+
+    def test_delete_reports_transport_error_after_max_attempts(self):
+        error = requests.exceptions.Timeout('timed out')
+        client, http = self._make_client(error, error)
+        bulk = self._make_one(client, max_attempts=2)
+        blobs = self._make_blobs('a', 'b')
+
+        with mock.patch('time.sleep'):
+            results = list(bulk.delete(blobs))
+
+        self.assertEqual(
+            [(result.blob.name, result.response, result.error)
+             for result in results],
+            [('a', None, error), ('b', None, error)])
+        self.assertEqual(http.request.call_count, 2)
+
+    def test_copy(self):
+        client, http = self._make_client(_make_batch_response(
+            (200, {'name': 'copy-of-a'})))
+        bulk = self._make_one(client)
+        blobs = self._make_blobs('a')
+        destination = _Bucket('other')
+
+        (result,) = list(bulk.copy(
+            blobs, destination, new_name=lambda blob: 'copy-of-' + blob.name))
+
+        self.assertEqual(result.response, {'name': 'copy-of-a'})
+        self.assertEqual(_sent_requests(http, 0), [
+            'POST https://www.googleapis.com/storage/v1/b/bucket/o/a'
+            '/copyTo/b/other/o/copy-of-a HTTP/1.1',
+        ])
+
+    def test_update_storage_class_continues_rewrites(self):
+        client, http = self._make_client(
+            _make_batch_response(
+                (200, {'done': False, 'rewriteToken': 'TOKEN'}),
+                (200, {'done': True, 'resource': {'name': 'b'}})),
+            _make_batch_response(
+                (200, {'done': True, 'resource': {'name': 'a'}})))
+        bulk = self._make_one(client)
+        blobs = self._make_blobs('a', 'b')
+
+        with mock.patch('time.sleep') as sleep:
+            results = list(bulk.update_storage_class(blobs, 'NEARLINE'))
+
+        self.assertEqual(
+            [result.response['resource']['name'] for result in results],
+            ['b', 'a'])
+        sleep.assert_not_called()
+        (request_line,) = _sent_requests(http, 1)
+        self.assertIn('/o/a/rewriteTo/b/bucket/o/a?', request_line)
+        self.assertIn('rewriteToken=TOKEN', request_line)
+        body = http.request.mock_calls[0][2]['data']
+        self.assertIn('{"storageClass": "NEARLINE"}', body)
+
+    def test_rewrite_w_invalid_storage_class(self):
+        client, _ = self._make_client()
+        bulk = self._make_one(client)
+
+        with self.assertRaises(ValueError):
+            bulk.rewrite([], storage_class='FROZEN')
+
+    def test_run_reads_blobs_lazily(self):
+        responses = [
+            _make_batch_response((204, None)) for _ in range(5)]
+        client, http = self._make_client(*responses)
+        bulk = self._make_one(client, batch_size=1)
+        read = []
+
+        def blobs():
+            for blob in self._make_blobs('a', 'b', 'c', 'd', 'e'):
+                read.append(blob.name)
+                yield blob
+
+        results = bulk.delete(blobs())
+        next(results)
+
+        # Two batches in flight per worker, plus the one completed.
+        self.assertLessEqual(len(read), 3)
+        self.assertEqual(len(list(results)), 4)
+
+
+class _Connection(object):
+
+    def __init__(self, http):
+        self.http = http
+
+    def _make_request(self, method, url, data=None, headers=None):
+        return self.http.request(
+            url=url, method=method, headers=headers, data=data)
+
+
+class _Client(object):
+
+    def __init__(self, connection):
+        self._base_connection = connection
+
+
+class _Bucket(object):
+
+    user_project = None
+
+    def __init__(self, name):
+        self.name = name
+        self.path = '/b/' + name
@@ -267,6 +267,19 @@ class TestClient(unittest.TestCase):
         self.assertIsInstance(batch, Batch)
         self.assertIs(batch._client, client)
 
+    def test_bulk(self):
+        from google.cloud.storage.bulk import BulkOperations
+
+        PROJECT = 'PROJECT'
+        CREDENTIALS = _make_credentials()
+
+        client = self._make_one(project=PROJECT, credentials=CREDENTIALS)
+        bulk = client.bulk(batch_size=50, max_workers=2)
+        self.assertIsInstance(bulk, BulkOperations)
+        self.assertIs(bulk._client, client)
+        self.assertEqual(bulk.batch_size, 50)
+        self.assertEqual(bulk.max_workers, 2)
+
     def test_get_bucket_miss(self):
         from google.cloud.exceptions import NotFound
 
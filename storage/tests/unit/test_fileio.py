@@ -0,0 +1,227 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import unittest
+
+import mock
+
+
+def _make_blob(content=None):
+    blob = mock.Mock(spec=[
+        'size', 'chunk_size', 'reload', 'download_as_string',
+        'upload_from_file', '_initiate_resumable_upload', '_set_properties',
+        '_CHUNK_SIZE_MULTIPLE'])
+    blob.chunk_size = None
+    blob._CHUNK_SIZE_MULTIPLE = 1
+    if content is not None:
+        blob.size = len(content)
+
+        def download_as_string(client=None, start=None, end=None):
+            return content[start:end + 1]
+
+        blob.download_as_string.side_effect = download_as_string
+    return blob
+
+
+class _Upload(object):
+    """Consume a stream as ``ResumableUpload`` does, with unknown size."""
+
+    def __init__(self, stream, chunk_size):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self.chunks = []
+        self.finished = False
+
+    def transmit_next_chunk(self, transport):
+        self.chunks.append((self._stream.tell(),
+                            self._stream.read(self._chunk_size)))
+        if len(self.chunks[-1][1]) < self._chunk_size:
+            self.finished = True
+        return mock.Mock(json=mock.Mock(return_value={'size': 'done'}))
+
+
+class TestBlobReader(unittest.TestCase):
+
+    @staticmethod
+    def _make_one(*args, **kw):
+        from google.cloud.storage.fileio import BlobReader
+
+        return BlobReader(*args, **kw)
+
+    def test_ctor_reloads_size(self):
+        blob = _make_blob()
+        blob.size = None
+
+        self._make_one(blob, client=mock.sentinel.client)
+
+        blob.reload.assert_called_once_with(client=mock.sentinel.client)
+
+    def test_read_ahead(self):
+        blob = _make_blob(b'abcdefghij')
+        reader = self._make_one(
+            blob, chunk_size=4, client=mock.sentinel.client)
+
+        self.assertEqual(reader.read(2), b'ab')
+        self.assertEqual(reader.read(1), b'c')
+        # A short read at the end of the buffer.
+        self.assertEqual(reader.read(3), b'd')
+        self.assertEqual(reader.read(6), b'efghij')
+        self.assertEqual(reader.read(1), b'')
+        self.assertEqual(blob.download_as_string.mock_calls, [
+            mock.call(client=mock.sentinel.client, start=0, end=3),
+            mock.call(client=mock.sentinel.client, start=4, end=9),
+        ])
+
+    def test_seek_within_buffer(self):
+        blob = _make_blob(b'abcdefghij')
+        reader = self._make_one(blob, chunk_size=4)
+
+        self.assertEqual(reader.read(2), b'ab')
+        self.assertEqual(reader.seek(-2, io.SEEK_CUR), 0)
+        self.assertEqual(reader.read(4), b'abcd')
+        self.assertEqual(reader.seek(-3, io.SEEK_END), 7)
+        self.assertEqual(reader.tell(), 7)
+        self.assertEqual(reader.read(), b'hij')
+        self.assertEqual(blob.download_as_string.call_count, 2)
+
+    def test_seek_invalid(self):
+        reader = self._make_one(_make_blob(b'abc'))
+
+        with self.assertRaises(ValueError):
+            reader.seek(-1)
+        with self.assertRaises(ValueError):
+            reader.seek(0, 3)
+
+    def test_buffered_readline(self):
+        blob = _make_blob(b'one\ntwo\nthree\n')
+        reader = io.BufferedReader(self._make_one(blob, chunk_size=5))
+
+        self.assertEqual(list(reader), [b'one\n', b'two\n', b'three\n'])
+
+    def test_closed(self):
+        reader = self._make_one(_make_blob(b'abc'))
+        reader.close()
+
+        with self.assertRaises(ValueError):
+            reader.read(1)
+
+
+class TestBlobWriter(unittest.TestCase):
+
+    @staticmethod
+    def _make_one(*args, **kw):
+        from google.cloud.storage.fileio import BlobWriter
+
+        return BlobWriter(*args, **kw)
+
+    @staticmethod
+    def _mock_initiate(blob):
+        uploads = []
+
+        def initiate(client, stream, content_type, size, num_retries,
+                     predefined_acl=None, chunk_size=None):
+            assert stream.tell() == 0
+            uploads.append(_Upload(stream, chunk_size))
+            return uploads[-1], mock.sentinel.transport
+
+        blob._initiate_resumable_upload.side_effect = initiate
+        return uploads
+
+    def test_ctor_w_invalid_chunk_size(self):
+        blob = _make_blob()
+        blob._CHUNK_SIZE_MULTIPLE = 256
+
+        with self.assertRaises(ValueError):
+            self._make_one(blob, chunk_size=100)
+
+    def test_write_uploads_full_chunks(self):
+        blob = _make_blob()
+        uploads = self._mock_initiate(blob)
+        writer = self._make_one(
+            blob, chunk_size=4, content_type=u'text/csv',
+            client=mock.sentinel.client)
+
+        writer.write(b'abc')
+        self.assertEqual(uploads, [])
+        writer.write(b'defghij')
+        (upload,) = uploads
+        self.assertEqual(upload.chunks, [(0, b'abcd'), (4, b'efgh')])
+        self.assertEqual(writer.tell(), 10)
+        self.assertEqual(len(writer._buffer), 2)
+        writer.close()
+
+        self.assertEqual(upload.chunks[-1], (8, b'ij'))
+        blob._set_properties.assert_called_once_with({'size': 'done'})
+        blob._initiate_resumable_upload.assert_called_once_with(
+            mock.sentinel.client, mock.ANY, u'text/csv', None, None,
+            predefined_acl=None, chunk_size=4)
+        blob.upload_from_file.assert_not_called()
+
+    def test_close_w_exact_chunks_sends_empty_final_chunk(self):
+        blob = _make_blob()
+        uploads = self._mock_initiate(blob)
+
+        with self._make_one(blob, chunk_size=4) as writer:
+            writer.write(b'abcdefgh')
+
+        self.assertEqual(
+            uploads[0].chunks, [(0, b'abcd'), (4, b'efgh'), (8, b'')])
+
+    def test_close_small_blob_single_request(self):
+        blob = _make_blob()
+        uploaded = []
+        blob.upload_from_file.side_effect = (
+            lambda stream, **kw: uploaded.append(stream.read(kw['size'])))
+
+        with self._make_one(blob, chunk_size=4,
+                            predefined_acl='private') as writer:
+            writer.write(b'abc')
+
+        self.assertEqual(uploaded, [b'abc'])
+        blob.upload_from_file.assert_called_once_with(
+            mock.ANY, size=3, content_type=None, client=None,
+            predefined_acl='private')
+        blob._initiate_resumable_upload.assert_not_called()
+
+    def test_exit_w_exception_abandons_upload(self):
+        blob = _make_blob()
+        uploads = self._mock_initiate(blob)
+
+        with self.assertRaises(RuntimeError):
+            with self._make_one(blob, chunk_size=4) as writer:
+                writer.write(b'abcdef')
+                raise RuntimeError('failed')
+
+        self.assertTrue(writer.closed)
+        self.assertEqual(uploads[0].chunks, [(0, b'abcd')])
+        self.assertFalse(uploads[0].finished)
+        blob.upload_from_file.assert_not_called()
+
+    def test_write_maps_invalid_response(self):
+        import requests
+        from google import resumable_media
+        from google.cloud.exceptions import Forbidden
+
+        blob = _make_blob()
+        response = requests.Response()
+        response.status_code = 403
+        response.request = requests.Request(
+            'PUT', 'http://example.com').prepare()
+        blob._initiate_resumable_upload.side_effect = (
+            resumable_media.InvalidResponse(response, 'denied'))
+        writer = self._make_one(blob, chunk_size=4)
+
+        with self.assertRaises(Forbidden):
+            writer.write(b'abcd')
@@ -0,0 +1,181 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import binascii
+import datetime
+import hashlib
+import unittest
+
+import mock
+from six.moves import urllib_parse
+
+
+def _sign(string_to_sign):
+    """Stand in for an RSA signature, deterministically."""
+    if not isinstance(string_to_sign, bytes):
+        string_to_sign = string_to_sign.encode('utf-8')
+    return hashlib.sha256(string_to_sign).digest()
+
+
+def _make_credentials():
+    import google.auth.credentials
+
+    credentials = mock.Mock(spec=google.auth.credentials.Signing)
+    credentials.signer_email = 'service@example.com'
+    credentials.signer = mock.Mock(spec=['sign'])
+    credentials.signer.sign.side_effect = _sign
+    credentials.sign_bytes.side_effect = _sign
+    return credentials
+
+
+def _make_service_account_info():
+    import rsa
+
+    _, private_key = rsa.newkeys(512)
+    return {
+        'client_email': 'service@example.com',
+        'private_key': private_key.save_pkcs1().decode('utf-8'),
+        'private_key_id': 'key-id',
+    }
+
+
+class TestSignedURLFactory(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.signed_url import SignedURLFactory
+
+        return SignedURLFactory
+
+    def _make_one(self, credentials=None, bucket_name='bucket', **kw):
+        if credentials is None:
+            credentials = _make_credentials()
+        return self._get_target_class().from_credentials(
+            credentials, bucket_name, **kw)
+
+    def test_ctor_w_invalid_version(self):
+        with self.assertRaises(ValueError):
+            self._make_one(version='v3')
+
+    def test_ctor_processes_wo_service_account_info(self):
+        with self.assertRaises(ValueError):
+            self._make_one(processes=2)
+
+    def test_from_credentials_wo_signer(self):
+        with self.assertRaises(AttributeError):
+            self._make_one(credentials=object())
+
+    def test_sign_v2_matches_generate_signed_url(self):
+        from google.cloud.storage._signing import generate_signed_url
+        from google.cloud.storage.blob import Blob
+
+        credentials = _make_credentials()
+        factory = self._make_one(
+            credentials, method='PUT', content_type='text/plain',
+            response_disposition='attachment')
+        blob = Blob(u'b l\xf6b', bucket=mock.Mock())
+
+        urls = factory.sign(['a/b.txt', blob], 1000000000)
+
+        for url, resource in zip(urls, ['/bucket/a/b.txt',
+                                        '/bucket/b%20l%C3%B6b']):
+            expected = generate_signed_url(
+                credentials, resource, 1000000000,
+                api_access_endpoint='https://storage.googleapis.com',
+                method='PUT', content_type='text/plain',
+                response_disposition='attachment')
+            actual_parts = urllib_parse.urlsplit(url)
+            expected_parts = urllib_parse.urlsplit(expected)
+            self.assertEqual(actual_parts.path, expected_parts.path)
+            self.assertEqual(
+                urllib_parse.parse_qs(actual_parts.query),
+                urllib_parse.parse_qs(expected_parts.query))
+
+    def test_sign_v2_resumable(self):
+        credentials = _make_credentials()
+        factory = self._make_one(credentials, method='RESUMABLE')
+
+        factory.sign(['a'], 1000000000)
+
+        credentials.signer.sign.assert_called_once_with(
+            'POST\n\n\n1000000000\nx-goog-resumable:start\n/bucket/a')
+
+    def test_sign_v4(self):
+        credentials = _make_credentials()
+        factory = self._make_one(
+            credentials, version='v4', response_type='text/csv')
+        now = datetime.datetime(2018, 7, 1, 12, 30, 15)
+
+        with mock.patch('google.cloud.storage._signing.NOW',
+                        return_value=now):
+            (url,) = factory.sign([u'a b~'], datetime.timedelta(hours=1))
+
+        query = (
+            'X-Goog-Algorithm=GOOG4-RSA-SHA256'
+            '&X-Goog-Credential=service%40example.com%2F20180701%2Fauto'
+            '%2Fstorage%2Fgoog4_request'
+            '&X-Goog-Date=20180701T123015Z'
+            '&X-Goog-Expires=3600'
+            '&X-Goog-SignedHeaders=host'
+            '&response-content-type=text%2Fcsv')
+        canonical_request = '\n'.join([
+            'GET',
+            '/bucket/a%20b~',
+            query,
+            'host:storage.googleapis.com\n',
+            'host',
+            'UNSIGNED-PAYLOAD',
+        ])
+        string_to_sign = '\n'.join([
+            'GOOG4-RSA-SHA256',
+            '20180701T123015Z',
+            '20180701/auto/storage/goog4_request',
+            hashlib.sha256(canonical_request.encode('utf-8')).hexdigest(),
+        ])
+        signature = binascii.hexlify(_sign(string_to_sign)).decode('ascii')
+        self.assertEqual(
+            url,
+            'https://storage.googleapis.com/bucket/a%20b~?' + query +
+            '&X-Goog-Signature=' + signature)
+
+    def test_sign_v4_signs_content_type_header(self):
+        credentials = _make_credentials()
+        factory = self._make_one(
+            credentials, version='v4', content_type='text/plain')
+
+        (url,) = factory.sign(['a'], datetime.timedelta(minutes=5))
+
+        self.assertIn('X-Goog-SignedHeaders=content-type%3Bhost', url)
+
+    def test_sign_v4_w_expiration_too_far(self):
+        factory = self._make_one(version='v4')
+
+        with self.assertRaises(ValueError):
+            factory.sign(['a'], datetime.timedelta(days=8))
+
+    def test_sign_in_processes(self):
+        info = _make_service_account_info()
+        factory_class = self._get_target_class()
+        in_process = factory_class.from_service_account_info(info, 'bucket')
+        names = ['blob-{}'.format(index) for index in range(8)]
+
+        with factory_class.from_service_account_info(
+                info, 'bucket', processes=2) as factory:
+            urls = factory.sign(names, 1000000000)
+            pool = factory._pool
+
+        # RSA signatures with PKCS #1 v1.5 padding are deterministic.
+        self.assertEqual(urls, in_process.sign(names, 1000000000))
+        self.assertIsNotNone(pool)
+        self.assertIsNone(factory._pool)
@@ -0,0 +1,263 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import base64
+import datetime
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+
+def _md5(data):
+    return base64.b64encode(hashlib.md5(data).digest()).decode('utf-8')
+
+
+class _Blob(object):
+
+    def __init__(self, name, data=b'', updated=None, md5_hash=True):
+        self.name = name
+        self.data = data
+        self.size = len(data)
+        self.updated = updated or datetime.datetime(2018, 1, 1)
+        self.md5_hash = _md5(data) if md5_hash else None
+
+    def upload_from_filename(self, filename, client=None):
+        with open(filename, 'rb') as file_obj:
+            self.data = file_obj.read()
+        self.size = len(self.data)
+        self.md5_hash = _md5(self.data)
+
+    def download_to_filename(self, filename, client=None):
+        with open(filename, 'wb') as file_obj:
+            file_obj.write(self.data)
+
+
+class _Bucket(object):
+
+    def __init__(self, *blobs):
+        self.blobs = {blob.name: blob for blob in blobs}
+        self.list_blobs = mock.Mock(side_effect=self._list_blobs)
+
+    def _list_blobs(self, prefix=None, **kw):
+        return [blob for name, blob in sorted(self.blobs.items())
+                if name.startswith(prefix or '')]
+
+    def blob(self, name):
+        return self.blobs.setdefault(name, _Blob(name))
+
+    def _require_client(self, client):
+        return client
+
+
+class Test_sync(unittest.TestCase):
+
+    def setUp(self):
+        self.local_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.local_dir)
+
+    @staticmethod
+    def _call_fut(*args, **kw):
+        from google.cloud.storage.transfer import sync
+
+        kw.setdefault('hash_processes', 1)
+        return sync(*args, **kw)
+
+    def _write(self, path, data, mtime=None):
+        filename = os.path.join(self.local_dir, *path.split('/'))
+        directory = os.path.dirname(filename)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        with open(filename, 'wb') as file_obj:
+            file_obj.write(data)
+        if mtime is not None:
+            os.utime(filename, (mtime, mtime))
+
+    def _read(self, path):
+        filename = os.path.join(self.local_dir, *path.split('/'))
+        with open(filename, 'rb') as file_obj:
+            return file_obj.read()
+
+    def test_invalid_direction(self):
+        with self.assertRaises(ValueError):
+            self._call_fut(self.local_dir, _Bucket(), direction='sideways')
+
+    def test_upload_plan_w_checksum(self):
+        self._write('same', b'abc')
+        self._write('sub/changed', b'xyz')
+        self._write('resized', b'abcd')
+        self._write('new', b'new')
+        bucket = _Bucket(
+            _Blob('data/same', b'abc'),
+            _Blob('data/sub/changed', b'XYZ'),
+            _Blob('data/resized', b'abc'),
+            _Blob('data/gone', b'old'),
+            _Blob('data/dir/'))
+
+        result = self._call_fut(
+            self.local_dir, bucket, prefix='data', delete=True, dry_run=True,
+            client=mock.sentinel.client)
+
+        self.assertEqual(result.transfers, ['new', 'resized', 'sub/changed'])
+        self.assertEqual(result.deletions, ['gone'])
+        self.assertEqual(result.skipped, 1)
+        # Only the files of the same size are hashed.
+        self.assertEqual(result.hashed, 2)
+        bucket.list_blobs.assert_called_once_with(
+            prefix='data/', fields='items(name,size,updated,md5Hash)',
+            prefetch=True, client=mock.sentinel.client)
+        self.assertEqual(bucket.blobs['data/gone'].data, b'old')
+
+    def test_upload_plan_wo_checksum_compares_mtime(self):
+        updated = datetime.datetime(2018, 1, 1)
+        epoch = datetime.datetime(1970, 1, 1)
+        remote_mtime = (updated - epoch).total_seconds()
+        self._write('older', b'abc', mtime=remote_mtime - 10)
+        self._write('newer', b'abc', mtime=remote_mtime + 10)
+        bucket = _Bucket(
+            _Blob('older', b'XYZ', updated=updated),
+            _Blob('newer', b'abc', updated=updated))
+
+        result = self._call_fut(
+            self.local_dir, bucket, checksum=False, dry_run=True)
+
+        self.assertEqual(result.transfers, ['newer'])
+        self.assertEqual(result.skipped, 1)
+        self.assertEqual(result.hashed, 0)
+
+    def test_upload(self):
+        self._write('a', b'abc')
+        self._write('sub/b', b'defg')
+        bucket = _Bucket(_Blob('gone', b'old'))
+        bulk = mock.Mock(spec=['delete'])
+        bulk.delete.side_effect = lambda blobs: [
+            mock.Mock(blob=blob, error=None) for blob in blobs]
+
+        patch = mock.patch(
+            'google.cloud.storage.transfer.BulkOperations',
+            return_value=bulk)
+        with patch as bulk_class:
+            result = self._call_fut(
+                self.local_dir, bucket, delete=True, max_workers=2,
+                client=mock.sentinel.client)
+
+        self.assertEqual(bucket.blobs['a'].data, b'abc')
+        self.assertEqual(bucket.blobs['sub/b'].data, b'defg')
+        self.assertEqual(result.bytes_transferred, 7)
+        self.assertEqual(result.errors, [])
+        self.assertGreater(result.elapsed, 0)
+        self.assertGreater(result.bytes_per_second, 0)
+        bulk_class.assert_called_once_with(
+            mock.sentinel.client, max_workers=2)
+        bulk.delete.assert_called_once_with([bucket.blobs['gone']])
+
+    def test_upload_collects_errors(self):
+        from google.cloud.exceptions import Forbidden
+
+        self._write('a', b'abc')
+        self._write('b', b'def')
+        bucket = _Bucket()
+        error = Forbidden('denied')
+        with mock.patch.object(_Blob, 'upload_from_filename',
+                               side_effect=error):
+            result = self._call_fut(self.local_dir, bucket)
+
+        self.assertEqual(sorted(result.errors), [('a', error), ('b', error)])
+        self.assertEqual(result.bytes_transferred, 0)
+        self.assertEqual(result.files_per_second, 0)
+
+    def test_download(self):
+        self._write('same', b'abc')
+        self._write('changed', b'abc')
+        self._write('extra', b'extra')
+        updated = datetime.datetime(2018, 1, 1)
+        bucket = _Bucket(
+            _Blob('p/same', b'abc'),
+            _Blob('p/changed', b'xyz', updated=updated),
+            _Blob('p/sub/new', b'new'))
+
+        result = self._call_fut(
+            self.local_dir, bucket, prefix='p/', direction='download',
+            delete=True)
+
+        self.assertEqual(result.transfers, ['changed', 'sub/new'])
+        self.assertEqual(result.deletions, ['extra'])
+        self.assertEqual(result.errors, [])
+        self.assertEqual(self._read('changed'), b'xyz')
+        self.assertEqual(self._read('sub/new'), b'new')
+        self.assertFalse(
+            os.path.exists(os.path.join(self.local_dir, 'extra')))
+        # Downloaded files take the time of their object.
+        stat = os.stat(os.path.join(self.local_dir, 'changed'))
+        self.assertEqual(stat.st_mtime, 1514764800)
+
+    def test_manifest_skips_hashing_unchanged_files(self):
+        from google.cloud.storage import transfer
+
+        self._write('a', b'abc')
+        self._write('b', b'def')
+        manifest_path = tempfile.mktemp(suffix='.json')
+        self.addCleanup(os.remove, manifest_path)
+        bucket = _Bucket(_Blob('a', b'abc'))
+
+        result = self._call_fut(
+            self.local_dir, bucket, manifest_path=manifest_path)
+        self.assertEqual(result.transfers, ['b'])
+        self.assertEqual(result.hashed, 1)
+
+        with open(manifest_path) as file_obj:
+            manifest = json.load(file_obj)
+        self.assertEqual(manifest['version'], 1)
+        self.assertEqual(
+            sorted((path, entry[0], entry[2])
+                   for path, entry in manifest['files'].items()),
+            [('a', 3, _md5(b'abc')), ('b', 3, _md5(b'def'))])
+
+        with mock.patch.object(transfer, '_hash_file') as hash_file:
+            result = self._call_fut(
+                self.local_dir, bucket, manifest_path=manifest_path)
+
+        hash_file.assert_not_called()
+        self.assertEqual(result.transfers, [])
+        self.assertEqual(result.skipped, 2)
+        self.assertEqual(result.hashed, 0)
+
+    def test_manifest_ignores_stale_entries(self):
+        self._write('a', b'abc')
+        manifest_path = tempfile.mktemp(suffix='.json')
+        self.addCleanup(os.remove, manifest_path)
+        with open(manifest_path, 'w') as file_obj:
+            json.dump({'version': 1, 'files': {
+                'a': [3, 0.0, _md5(b'xyz')]}}, file_obj)
+        bucket = _Bucket(_Blob('a', b'abc'))
+
+        result = self._call_fut(
+            self.local_dir, bucket, manifest_path=manifest_path)
+
+        self.assertEqual(result.hashed, 1)
+        self.assertEqual(result.transfers, [])
+
+    def test_hash_files_in_processes(self):
+        from google.cloud.storage.transfer import _hash_files
+
+        self._write('a', b'abc')
+        self._write('b', b'def')
+
+        hashes = _hash_files(self.local_dir, ['a', 'b'], 2)
+
+        self.assertEqual(hashes, {'a': _md5(b'abc'), 'b': _md5(b'def')})